@@ -0,0 +1,50 @@
+"""Measure the time of adding a table with 100k cells to `TableElement` and of
+serializing it, i.e. the cost of the sanitization of the cells.
+
+Run with `python -m benchmarks.table_sanitization_benchmark` from the root of the repo.
+"""
+import random
+import timeit
+from functools import partial
+
+from visuallm.elements.plain_text_element import PlainTextElement
+from visuallm.elements.table_element import TableElement
+
+N_ROWS = 10000
+N_COLUMNS = 10
+
+
+def create_rows(distinct_cells: int) -> list[list[str]]:
+    rng = random.Random(0)  # noqa: S311
+    cells = [
+        rng.choice(["token", "**bold**", "`code`", "a < b", "line\nbreak", "0.25"])
+        + str(i)
+        for i in range(distinct_cells)
+    ]
+    return [[rng.choice(cells) for _ in range(N_COLUMNS)] for _ in range(N_ROWS)]
+
+
+def add_table(rows: list[list[str]]):
+    element = TableElement()
+    element.add_table("Benchmark", [f"column {i}" for i in range(N_COLUMNS)], rows)
+    element.construct_element_configuration()
+
+
+def main():
+    for distinct_cells in [100, N_ROWS * N_COLUMNS]:
+        rows = create_rows(distinct_cells)
+        seconds = min(timeit.repeat(partial(add_table, rows), number=1, repeat=5))
+        print(
+            f"{N_ROWS * N_COLUMNS} cells ({distinct_cells} distinct): "
+            f"{seconds * 1000:.1f} ms"
+        )
+
+    element = PlainTextElement(content="**Generated** text\n" * 100)
+    seconds = min(
+        timeit.repeat(element.construct_element_configuration, number=10000, repeat=5)
+    )
+    print(f"PlainText serialization: {seconds / 10000 * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
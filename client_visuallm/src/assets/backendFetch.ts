@@ -0,0 +1,52 @@
+import { decode, encode, MSGPACK_MIMETYPE } from './msgpack'
+
+/** MessagePack is preferred, the backend without msgpack installed responds with json */
+const ACCEPT = `${MSGPACK_MIMETYPE}, application/json;q=0.9`
+
+/** The request bodies are sent as MessagePack only after the backend
+ * responded with MessagePack, i.e. it is able to unpack them. */
+let backendSupportsMsgpack = false
+
+/** Features of this frontend, the backend sends the older formats of the
+ * element descriptions to the frontends which don't list them. */
+const FEATURES = [
+  'table-windows',
+  'table-deltas',
+  'collapsible-deltas',
+  'bar-columns'
+].join(', ')
+
+async function parseResponse(response: Response): Promise<any> {
+  if (response.headers.get('Content-Type')?.startsWith(MSGPACK_MIMETYPE)) {
+    backendSupportsMsgpack = true
+    return decode(new Uint8Array(await response.arrayBuffer()))
+  }
+  return await response.json()
+}
+
+/** GET the `address` of the backend and parse the json or MessagePack response. */
+export async function getFromBackend(address: string): Promise<any> {
+  const response = await fetch(address, {
+    method: 'GET',
+    headers: {
+      Accept: ACCEPT,
+      'X-Visuallm-Features': FEATURES
+    }
+  })
+  return await parseResponse(response)
+}
+
+/** POST the `body` to the `address` of the backend and parse the json or
+ * MessagePack response. */
+export async function postToBackend(address: string, body: any): Promise<any> {
+  const response = await fetch(address, {
+    method: 'POST',
+    headers: {
+      Accept: ACCEPT,
+      'X-Visuallm-Features': FEATURES,
+      'Content-Type': backendSupportsMsgpack ? MSGPACK_MIMETYPE : 'application/json'
+    },
+    body: backendSupportsMsgpack ? encode(body) : JSON.stringify(body)
+  })
+  return await parseResponse(response)
+}
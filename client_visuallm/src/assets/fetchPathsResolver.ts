@@ -7,30 +7,41 @@ interface Instance {
   [pollName: string]: any,
 }
 
+/** Resolve the default fetch path of the component displayed on the current route.
+ *
+ * @param instance the component that holds '$router' and '$default_fetch_paths'
+ */
+export function resolveDefaultFetchPath(instance: Instance): string {
+  const route_name = instance['$router'].currentRoute.value.name
+  if (route_name === undefined || route_name === null) {
+    throw TypeError()
+  }
+  const name = route_name.toString() as string
+  return instance['$default_fetch_paths'][name] as string
+}
+
 /** Fetch the information about all the elements at the start of the component lifecycle.
  *
  * @param instance the component that holds '$router', 'backendAddress' and '$default_fetch_paths'
  * @param pollName the name that the poll should get
  * @param callback function that should be called after the poll succeeds and the function gets repsponse from the backend
+ * @param progressCallback function that is called while the backend answers that the component is still loading
  */
 export async function fetchDefault(
   instance: Instance,
   backendAddress: string,
   pollName: string,
-  callback: (response: any) => void
+  callback: (response: any) => void,
+  progressCallback: ((response: any) => void) | undefined = undefined
 ) {
-  const route_name = instance['$router'].currentRoute.value.name
-  if (route_name === undefined || route_name === null) {
-    throw TypeError()
-  }
-  const name = route_name.toString() as string
-  const default_fetch_path = instance['$default_fetch_paths'][name] as string
+  const default_fetch_path = resolveDefaultFetchPath(instance)
   instance[pollName]?.clear()
   instance[pollName] = new PollUntilSuccessGET(
     `${backendAddress}/${default_fetch_path}`,
     callback,
     1000
   )
+  instance[pollName].progressCallback = progressCallback
   await instance[pollName].newRequest()
 }
 
@@ -0,0 +1,221 @@
+/** Minimal MessagePack codec for the communication with the backend.
+ *
+ * Supports all the types the backend sends, and the extension type
+ * `FLOAT64_ARRAY_EXT` with the float arrays packed as little-endian float64
+ * values, which are decoded to plain arrays of numbers.
+ */
+
+export const MSGPACK_MIMETYPE = 'application/msgpack'
+const FLOAT64_ARRAY_EXT = 1
+
+const textDecoder = new TextDecoder()
+const textEncoder = new TextEncoder()
+
+class Decoder {
+  view: DataView
+  bytes: Uint8Array
+  offset: number = 0
+
+  constructor(bytes: Uint8Array) {
+    this.bytes = bytes
+    this.view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength)
+  }
+
+  decode(): any {
+    const view = this.view
+    const type = view.getUint8(this.offset++)
+    if (type <= 0x7f) return type
+    if (type <= 0x8f) return this.map(type & 0x0f)
+    if (type <= 0x9f) return this.array(type & 0x0f)
+    if (type <= 0xbf) return this.str(type & 0x1f)
+    if (type >= 0xe0) return type - 0x100
+    switch (type) {
+      case 0xc0: return null
+      case 0xc2: return false
+      case 0xc3: return true
+      case 0xc4: return this.bin(this.uint(1))
+      case 0xc5: return this.bin(this.uint(2))
+      case 0xc6: return this.bin(this.uint(4))
+      case 0xc7: return this.ext(this.uint(1))
+      case 0xc8: return this.ext(this.uint(2))
+      case 0xc9: return this.ext(this.uint(4))
+      case 0xca: return this.advance(4, view.getFloat32(this.offset))
+      case 0xcb: return this.advance(8, view.getFloat64(this.offset))
+      case 0xcc: return this.uint(1)
+      case 0xcd: return this.uint(2)
+      case 0xce: return this.uint(4)
+      case 0xcf: return this.advance(8, Number(view.getBigUint64(this.offset)))
+      case 0xd0: return this.advance(1, view.getInt8(this.offset))
+      case 0xd1: return this.advance(2, view.getInt16(this.offset))
+      case 0xd2: return this.advance(4, view.getInt32(this.offset))
+      case 0xd3: return this.advance(8, Number(view.getBigInt64(this.offset)))
+      case 0xd4: return this.ext(1)
+      case 0xd5: return this.ext(2)
+      case 0xd6: return this.ext(4)
+      case 0xd7: return this.ext(8)
+      case 0xd8: return this.ext(16)
+      case 0xd9: return this.str(this.uint(1))
+      case 0xda: return this.str(this.uint(2))
+      case 0xdb: return this.str(this.uint(4))
+      case 0xdc: return this.array(this.uint(2))
+      case 0xdd: return this.array(this.uint(4))
+      case 0xde: return this.map(this.uint(2))
+      case 0xdf: return this.map(this.uint(4))
+    }
+    throw RangeError(`Invalid MessagePack type: 0x${type.toString(16)}`)
+  }
+
+  advance<T>(length: number, value: T): T {
+    this.offset += length
+    return value
+  }
+
+  uint(length: number): number {
+    const view = this.view
+    switch (length) {
+      case 1: return this.advance(1, view.getUint8(this.offset))
+      case 2: return this.advance(2, view.getUint16(this.offset))
+      default: return this.advance(4, view.getUint32(this.offset))
+    }
+  }
+
+  str(length: number): string {
+    const value = textDecoder.decode(this.bytes.subarray(this.offset, this.offset + length))
+    return this.advance(length, value)
+  }
+
+  bin(length: number): Uint8Array {
+    return this.advance(length, this.bytes.slice(this.offset, this.offset + length))
+  }
+
+  array(length: number): any[] {
+    const value = new Array(length)
+    for (let i = 0; i < length; i++) {
+      value[i] = this.decode()
+    }
+    return value
+  }
+
+  map(length: number): { [key: string]: any } {
+    const value: { [key: string]: any } = {}
+    for (let i = 0; i < length; i++) {
+      const key = this.decode()
+      value[key] = this.decode()
+    }
+    return value
+  }
+
+  ext(length: number): any {
+    const code = this.view.getInt8(this.offset++)
+    const data = this.bin(length)
+    if (code !== FLOAT64_ARRAY_EXT) {
+      throw RangeError(`Unsupported MessagePack extension type: ${code}`)
+    }
+    // the copied data are aligned, hence they can be viewed as float array
+    // (the byte order of all the supported platforms is little-endian)
+    return Array.from(new Float64Array(data.buffer))
+  }
+}
+
+export function decode(bytes: Uint8Array): any {
+  return new Decoder(bytes).decode()
+}
+
+class Encoder {
+  bytes: Uint8Array = new Uint8Array(256)
+  view: DataView = new DataView(this.bytes.buffer)
+  offset: number = 0
+
+  reserve(length: number) {
+    if (this.offset + length <= this.bytes.length) {
+      return
+    }
+    const bytes = new Uint8Array(Math.max(this.bytes.length * 2, this.offset + length))
+    bytes.set(this.bytes)
+    this.bytes = bytes
+    this.view = new DataView(bytes.buffer)
+  }
+
+  header(length: number, fixType: number | undefined, fixLimit: number, types: (number | undefined)[]) {
+    this.reserve(5)
+    if (fixType !== undefined && length < fixLimit) {
+      this.view.setUint8(this.offset++, fixType | length)
+    } else if (length <= 0xff && types[0] !== undefined) {
+      this.view.setUint8(this.offset++, types[0])
+      this.view.setUint8(this.offset++, length)
+    } else if (length <= 0xffff) {
+      this.view.setUint8(this.offset++, types[1]!)
+      this.view.setUint16(this.offset, length)
+      this.offset += 2
+    } else {
+      this.view.setUint8(this.offset++, types[2]!)
+      this.view.setUint32(this.offset, length)
+      this.offset += 4
+    }
+  }
+
+  encode(value: any) {
+    this.reserve(9)
+    if (value === null || value === undefined) {
+      this.view.setUint8(this.offset++, 0xc0)
+    } else if (typeof value === 'boolean') {
+      this.view.setUint8(this.offset++, value ? 0xc3 : 0xc2)
+    } else if (typeof value === 'number') {
+      this.number(value)
+    } else if (typeof value === 'string') {
+      const bytes = textEncoder.encode(value)
+      this.header(bytes.length, 0xa0, 32, [0xd9, 0xda, 0xdb])
+      this.raw(bytes)
+    } else if (value instanceof Uint8Array) {
+      this.header(value.length, undefined, 0, [0xc4, 0xc5, 0xc6])
+      this.raw(value)
+    } else if (Array.isArray(value)) {
+      this.header(value.length, 0x90, 16, [undefined, 0xdc, 0xdd])
+      for (const item of value) {
+        this.encode(item)
+      }
+    } else {
+      const keys = Object.keys(value).filter((key) => value[key] !== undefined)
+      this.header(keys.length, 0x80, 16, [undefined, 0xde, 0xdf])
+      for (const key of keys) {
+        this.encode(key)
+        this.encode(value[key])
+      }
+    }
+  }
+
+  number(value: number) {
+    const view = this.view
+    if (Number.isInteger(value) && value >= -0x80000000 && value <= 0xffffffff) {
+      if (value >= 0 && value <= 0x7f) {
+        view.setUint8(this.offset++, value)
+      } else if (value < 0 && value >= -32) {
+        view.setInt8(this.offset++, value)
+      } else if (value >= 0) {
+        view.setUint8(this.offset++, 0xce)
+        view.setUint32(this.offset, value)
+        this.offset += 4
+      } else {
+        view.setUint8(this.offset++, 0xd2)
+        view.setInt32(this.offset, value)
+        this.offset += 4
+      }
+      return
+    }
+    view.setUint8(this.offset++, 0xcb)
+    view.setFloat64(this.offset, value)
+    this.offset += 8
+  }
+
+  raw(bytes: Uint8Array) {
+    this.reserve(bytes.length)
+    this.bytes.set(bytes, this.offset)
+    this.offset += bytes.length
+  }
+}
+
+export function encode(value: any): Uint8Array {
+  const encoder = new Encoder()
+  encoder.encode(value)
+  return encoder.bytes.slice(0, encoder.offset)
+}
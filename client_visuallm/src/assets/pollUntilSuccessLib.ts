@@ -1,8 +1,20 @@
+import { getFromBackend, postToBackend } from './backendFetch'
+import { pushChannel } from './pushChannel'
+
 abstract class PollingBase {
   backendAddress: string
   responseCallback: (el: any) => void
   pollingInterval: number | boolean = false
   howOftenToPoll: number
+  /** When the backend answers that a background job is still running (result
+   * 'loading') and the push channel is connected, the request is repeated after
+   * the backend pushes that a job has finished instead of polling. If no such
+   * event arrives in `pushFallbackTimeout` ms, the request is repeated anyway.
+   * All the other responses and the errors are retried by polling. */
+  pushFallbackTimeout: number = 5000
+  pushRetry: (() => void) | undefined = undefined
+  /** Called with the responses with result 'loading', e.g. while the backend loads a model */
+  progressCallback: ((response: any) => void) | undefined = undefined
 
   constructor(
     backendAddress: string,
@@ -15,7 +27,7 @@ abstract class PollingBase {
   }
 
   isPending() {
-    return typeof this.pollingInterval === 'number'
+    return typeof this.pollingInterval === 'number' || this.pushRetry !== undefined
   }
 
   async newRequest() {
@@ -27,6 +39,7 @@ abstract class PollingBase {
   }
 
   async _fetchFromBackend() {
+    let jobPending = false
     try {
       const response = await this._fetchMethod()
       if (response.result === 'success' || response.result === 'exception') {
@@ -34,18 +47,49 @@ abstract class PollingBase {
         this.clear()
         return
       }
+      if (response.result === 'loading') {
+        jobPending = true
+        if (this.progressCallback !== undefined) {
+          this.progressCallback(response)
+        }
+      }
     } catch (err) {
       console.log('Error - PollUntilSuccess')
       console.log(err)
     }
     if (typeof this.pollingInterval === 'boolean') {
+      if (jobPending && pushChannel.isConnected()) {
+        this._waitForPush()
+        return
+      }
       this.pollingInterval = setInterval(this._fetchFromBackend.bind(this), this.howOftenToPoll)
     }
   }
 
+  _waitForPush() {
+    const timeout = setTimeout(() => retry(), this.pushFallbackTimeout)
+    const retry = () => {
+      if (this.pushRetry !== retry) {
+        return
+      }
+      this._clearPushRetry()
+      clearTimeout(timeout)
+      this._fetchFromBackend()
+    }
+    this.pushRetry = retry
+    pushChannel.on('job', retry)
+  }
+
+  _clearPushRetry() {
+    if (this.pushRetry !== undefined) {
+      pushChannel.off('job', this.pushRetry)
+      this.pushRetry = undefined
+    }
+  }
+
   clear() {
-    if (this.isPending()) {
-      // @ts-ignore
+    this._clearPushRetry()
+    if (typeof this.pollingInterval === 'number') {
       clearInterval(this.pollingInterval)
       this.pollingInterval = false
     }
@@ -56,12 +100,7 @@ abstract class PollingBase {
 
 export class PollUntilSuccessGET extends PollingBase {
   async _fetchMethod() {
-    return await fetch(this.backendAddress, {
-      method: 'GET',
-      headers: {
-        Accept: 'application/json'
-      }
-    }).then((response) => response.json())
+    return await getFromBackend(this.backendAddress)
   }
 }
 
@@ -78,14 +117,7 @@ export class PollUntilSuccessPOST extends PollingBase {
   }
 
   async _fetchMethod() {
-    return await fetch(this.backendAddress, {
-      method: 'POST',
-      headers: {
-        Accept: 'application/json',
-        'Content-Type': 'application/json'
-      },
-      body: JSON.stringify(this.body)
-    }).then((response) => response.json())
+    return await postToBackend(this.backendAddress, this.body)
   }
 
   static async startPoll(instance: any, name: string, address: string, responseCallback: any, data: any) {
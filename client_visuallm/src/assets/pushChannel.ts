@@ -0,0 +1,80 @@
+type PushListener = (data: any) => void
+
+/** Names of the events that the backend pushes over the channel.
+ *
+ * - `diff` - descriptions of the changed elements (same format as the response
+ *   to the default fetch)
+ * - `job` - a long running job on the backend has finished
+ * - `token` - a token that should be appended to the value of an element
+ */
+export const PUSH_EVENTS = ['diff', 'job', 'token']
+
+/**
+ * Server-sent events subscription to the events of a single component.
+ * If the browser doesn't support `EventSource` or the connection cannot be
+ * established, `isConnected()` returns false and the requests fall back to
+ * polling.
+ */
+export class PushChannel {
+  source: EventSource | undefined = undefined
+  connected: boolean = false
+  listeners: { [event: string]: Set<PushListener> } = {}
+
+  constructor() {
+    for (const event of PUSH_EVENTS) {
+      this.listeners[event] = new Set()
+    }
+  }
+
+  /** Subscribe to the events of the component whose default fetch path is `componentPath`. */
+  open(backendAddress: string, componentPath: string) {
+    this.close()
+    if (typeof EventSource === 'undefined') {
+      return
+    }
+    const source = new EventSource(
+      `${backendAddress}/events?component=${encodeURIComponent(componentPath)}`
+    )
+    source.onopen = () => {
+      this.connected = true
+    }
+    source.onerror = () => {
+      // the browser reconnects on its own, until then the polling is used
+      this.connected = false
+    }
+    for (const event of PUSH_EVENTS) {
+      source.addEventListener(event, (message: MessageEvent) => {
+        this.dispatch(event, JSON.parse(message.data))
+      })
+    }
+    this.source = source
+  }
+
+  close() {
+    this.source?.close()
+    this.source = undefined
+    this.connected = false
+  }
+
+  isConnected() {
+    return this.connected
+  }
+
+  on(event: string, listener: PushListener) {
+    this.listeners[event].add(listener)
+  }
+
+  off(event: string, listener: PushListener) {
+    this.listeners[event].delete(listener)
+  }
+
+  dispatch(event: string, data: any) {
+    // copy, so that the listeners may unsubscribe themselves
+    for (const listener of Array.from(this.listeners[event])) {
+      listener(data)
+    }
+  }
+}
+
+/** The channel of the currently displayed component */
+export const pushChannel = new PushChannel()
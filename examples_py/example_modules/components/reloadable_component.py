@@ -45,35 +45,29 @@ class ReloadableComponent(ComponentBase):
                 )
             ],
         )
-        self.add_elements(
-            [
-                self.main_heading_element,
-                self.stage_1_description,
-                self.stage_2_description,
-                self.stage_1_button,
-                self.stage_2_button_collapsible,
-            ]
-        )
+        self.add_element(self.main_heading_element)
+        # the elements of the stages are added and removed at runtime
         self.stage_1_elements: list[ElementBase] = [
-            self.main_heading_element,
             self.stage_1_description,
             self.stage_1_button,
         ]
         self.stage_2_elements: list[ElementBase] = [
-            self.main_heading_element,
             self.stage_2_description,
             self.stage_2_button_collapsible,
         ]
+        self.stage_elements: list[ElementBase] = []
+
+    def show_stage_elements(self, elements: list[ElementBase]) -> None:
+        for element in self.stage_elements:
+            self.remove_element(element)
+        self.add_elements(elements)
+        self.stage_elements = elements
 
     def stage_1(self) -> None:
-        self.clear_elements()
-        for element in self.stage_1_elements:
-            element.set_displayed()
+        self.show_stage_elements(self.stage_1_elements)
 
     def stage_2(self) -> None:
-        self.clear_elements()
-        for element in self.stage_2_elements:
-            element.set_displayed()
+        self.show_stage_elements(self.stage_2_elements)
 
     def reload_page_callback(self) -> None:
         self.stage_index = (self.stage_index + 1) % len(self.stages)
@@ -0,0 +1,33 @@
+from tests.stubs.generator_stub import GeneratorStub
+from visuallm.components.chat_component import ChatComponent
+
+
+def accept_generation(component: ChatComponent, message: str, generation: str):
+    component.loaded_sample["user_message"] = message
+    component.model_output_display_element.content = generation
+    component.on_accept_generation_callback()
+
+
+def test_accepted_generations_are_appended_to_history():
+    component = ChatComponent(title="Chat", generator=GeneratorStub())
+    component.fetch_info()
+    accept_generation(component, "hi", "hello")
+    first_row = component.chat_history_table.tables[0].rows[0]
+
+    component.fetch_info()
+    accept_generation(component, "*how* are you?", "fine")
+    rows = component.chat_history_table.tables[0].rows
+    assert rows == (
+        ("You", "hi"),
+        ("Bot", "hello"),
+        ("You", "<em>how</em> are you?"),
+        ("Bot", "fine"),
+    )
+    # the displayed utterances aren't processed again
+    assert rows[0] is first_row
+    update = component.chat_history_table.construct_element_update()
+    assert update["appended_rows"][0]["start"] == 2
+
+    component.loaded_sample["history"].clear()
+    component.update_chat_history_elements()
+    assert component.chat_history_table.tables == []
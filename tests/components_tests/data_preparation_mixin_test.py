@@ -0,0 +1,121 @@
+from visuallm.component_base import ComponentBase
+from visuallm.components.mixins.data_preparation_mixin import (
+    DataPreparationMixin,
+    estimate_dataset_size,
+)
+
+
+class DataComponent(ComponentBase, DataPreparationMixin):
+    def __init__(self, **kwargs):
+        super().__init__(name="data", title="Data")
+        DataPreparationMixin.__init__(self, **kwargs)
+        self.add_elements(self.dataset_choice_elements)
+
+    def after_on_dataset_change_callback(self):
+        pass
+
+
+class CountingLoader:
+    def __init__(self, name: str):
+        self.name = name
+        self.n_calls = 0
+
+    def __call__(self):
+        self.n_calls += 1
+        return {"train": [{"text": self.name}] * 10}
+
+
+class ArrowTableStub:
+    nbytes = 1234
+
+
+class ArrowSplitStub(list):
+    data = ArrowTableStub()
+
+
+def test_least_recently_selected_dataset_is_evicted():
+    loaders = {name: CountingLoader(name) for name in ["a", "b", "c"]}
+    component = DataComponent(
+        dataset_choices=loaders,
+        dataset_cache_budget=250,
+        dataset_size_estimator=lambda _: 100,
+    )
+
+    for name in ["b", "a", "c", "b"]:
+        component.dataset_selector_element.value_on_backend = name
+        component.on_dataset_change_callback()
+
+    assert component.loaded_sample == {"text": "b"}
+    assert [loader.n_calls for loader in loaders.values()] == [1, 2, 1]
+    statistics = component.dataset_cache_statistics
+    assert statistics is not None
+    assert (statistics.hits, statistics.misses, statistics.evictions) == (1, 4, 2)
+    assert statistics.size_bytes == 200
+
+
+def test_dataset_size_estimation():
+    samples = [{"text": "a" * 100}] * 100
+    plain_size = estimate_dataset_size({"train": samples})
+    assert plain_size > 100 * 100
+
+    arrow_size = estimate_dataset_size({"train": ArrowSplitStub(samples)})
+    assert arrow_size == ArrowTableStub.nbytes
+
+
+def test_shared_dataset_is_loaded_once():
+    loaders = {name: CountingLoader(name) for name in ["a", "b"]}
+    first = DataComponent(dataset_choices=loaders)
+    second = DataComponent(dataset_choices=loaders, keep_datasets_in_memory=False)
+    assert first.dataset is second.dataset
+
+    second.dataset_selector_element.value_on_backend = "b"
+    second.on_dataset_change_callback()
+    first.dataset_selector_element.value_on_backend = "b"
+    first.on_dataset_change_callback()
+    assert [loader.n_calls for loader in loaders.values()] == [1, 1]
+
+    # the second component doesn't cache "a" and the first one still holds it
+    second.dataset_selector_element.value_on_backend = "a"
+    second.on_dataset_change_callback()
+    assert [loader.n_calls for loader in loaders.values()] == [1, 1]
+
+
+class KeysOnlyDataset:
+
+    """Dataset which isn't iterable, it only has the keys of the splits."""
+
+    def __init__(self, splits: dict):
+        self._splits = splits
+
+    def keys(self):
+        return self._splits.keys()
+
+    def __getitem__(self, key: str):
+        return self._splits[key]
+
+
+def test_dataset_with_only_keys_is_estimated():
+    samples = [{"text": "a" * 100}] * 100
+    dataset = KeysOnlyDataset({"train": samples})
+    assert estimate_dataset_size(dataset) == estimate_dataset_size({"train": samples})
+
+
+def test_datasets_are_measured_only_with_budget():
+    measured: list[object] = []
+
+    def estimator(dataset) -> int:
+        measured.append(dataset)
+        return 100
+
+    loaders = {name: CountingLoader(name) for name in ["a", "b"]}
+    component = DataComponent(dataset_choices=loaders, dataset_size_estimator=estimator)
+    component.dataset_selector_element.value_on_backend = "b"
+    component.on_dataset_change_callback()
+    assert measured == []
+
+    DataComponent(
+        dataset_choices=loaders,
+        dataset_cache_budget=1000,
+        dataset_size_estimator=estimator,
+    )
+    assert len(measured) == 1
@@ -0,0 +1,90 @@
+import json
+from functools import partial
+
+from tests.components_tests.data_preparation_mixin_test import (
+    CountingLoader,
+    DataComponent,
+)
+from visuallm.components.dataset_snapshots import (
+    DatasetSnapshotCache,
+    constructor_identity,
+    split_fingerprint,
+)
+from visuallm.components.memory_mapped_datasets import (
+    MemoryMappedDataset,
+    MemoryMappedJSONL,
+)
+
+
+def build_dataset(n_samples: int):
+    return {
+        "train": [{"text": f"sample {i}", "ids": [i, i]} for i in range(n_samples)],
+        "test": [],
+    }
+
+
+def test_constructor_identity():
+    assert constructor_identity(build_dataset).endswith(
+        "dataset_snapshots_test.build_dataset"
+    )
+    assert constructor_identity(partial(build_dataset, 1)) != constructor_identity(
+        partial(build_dataset, 2)
+    )
+    assert constructor_identity(CountingLoader("a")).endswith("CountingLoader")
+
+
+def test_split_fingerprint_covers_all_samples(tmp_path):
+    samples = build_dataset(5)["train"]
+    changed = [*samples[:2], {"text": "changed", "ids": [2, 2]}, *samples[3:]]
+    assert split_fingerprint(samples) == split_fingerprint(list(samples))
+    assert split_fingerprint(samples) != split_fingerprint(changed)
+
+    path = tmp_path / "train.jsonl"
+    path.write_text("".join(json.dumps(sample) + "\n" for sample in samples))
+    fingerprint = split_fingerprint(MemoryMappedJSONL(path))
+    assert split_fingerprint(MemoryMappedJSONL(path)) == fingerprint
+    path.write_text("".join(json.dumps(sample) + "\n" for sample in changed))
+    assert split_fingerprint(MemoryMappedJSONL(path)) != fingerprint
+
+
+def test_snapshot_is_memory_mapped_after_restart(tmp_path):
+    loaders = {"a": CountingLoader("a"), "b": CountingLoader("b")}
+    first = DataComponent(dataset_choices=loaders, dataset_snapshot_dir=tmp_path)
+    first.dataset_selector_element.value_on_backend = "b"
+    first.on_dataset_change_callback()
+    assert isinstance(first.dataset, MemoryMappedDataset)
+
+    # another component with new constructors simulates the restart of the app
+    restarted_loaders = {"a": CountingLoader("a"), "b": CountingLoader("b")}
+    restarted = DataComponent(
+        dataset_choices=restarted_loaders, dataset_snapshot_dir=tmp_path
+    )
+    restarted.dataset_selector_element.value_on_backend = "b"
+    restarted.on_dataset_change_callback()
+    assert restarted.loaded_sample == {"text": "b"}
+    assert [loader.n_calls for loader in restarted_loaders.values()] == [0, 0]
+
+    # new version builds the snapshots again
+    loader = CountingLoader("a")
+    DataComponent(
+        dataset_choices={"a": loader},
+        dataset_snapshot_dir=tmp_path,
+        dataset_snapshot_version="2",
+    )
+    assert loader.n_calls == 1
+
+
+def test_snapshot_keeps_samples(tmp_path):
+    cache = DatasetSnapshotCache(tmp_path)
+    dataset = cache.load("default", partial(build_dataset, 5))
+    assert isinstance(dataset, MemoryMappedDataset)
+    assert list(dataset.keys()) == ["train", "test"]
+    assert dataset["train"][:] == build_dataset(5)["train"]
+    assert len(dataset["test"]) == 0
+
+
+def test_not_serializable_dataset_is_not_snapshotted(tmp_path):
+    cache = DatasetSnapshotCache(tmp_path)
+    dataset = {"train": [object()]}
+    assert cache.load("default", lambda: dataset) is dataset
+    assert list(tmp_path.iterdir()) == []
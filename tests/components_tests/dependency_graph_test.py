@@ -0,0 +1,148 @@
+import pytest
+
+from visuallm.dependency_graph import DependencyGraph
+
+
+class Recorder:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def node(self, name, compute):
+        def recorded(*args):
+            self.calls.append(name)
+            return compute(*args)
+
+        return recorded
+
+
+@pytest.fixture()
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture()
+def graph(recorder: Recorder):
+    graph = DependencyGraph()
+    graph.add_input("a")
+    graph.add_input("b")
+    graph.add_node("sum", recorder.node("sum", lambda a, b: a + b), ["a", "b"])
+    graph.add_node("double_a", recorder.node("double_a", lambda a: 2 * a), ["a"])
+    graph.add_node(
+        "parity",
+        recorder.node("parity", lambda total: total % 2),
+        ["sum"],
+    )
+    graph.add_node(
+        "report",
+        recorder.node("report", lambda parity, double_a: (parity, double_a)),
+        ["parity", "double_a"],
+    )
+    graph.set_input("a", 1)
+    graph.set_input("b", 2)
+    return graph
+
+
+def test_nodes_are_memoized(graph: DependencyGraph, recorder: Recorder):
+    assert graph.get("report") == (1, 2)
+    assert graph.get("report") == (1, 2)
+    assert recorder.calls == ["sum", "parity", "double_a", "report"]
+
+
+def test_only_dependants_of_changed_input_are_recomputed(
+    graph: DependencyGraph, recorder: Recorder
+):
+    graph.get("report")
+    recorder.calls.clear()
+
+    graph.set_input("b", 4)
+    assert graph.get("report") == (1, 2)
+    # the parity didn't change, hence the report isn't recomputed
+    assert recorder.calls == ["sum", "parity"]
+
+
+def test_setting_equal_value_doesnt_invalidate(
+    graph: DependencyGraph, recorder: Recorder
+):
+    graph.get("report")
+    recorder.calls.clear()
+
+    graph.set_input("a", 1)
+    graph.set_input("b", 2)
+    graph.get("report")
+    assert recorder.calls == []
+
+
+def test_invalidated_node_is_recomputed(graph: DependencyGraph, recorder: Recorder):
+    graph.get("report")
+    recorder.calls.clear()
+
+    graph.invalidate("sum")
+    graph.get("report")
+    assert recorder.calls == ["sum"]
+
+    graph.invalidate("a")
+    graph.get("report")
+    assert recorder.calls == ["sum", "sum", "double_a"]
+
+
+def test_failed_computation_is_repeated(graph: DependencyGraph):
+    graph.add_node("inverse", lambda a: 1 / a, ["a"])
+    graph.set_input("a", 0)
+    with pytest.raises(ZeroDivisionError):
+        graph.get("inverse")
+    graph.set_input("a", 4)
+    assert graph.get("inverse") == 0.25
+
+
+def test_values_which_cannot_be_compared_are_considered_changed(
+    graph: DependencyGraph, recorder: Recorder
+):
+    class Ambiguous:
+        def __eq__(self, other):
+            raise ValueError("ambiguous")
+
+    graph.add_node("wrapped", lambda a: Ambiguous(), ["a"])
+    graph.add_node("after", recorder.node("after", lambda wrapped: 0), ["wrapped"])
+    graph.get("after")
+    graph.invalidate("wrapped")
+    graph.get("after")
+    assert recorder.calls == ["after", "after"]
+
+
+def test_effects_are_applied_after_evaluation_only_on_change(
+    graph: DependencyGraph, recorder: Recorder
+):
+    applied: list[tuple] = []
+
+    def apply(parity, double_a):
+        # all the nodes are computed before any effect is applied
+        assert recorder.calls == ["sum", "parity", "double_a"]
+        applied.append((parity, double_a))
+
+    graph.add_effect("display", apply, ["parity", "double_a"])
+    graph.apply_effects()
+    graph.apply_effects()
+    assert applied == [(1, 2)]
+
+    graph.set_input("b", 4)
+    graph.apply_effects()
+    assert applied == [(1, 2)]
+    graph.set_input("a", 2)
+    recorder.calls.clear()
+    graph.apply_effects()
+    assert applied == [(1, 2), (0, 4)]
+
+
+def test_invalid_graphs_are_rejected(graph: DependencyGraph):
+    with pytest.raises(KeyError):
+        graph.add_node("node", lambda missing: missing, ["missing"])
+    with pytest.raises(ValueError):
+        graph.add_input("a")
+    with pytest.raises(ValueError):
+        graph.set_input("sum", 3)
+    with pytest.raises(KeyError):
+        graph.add_effect("effect", lambda missing: None, ["missing"])
+
+    graph.add_input("unset")
+    with pytest.raises(RuntimeError):
+        graph.get("unset")
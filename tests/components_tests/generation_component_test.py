@@ -0,0 +1,186 @@
+import threading
+
+from tests.stubs.generator_stub import GeneratorStub
+from visuallm.components.generation_component import GenerationComponent
+from visuallm.components.generators.base import (
+    GeneratedOutput,
+    OutputProbabilityInterface,
+)
+from visuallm.components.mixins.generation_selectors_mixin import MinMaxSelectorType
+from visuallm.components.mixins.metrics_mixin import GeneratedTextMetric
+
+
+class RecordingGeneratorStub(GeneratorStub):
+
+    """Records the texts and the threads of the generations."""
+
+    def __init__(self):
+        super().__init__()
+        self.generations: list[tuple[str, str]] = []
+
+    def generate_output(self, text_to_tokenizer: str, **kwargs):
+        self.generations.append((text_to_tokenizer, threading.current_thread().name))
+        return super().generate_output(text_to_tokenizer, **kwargs)
+
+
+DATASET = {"train": [{"text": f"text_{i}", "target": "target"} for i in range(5)]}
+
+
+def create_component(generator, **kwargs) -> GenerationComponent:
+    return GenerationComponent(generator=generator, dataset=DATASET, **kwargs)
+
+
+def select_sample(component: GenerationComponent, index: int):
+    component.sample_selector_element.value_on_backend = index
+    component.on_dataset_change_callback()
+
+
+def wait_for_prefetching(component: GenerationComponent):
+    prefetcher = component._sample_prefetcher
+    assert prefetcher is not None
+    for future in list(prefetcher._entries.values()):
+        future.exception(timeout=5)
+
+
+def test_next_sample_is_prefetched():
+    generator = RecordingGeneratorStub()
+    component = create_component(
+        generator, prefetch_offsets=(1,), prefetch_generations=True
+    )
+    wait_for_prefetching(component)
+    select_sample(component, 1)
+    wait_for_prefetching(component)
+
+    texts = [text for text, _ in generator.generations]
+    assert texts == ["text_0", "text_1", "text_2"]
+    # only the first sample is generated in the foreground
+    assert [
+        thread.startswith("visuallm-prefetch") for _, thread in generator.generations
+    ] == [
+        False,
+        True,
+        True,
+    ]
+    assert component.text_to_tokenizer_element.content == "text_1"
+    assert component._sample_prefetcher is not None
+    assert component._sample_prefetcher.misses == 1
+
+
+def test_generations_arent_prefetched_by_default():
+    generator = RecordingGeneratorStub()
+    component = create_component(generator, prefetch_offsets=(1,))
+    wait_for_prefetching(component)
+    select_sample(component, 1)
+
+    texts = [text for text, _ in generator.generations]
+    assert texts == ["text_0", "text_1"]
+    assert component.text_to_tokenizer_element.content == "text_1"
+
+
+def test_sample_is_prefetched_once_per_update(monkeypatch):
+    component = create_component(RecordingGeneratorStub(), prefetch_offsets=(1,))
+    wait_for_prefetching(component)
+    prefetched_sample = component.prefetched_sample
+    calls: list[int] = []
+
+    def counted_prefetched_sample():
+        calls.append(component.sample_selector_element.value_on_backend)
+        return prefetched_sample()
+
+    monkeypatch.setattr(component, "prefetched_sample", counted_prefetched_sample)
+    select_sample(component, 1)
+
+    assert calls == [1]
+    assert component.text_to_tokenizer_element.content == "text_1"
+
+
+class ScoringGeneratorStub(GeneratorStub, OutputProbabilityInterface):
+
+    """Records the prompts, the generations and the measured probabilities."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: list[str] = []
+
+    def create_text_to_tokenizer(self, loaded_sample, target=None):  # type: ignore[override]
+        if target is None:
+            self.calls.append("prompt")
+        return super().create_text_to_tokenizer(loaded_sample, target)
+
+    def generate_output(self, text_to_tokenizer: str, **kwargs):
+        self.calls.append(f"generate {kwargs}")
+        return GeneratedOutput([f"generated {kwargs}"], input_length=1)
+
+    def measure_output_probability(self, texts, input_length):
+        self.calls.append(f"measure {len(texts)}")
+        return [0.5] * len(texts), [None] * len(texts)
+
+
+def create_scoring_component(generator, metric_calls: list[str]):
+    def metric(generated: str, target: str) -> float:
+        metric_calls.append(generated)
+        return 1.0
+
+    return create_component(
+        generator,
+        selectors={"temperature": MinMaxSelectorType(0, 2, 1)},
+        metrics_on_generated_text={
+            "metric": GeneratedTextMetric("{}", True, metric),
+            "other": GeneratedTextMetric("{}", True, metric),
+        },
+    )
+
+
+def test_generation_parameters_change_doesnt_recompute_prompt_and_target():
+    generator = ScoringGeneratorStub()
+    metric_calls: list[str] = []
+    component = create_scoring_component(generator, metric_calls)
+    assert generator.calls == [
+        "prompt",
+        "generate {'temperature': 1}",
+        "measure 1",
+        "measure 1",
+    ]
+    generator.calls.clear()
+    metric_calls.clear()
+
+    component.name_generation_selector_mapping["temperature"].value_on_backend = 2
+    component.on_generation_changed_callback()
+
+    # only the generated outputs and their scores are computed again
+    assert generator.calls == ["generate {'temperature': 2}", "measure 1"]
+    assert metric_calls == ["generated {'temperature': 2}"] * 2
+
+
+def test_metrics_selection_change_doesnt_generate():
+    generator = ScoringGeneratorStub()
+    metric_calls: list[str] = []
+    component = create_scoring_component(generator, metric_calls)
+    generator.calls.clear()
+    metric_calls.clear()
+
+    component._select_metrics_elements["other"].value_on_backend = False
+    component.metrics_processing_callback()
+
+    assert generator.calls == []
+    # the metric on the generated output and on the target
+    assert metric_calls == ["generated {'temperature': 1}", "target"]
+    assert component.selected_metrics == ("metric",)
+
+
+def test_generator_change_keeps_selected_sample():
+    generator = ScoringGeneratorStub()
+    other_generator = ScoringGeneratorStub()
+    component = GenerationComponent(
+        generator_choices={"first": generator, "second": other_generator},
+        dataset=DATASET,
+    )
+    select_sample(component, 3)
+
+    component.generator_selector_element.value_on_backend = "second"
+    component.on_generator_change_callback()
+
+    assert other_generator.calls[0] == "prompt"
+    assert "generate {}" in other_generator.calls
+    assert component.sample_selector_element.value_on_backend == 3
+    assert component.text_to_tokenizer_element.content == "text_3"
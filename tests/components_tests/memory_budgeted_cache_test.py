@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from visuallm.utils.memory_budgeted_cache import MemoryBudgetedLRUCache
+
+
+def test_least_recently_used_values_are_evicted():
+    evicted: list[str] = []
+    cache: MemoryBudgetedLRUCache[str, str] = MemoryBudgetedLRUCache(
+        size_of=len, budget_bytes=4, on_evict=lambda key, _: evicted.append(key)
+    )
+    cache.get_or_load("a", lambda: "aa")
+    cache.get_or_load("b", lambda: "bb")
+    cache.get_or_load("a", lambda: "aa")
+    cache.get_or_load("c", lambda: "cc")
+
+    assert evicted == ["b"]
+    assert "a" in cache
+    assert cache.statistics.size_bytes == 4
+
+
+def test_pinned_value_isnt_evicted():
+    evicted: list[str] = []
+    cache: MemoryBudgetedLRUCache[str, str] = MemoryBudgetedLRUCache(
+        size_of=len, budget_bytes=3, on_evict=lambda key, _: evicted.append(key)
+    )
+    cache.pin("a")
+    cache.get_or_load("a", lambda: "aa")
+    cache.get_or_load("b", lambda: "bb")
+
+    # the value which doesn't fit next to the pinned one is evicted itself
+    assert evicted == ["b"]
+    assert "a" in cache
+
+    cache.get_or_load("c", lambda: "c")
+    cache.unpin("a")
+    assert evicted == ["b"]
+    cache.get_or_load("d", lambda: "d")
+    assert evicted == ["b", "a"]
+    assert cache.statistics.size_bytes == 2
+
+
+def test_concurrent_misses_load_the_key_once():
+    loads: list[str] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def load() -> str:
+        loads.append("a")
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    cache: MemoryBudgetedLRUCache[str, str] = MemoryBudgetedLRUCache(size_of=len)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(cache.get_or_load, "a", load)
+        assert started.wait(timeout=5)
+        others = [executor.submit(cache.get_or_load, "a", load) for _ in range(3)]
+        # another key isn't blocked by the loading of "a"
+        assert cache.get_or_load("b", lambda: "other") == "other"
+        release.set()
+        results = [future.result(timeout=5) for future in [first, *others]]
+
+    assert results == ["value"] * 4
+    assert loads == ["a"]
+    statistics = cache.statistics
+    assert (statistics.misses, statistics.hits) == (2, 3)
+    assert cache._key_locks == {}
@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.components_tests.data_preparation_mixin_test import DataComponent
+from visuallm.components.memory_mapped_datasets import (
+    MemoryMappedDataset,
+    MemoryMappedJSONL,
+)
+
+
+def write_jsonl(path, samples, empty_lines: bool = False):
+    separator = "\n\n" if empty_lines else "\n"
+    path.write_text(separator.join(json.dumps(sample) for sample in samples))
+
+
+def test_lines_are_accessed_through_persisted_index(tmp_path):
+    path = tmp_path / "train.jsonl"
+    samples = [{"text": f"ünicode {i}"} for i in range(10)]
+    write_jsonl(path, samples, empty_lines=True)
+
+    split = MemoryMappedJSONL(path)
+    assert len(split) == 10
+    assert split[3] == samples[3]
+    assert split[-1] == samples[-1]
+    assert split[8:] == samples[8:]
+    with pytest.raises(IndexError):
+        split[10]
+    assert Path(f"{path}.idx").exists()
+
+    # the second open reads the persisted index instead of scanning the file
+    reopened = MemoryMappedJSONL(path)
+    assert isinstance(reopened._offsets, memoryview)
+    assert list(reopened) == samples
+
+
+def test_index_is_rebuilt_when_the_file_changes(tmp_path):
+    path = tmp_path / "train.jsonl"
+    write_jsonl(path, [{"text": "a"}])
+    assert len(MemoryMappedJSONL(path)) == 1
+
+    write_jsonl(path, [{"text": "a"}, {"text": "bb"}])
+    split = MemoryMappedJSONL(path)
+    assert len(split) == 2
+    assert split[1] == {"text": "bb"}
+
+
+def test_sample_selector_works_on_memory_mapped_dataset(tmp_path):
+    for split in ["train", "test"]:
+        write_jsonl(
+            tmp_path / f"{split}.jsonl", [{"split": split, "i": i} for i in range(5)]
+        )
+    dataset = MemoryMappedDataset(
+        {split: tmp_path / f"{split}.jsonl" for split in ["train", "test"]}
+    )
+    component = DataComponent(dataset=dataset)
+
+    assert component.sample_selector_element._max == 4
+    component.sample_selector_element.value_on_backend = 3
+    component.on_dataset_change_callback()
+    assert component.loaded_sample == {"split": "train", "i": 3}
+    assert component.dataset_cache_statistics is not None
+    assert component.dataset_cache_statistics.size_bytes == 0
+
+
+def test_arrow_split(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / "train.arrow"
+    table = pa.table({"text": [f"text {i}" for i in range(10)]})
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_stream(
+        sink, table.schema
+    ) as writer:
+        for batch in table.to_batches(max_chunksize=3):
+            writer.write_batch(batch)
+
+    split = MemoryMappedDataset({"train": path})["train"]
+    assert len(split) == 10
+    assert split[7] == {"text": "text 7"}
@@ -0,0 +1,227 @@
+import threading
+
+import pytest
+
+from tests.stubs.generator_stub import GeneratorStub
+from visuallm.background_jobs import JobState
+from visuallm.component_base import ComponentBase
+from visuallm.components.mixins.model_selection_mixin import ModelSelectionMixin
+from visuallm.elements.plain_text_element import PlainTextElement
+from visuallm.resource_registry import resource_registry
+from visuallm.server import Server
+
+
+class ModelComponent(ComponentBase, ModelSelectionMixin):
+    def __init__(self, **kwargs):
+        super().__init__(name="model", title="Model")
+        ModelSelectionMixin.__init__(self, **kwargs)
+        self.text = PlainTextElement()
+        self.add_element(self.text)
+        self.add_elements(self.generator_selection_elements)
+
+    def __post_init__(self, *args, **kwargs):
+        self.when_generator_ready(self.on_generator_ready)
+
+    def on_generator_ready(self):
+        self.text.content = type(self.generator).__name__
+
+
+class GatedConstructor:
+
+    """Generator constructor which blocks until `release` is called."""
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.n_calls = 0
+
+    def release(self):
+        self.released.set()
+
+    def __call__(self):
+        self.n_calls += 1
+        self.released.wait(timeout=5)
+        return GeneratorStub()
+
+
+def failing_constructor():
+    raise ValueError("cannot load")
+
+
+def wait_until_loaded(component: ModelComponent):
+    for future in list(component._generator_futures.values()):
+        future.exception(timeout=5)
+
+
+def test_generator_is_loaded_on_background():
+    constructor = GatedConstructor()
+    component = ModelComponent(
+        generator_choices={"gated": constructor}, load_in_background=True
+    )
+    client = Server(__name__, [component]).app.test_client()
+
+    response = client.get("/model")
+    assert response.get_json() == {
+        "result": "loading",
+        "reason": "Loading generator 'gated'",
+    }
+    readiness = client.get("/readiness")
+    assert readiness.status_code == 503
+    assert component.generator_states == {"gated": JobState.LOADING}
+
+    constructor.release()
+    wait_until_loaded(component)
+
+    assert client.get("/readiness").status_code == 200
+    assert component.generator_states == {"gated": JobState.READY}
+    response = client.get("/model").get_json()
+    assert response["result"] == "success"
+    assert response["elementDescriptions"][0]["value"] == "GeneratorStub"
+
+
+def test_generator_property_waits_for_loading():
+    constructor = GatedConstructor()
+    component = ModelComponent(
+        generator_choices={"gated": constructor}, load_in_background=True
+    )
+    threading.Timer(0.05, constructor.release).start()
+
+    assert isinstance(component.generator, GeneratorStub)
+
+
+def test_failed_loading_is_reported():
+    component = ModelComponent(
+        generator_choices={"failing": failing_constructor}, load_in_background=True
+    )
+    client = Server(__name__, [component]).app.test_client()
+    wait_until_loaded(component)
+
+    response = client.get("/model").get_json()
+    assert response["result"] == "exception"
+    assert "cannot load" in response["reason"]
+    assert component.generator_states == {"failing": JobState.FAILED}
+    with pytest.raises(ValueError, match="cannot load"):
+        _ = component.generator
+
+
+def test_preloaded_generator_isnt_loaded_again():
+    first, second = GatedConstructor(), GatedConstructor()
+    first.release()
+    second.release()
+    component = ModelComponent(
+        generator_choices={"first": first, "second": second},
+        load_in_background=True,
+        preload_generators=True,
+    )
+    wait_until_loaded(component)
+    assert component.generator_states == {
+        "first": JobState.READY,
+        "second": JobState.READY,
+    }
+
+    component.generator_selector_element.value_on_backend = "second"
+    component.on_generator_change_callback()
+    assert second.n_calls == 1
+
+
+def test_selection_during_startup_isnt_replaced():
+    first = GatedConstructor()
+    second = GeneratorStub()
+    component = ModelComponent(
+        generator_choices={"first": first, "second": second},
+        load_in_background=True,
+    )
+
+    component.generator_selector_element.value_on_backend = "second"
+    component.on_generator_change_callback()
+    first.release()
+    wait_until_loaded(component)
+
+    assert component.generator is second
+
+
+def test_synchronous_loading():
+    component = ModelComponent(generator=GeneratorStub())
+
+    assert component.is_ready
+    assert component.text.content == "GeneratorStub"
+
+
+def test_preloading_requires_background_loading():
+    with pytest.raises(ValueError, match="preload_generators"):
+        ModelComponent(
+            generator_choices={"a": GeneratorStub()},
+            load_in_background=False,
+            preload_generators=True,
+        )
+
+
+class SizedGeneratorStub(GeneratorStub):
+    @property
+    def memory_footprint(self) -> int:
+        return 100
+
+
+class CountingConstructor:
+    def __init__(self):
+        self.n_calls = 0
+
+    def __call__(self):
+        self.n_calls += 1
+        return SizedGeneratorStub()
+
+
+def test_least_recently_selected_generator_is_evicted():
+    constructors = {name: CountingConstructor() for name in ["a", "b", "c"]}
+    component = ModelComponent(
+        generator_choices=constructors,
+        generator_cache_budget=250,
+    )
+
+    def select(name: str):
+        component.generator_selector_element.value_on_backend = name
+        component.on_generator_change_callback()
+
+    for name in ["b", "a", "c", "b"]:
+        select(name)
+
+    assert [c.n_calls for c in constructors.values()] == [1, 2, 1]
+    statistics = component.generator_cache_statistics
+    assert statistics is not None
+    # "a" is loaded on the startup, hence the second selection of "a" is a hit
+    assert (statistics.hits, statistics.misses, statistics.evictions) == (1, 4, 2)
+    assert statistics.size_bytes == 200
+    assert statistics.load_time > 0
+
+
+def test_preloading_doesnt_evict_selected_generator():
+    constructors = {name: CountingConstructor() for name in ["a", "b"]}
+    component = ModelComponent(
+        generator_choices=constructors,
+        generator_cache_budget=100,
+        load_in_background=True,
+        preload_generators=True,
+    )
+    wait_until_loaded(component)
+
+    # "b" doesn't fit into the budget next to the selected "a", hence it is
+    # evicted and released right after it is preloaded
+    assert list(component.generator_states) == ["a"]
+    assert "a" in component._cache
+    assert "b" not in component._cache
+    assert resource_registry.references("generator", "b", constructors["b"]) == 0
+
+    component.generator_selector_element.value_on_backend = "b"
+    component.on_generator_change_callback()
+    assert [c.n_calls for c in constructors.values()] == [1, 2]
+    # the previously selected generator is evicted once it isn't selected
+    assert "a" not in component._cache
+
+
+def test_shared_generator_is_loaded_once():
+    constructors = {"a": CountingConstructor()}
+    first = ModelComponent(generator_choices=constructors)
+    second = ModelComponent(generator_choices=constructors)
+
+    assert first.generator is second.generator
+    assert constructors["a"].n_calls == 1
+    assert resource_registry.references("generator", "a", constructors["a"]) == 2
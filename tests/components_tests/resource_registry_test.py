@@ -0,0 +1,87 @@
+from functools import partial
+
+import pytest
+
+from visuallm.resource_registry import ResourceRegistry
+from visuallm.utils.memory_budgeted_cache import MemoryBudgetedLRUCache
+
+
+def test_resource_is_dropped_after_last_release():
+    registry = ResourceRegistry()
+    constructor = object()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return object()
+
+    first = registry.acquire("generator", "a", constructor, load)
+    second = registry.acquire("generator", "a", constructor, load)
+    assert first is second
+    assert len(loads) == 1
+
+    registry.release("generator", "a", constructor)
+    assert registry.references("generator", "a", constructor) == 1
+    registry.release("generator", "a", constructor)
+    assert len(registry) == 0
+
+    registry.acquire("generator", "a", constructor, load)
+    assert len(loads) == 2
+
+
+def test_failed_load_isnt_registered():
+    registry = ResourceRegistry()
+
+    def load():
+        raise ValueError("cannot load")
+
+    with pytest.raises(ValueError, match="cannot load"):
+        registry.acquire("dataset", "a", load, load)
+    assert len(registry) == 0
+    with pytest.raises(KeyError):
+        registry.release("dataset", "a", load)
+
+
+def test_replaced_cache_entry_releases_its_reference():
+    registry = ResourceRegistry()
+    constructor = object()
+    cache: MemoryBudgetedLRUCache[str, object] = MemoryBudgetedLRUCache(
+        size_of=lambda _: 0,
+        on_evict=lambda name, _: registry.release("generator", name, constructor),
+    )
+
+    # e.g. two loads of the same key which both acquired the resource
+    for _ in range(2):
+        cache.put("a", registry.acquire("generator", "a", constructor, object))
+    assert registry.references("generator", "a", constructor) == 1
+
+    cache.clear()
+    assert len(registry) == 0
+
+
+def load_dataset(path: str) -> dict:
+    return {"train": [{"path": path}]}
+
+
+def test_functions_are_identified_by_their_qualified_names():
+    registry = ResourceRegistry()
+    loaders = [lambda: load_dataset("a") for _ in range(2)]
+
+    first = registry.acquire("dataset", "a", loaders[0], loaders[0])
+    assert registry.acquire("dataset", "a", loaders[1], loaders[1]) is first
+    assert registry.references("dataset", "a", loaders[0]) == 2
+
+    other = partial(load_dataset, "b")
+    assert registry.acquire("dataset", "a", other, other) is not first
+    assert registry.acquire("dataset", "a", partial(load_dataset, "b"), other) == {
+        "train": [{"path": "b"}]
+    }
+    assert len(registry) == 2
+
+
+def test_objects_are_identified_by_themselves():
+    registry = ResourceRegistry()
+    first, second = {"train": []}, {"train": []}
+
+    assert registry.acquire("dataset", "a", first, lambda: first) is first
+    assert registry.acquire("dataset", "a", second, lambda: second) is second
@@ -0,0 +1,129 @@
+import time
+
+from tests.stubs.generator_stub import GeneratorStub
+from visuallm.components.dataset_visualization_component import (
+    DatasetVisualizationComponent,
+)
+from visuallm.components.search_index import SearchIndex
+
+TEXTS = ["The quick brown fox", "a lazy dog", "quick dog, QUICK!", ""]
+
+
+def test_search_index_intersects_words():
+    index = SearchIndex.build(TEXTS)
+
+    assert index.search("quick") == [0, 2]
+    assert index.search("Quick  DOG") == [2]
+    assert index.search("cat") == []
+    assert index.search("") == []
+
+
+def test_search_index_is_persisted(tmp_path):
+    path = tmp_path / "split.index"
+    SearchIndex.build(TEXTS).save(path, key="text")
+
+    assert SearchIndex.load(path, key="other") is None
+    index = SearchIndex.load(path, key="text")
+    assert index is not None
+    assert index.n_documents == len(TEXTS)
+    assert index.search("quick dog") == [2]
+    assert index.search("quick") == [0, 2]
+
+
+def wait_until_built(component: DatasetVisualizationComponent):
+    deadline = time.monotonic() + 5
+    while not all(job.finished for job in component.background_jobs.values()):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def create_component(**kwargs) -> DatasetVisualizationComponent:
+    dataset = {
+        "train": [{"text": text, "target": str(i)} for i, text in enumerate(TEXTS)]
+    }
+    component = DatasetVisualizationComponent(
+        generator=GeneratorStub(), dataset=dataset, enable_search=True, **kwargs
+    )
+    wait_until_built(component)
+    return component
+
+
+def search(component: DatasetVisualizationComponent, query: str):
+    component.search_query_element.value_on_backend = query
+    component.on_search_callback()
+
+
+def test_search_goes_over_matching_samples():
+    component = create_component()
+
+    search(component, "quick")
+    assert component.loaded_sample["target"] == "2"
+    assert component.search_results_element.content == "2 samples match 'quick': 0, 2"
+    search(component, "quick")
+    assert component.loaded_sample["target"] == "0"
+    assert component.text_to_tokenizer_element.content == TEXTS[0]
+
+    search(component, "cat")
+    assert component.search_results_element.content == "No sample matches 'cat'."
+    assert component.loaded_sample["target"] == "0"
+
+
+def test_search_fields_and_index_dir(tmp_path):
+    create_component(search_fields=["target"], search_index_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    component = create_component(
+        search_fields=["target"], search_index_dir=str(tmp_path)
+    )
+    search(component, "3")
+    assert component.loaded_sample["target"] == "3"
+
+
+class TargetTextGeneratorStub(GeneratorStub):
+    def create_text_to_tokenizer(self, loaded_sample, target=None):  # type: ignore[override]
+        return loaded_sample["target"]
+
+
+def test_index_follows_selected_generator(tmp_path):
+    dataset = {
+        "train": [{"text": text, "target": str(i)} for i, text in enumerate(TEXTS)]
+    }
+    component = DatasetVisualizationComponent(
+        generator_choices={
+            "text": GeneratorStub(),
+            "target": TargetTextGeneratorStub(),
+        },
+        dataset=dataset,
+        enable_search=True,
+        search_index_dir=str(tmp_path),
+    )
+    wait_until_built(component)
+    search(component, "quick")
+    assert component.loaded_sample["target"] == "2"
+
+    component.generator_selector_element.value_on_backend = "target"
+    component.on_generator_change_callback()
+    wait_until_built(component)
+    search(component, "quick")
+    assert component.search_results_element.content == "No sample matches 'quick'."
+    search(component, "3")
+    assert component.loaded_sample["target"] == "3"
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_index_of_changed_dataset_isnt_reused(tmp_path):
+    create_component(search_index_dir=str(tmp_path))
+    # only a sample in the middle of the split changes
+    samples = [{"text": text, "target": str(i)} for i, text in enumerate(TEXTS)]
+    samples[1] = {"text": "a lazy cat", "target": "1"}
+    component = DatasetVisualizationComponent(
+        generator=GeneratorStub(),
+        dataset={"train": samples},
+        enable_search=True,
+        search_index_dir=str(tmp_path),
+    )
+    wait_until_built(component)
+
+    search(component, "cat")
+    assert component.loaded_sample["target"] == "1"
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,158 @@
+import time
+
+import pytest
+
+from tests.stubs.generator_stub import GeneratorStub
+from visuallm.components.dataset_visualization_component import (
+    DatasetVisualizationComponent,
+)
+from visuallm.components.embedding_index import EmbeddingIndex
+
+np = pytest.importorskip("numpy")
+
+WORDS = ["cat", "dog", "fish", "bird"]
+
+
+def encode(texts: list[str]):
+    """Bag of words embeddings over `WORDS`."""
+    return [[text.split().count(word) + 0.01 for word in WORDS] for text in texts]
+
+
+TEXTS = ["cat cat", "dog", "cat cat fish", "bird", "dog dog bird", "cat"]
+
+
+def test_nearest_rows_by_cosine_similarity(tmp_path):
+    index = EmbeddingIndex(tmp_path, len(TEXTS))
+    index.update(TEXTS.__getitem__, encode, batch_size=4)
+
+    nearest = index.nearest(0, k=2)
+    assert [row for row, _ in nearest] == [5, 2]
+    assert nearest[0][1] == pytest.approx(1.0, abs=1e-3)
+
+
+def test_computation_is_resumed(tmp_path):
+    index = EmbeddingIndex(tmp_path, len(TEXTS))
+
+    def failing_encode(texts):
+        if "bird" in texts:
+            raise ValueError("encoder failed")
+        return encode(texts)
+
+    with pytest.raises(ValueError, match="encoder failed"):
+        index.update(TEXTS.__getitem__, failing_encode, batch_size=2)
+    assert index.n_done == 2
+    # only the computed rows are searched
+    assert [row for row, _ in index.nearest(1, k=5)] == [0]
+
+    encoded = []
+    resumed = EmbeddingIndex(tmp_path, len(TEXTS))
+    resumed.update(
+        TEXTS.__getitem__, lambda texts: encoded.extend(texts) or encode(texts)
+    )
+    assert encoded == TEXTS[2:]
+    assert resumed.complete
+
+    # another key invalidates the stored embeddings
+    assert EmbeddingIndex(tmp_path, len(TEXTS), key="other").n_done == 0
+
+
+def test_partitioned_search_matches_exact_search(tmp_path):
+    rng = np.random.default_rng(1)
+    centers = rng.normal(size=(4, 16))
+    vectors = np.concatenate([c + 0.05 * rng.normal(size=(50, 16)) for c in centers])
+    index = EmbeddingIndex(tmp_path, len(vectors))
+    index.update(lambda row: str(row), lambda texts: vectors[[int(t) for t in texts]])
+    exact = index.nearest(0, k=5)
+
+    index.build_partitions(n_partitions=4)
+    assert index.nearest(0, k=5, n_probe=1) == pytest.approx(exact)
+    reopened = EmbeddingIndex(tmp_path, len(vectors))
+    assert reopened.n_partitions == 4
+    assert reopened.nearest(0, k=5, n_probe=1) == pytest.approx(exact)
+
+
+def wait_until_computed(component: DatasetVisualizationComponent):
+    deadline = time.monotonic() + 5
+    while not all(job.finished for job in component.background_jobs.values()):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def create_component(texts: list[str], embeddings_dir: str | None):
+    dataset = {"train": [{"text": text, "target": ""} for text in texts]}
+    component = DatasetVisualizationComponent(
+        generator=GeneratorStub(),
+        dataset=dataset,
+        embedding_encoder=encode,
+        embeddings_dir=embeddings_dir,
+    )
+    wait_until_computed(component)
+    return component
+
+
+def test_similar_samples_are_displayed(tmp_path):
+    component = create_component(TEXTS, str(tmp_path))
+
+    component.on_similar_samples_callback()
+    table = component.similar_samples_table.tables[0]
+    assert table.headers == ("Sample", "Similarity", "Text")
+    assert [row[0] for row in table.rows[:2]] == ["5", "2"]
+    assert table.rows[0][2] == "cat"
+
+
+def test_embeddings_of_changed_dataset_arent_reused(tmp_path):
+    create_component(TEXTS, str(tmp_path))
+    component = create_component(list(reversed(TEXTS)), str(tmp_path))
+
+    component.on_similar_samples_callback()
+    table = component.similar_samples_table.tables[0]
+    assert [row[0] for row in table.rows[:2]] == ["5", "3"]
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_temporary_embeddings_dir_is_removed():
+    component = create_component(TEXTS, None)
+    embeddings_dir = component.embedding_index().directory.parent
+    assert embeddings_dir.exists()
+
+    component.cleanup_embeddings()
+    assert not embeddings_dir.exists()
+
+
+def test_embeddings_of_changed_sample_arent_reused(tmp_path):
+    create_component(TEXTS, str(tmp_path))
+    # only a sample in the middle of the split changes
+    texts = [*TEXTS[:4], "cat cat", TEXTS[5]]
+    component = create_component(texts, str(tmp_path))
+
+    component.on_similar_samples_callback()
+    table = component.similar_samples_table.tables[0]
+    assert [row[0] for row in table.rows[:2]] == ["4", "5"]
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+class ReversedTextGeneratorStub(GeneratorStub):
+    def create_text_to_tokenizer(self, loaded_sample, target=None):  # type: ignore[override]
+        return " ".join(reversed(WORDS)) if loaded_sample["text"] == "bird" else "fish"
+
+
+def test_embeddings_follow_selected_generator(tmp_path):
+    component = DatasetVisualizationComponent(
+        generator_choices={
+            "text": GeneratorStub(),
+            "reversed": ReversedTextGeneratorStub(),
+        },
+        dataset={"train": [{"text": text, "target": ""} for text in TEXTS]},
+        embedding_encoder=encode,
+        embeddings_dir=str(tmp_path),
+    )
+    wait_until_computed(component)
+
+    component.generator_selector_element.value_on_backend = "reversed"
+    component.on_generator_change_callback()
+    wait_until_computed(component)
+
+    component.on_similar_samples_callback()
+    table = component.similar_samples_table.tables[0]
+    assert {row[2] for row in table.rows} == {"fish", "bird fish dog cat"}
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,146 @@
+from array import array
+
+import pytest
+from flask import Flask
+
+from visuallm import ComponentBase
+from visuallm.elements import BarChartElement, barchart_element
+from visuallm.elements.barchart_element import BarChartColumns, PieceInfo
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def has_numpy(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(barchart_element, "_has_numpy", request.param)
+    return request.param
+
+
+def test_columns_are_flattened(has_numpy):
+    columns = BarChartColumns.create(
+        piece_titles=["a", "b"],
+        bar_heights=[[10, 20.5], [30, 100]],
+        bar_names=["x", "y"],
+        bar_annotations=[["1", "2"], ["3", "4"]],
+    )
+
+    assert columns.bar_heights == array("d", [10.0, 20.5, 30.0, 100.0])
+    assert columns.bar_annotations == ["1", "2", "3", "4"]
+    assert columns.piece_infos() == [
+        PieceInfo(
+            pieceTitle="a",
+            barHeights=[10.0, 20.5],
+            barAnnotations=["1", "2"],
+            barNames=["x", "y"],
+        ),
+        PieceInfo(
+            pieceTitle="b",
+            barHeights=[30.0, 100.0],
+            barAnnotations=["3", "4"],
+            barNames=["x", "y"],
+        ),
+    ]
+
+
+def test_empty_columns(has_numpy):
+    columns = BarChartColumns.create(
+        piece_titles=[], bar_heights=[], bar_names=["x"], bar_annotations=[]
+    )
+    assert columns.bar_heights == array("d")
+
+    columns = BarChartColumns.create(
+        piece_titles=["a"], bar_heights=[[]], bar_names=[], bar_annotations=[[]]
+    )
+    assert columns.piece_infos()[0].barHeights == []
+
+
+@pytest.mark.parametrize(
+    "bar_heights",
+    [
+        [[10, 20], [30]],
+        [[10, 20]],
+        [[10, 20, 30], [40, 50, 60]],
+    ],
+)
+def test_invalid_shape_of_heights(has_numpy, bar_heights):
+    with pytest.raises(ValueError):
+        BarChartColumns.create(
+            piece_titles=["a", "b"],
+            bar_heights=bar_heights,
+            bar_names=["x", "y"],
+            bar_annotations=[["1", "2"], ["3", "4"]],
+        )
+
+
+@pytest.mark.parametrize("height", [-1, 100.5, float("nan")])
+def test_invalid_height(has_numpy, height):
+    with pytest.raises(ValueError, match="between 0 and 100"):
+        BarChartColumns.create(
+            piece_titles=["a", "b"],
+            bar_heights=[[10], [height]],
+            bar_names=["x"],
+            bar_annotations=[["1"], ["2"]],
+        )
+
+
+def test_invalid_shape_of_annotations():
+    with pytest.raises(ValueError, match="bar_annotations"):
+        BarChartColumns.create(
+            piece_titles=["a", "b"],
+            bar_heights=[[10], [20]],
+            bar_names=["x"],
+            bar_annotations=[["1"], ["2", "3"]],
+        )
+
+
+def test_columns_are_serialized_instead_of_pieces():
+    element = BarChartElement()
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(element)
+    element.set_piece_infos(
+        [PieceInfo(pieceTitle="a", barHeights=[1], barAnnotations=["1"], barNames=[""])]
+    )
+    assert element.construct_element_description()["bar_columns"] is None
+
+    element.set_columns(
+        BarChartColumns.create(
+            piece_titles=["a", "b"],
+            bar_heights=[[10], [20]],
+            bar_names=[""],
+            bar_annotations=[["10%"], ["20%"]],
+        )
+    )
+
+    description = element.construct_element_description()
+    assert description["piece_infos"] == []
+    assert description["bar_columns"] == {
+        "piece_titles": ["a", "b"],
+        "bar_names": [""],
+        "bar_heights": array("d", [10.0, 20.0]),
+        "bar_annotations": ["10%", "20%"],
+    }
+    assert [piece.pieceTitle for piece in element.piece_infos] == ["a", "b"]
+
+    with Flask(__name__).test_request_context():
+        description = element.construct_element_description()
+    # the frontend without the columnar layout receives the pieces
+    assert description["bar_columns"] is None
+    assert [piece.barHeights for piece in description["piece_infos"]] == [
+        [10.0],
+        [20.0],
+    ]
+
+
+def test_changed_layout_is_described():
+    element = BarChartElement()
+    description = element.construct_element_description()
+    assert not description["long_contexts"]
+    assert not description["selectable"]
+
+    element.long_contexts = True
+    element.processing_callback = lambda: None
+
+    assert element.changed
+    description = element.construct_element_description()
+    assert description["long_contexts"]
+    assert description["selectable"]
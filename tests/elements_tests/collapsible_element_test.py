@@ -0,0 +1,151 @@
+from flask import Flask
+
+from tests.elements_tests.custom_request_mixin import CustomRequestMixin
+from visuallm import ComponentBase
+from visuallm.elements import ButtonElement, PlainTextElement
+from visuallm.elements.collapsible_element import CollapsibleElement
+from visuallm.elements.selector_elements import CheckBoxSubElement
+
+
+class ButtonElementStub(CustomRequestMixin, ButtonElement):
+
+    """Stub that instead of real request json returns something that test user specifies."""
+
+
+def test_description_is_cached_until_changed():
+    element = PlainTextElement(content="first")
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(element)
+
+    first = element.construct_element_description()
+    assert element.construct_element_description() is first
+
+    element.content = "second"
+    second = element.construct_element_description()
+    assert second is not first
+    assert second["value"] == "second"
+
+
+def test_collapsible_composes_cached_subelement_descriptions():
+    # arrange
+    text = PlainTextElement(content="text", name="text")
+    button = ButtonElementStub(
+        returned_response={"check_box": True},
+        processing_callback=lambda: None,
+        subelements=[CheckBoxSubElement("check")],
+    )
+    collapsible = CollapsibleElement(name="collapsible", subelements=[text, button])
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(collapsible)
+
+    # assert
+    first = parent_component.fetch_info()["elementDescriptions"][0]
+    text_description, button_description = first["subelements"]
+    assert text_description["name"] == "collapsible>>text"
+    assert button_description["subelement_configs"][0].parent_name == (
+        "collapsible>>button"
+    )
+    # the cached descriptions of the subelements are left intact
+    assert text.construct_element_description()["name"] == "text"
+    assert button.construct_element_description()["subelement_configs"][0] is not (
+        button_description["subelement_configs"][0]
+    )
+
+    assert parent_component.fetch_info()["elementDescriptions"][0] is first
+
+    button.endpoint_callback()
+    second = parent_component.fetch_info()["elementDescriptions"][0]
+    assert second is not first
+    assert second["subelements"][0] == text_description
+    assert second["subelements"][1]["subelement_configs"][0].configuration["selected"]
+
+
+def test_collapsible_subelements_are_sorted_when_added():
+    first = PlainTextElement(content="first", name="first")
+    second = PlainTextElement(content="second", name="second")
+    collapsible = CollapsibleElement(name="collapsible")
+    collapsible.add_subelement(second, order=2)
+    collapsible.add_subelement(first, order=1)
+
+    assert collapsible.subelements == [first, second]
+    names = [
+        d["name"] for d in collapsible.construct_element_description()["subelements"]
+    ]
+    assert names == ["collapsible>>first", "collapsible>>second"]
+
+
+def test_collapsible_update_contains_only_changed_subelements():
+    # arrange
+    text = PlainTextElement(content="text", name="text")
+    other = PlainTextElement(content="other", name="other")
+    button = ButtonElementStub(
+        returned_response={"check_box": True},
+        processing_callback=lambda: None,
+        subelements=[CheckBoxSubElement("check")],
+    )
+    collapsible = CollapsibleElement(
+        name="collapsible", subelements=[text, button, other]
+    )
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(collapsible)
+    parent_component.fetch_info()
+
+    # act
+    other.content = "changed"
+    response = button.endpoint_callback()
+
+    # assert
+    (update,) = response["elementDescriptions"]
+    assert "subelements" not in update
+    assert update["version"] == collapsible.version
+    button_update, other_update = update["updated_subelements"]
+    assert button_update["name"] == "collapsible>>button"
+    assert button_update["subelement_configs"][0].parent_name == ("collapsible>>button")
+    assert other_update["name"] == "collapsible>>other"
+    assert other_update["value"] == "changed"
+    assert not collapsible.changed
+    assert not other.changed
+
+    # nothing changed since the update
+    assert parent_component.fetch_info(fetch_all=False)["elementDescriptions"] == []
+
+
+def test_collapsible_sends_whole_description_to_frontend_without_deltas():
+    text = PlainTextElement(content="text", name="text")
+    collapsible = CollapsibleElement(name="collapsible", subelements=[text])
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(collapsible)
+    parent_component.fetch_info()
+
+    text.content = "changed"
+    with Flask(__name__).test_request_context():
+        (update,) = parent_component.fetch_info(fetch_all=False)["elementDescriptions"]
+    assert "updated_subelements" not in update
+    assert update["subelements"][0]["value"] == "changed"
+
+
+def test_collapsible_own_change_sends_whole_description():
+    text = PlainTextElement(content="text", name="text")
+    collapsible = CollapsibleElement(name="collapsible", subelements=[text])
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(collapsible)
+    parent_component.fetch_info()
+
+    text.content = "changed"
+    collapsible.title = "new title"
+
+    (update,) = parent_component.fetch_info(fetch_all=False)["elementDescriptions"]
+    assert update["title"] == "new title"
+    assert update["subelements"][0]["value"] == "changed"
+
+
+def test_collapsible_subelement_changed_before_first_description():
+    text = PlainTextElement(content="text", name="text")
+    collapsible = CollapsibleElement(name="collapsible", subelements=[text])
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(collapsible)
+
+    text.content = "changed"
+
+    (update,) = parent_component.fetch_info(fetch_all=False)["elementDescriptions"]
+    assert update["subelements"][0]["value"] == "changed"
@@ -118,3 +118,16 @@ def test_convert_backticks_3():
         element.content
         == "<code></code><code>madness</code> from code<code> perspective</code>"
     )
+
+
+def test_changed_heading_is_described():
+    element = PlainTextElement(content="text")
+    assert not element.construct_element_description()["heading"]
+
+    element.is_heading = True
+    element.heading_level = 2
+
+    assert element.changed
+    description = element.construct_element_description()
+    assert description["heading"]
+    assert description["heading_level"] == 2
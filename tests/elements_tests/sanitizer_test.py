@@ -0,0 +1,52 @@
+import random
+import re
+
+import pytest
+
+from visuallm.elements.table_element import TableElement
+from visuallm.utils.sanitizer import Sanitizer
+
+
+def reference_sanitize_str(value: str) -> str:
+    """The straightforward implementation, one pass per conversion."""
+    value = value.replace("<", "&lt;")
+    value = value.replace(">", "&gt;")
+    value = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", value)
+    value = re.sub(r"\*(.+?)\*", r"<em>\1</em>", value)
+    value = value.replace("\n", "<br />")
+    value = re.sub(r"`([^`]*)`", r"<code>\1</code>", value)
+    return value
+
+
+def random_texts(n_texts: int, seed: int = 0):
+    rng = random.Random(seed)  # noqa: S311 (seeded fuzzing inputs)
+    alphabet = ["a", "b", " ", "*", "**", "`", "<", ">", "\n", "<b>", "ü"]
+    for _ in range(n_texts):
+        yield "".join(rng.choices(alphabet, k=rng.randint(0, 20)))
+
+
+@pytest.mark.parametrize("text", list(random_texts(2000)))
+def test_sanitize_matches_reference(text):
+    sanitized = Sanitizer.sanitize(text)
+    assert sanitized == reference_sanitize_str(text)
+    assert Sanitizer.is_sane(sanitized)
+
+
+def test_long_texts_are_sanitized():
+    text = "**bold** <tag> `code`\n" * 100
+    assert Sanitizer.sanitize(text) == reference_sanitize_str(text)
+
+
+def test_is_sane():
+    assert Sanitizer.is_sane("<b>bold</b><br /><em>a</em><code>b</code>")
+    assert not Sanitizer.is_sane("<script>")
+    assert not Sanitizer.is_sane("<b>a</b>>")
+
+
+def test_table_cells_are_sanitized():
+    element = TableElement()
+    element.add_table("<Title>", ["a", 1], [["*x*", 2], ["<y>", True]])
+    table = element.tables[0]
+    assert table.title == "&lt;Title&gt;"
+    assert table.headers == ("a", "1")
+    assert table.rows == (("<em>x</em>", "2"), ("&lt;y&gt;", "True"))
@@ -0,0 +1,174 @@
+import dataclasses
+
+import pytest
+from flask import Flask
+
+from tests.elements_tests.custom_request_mixin import CustomRequestMixin
+from visuallm import ComponentBase
+from visuallm.elements.table_element import LinkBetweenRows, Table, TableElement
+from visuallm.utils.client_features import FEATURES_HEADER, TABLE_WINDOWS
+
+
+class TableElementStub(CustomRequestMixin, TableElement):
+
+    """Stub that instead of real request json returns something that test user specifies."""
+
+
+def create_table(page_size: int | None, request: dict) -> TableElementStub:
+    element = TableElementStub(returned_response=request, page_size=page_size)
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(element)
+    element.add_table("small", ["i"], [[str(i)] for i in range(3)])
+    element.add_table(
+        "large", ["i", "square"], [[str(i), str(i * i)] for i in range(100)]
+    )
+    element.add_link_between_rows(LinkBetweenRows("small", 1, "large", 90))
+    return element
+
+
+def test_all_rows_are_described_without_paging():
+    element = create_table(page_size=None, request={})
+    description = element.construct_element_description()
+    assert description["page_size"] is None
+    assert [len(t["rows"]) for t in description["tables"]] == [3, 100]
+    assert [t["total_rows"] for t in description["tables"]] == [3, 100]
+
+
+def test_only_first_page_is_described():
+    element = create_table(page_size=10, request={})
+    description = element.construct_element_description()
+    assert description["page_size"] == 10
+    assert [len(t["rows"]) for t in description["tables"]] == [3, 10]
+    assert [t["total_rows"] for t in description["tables"]] == [3, 100]
+    assert description["tables"][1]["rows"][9] == ("9", "81")
+    # the links refer to the stable indices of the rows, not to the first page
+    assert description["links"][0].EndRow == 90
+
+
+def test_changed_page_size_is_described():
+    element = create_table(page_size=None, request={})
+    element.construct_element_description()
+
+    element.page_size = 10
+
+    assert element.changed
+    description = element.construct_element_description()
+    assert [len(t["rows"]) for t in description["tables"]] == [3, 10]
+    with pytest.raises(ValueError):
+        element.page_size = 0
+
+
+def test_all_rows_are_described_to_frontend_without_windows():
+    element = create_table(page_size=10, request={})
+    app = Flask(__name__)
+    with app.test_request_context(headers={FEATURES_HEADER: TABLE_WINDOWS}):
+        paged = element.construct_element_description()
+    with app.test_request_context():
+        description = element.construct_element_description()
+    assert paged["page_size"] == 10
+    assert description["page_size"] is None
+    assert [len(t["rows"]) for t in description["tables"]] == [3, 100]
+
+
+def test_window_of_rows_is_returned():
+    element = create_table(page_size=10, request={"table": 1, "start": 85, "count": 10})
+    response = element.endpoint_callback()
+    assert response["result"] == "success"
+    assert response["version"] == element.version
+    assert (response["start"], response["total_rows"]) == (85, 100)
+    assert response["rows"] == tuple((str(i), str(i * i)) for i in range(85, 95))
+
+
+def test_window_after_the_end_is_truncated():
+    element = create_table(page_size=10, request={"table": 1, "start": 95, "count": 10})
+    assert len(element.endpoint_callback()["rows"]) == 5
+
+
+def test_invalid_window_request():
+    element = create_table(page_size=10, request={"table": 5, "start": 0, "count": 10})
+    response = element.endpoint_callback()
+    assert response["result"] == "exception"
+
+
+def test_table_is_normalized_once():
+    rows = [[1, "*a*"]]
+    table = Table.create("title", ["number", "text"], rows)
+    rows[0][0] = 2
+    assert table.rows == (("1", "<em>a</em>"),)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        table.title = "changed"  # type: ignore[misc]
+
+
+def test_descriptions_of_unchanged_tables_are_reused():
+    element = create_table(page_size=None, request={})
+    first = element.construct_element_description()["tables"]
+    element.add_table("another", ["i"], [[0]])
+    second = element.construct_element_description()["tables"]
+    assert second[0] is first[0]
+    assert second[1] is first[1]
+
+
+def test_only_appended_rows_are_sent():
+    element = create_table(page_size=None, request={})
+    element.construct_element_description()
+    base_version = element.version
+
+    element.append_rows("small", [[3], ["*4*"]])
+    element.append_rows("small", [[5]])
+    update = element.construct_element_update()
+    assert update["base_version"] == base_version
+    assert update["version"] == element.version
+    assert update["appended_rows"] == [
+        {
+            "table": 0,
+            "start": 3,
+            "rows": (("3",), ("<em>4</em>",), ("5",)),
+            "total_rows": 6,
+        }
+    ]
+    assert not element.changed
+    assert element.tables[0].rows[-1] == ("5",)
+    assert element.construct_element_description()["tables"][0]["total_rows"] == 6
+
+
+def test_whole_description_is_sent_after_other_changes():
+    element = create_table(page_size=None, request={})
+    element.construct_element_description()
+    element.append_rows("small", [[3]])
+    element.add_table("another", ["i"], [[0]])
+    assert "appended_rows" not in element.construct_element_update()
+
+    # the rows appended to the element which wasn't sent are in its description
+    element.add_table("yet another", ["i"], [[0]])
+    element.append_rows("small", [[4]])
+    update = element.construct_element_update()
+    assert update["tables"][0]["total_rows"] == 5
+
+
+def test_whole_description_is_sent_to_frontend_without_deltas():
+    element = create_table(page_size=None, request={})
+    element.construct_element_description()
+    element.append_rows("small", [[3]])
+
+    with Flask(__name__).test_request_context():
+        update = element.construct_element_update()
+    assert "appended_rows" not in update
+    assert update["tables"][0]["total_rows"] == 4
+    # the appended rows are part of the sent description
+    assert "appended_rows" not in element.construct_element_update()
+
+
+def test_appended_rows_after_first_page_are_requested_by_frontend():
+    element = create_table(page_size=10, request={})
+    element.construct_element_description()
+    element.append_rows("small", [[i] for i in range(3, 15)])
+    element.append_rows("large", [[100, 10000]])
+    appended_rows = element.construct_element_update()["appended_rows"]
+    assert [len(a["rows"]) for a in appended_rows] == [7, 0]
+    assert [a["total_rows"] for a in appended_rows] == [15, 101]
+
+
+def test_whole_element_is_returned_on_request():
+    element = create_table(page_size=10, request={})
+    response = element.endpoint_callback()
+    assert response["elementDescriptions"][0]["name"] == element.name
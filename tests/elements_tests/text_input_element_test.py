@@ -73,3 +73,27 @@ def test_on_button_text_change():
 
     text_input_config = button_config["subelement_configs"][0].configuration
     assert text_input_config["selected"] == ""
+
+
+def test_text_input_version_bumped_only_on_update():
+    # arrange
+    text_input_element = TextInputSubElement(blank_after_text_send=True)
+    button_element = ButtonElementStub(
+        returned_response={text_input_element.name: "Something"},
+        processing_callback=lambda: None,
+        subelements=[text_input_element],
+    )
+    parent_component = ComponentBase(name="base", title="base")
+    parent_component.add_element(button_element)
+
+    # assert
+    first = parent_component.fetch_info(fetch_all=True)
+    second = parent_component.fetch_info(fetch_all=True)
+    assert first == second
+
+    returned_value = button_element.endpoint_callback()
+    button_config = returned_value["elementDescriptions"][0]
+    text_input_config = button_config["subelement_configs"][0].configuration
+    assert text_input_config["version"] == text_input_element.version == 1
+    assert button_config["version"] == button_element.version
+    assert button_config["version"] > first["elementDescriptions"][0]["version"]
@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ["torch", "transformers", "openai", "numpy", "datasets"]
+
+IMPORT_TIME_BUDGET = float(os.getenv("VISUALLM_IMPORT_TIME_BUDGET", "1.0"))
+"""Maximal number of seconds that the import of the library may take,
+can be adjusted on slow CI machines."""
+
+MEASURE_IMPORT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import visuallm
+import visuallm.elements
+import visuallm.server
+duration = time.perf_counter() - start
+
+print(json.dumps({"duration": duration, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_import():
+    # a fresh interpreter, so that no module is already imported
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", MEASURE_IMPORT],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_doesnt_load_heavy_modules():
+    modules = measure_import()["modules"]
+
+    loaded = [m for m in modules if m.split(".")[0] in HEAVY_MODULES]
+    assert loaded == []
+    assert "visuallm.components.generation_component" not in modules
+
+
+def test_import_time_is_within_budget():
+    assert measure_import()["duration"] < IMPORT_TIME_BUDGET
+
+
+def test_components_are_loaded_on_first_access():
+    import visuallm
+
+    assert visuallm.GenerationComponent.__name__ == "GenerationComponent"
+    assert "GenerationComponent" in dir(visuallm)
@@ -0,0 +1,150 @@
+import pytest
+
+from visuallm.component_base import ComponentBase
+from visuallm.elements import (
+    ButtonElement,
+    CollapsibleElement,
+    PlainTextElement,
+    TableElement,
+)
+from visuallm.elements.barchart_element import BarChartElement, PieceInfo
+from visuallm.elements.selector_elements import TextInputSubElement
+from visuallm.server import Server
+
+
+class BatchComponent(ComponentBase):
+    def __init__(self):
+        super().__init__(name="steps", title="Steps")
+        self.calls: list[str] = []
+        self.text = PlainTextElement("", name="text")
+        self.untouched = PlainTextElement("untouched", name="untouched")
+        self.text_input = TextInputSubElement()
+        self.button = ButtonElement(
+            processing_callback=self.on_button,
+            subelements=[self.text_input],
+            name="button",
+        )
+        self.nested_button = ButtonElement(
+            processing_callback=lambda: self.calls.append("nested"),
+            name="nested_button",
+        )
+        self.barchart = BarChartElement(
+            processing_callback=self.on_barchart, name="barchart"
+        )
+        self.barchart.set_piece_infos(
+            [
+                PieceInfo(
+                    pieceTitle=token,
+                    barHeights=[50],
+                    barAnnotations=[""],
+                    barNames=[""],
+                )
+                for token in ["a", "b"]
+            ]
+        )
+        self.add_elements(
+            [
+                self.text,
+                self.untouched,
+                self.button,
+                self.barchart,
+                TableElement(name="table"),
+                CollapsibleElement(
+                    name="collapsible", subelements=[self.nested_button]
+                ),
+            ]
+        )
+
+    def on_button(self):
+        self.calls.append(f"button {self.text_input.value_from_frontend}")
+        self.text.content += self.text_input.value_from_frontend
+
+    def on_barchart(self):
+        self.calls.append(f"barchart {self.barchart.selected}")
+        self.text.content += self.barchart.selected
+
+
+@pytest.fixture()
+def component():
+    return BatchComponent()
+
+
+@pytest.fixture()
+def client(component):
+    client = Server(__name__, [component]).app.test_client()
+    client.get("/steps")
+    return client
+
+
+def test_actions_are_applied_in_order_with_one_merged_diff(client, component):
+    response = client.post(
+        "/batch",
+        json={
+            "component": "steps",
+            "actions": [
+                {"address": "button", "data": {"text_input": "x"}},
+                {"address": "barchart", "data": {"selected": "b"}},
+                {"address": "/button", "data": {"text_input": "y"}},
+                {"address": "nested_button"},
+            ],
+        },
+    ).get_json()
+
+    assert response["result"] == "success"
+    assert component.calls == ["button x", "barchart b", "button y", "nested"]
+    descriptions = {d["name"]: d for d in response["elementDescriptions"]}
+    assert descriptions["text"]["value"] == "xby"
+    assert "untouched" not in descriptions
+    assert set(descriptions) == {"text", "button", "barchart"}
+
+
+def test_failing_action_stops_the_batch(client, component):
+    response = client.post(
+        "/batch",
+        json={
+            "component": "steps",
+            "actions": [
+                {"address": "button", "data": {"text_input": "x"}},
+                {"address": "missing"},
+                {"address": "button", "data": {"text_input": "y"}},
+            ],
+        },
+    ).get_json()
+
+    assert response["result"] == "exception"
+    assert "missing" in response["reason"]
+    assert component.calls == ["button x"]
+
+
+def test_element_without_action(client, component):
+    response = client.post(
+        "/batch",
+        json={"component": "steps", "actions": [{"address": "table"}]},
+    ).get_json()
+    assert response["result"] == "exception"
+    assert "doesn't support actions" in response["reason"]
+
+
+def test_unknown_component(client):
+    response = client.post("/batch", json={"component": "other", "actions": []})
+    assert response.status_code == 404
+    assert response.get_json()["result"] == "exception"
+
+
+def test_request_must_be_json(client):
+    response = client.post("/batch", data="actions")
+    assert response.status_code == 400
+
+
+def test_malformed_json_is_rejected(client):
+    response = client.post(
+        "/batch", data='{"component": "steps"', content_type="application/json"
+    )
+    assert response.status_code == 400
+    assert response.get_json()["result"] == "exception"
+
+
+def test_single_element_endpoints_still_work(client, component):
+    response = client.post("/steps/button", json={"text_input": "z"}).get_json()
+    assert response["result"] == "success"
+    assert component.calls == ["button z"]
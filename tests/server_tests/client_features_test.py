@@ -0,0 +1,178 @@
+import pytest
+
+from visuallm.component_base import ComponentBase
+from visuallm.elements import ButtonElement, CollapsibleElement, PlainTextElement
+from visuallm.elements.barchart_element import BarChartColumns, BarChartElement
+from visuallm.elements.table_element import TableElement
+from visuallm.server import Server
+from visuallm.utils.client_features import (
+    BAR_COLUMNS,
+    COLLAPSIBLE_DELTAS,
+    FEATURES_HEADER,
+    TABLE_DELTAS,
+    TABLE_WINDOWS,
+)
+
+
+class FeaturesComponent(ComponentBase):
+    def __init__(self):
+        super().__init__(name="features", title="Features")
+        self.table = TableElement(page_size=2, name="table")
+        self.table.add_table("t", ["i"], [[str(i)] for i in range(5)])
+        self.history = TableElement(name="history")
+        self.history.add_table("h", ["utterance"], [["hello"]])
+        self.append = ButtonElement(processing_callback=self.on_append, name="append")
+        self.status = PlainTextElement("idle", name="status")
+        self.configuration = CollapsibleElement(
+            name="configuration",
+            subelements=[self.status, PlainTextElement("unchanged", name="unchanged")],
+        )
+        self.configure = ButtonElement(
+            processing_callback=self.on_configure, name="configure"
+        )
+        self.barchart = BarChartElement(name="barchart")
+        self.barchart.set_columns(
+            BarChartColumns.create(
+                piece_titles=["a", "b"],
+                bar_heights=[[10.0], [90.0]],
+                bar_names=["p"],
+                bar_annotations=[["10%"], ["90%"]],
+            )
+        )
+        self.add_elements(
+            [
+                self.table,
+                self.history,
+                self.append,
+                self.configuration,
+                self.configure,
+                self.barchart,
+            ]
+        )
+
+    def on_append(self):
+        self.history.append_rows("h", [["*hi*"]])
+
+    def on_configure(self):
+        self.status.content = "configured"
+
+
+@pytest.fixture()
+def component():
+    return FeaturesComponent()
+
+
+@pytest.fixture()
+def client(component):
+    return Server(__name__, [component]).app.test_client()
+
+
+def with_features(client, *features: str):
+    client.environ_base["HTTP_X_VISUALLM_FEATURES"] = ",".join(features)
+    return client
+
+
+def descriptions(response) -> dict[str, dict]:
+    return {d["name"]: d for d in response.get_json()["elementDescriptions"]}
+
+
+def test_frontend_with_windows_receives_first_page(client):
+    table = descriptions(with_features(client, TABLE_WINDOWS).get("/features"))["table"]
+    assert table["page_size"] == 2
+    assert table["tables"][0]["total_rows"] == 5
+    assert len(table["tables"][0]["rows"]) == 2
+
+    window = client.post(
+        "/features/table", json={"table": 0, "start": 2, "count": 2}
+    ).get_json()
+    assert window["result"] == "success"
+    assert window["rows"] == [["2"], ["3"]]
+    assert window["total_rows"] == 5
+
+
+def test_frontend_without_windows_receives_all_rows(client):
+    table = descriptions(client.get("/features"))["table"]
+    assert table["page_size"] is None
+    assert len(table["tables"][0]["rows"]) == 5
+
+
+def test_features_are_read_from_header(client):
+    response = client.get("/features", headers={FEATURES_HEADER: TABLE_WINDOWS})
+    assert len(descriptions(response)["table"]["tables"][0]["rows"]) == 2
+
+
+def test_frontend_with_deltas_receives_appended_rows(client, component):
+    with_features(client, TABLE_DELTAS).get("/features")
+    base_version = component.history.version
+
+    response = client.post("/features/append", json={})
+    history = descriptions(response)["history"]
+    assert history["base_version"] == base_version
+    assert history["appended_rows"] == [
+        {"table": 0, "start": 1, "rows": [["<em>hi</em>"]], "total_rows": 2}
+    ]
+    assert "tables" not in history
+
+
+def test_frontend_without_deltas_receives_whole_table(client):
+    client.get("/features")
+
+    history = descriptions(client.post("/features/append", json={}))["history"]
+    assert "appended_rows" not in history
+    assert history["tables"][0]["rows"] == [["hello"], ["<em>hi</em>"]]
+
+
+def test_frontend_with_deltas_receives_changed_subelements(client, component):
+    with_features(client, COLLAPSIBLE_DELTAS).get("/features")
+
+    response = client.post("/features/configure", json={})
+    configuration = descriptions(response)["configuration"]
+    assert "subelements" not in configuration
+    assert configuration["version"] == component.configuration.version
+    (status,) = configuration["updated_subelements"]
+    assert status["name"] == "configuration>>status"
+    assert status["value"] == "configured"
+
+
+def test_frontend_without_deltas_receives_whole_collapsible(client):
+    client.get("/features")
+
+    response = client.post("/features/configure", json={})
+    configuration = descriptions(response)["configuration"]
+    assert "updated_subelements" not in configuration
+    assert [s["value"] for s in configuration["subelements"]] == [
+        "configured",
+        "unchanged",
+    ]
+
+
+def test_frontend_with_columns_receives_bar_columns(client):
+    barchart = descriptions(with_features(client, BAR_COLUMNS).get("/features"))[
+        "barchart"
+    ]
+    assert barchart["piece_infos"] == []
+    assert barchart["bar_columns"] == {
+        "piece_titles": ["a", "b"],
+        "bar_names": ["p"],
+        "bar_heights": [10.0, 90.0],
+        "bar_annotations": ["10%", "90%"],
+    }
+
+
+def test_frontend_without_columns_receives_piece_infos(client):
+    barchart = descriptions(client.get("/features"))["barchart"]
+    assert barchart["bar_columns"] is None
+    assert barchart["piece_infos"] == [
+        {
+            "pieceTitle": "a",
+            "barHeights": [10.0],
+            "barAnnotations": ["10%"],
+            "barNames": ["p"],
+        },
+        {
+            "pieceTitle": "b",
+            "barHeights": [90.0],
+            "barAnnotations": ["90%"],
+            "barNames": ["p"],
+        },
+    ]
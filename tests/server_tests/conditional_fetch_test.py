@@ -0,0 +1,97 @@
+import gzip
+import json
+
+import pytest
+
+from visuallm.component_base import ComponentBase
+from visuallm.elements.plain_text_element import PlainTextElement
+from visuallm.elements.table_element import TableElement
+from visuallm.server import Server
+from visuallm.utils.client_features import FEATURES_HEADER, TABLE_WINDOWS
+
+
+@pytest.fixture()
+def component():
+    component = ComponentBase(name="conditional", title="Conditional")
+    component.text = PlainTextElement("first")
+    component.add_element(component.text)
+    return component
+
+
+@pytest.fixture()
+def client(component):
+    return Server(__name__, [component]).app.test_client()
+
+
+def test_unchanged_component_is_not_modified(client, component):
+    first = client.get("/conditional")
+    etag = first.headers["ETag"]
+
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    second = client.get("/conditional", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.get_data() == b""
+    assert {"Accept", FEATURES_HEADER} <= set(second.vary)
+
+
+def test_changed_element_changes_etag(client, component):
+    etag = client.get("/conditional").headers["ETag"]
+    component.text.content = "second"
+
+    response = client.get("/conditional", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.get_json()["elementDescriptions"][0]["value"] == "second"
+
+
+def test_hidden_element_changes_etag(client, component):
+    etag = client.get("/conditional").headers["ETag"]
+    component.clear_elements()
+
+    response = client.get("/conditional", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["elementDescriptions"] == []
+
+
+def test_exception_is_not_cached(component):
+    component.default_callback = lambda: component.fetch_exception("failed")
+    client = Server(__name__, [component]).app.test_client()
+
+    response = client.get("/conditional")
+    assert response.get_json()["result"] == "exception"
+    assert "ETag" not in response.headers
+
+
+def test_big_json_response_is_compressed(client, component):
+    component.text.content = "a" * 2000
+
+    response = client.get("/conditional", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    payload = json.loads(gzip.decompress(response.get_data()))
+    assert payload["elementDescriptions"][0]["value"] == "a" * 2000
+
+
+def test_small_json_response_is_not_compressed(client):
+    response = client.get("/conditional", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.get_json()["result"] == "success"
+
+
+def test_features_of_frontend_change_etag(client, component):
+    component.table = TableElement(page_size=2)
+    component.add_element(component.table)
+    component.table.add_table("t", ["i"], [[str(i)] for i in range(5)])
+    etag = client.get("/conditional").headers["ETag"]
+
+    response = client.get(
+        "/conditional",
+        headers={"If-None-Match": etag, FEATURES_HEADER: TABLE_WINDOWS},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    table = response.get_json()["elementDescriptions"][1]
+    assert len(table["tables"][0]["rows"]) == 2
@@ -0,0 +1,134 @@
+import pytest
+
+from visuallm.component_base import ComponentBase
+from visuallm.elements import ButtonElement, CollapsibleElement, PlainTextElement
+from visuallm.elements.utils import RegisteredNames, register_named
+from visuallm.named import Named
+from visuallm.server import Server
+
+
+class DynamicComponent(ComponentBase):
+    def __init__(self):
+        super().__init__(name="dynamic", title="Dynamic")
+        self.calls: list[str] = []
+        self.add_element(PlainTextElement("static", name="text"))
+
+
+@pytest.fixture()
+def component():
+    return DynamicComponent()
+
+
+@pytest.fixture()
+def client(component):
+    client = Server(__name__, [component]).app.test_client()
+    client.get("/dynamic")
+    return client
+
+
+def element_names(response) -> list[str]:
+    return [e["name"] for e in response.get_json()["elementDescriptions"]]
+
+
+def test_element_added_after_first_fetch_is_reachable(client, component):
+    button = ButtonElement(
+        processing_callback=lambda: component.calls.append("added"), name="added"
+    )
+    component.add_element(button)
+
+    assert "added" in element_names(client.get("/dynamic"))
+    assert button.construct_element_description()["address"] == "dynamic/added"
+    response = client.post("/dynamic/added", json={}).get_json()
+    assert response["result"] == "success"
+    assert component.calls == ["added"]
+
+
+def test_subelements_of_added_collapsible_are_reachable(client, component):
+    component.add_element(
+        CollapsibleElement(
+            name="collapsible",
+            subelements=[
+                ButtonElement(
+                    processing_callback=lambda: component.calls.append("nested"),
+                    name="nested",
+                )
+            ],
+        )
+    )
+
+    response = client.post("/dynamic/nested", json={}).get_json()
+    assert response["result"] == "success"
+    assert component.calls == ["nested"]
+
+
+def test_removed_element_isnt_reachable(client, component):
+    button = ButtonElement(
+        processing_callback=lambda: component.calls.append("removed"), name="removed"
+    )
+    component.add_element(button)
+    component.remove_element(button)
+
+    assert "removed" not in element_names(client.get("/dynamic"))
+    response = client.post("/dynamic/removed", json={})
+    assert response.status_code == 404
+    assert response.get_json()["result"] == "exception"
+    assert component.calls == []
+    assert not button.is_registered_to_component
+
+
+def test_button_may_remove_itself(client, component):
+    def replace_button():
+        component.remove_element(first)
+        component.add_element(second)
+
+    first = ButtonElement(processing_callback=replace_button, name="first")
+    second = ButtonElement(
+        processing_callback=lambda: component.calls.append("second"), name="second"
+    )
+    component.add_element(first)
+
+    response = client.post("/dynamic/first", json={}).get_json()
+    assert response["result"] == "success"
+    assert client.post("/dynamic/first", json={}).status_code == 404
+    assert client.post("/dynamic/second", json={}).get_json()["result"] == "success"
+    assert component.calls == ["second"]
+
+
+def test_endpoint_urls_of_elements_with_same_name_are_unique(client, component):
+    buttons = [
+        ButtonElement(
+            processing_callback=lambda i=i: component.calls.append(f"button {i}"),
+            name="button",
+        )
+        for i in range(3)
+    ]
+    component.add_elements(buttons)
+
+    for i, button in enumerate(buttons):
+        response = client.post(f"/{button.address}", json={}).get_json()
+        assert response["result"] == "success"
+        assert component.calls[-1] == f"button {i}"
+    assert len({button.address for button in buttons}) == 3
+
+
+def register(name: str, registered: RegisteredNames) -> str:
+    named = Named(name)
+    register_named(named, registered)
+    return named.name
+
+
+def test_registered_names_continue_from_last_suffix():
+    registered = RegisteredNames()
+    names = [register("n", registered) for _ in range(5)]
+    assert names == ["n", "n_1", "n_2", "n_3", "n_4"]
+    assert registered.next_suffixes == {"n": 5}
+
+    # the numbers of the removed names aren't reused
+    registered.discard("n_2")
+    assert register("n", registered) == "n_5"
+
+
+def test_registered_names_skip_taken_names():
+    registered = RegisteredNames(["n", "n_1"])
+    assert register("n", registered) == "n_2"
+    assert register("n_1", registered) == "n_1_1"
@@ -0,0 +1,174 @@
+import gzip
+import json
+import time
+from array import array
+
+import pytest
+
+from visuallm.component_base import ComponentBase
+from visuallm.elements.barchart_element import BarChartColumns, BarChartElement
+from visuallm.elements.table_element import TableElement
+from visuallm.server import Server
+from visuallm.utils.client_features import BAR_COLUMNS
+
+msgpack = pytest.importorskip("msgpack")
+from visuallm.utils.msgpack_encoding import packb, unpackb  # noqa: E402
+
+MSGPACK = "application/msgpack"
+N_PIECES = 2000
+N_BARS = 8
+
+
+def _height(i: int, j: int) -> float:
+    # e.g. probabilities, which have all the digits of float
+    return 100 * ((i * N_BARS + j) * 0.6180339887 % 1)
+
+
+@pytest.fixture()
+def component():
+    component = ComponentBase(name="msgpack", title="MessagePack")
+    component.barchart = BarChartElement(processing_callback=lambda: None)
+    component.table = TableElement()
+    component.add_elements([component.barchart, component.table])
+    component.barchart.set_columns(
+        BarChartColumns.create(
+            piece_titles=[f"token {i}" for i in range(N_PIECES)],
+            bar_heights=[
+                [_height(i, j) for j in range(N_BARS)] for i in range(N_PIECES)
+            ],
+            bar_names=[f"metric {j}" for j in range(N_BARS)],
+            bar_annotations=[
+                [f"{_height(i, j):.2f}" for j in range(N_BARS)] for i in range(N_PIECES)
+            ],
+        )
+    )
+    component.table.add_table(
+        "Table",
+        ["id", "text"],
+        [[str(i), f"sample text number {i}"] for i in range(N_PIECES)],
+    )
+    return component
+
+
+@pytest.fixture()
+def client(component):
+    client = Server(__name__, [component]).app.test_client()
+    # the frontend which displays the columns of the bar chart
+    client.environ_base["HTTP_X_VISUALLM_FEATURES"] = BAR_COLUMNS
+    return client
+
+
+def _as_json(value):
+    """Convert the unpacked float arrays to lists, as they are in json."""
+    return json.loads(json.dumps(value, default=list))
+
+
+def test_float_arrays_are_packed_as_typed_binary():
+    values = array("d", [0.5, 1.25, 100.0])
+    packed = packb({"heights": values}, default=str)
+
+    # 8 bytes per value instead of 9 bytes of msgpack float per value
+    assert len(packed) < len(msgpack.packb({"heights": values.tolist()}))
+    assert unpackb(packed) == {"heights": values}
+
+
+def test_msgpack_response_when_client_prefers_it(client):
+    json_response = client.get("/msgpack", headers={"Accept": "application/json"})
+    msgpack_response = client.get(
+        "/msgpack", headers={"Accept": f"{MSGPACK}, application/json;q=0.9"}
+    )
+
+    assert json_response.mimetype == "application/json"
+    assert msgpack_response.mimetype == MSGPACK
+    assert "Accept" in msgpack_response.headers["Vary"]
+    assert _as_json(unpackb(msgpack_response.get_data())) == json_response.get_json()
+
+
+def test_json_response_by_default(client):
+    for headers in [{}, {"Accept": "*/*"}, {"Accept": f"{MSGPACK};q=0.5, */*"}]:
+        assert client.get("/msgpack", headers=headers).mimetype == "application/json"
+
+
+def test_json_response_without_msgpack(client, monkeypatch):
+    from visuallm.utils import msgpack_encoding
+
+    monkeypatch.setattr(msgpack_encoding, "_has_msgpack", False)
+    response = client.get("/msgpack", headers={"Accept": MSGPACK})
+    assert response.mimetype == "application/json"
+
+
+def test_big_msgpack_response_is_compressed(client):
+    response = client.get(
+        "/msgpack", headers={"Accept": MSGPACK, "Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    payload = unpackb(gzip.decompress(response.get_data()))
+    assert payload["result"] == "success"
+
+
+def test_msgpack_request_body(client, component):
+    selected = []
+    component.barchart.processing_callback = lambda: selected.append(
+        component.barchart.selected
+    )
+
+    response = client.post(
+        "/msgpack/barchart",
+        data=packb({"selected": "token 3"}, default=str),
+        content_type=MSGPACK,
+        headers={"Accept": MSGPACK},
+    )
+
+    assert response.mimetype == MSGPACK
+    assert unpackb(response.get_data())["result"] == "success"
+    assert selected == ["token 3"]
+
+
+@pytest.mark.parametrize("data", [b"\xc1", b"\x93\x01", b"\x01\x02"])
+def test_malformed_msgpack_request_body_is_rejected(client, data):
+    response = client.post("/batch", data=data, content_type=MSGPACK)
+    assert response.status_code == 400
+    assert response.get_json()["result"] == "exception"
+
+
+def test_size_and_latency_comparison(client, component):
+    """MessagePack payload of a float-heavy bar chart and of a big text table is
+    smaller than json, and isn't slower to produce.
+    """
+
+    def best_time(headers):
+        best = float("inf")
+        for _ in range(5):
+            component.barchart.set_changed()
+            component.table.set_changed()
+            start = time.perf_counter()
+            response = client.get("/msgpack", headers=headers)
+            best = min(best, time.perf_counter() - start)
+        return best, response.get_data()
+
+    json_time, json_data = best_time({"Accept": "application/json"})
+    msgpack_time, msgpack_data = best_time({"Accept": MSGPACK})
+    print(
+        f"json: {len(json_data)} B, {json_time * 1000:.1f} ms;"
+        f" msgpack: {len(msgpack_data)} B, {msgpack_time * 1000:.1f} ms"
+    )
+
+    assert len(msgpack_data) < len(json_data)
+    barchart_json, _ = json.loads(json_data)["elementDescriptions"]
+    barchart_msgpack, _ = unpackb(msgpack_data)["elementDescriptions"]
+    json_heights = json.dumps(barchart_json["bar_columns"]["bar_heights"])
+    msgpack_heights = packb(barchart_msgpack["bar_columns"]["bar_heights"], str)
+    assert len(msgpack_heights) < 0.6 * len(json_heights)
+    # generous bound, the timings on a loaded machine are noisy
+    assert msgpack_time < 2 * json_time
+
+
+def test_json_and_msgpack_representations_have_different_etags(client):
+    json_etag = client.get("/msgpack").headers["ETag"]
+
+    response = client.get(
+        "/msgpack", headers={"Accept": MSGPACK, "If-None-Match": json_etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != json_etag
+    assert response.mimetype == MSGPACK
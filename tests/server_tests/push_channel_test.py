@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from visuallm.background_jobs import JobState
+from visuallm.component_base import ComponentBase
+from visuallm.elements.plain_text_element import PlainTextElement
+from visuallm.push_channel import PushChannel, format_event
+from visuallm.server import Server
+
+
+def parse_event(message: str) -> tuple[str, dict]:
+    fields = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+    return fields["event"], json.loads(fields["data"])
+
+
+@pytest.fixture()
+def component():
+    component = ComponentBase(name="pushing", title="Pushing")
+    component.text = PlainTextElement("first")
+    component.add_element(component.text)
+    return component
+
+
+@pytest.fixture()
+def server(component):
+    return Server(__name__, [component])
+
+
+def test_published_event_is_delivered_to_all_subscribers():
+    channel = PushChannel(json.dumps)
+    first = channel.subscribe("c")
+    second = channel.subscribe("c")
+    other = channel.subscribe("other")
+
+    assert channel.publish("c", "job", {"job": "j"}) == 2
+    assert parse_event(first.get_nowait()) == ("job", {"job": "j"})
+    assert parse_event(second.get_nowait()) == ("job", {"job": "j"})
+    assert other.empty()
+
+
+def test_unsubscribed_channel_is_forgotten():
+    channel = PushChannel(json.dumps)
+    subscriber = channel.subscribe("c")
+    channel.unsubscribe("c", subscriber)
+
+    assert not channel.has_subscribers("c")
+    assert channel.publish("c", "job", {}) == 0
+
+
+def test_multiline_data_are_split_to_multiple_fields():
+    assert format_event("e", "a\nb") == "event: e\ndata: a\ndata: b\n\n"
+
+
+def test_stream_sends_heartbeat_when_idle():
+    channel = PushChannel(json.dumps, heartbeat_interval=0.01)
+    stream = channel.stream("c")
+
+    assert next(stream).startswith("retry:")
+    assert next(stream) == ": heartbeat\n\n"
+    stream.close()
+    assert not channel.has_subscribers("c")
+
+
+def test_events_endpoint_streams_completed_jobs(server, component):
+    client = server.app.test_client()
+    response = client.get("/events?component=pushing", buffered=False)
+    stream = iter(response.response)
+
+    assert response.mimetype == "text/event-stream"
+    assert next(stream).startswith(b"retry:")
+
+    component.update_background_job("model", JobState.LOADING, "Loading")
+    component.update_background_job("model", JobState.READY, "Loaded")
+    event, data = parse_event(next(stream).decode())
+    assert event == "job"
+    assert data == {"job": "model", "result": "success"}
+    response.close()
+
+
+def test_events_endpoint_streams_pushed_diff_and_tokens(server, component):
+    client = server.app.test_client()
+    component.fetch_info()
+    response = client.get("/events?component=pushing", buffered=False)
+    stream = iter(response.response)
+    assert next(stream).startswith(b"retry:")
+
+    component.text.content = "second"
+    assert component.push_changed_elements()
+    event, data = parse_event(next(stream).decode())
+    assert event == "diff"
+    assert [d["value"] for d in data["elementDescriptions"]] == ["second"]
+    assert not component.text.changed
+
+    assert component.push_token(component.text, "<b>")
+    event, data = parse_event(next(stream).decode())
+    assert event == "token"
+    assert data == {"name": component.text.name, "token": "&lt;b&gt;"}
+    response.close()
+
+
+def test_nothing_is_pushed_without_subscribers(server, component):
+    component.text.content = "second"
+
+    assert not component.push_job_completed("model")
+    assert not component.push_changed_elements()
+    assert not component.push_token(component.text, "token")
+    assert component.text.changed
+
+
+def test_events_endpoint_requires_component(server):
+    assert server.app.test_client().get("/events").status_code == 400
@@ -0,0 +1,82 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from visuallm.server import Server
+from visuallm.utils.static_files import IMMUTABLE_CACHE_CONTROL, SHORT_CACHE_CONTROL
+
+DIST_PATH = Path(__file__).parents[2] / "visuallm" / "dist"
+
+
+@pytest.fixture()
+def client():
+    return Server(__name__, []).app.test_client()
+
+
+@pytest.fixture()
+def js_bundle_url():
+    bundle = next((DIST_PATH / "assets").glob("index-*.js"))
+    return f"/assets/{bundle.name}"
+
+
+def test_hashed_bundle_is_cached_forever(client, js_bundle_url):
+    response = client.get(js_bundle_url)
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+    assert "Content-Encoding" not in response.headers
+
+
+def test_index_html_is_cached_shortly(client):
+    response = client.get("/index.html")
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == SHORT_CACHE_CONTROL
+    assert response.mimetype == "text/html"
+
+
+def test_gzip_variant_is_served_when_accepted(client, js_bundle_url):
+    plain = client.get(js_bundle_url)
+    response = client.get(js_bundle_url, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(response.data) == plain.data
+
+
+def test_brotli_variant_is_preferred(client, js_bundle_url):
+    brotli = pytest.importorskip("brotli")
+    plain = client.get(js_bundle_url)
+    response = client.get(js_bundle_url, headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(response.data) == plain.data
+
+
+def test_rejected_encoding_is_not_used(client, js_bundle_url):
+    response = client.get(js_bundle_url, headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_conditional_request_returns_not_modified(client, js_bundle_url):
+    response = client.get(js_bundle_url, headers={"Accept-Encoding": "gzip"})
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        js_bundle_url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+
+
+def test_missing_file_and_path_traversal(client):
+    assert client.get("/assets/does-not-exist.js").status_code == 404
+    assert client.get("/../server.py").status_code == 404
+
+
+def test_other_methods_of_unknown_path_are_not_found(client):
+    assert client.post("/does-not-exist").status_code == 404
+    assert client.delete("/assets/does-not-exist.js").status_code == 404
+    assert client.post("/fetch_component_infos").status_code == 405
@@ -1,10 +1,9 @@
-import logging
+from typing import TYPE_CHECKING
 
 from visuallm.component_base import ComponentBase
+from visuallm.utils.lazy_loading import lazy_attributes
 
-try:
-    # these modules interact with torch and with transformers which aren't
-    # direct dependencies of the library
+if TYPE_CHECKING:
     from visuallm.components.dataset_visualization_component import (
         DatasetVisualizationComponent,
     )
@@ -14,9 +13,33 @@ try:
         GenerationSelectorsMixin,
         MetricsMixin,
         ModelSelectionMixin,
+        SampleSearchMixin,
+        SimilarSamplesMixin,
     )
     from visuallm.components.next_token_prediction_component import (
         NextTokenPredictionComponent,
     )
-except:  # noqa: E722
-    logging.exception("Import exception during the initialization of the library.")
+
+# the components are imported only on the first access, so that `import visuallm`
+# stays cheap for the apps which use only the elements
+_LAZY_ATTRIBUTES = {
+    "DatasetVisualizationComponent": (
+        "visuallm.components.dataset_visualization_component"
+    ),
+    "GenerationComponent": "visuallm.components.generation_component",
+    "DataPreparationMixin": "visuallm.components.mixins.data_preparation_mixin",
+    "GenerationSelectorsMixin": (
+        "visuallm.components.mixins.generation_selectors_mixin"
+    ),
+    "MetricsMixin": "visuallm.components.mixins.metrics_mixin",
+    "ModelSelectionMixin": "visuallm.components.mixins.model_selection_mixin",
+    "SampleSearchMixin": "visuallm.components.mixins.sample_search_mixin",
+    "SimilarSamplesMixin": "visuallm.components.mixins.similar_samples_mixin",
+    "NextTokenPredictionComponent": (
+        "visuallm.components.next_token_prediction_component"
+    ),
+}
+
+__all__ = ["ComponentBase", *_LAZY_ATTRIBUTES]
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class JobState(Enum):
+    LOADING = "loading"
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class BackgroundJob:
+
+    """State of a long running job (e.g. loading of a model) of a component."""
+
+    state: JobState
+    message: str
+    """Human readable description of what is happening, displayed on the frontend"""
+    blocking: bool = False
+    """The component isn't displayed on the frontend until all its blocking
+    jobs are ready"""
+    error: str | None = None
+    """Traceback of the exception that made the job fail"""
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (JobState.READY, JobState.FAILED)
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "message": self.message,
+            "blocking": self.blocking,
+            "error": self.error,
+        }
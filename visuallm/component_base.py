@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import secrets
+import traceback
 from collections.abc import Callable, MutableSet
 from pprint import pprint
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from visuallm.elements.element_base import ElementBase
+    from visuallm.elements.element_base import ElementBase, ElementWithEndpoint
     from visuallm.server import Server
 
 from abc import ABCMeta
 
-from visuallm.elements.utils import register_named, sanitize_url
+from flask import Response, has_request_context, make_response, request
+
+from visuallm.background_jobs import BackgroundJob, JobState
+from visuallm.dependency_graph import DependencyGraph
+from visuallm.elements.utils import RegisteredNames, register_named, sanitize_url
 from visuallm.named import Named, NamedWrapper
+from visuallm.utils.client_features import FEATURES_HEADER
+from visuallm.utils.msgpack_encoding import prefers_msgpack
+from visuallm.utils.sanitizer import Sanitizer
 
 
 class ComponentMetaclass(ABCMeta):
@@ -47,12 +57,23 @@ class ComponentBase(Named, metaclass=ComponentMetaclass):
         self.title = title
 
         # register all elements to component structures
-        self.registered_element_names: set[str] = set()
+        self.registered_element_names: set[str] = RegisteredNames()
         self.registered_elements: list[ElementBase] = []
-        self.registered_url_endpoints: MutableSet[str] = set()
+        self.registered_url_endpoints: MutableSet[str] = RegisteredNames()
+        self.endpoint_elements: dict[str, ElementWithEndpoint] = {}
+        """Elements (including the subelements of the collapsibles) by their
+        endpoint urls, the requests to all of them are dispatched by a single
+        route of the component"""
 
         self.default_callback = default_callback
-        self._already_fetched = False
+        self._server: Server | None = None
+        # the etags from the previous runs of the server mustn't match
+        self._etag_nonce = secrets.token_hex(8)
+        self.background_jobs: dict[str, BackgroundJob] = {}
+        self.dependency_graph = DependencyGraph()
+        """Inputs selected on the frontend and the values derived from them,
+        the components declare the nodes so that only the values affected by
+        a change are recomputed"""
 
     def __post_init__(self, *args, **kwargs):
         pass
@@ -77,6 +98,11 @@ class ComponentBase(Named, metaclass=ComponentMetaclass):
         can optionally specify order, to put the element on the other position
         in the list.
 
+        The elements may be added (and removed by `remove_element`) also
+        after the server is started, the frontend displays them after it
+        fetches all the elements of the component again (e.g. after a button
+        with `reload_page=True` is pressed).
+
         Args:
         ----
             element (ElementBase): element to be added to frontend-rendered elements.
@@ -88,16 +114,12 @@ class ComponentBase(Named, metaclass=ComponentMetaclass):
             RuntimeError: each element may be registered to at most one component,
                 if you try to register the element into multiple componnets, this
                 exception is raised.
+
         """
         if element.is_registered_to_component:
             raise RuntimeError(
                 f"Element with name: {element.name} is already registered to some component!"
             )
-        if self._already_fetched:
-            raise RuntimeError(
-                "After first fetch, Flask doesn't support adding any new elements! "
-                "(limitation of add_url_rule)"
-            )
         order = self._get_order(order)
         element.register_to_component(self)
         element.order = order
@@ -107,6 +129,34 @@ class ComponentBase(Named, metaclass=ComponentMetaclass):
         for element in elements:
             self.add_element(element, order)
 
+    def remove_element(self, element: ElementBase):
+        """Remove the element from the component, e.g. when the element was
+        created at runtime and isn't needed anymore. The frontend stops
+        displaying it after it fetches all the elements of the component again.
+        """
+        self.registered_elements.remove(element)
+        self.registered_element_names.discard(element.name)
+        element.unregister_from_component(self)
+
+    def register_endpoint(self, element: ElementWithEndpoint):
+        """Make the endpoint of the element (or of the subelement of a
+        collapsible) reachable through the dispatch route of the component.
+        If another element has the same endpoint url, a number is appended
+        after the url of the registered element.
+        """
+        register_named(
+            NamedWrapper(element, "endpoint_url"), self.registered_url_endpoints
+        )
+        self.endpoint_elements[element.endpoint_url.removeprefix("/")] = element
+        element._parent_component = self
+
+    def unregister_endpoint(self, element: ElementWithEndpoint):
+        url = element.endpoint_url.removeprefix("/")
+        if self.endpoint_elements.get(url) is element:
+            del self.endpoint_elements[url]
+            self.registered_url_endpoints.discard(element.endpoint_url)
+        element._parent_component = None
+
     def clear_elements(self):
         """Do not show any elements on the frontend.
 
@@ -125,17 +175,140 @@ class ComponentBase(Named, metaclass=ComponentMetaclass):
         register_named(self, server.registered_component_names)
 
         # ensure that there are no two components sharing the same default url
+        default_url = self.default_url
         register_named(NamedWrapper(self, "default_url"), server.registered_urls)
-        server.add_endpoint(self.default_url, self.default_callback, methods=["GET"])
+        if self.default_url != default_url:
+            # the addresses of the elements contain the url of the component
+            for element in self.registered_elements:
+                element.set_changed()
+        server.add_endpoint(self.default_url, self.on_default_fetch, methods=["GET"])
+        # single route for all the elements, so that the elements may be added
+        # after the server is started (flask doesn't allow adding the routes then)
+        server.add_endpoint(
+            f"{self.default_url}/<path:address>",
+            self.on_element_request,
+            methods=["POST"],
+        )
+        self._server = server
+
+    def compute_etag(self) -> str:
+        """Identifier of the current state of the component computed from the
+        versions of its elements, so it changes each time any element is
+        changed (`ElementBase.set_changed`), shown or hidden. The identifier
+        also differs for each representation of the state, i.e. for json and
+        MessagePack and for the features of the frontend which the elements
+        use.
+        """
+        state = repr(
+            [
+                (
+                    e.name,
+                    e.version,
+                    e.is_displayed,
+                    sorted(e.supported_client_features()),
+                )
+                for e in self.registered_elements
+            ]
+        )
+        if has_request_context():
+            state += f":{prefers_msgpack(request.accept_mimetypes)}"
+        return hashlib.sha1(
+            f"{self._etag_nonce}:{state}".encode(), usedforsecurity=False
+        ).hexdigest()
+
+    def on_element_request(self, address: str):
+        """Dispatch the request to the endpoint of the element with the
+        endpoint url `address`.
+        """
+        element = self.endpoint_elements.get(address)
+        if element is None:
+            return {
+                "result": "exception",
+                "reason": f"No element of component '{self.name}' has address '{address}'",
+            }, 404
+        return element.endpoint_callback()
+
+    def on_default_fetch(self) -> Response:
+        """Answer the request to `default_url` with the result of
+        `default_callback`. If the frontend already has the current state of
+        the component (its `If-None-Match` header matches the etag), the
+        callback isn't called at all and `304 Not Modified` is returned.
+        """
+        blocking_result = self.fetch_blocking_jobs()
+        if blocking_result is not None:
+            return make_response(blocking_result)
+        if request.if_none_match.contains_weak(self.compute_etag()):
+            response = Response(status=304)
+        else:
+            result = self.default_callback()
+            response = make_response(result)
+            if not isinstance(result, dict) or result.get("result") != "success":
+                return response
+        # the callback may have changed the elements, hence compute the etag again
+        response.set_etag(self.compute_etag(), weak=True)
+        response.headers["Cache-Control"] = "no-cache"
+        # the 304 responses aren't created by the json provider which adds these
+        response.vary.add("Accept")
+        response.vary.add(FEATURES_HEADER)
+        return response
+
+    @property
+    def push_channel_name(self) -> str:
+        """Name of the channel over which the events of this component are
+        pushed to the frontend.
+        """
+        return self.default_url.removeprefix("/")
+
+    def has_push_subscribers(self) -> bool:
+        """Is there any frontend listening to the events of this component ?"""
+        if self._server is None:
+            return False
+        return self._server.push_channel.has_subscribers(self.push_channel_name)
+
+    def _push(self, event: str, data: Any) -> bool:
+        if self._server is None or not self.has_push_subscribers():
+            return False
+        self._server.push_channel.publish(self.push_channel_name, event, data)
+        return True
+
+    def push_changed_elements(self) -> bool:
+        """Push descriptions of all the changed elements to the frontend, so
+        that it doesn't need to ask for them.
+
+        Returns False if no frontend is subscribed, in that case the elements
+        stay changed and are sent in the response to the next request.
+        """
+        if not self.has_push_subscribers():
+            return False
+        return self._push("diff", self.fetch_info(fetch_all=False))
+
+    def push_job_completed(self, job: str, result: str = "success") -> bool:
+        """Notify the frontend that a long running `job` has finished, the
+        frontend then immediately repeats its requests which were answered
+        with other result than "success" or "exception".
+        """
+        return self._push("job", {"job": job, "result": result})
+
+    def push_token(self, element: ElementBase, token: str) -> bool:
+        """Append `token` to the value of `element` displayed on the
+        frontend, meant for streaming the generated text token by token.
+
+        The element itself isn't modified, set its final content after the
+        generation is finished.
+        """
+        return self._push(
+            "token", {"name": element.name, "token": Sanitizer.sanitize(token)}
+        )
 
     def fetch_info(
         self, fetch_all: bool = True, debug_print: bool = False
     ) -> dict[str, Any]:
-        self._already_fetched = True
         res = {
             "result": "success",
             "elementDescriptions": [
                 element.construct_element_description()
+                if fetch_all
+                else element.construct_element_update()
                 for element in sorted(self.registered_elements, key=lambda e: e.order)
                 if _element_should_be_displayed(element, fetch_all)
             ],
@@ -144,11 +317,109 @@ class ComponentBase(Named, metaclass=ComponentMetaclass):
             pprint(res)
         return res
 
+    def apply_actions(self, actions: list[dict[str, Any]]) -> dict[str, Any]:
+        """Apply the `actions` of the elements in order, as if the frontend
+        sent them to the endpoints of the elements one after another (e.g.
+        set the values of the button's selectors and run its processing
+        callback), and return one diff with all the elements changed by them.
+
+        If any action fails, the following actions aren't applied and the
+        exception is returned (the preceding actions stay applied).
+
+        Args:
+        ----
+            actions (list[dict[str, Any]]): each action contains the `address`
+                of the element (as in its description) and the `data` that the
+                frontend sends to the element's endpoint
+
+        """
+        try:
+            fetch_all = False
+            for action in actions:
+                element = self.element_with_address(action["address"])
+                if element.apply_action(action.get("data", {})):
+                    fetch_all = True
+            return self.fetch_info(fetch_all=fetch_all)
+        except Exception:
+            return self.fetch_exception(traceback.format_exc())
+
+    def element_with_address(self, address: str) -> ElementWithEndpoint:
+        """Find the element (or the subelement of a collapsible) with the
+        `address` from its description, or with the endpoint url `address`.
+        """
+        url = address.removeprefix("/")
+        url = url.removeprefix(self.default_url.removeprefix("/") + "/")
+        element = self.endpoint_elements.get(url)
+        if element is None:
+            raise KeyError(
+                f"No element of component '{self.name}' has address '{address}'"
+            )
+        return element
+
     def fetch_exception(self, traceback: str) -> dict[str, Any]:
-        self._already_fetched = True
         res = {"result": "exception", "reason": traceback}
         return res
 
+    def update_background_job(
+        self,
+        job: str,
+        state: JobState,
+        message: str,
+        blocking: bool = False,
+        error: str | None = None,
+    ):
+        """Report the state of a long running `job` of the component. When the
+        job finishes, the frontend is notified through the push channel.
+
+        Args:
+        ----
+            job (str): unique name of the job
+            state (JobState): current state of the job
+            message (str): human readable description of the state
+            blocking (bool, optional): whether the component can be displayed
+                only after the job is ready. Defaults to False.
+            error (str, optional): traceback of the exception which made
+                the job fail. Defaults to None.
+
+        """
+        background_job = BackgroundJob(state, message, blocking, error)
+        self.background_jobs[job] = background_job
+        if background_job.finished:
+            result = "success" if state == JobState.READY else "exception"
+            self.push_job_completed(job, result)
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether all the blocking jobs of the component are ready."""
+        return all(
+            job.state == JobState.READY
+            for job in list(self.background_jobs.values())
+            if job.blocking
+        )
+
+    def fetch_blocking_jobs(self) -> dict[str, Any] | None:
+        """If some blocking job failed, return the exception response, if
+        some is still running, return response with result "loading" and
+        the description of the job. Otherwise return None.
+        """
+        blocking_jobs = [j for j in list(self.background_jobs.values()) if j.blocking]
+        for job in blocking_jobs:
+            if job.state == JobState.FAILED:
+                return self.fetch_exception(job.error or job.message)
+        for job in blocking_jobs:
+            if not job.finished:
+                return {"result": "loading", "reason": job.message}
+        return None
+
+    def readiness(self) -> dict[str, Any]:
+        """Describe the states of all the background jobs of the component."""
+        return {
+            "ready": self.is_ready,
+            "jobs": {
+                name: job.describe() for name, job in list(self.background_jobs.items())
+            },
+        }
+
 
 def _element_should_be_displayed(element: ElementBase, fetch_all: bool):
     if not element.is_displayed:
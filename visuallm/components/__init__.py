@@ -1,8 +1,32 @@
-from visuallm.components.chat_component import ChatComponent
-from visuallm.components.dataset_visualization_component import (
-    DatasetVisualizationComponent,
-)
-from visuallm.components.generation_component import GenerationComponent
-from visuallm.components.next_token_prediction_component import (
-    NextTokenPredictionComponent,
-)
+from typing import TYPE_CHECKING
+
+from visuallm.utils.lazy_loading import lazy_attributes
+
+if TYPE_CHECKING:
+    from visuallm.components.chat_component import ChatComponent
+    from visuallm.components.dataset_snapshots import DatasetSnapshotCache
+    from visuallm.components.dataset_visualization_component import (
+        DatasetVisualizationComponent,
+    )
+    from visuallm.components.generation_component import GenerationComponent
+    from visuallm.components.memory_mapped_datasets import MemoryMappedDataset
+    from visuallm.components.next_token_prediction_component import (
+        NextTokenPredictionComponent,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "ChatComponent": "visuallm.components.chat_component",
+    "DatasetSnapshotCache": "visuallm.components.dataset_snapshots",
+    "DatasetVisualizationComponent": (
+        "visuallm.components.dataset_visualization_component"
+    ),
+    "GenerationComponent": "visuallm.components.generation_component",
+    "MemoryMappedDataset": "visuallm.components.memory_mapped_datasets",
+    "NextTokenPredictionComponent": (
+        "visuallm.components.next_token_prediction_component"
+    ),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -22,6 +22,10 @@ from visuallm.elements.selector_elements import ButtonElement, TextInputSubEleme
 
 # TODO: other than top to down linear organization
 
+_CHAT_HISTORY_PAGE_SIZE = 50
+"""Long chat histories are sent to the frontend in windows of this many utterances"""
+_CHAT_HISTORY_TITLE = "CHAT HISTORY"
+
 
 class CreateTextToTokenizerChatIsNoneError(Exception):
     def __init__(self) -> None:
@@ -37,6 +41,7 @@ class ChatComponent(ComponentBase, ModelSelectionMixin, GenerationSelectorsMixin
         generator_choices: GENERATOR_CHOICES | None = None,
         generator: Generator | None = None,
         selectors: SELECTORS_TYPE | None = None,
+        load_in_background: bool = False,
         **kwargs,
     ):
         super().__init__(name="chat_component", title=title)
@@ -45,8 +50,9 @@ class ChatComponent(ComponentBase, ModelSelectionMixin, GenerationSelectorsMixin
             self,
             generator_choices=generator_choices,
             generator=generator,
+            load_in_background=load_in_background,
         )
-        self._check_generators(self.generator, generator_choices)
+        self._check_generators(generator, generator_choices)
         GenerationSelectorsMixin.__init__(self, selectors=selectors)
         chat_elements = self.init_chat_elements()
         text_to_tokenizer_elements = self.init_text_to_tokenizer_elements()
@@ -155,7 +161,7 @@ class ChatComponent(ComponentBase, ModelSelectionMixin, GenerationSelectorsMixin
 
     def init_chat_history_elements(self) -> list[ElementBase]:
         chat_history_heading = HeadingElement(content="Chat History")
-        self.chat_history_table = TableElement()
+        self.chat_history_table = TableElement(page_size=_CHAT_HISTORY_PAGE_SIZE)
         return [chat_history_heading, self.chat_history_table]
 
     def init_model_outputs_elements(self) -> list[ElementBase]:
@@ -180,14 +186,28 @@ class ChatComponent(ComponentBase, ModelSelectionMixin, GenerationSelectorsMixin
         return [text_to_tokenizer_heading, self.text_to_tokenizer_element]
 
     def update_chat_history_elements(self):
-        self.chat_history_table.clear()
+        """Append the utterances which aren't displayed yet to the chat history
+        table, so that the past utterances aren't processed again after each
+        accepted generation. The table is rebuilt only if the history shrank.
+        """
+        history = self.loaded_sample["history"]
         who = ["You", "Bot"]
-        if len(self.loaded_sample["history"]) == 0:
+        tables = self.chat_history_table.tables
+        n_displayed = len(tables[0].rows) if len(tables) != 0 else 0
+        if n_displayed != 0 and n_displayed <= len(history):
+            self.chat_history_table.append_rows(
+                _CHAT_HISTORY_TITLE,
+                [[who[i % 2], history[i]] for i in range(n_displayed, len(history))],
+            )
+            return
+
+        self.chat_history_table.clear()
+        if len(history) == 0:
             return
         self.chat_history_table.add_table(
-            title="CHAT HISTORY",
+            title=_CHAT_HISTORY_TITLE,
             headers=["Who", "Utterance"],
-            rows=[[who[i % 2], u] for i, u in enumerate(self.loaded_sample["history"])],
+            rows=[[who[i % 2], u] for i, u in enumerate(history)],
         )
 
     def _check_generators(
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from visuallm.components.memory_mapped_datasets import (
+    MemoryMappedArrow,
+    MemoryMappedDataset,
+    MemoryMappedJSONL,
+)
+
+_MANIFEST_FILE = "manifest.json"
+_FORMAT_VERSION = 1
+
+
+def constructor_identity(constructor: Callable[..., Any]) -> str:
+    """Identifier of the `constructor` which is the same after the restart of
+    the app: its module and qualified name, and the bound arguments of
+    `functools.partial` objects.
+    """
+    if isinstance(constructor, partial):
+        return (
+            f"{constructor_identity(constructor.func)}"
+            f"({constructor.args!r}, {constructor.keywords!r})"
+        )
+    module = getattr(constructor, "__module__", None)
+    qualname = getattr(constructor, "__qualname__", None)
+    if qualname is None:
+        # callable object, e.g. an instance of a class with `__call__`
+        qualname = type(constructor).__qualname__
+        module = type(constructor).__module__
+    return f"{module}.{qualname}"
+
+
+def split_fingerprint(split: Any) -> str:
+    """Identifier of the content of a dataset split, which changes whenever
+    any of its samples changes, also after the restart of the app. The memory
+    mapped splits are identified by their files, HuggingFace datasets by their
+    own fingerprints, the other splits by the hash of all their samples.
+    """
+    if isinstance(split, MemoryMappedJSONL | MemoryMappedArrow):
+        stat = split.path.stat()
+        return f"{split.path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    hf_fingerprint = getattr(split, "_fingerprint", None)
+    if isinstance(hf_fingerprint, str):
+        return hf_fingerprint
+    digest = hashlib.sha1(usedforsecurity=False)
+    for sample in split:
+        digest.update(repr(sample).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class DatasetSnapshotCache:
+
+    """On-disk cache of the datasets built by expensive constructors (which
+    e.g. download, filter and preprocess the data). On the first load each
+    split is written to a JSONL file, on the following loads (also after the
+    restart of the app) the files are memory mapped (see `MemoryMappedDataset`),
+    so only the accessed samples are read.
+
+    The snapshot is keyed by the identity of the constructor, the name of the
+    dataset and the `version`; change the version whenever the constructor
+    produces different samples. The samples must be JSON serializable (tuples
+    are loaded back as lists), otherwise the dataset isn't snapshotted and is
+    returned as constructed.
+    """
+
+    def __init__(self, directory: str | os.PathLike, version: str = ""):
+        """Args:
+        ----
+            directory (str | os.PathLike): where the snapshots are stored
+            version (str, optional): version of the constructors, the snapshots
+                stored with another version are ignored. Defaults to "".
+        """
+        self.directory = Path(directory)
+        self.version = version
+
+    def snapshot_path(self, name: str, constructor: Callable[[], Any]) -> Path:
+        """Directory with the snapshot of the dataset."""
+        identity = constructor_identity(constructor)
+        fingerprint = hashlib.sha1(usedforsecurity=False)
+        fingerprint.update(repr((name, identity, self.version)).encode())
+        prefix = re.sub(r"[^\w.-]", "_", name)
+        return self.directory / f"{prefix}-{fingerprint.hexdigest()[:16]}"
+
+    def load(self, name: str, constructor: Callable[[], Any]) -> Any:
+        """Memory map the snapshot of the dataset, or construct the dataset and
+        store its snapshot if it doesn't exist yet.
+
+        Args:
+        ----
+            name (str): name of the dataset
+            constructor (Callable[[], Any]): function that constructs the dataset
+
+        """
+        path = self.snapshot_path(name, constructor)
+        dataset = self._load_snapshot(path)
+        if dataset is not None:
+            return dataset
+
+        constructed = constructor()
+        try:
+            self._write_snapshot(path, constructed)
+        except (TypeError, ValueError, OSError) as e:
+            logging.warning(f"Cannot store snapshot of dataset '{name}': {e!r}")
+            return constructed
+        dataset = self._load_snapshot(path)
+        return constructed if dataset is None else dataset
+
+    def _load_snapshot(self, path: Path) -> MemoryMappedDataset | None:
+        try:
+            with (path / _MANIFEST_FILE).open() as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("format_version") != _FORMAT_VERSION:
+            return None
+        return MemoryMappedDataset(
+            {split: path / file for split, file in manifest["splits"].items()}
+        )
+
+    def _write_snapshot(self, path: Path, dataset: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # the snapshot is written to a temporary directory and renamed once
+        # complete, so an interrupted write never leaves a partial snapshot
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{path.name}-", dir=self.directory))
+        try:
+            splits = {}
+            for i, split in enumerate(dataset.keys()):
+                file = f"split-{i}.jsonl"
+                with (tmp_dir / file).open("w", encoding="utf-8") as f:
+                    for sample in dataset[split]:
+                        f.write(json.dumps(sample))
+                        f.write("\n")
+                splits[split] = file
+            with (tmp_dir / _MANIFEST_FILE).open("w") as f:
+                json.dump({"format_version": _FORMAT_VERSION, "splits": splits}, f)
+            if path.exists():
+                # incomplete snapshot without the manifest
+                shutil.rmtree(path)
+            tmp_dir.replace(path)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
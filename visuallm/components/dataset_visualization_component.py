@@ -1,6 +1,10 @@
 import logging
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any
 
 from visuallm.component_base import ComponentBase
+from visuallm.components.dataset_snapshots import constructor_identity
 from visuallm.components.mixins.data_preparation_mixin import (
     DATASET_TYPE,
     DATASETS_TYPE,
@@ -11,11 +15,17 @@ from visuallm.components.mixins.model_selection_mixin import (
     Generator,
     ModelSelectionMixin,
 )
+from visuallm.components.mixins.sample_search_mixin import SampleSearchMixin
+from visuallm.components.mixins.similar_samples_mixin import SimilarSamplesMixin
 from visuallm.elements import ElementBase, HeadingElement, PlainTextElement
 
 
 class DatasetVisualizationComponent(
-    ComponentBase, DataPreparationMixin, ModelSelectionMixin
+    ComponentBase,
+    DataPreparationMixin,
+    ModelSelectionMixin,
+    SampleSearchMixin,
+    SimilarSamplesMixin,
 ):
     def __init__(
         self,
@@ -24,7 +34,57 @@ class DatasetVisualizationComponent(
         generator_choices: GENERATOR_CHOICES | None = None,
         dataset: DATASET_TYPE | None = None,
         dataset_choices: DATASETS_TYPE | None = None,
+        enable_search: bool = False,
+        search_fields: Sequence[str] | None = None,
+        search_index_dir: str | None = None,
+        embedding_encoder: Callable[[list[str]], Any] | None = None,
+        embedding_encoder_key: str = "",
+        embeddings_dir: str | None = None,
+        embedding_partitions: int | None = None,
+        dataset_snapshot_dir: str | None = None,
+        dataset_snapshot_version: str = "",
+        load_in_background: bool = False,
     ):
+        """Display the samples of the dataset, and the texts that the generator
+        creates from them.
+
+        Args:
+        ----
+            title (str, optional): The title of the component. Defaults to "Dataset Visualization".
+            generator (Optional[Generator], optional): Generator. Defaults to None.
+            generator_choices (Optional[GENERATOR_CHOICES], optional): dictionary where key
+                is the name of the generator and value is the generator. Defaults to None.
+            dataset (Optional[DATASET_TYPE], optional): Dataset or a function that loads
+                the dataset. Defaults to None.
+            dataset_choices (Optional[DATASETS_TYPE], optional): Dictionary of datasets, or
+                dictionary of functions that load the dataset. Defaults to None.
+            enable_search (bool, optional): Whether to display a text input, which selects
+                the samples that contain the searched words. Defaults to False.
+            search_fields (Sequence[str] | None, optional): Fields of the samples which are
+                searched and embedded, if None the text created by `create_text_to_tokenizer` of the
+                generator is searched. Defaults to None.
+            search_index_dir (str | None, optional): Directory where the search indices
+                are stored, so that they are built only once. Defaults to None.
+            embedding_encoder (Callable[[list[str]], Any] | None, optional): Encoder that
+                returns a matrix with one embedding per text. If set, a button displays the
+                samples most similar to the selected one. Defaults to None.
+            embedding_encoder_key (str, optional): Identifier of the encoder, the embeddings
+                stored in `embeddings_dir` are reused only for the same key. Defaults to "".
+            embeddings_dir (str | None, optional): Directory where the embeddings are
+                stored, so that their computation continues after the restart of the app.
+                Defaults to None.
+            embedding_partitions (int | None, optional): Number of partitions of the
+                embeddings, makes the search on large splits faster. Defaults to None.
+            dataset_snapshot_dir (str | None, optional): Directory where the datasets
+                constructed by functions are stored, so that they are memory mapped after
+                the restart of the app. Defaults to None.
+            dataset_snapshot_version (str, optional): Version of the dataset constructors,
+                the snapshots are built again when it changes. Defaults to "".
+            load_in_background (bool, optional): Whether to load and warm up the generator
+                on a background thread, so that the server starts immediately and the
+                frontend displays that the model is loading. Defaults to False.
+
+        """
         super().__init__(name="dataset_visualization", title=title)
         self.main_heading_element = PlainTextElement(
             is_heading=True, heading_level=2, content=title
@@ -34,18 +94,65 @@ class DatasetVisualizationComponent(
             self,
             dataset=dataset,
             dataset_choices=dataset_choices,
+            dataset_snapshot_dir=dataset_snapshot_dir,
+            dataset_snapshot_version=dataset_snapshot_version,
         )
         ModelSelectionMixin.__init__(
-            self, generator=generator, generator_choices=generator_choices
+            self,
+            generator=generator,
+            generator_choices=generator_choices,
+            load_in_background=load_in_background,
+        )
+        self._search_fields = None if search_fields is None else list(search_fields)
+        SampleSearchMixin.__init__(
+            self,
+            sample_text=self._indexed_text if enable_search else None,
+            index_dir=search_index_dir,
+        )
+        SimilarSamplesMixin.__init__(
+            self,
+            sample_text=self._indexed_text,
+            encode=embedding_encoder,
+            encoder_key=embedding_encoder_key,
+            embeddings_dir=embeddings_dir,
+            n_partitions=embedding_partitions,
         )
 
         self.add_element(self.main_heading_element)
         self.add_elements(self.dataset_choice_elements)
         self.add_elements(self.generator_selection_elements)
+        self.add_elements(self.search_elements)
+        self.add_elements(self.similar_samples_elements)
         self.add_elements(sample_vis_elements)
 
     def __post_init__(self, *args, **kwargs):
-        self.update_sample_vis_elements()
+        self.when_generator_ready(self.update_sample_vis_elements)
+        self.when_generator_ready(self.build_search_indices)
+        self.when_generator_ready(self.compute_embeddings)
+
+    def _indexed_text(self, sample: Any) -> str:
+        sample_text, _ = self._indexed_text_source()
+        return sample_text(sample)
+
+    def _indexed_text_source(self) -> tuple[Callable[[Any], str], str]:
+        """The function that returns the searched and embedded text of a sample,
+        and its identifier. Without `search_fields` the text depends on the
+        selected generator, hence the function is bound to it.
+        """
+        if self._search_fields is not None:
+            fields = self._search_fields
+            return partial(_join_fields, fields), f"fields:{fields!r}"
+        create_text = self.generator.create_text_to_tokenizer
+        if create_text is None:
+            raise CreateTextToTokenizerIsNoneError()
+        identity = constructor_identity(create_text)
+        return create_text, f"generator:{self.selected_generator_name}:{identity}"
+
+    def search_text_source(self) -> tuple[Callable[[Any], str], str]:
+        return self._indexed_text_source()
+
+    def embedded_text_source(self) -> tuple[Callable[[Any], str], str]:
+        return self._indexed_text_source()
 
     def initialize_sample_visualization_elements(self) -> list[ElementBase]:
         text_to_tokenizer_heading = HeadingElement(content="Text Model Inputs")
@@ -74,9 +181,15 @@ class DatasetVisualizationComponent(
 
     def after_on_dataset_change_callback(self):
         self.update_sample_vis_elements()
+        # the indices of the newly selected dataset
+        self.build_search_indices()
+        self.compute_embeddings()
 
     def after_on_generator_change_callback(self):
         self.update_sample_vis_elements()
+        # the searched and embedded text may depend on the generator
+        self.build_search_indices()
+        self.compute_embeddings()
 
     def _check_generators(
         self,
@@ -113,3 +226,7 @@ class RetrieveTargetStrIsNoneError(Exception):
         super().__init__(
             "self.generator.retrieve_target_str is None, DatasetVisualizationComponent needs it!"
         )
+
+
+def _join_fields(fields: list[str], sample: Any) -> str:
+    return " ".join(str(sample.get(field, "")) for field in fields)
@@ -0,0 +1,263 @@
+import json
+import os
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# numpy is imported only when the embeddings are computed or searched
+_has_numpy = find_spec("numpy") is not None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_META_FILE = "meta.json"
+_EMBEDDINGS_FILE = "embeddings.npy"
+_CENTROIDS_FILE = "centroids.npy"
+_PARTITION_ROWS_FILE = "partition_rows.npy"
+_PARTITION_OFFSETS_FILE = "partition_offsets.npy"
+_CHUNK_ROWS = 65536
+"""Number of rows multiplied at once, bounds the memory used by the search"""
+
+
+class EmbeddingIndex:
+
+    """Normalized embeddings of the samples of a split, stored in a memory mapped
+    float32 matrix in `directory`, and the search of the most similar samples
+    by the cosine similarity.
+
+    The embeddings are computed in batches by `update`, after each batch the
+    progress is persisted, so an interrupted computation continues where it
+    stopped. Large splits may be partitioned by `build_partitions` (IVF), then
+    only the rows in the partitions closest to the query are searched.
+    """
+
+    def __init__(self, directory: str | os.PathLike, n_rows: int, key: str = ""):
+        """Args:
+        ----
+            directory (str | os.PathLike): where the embeddings are stored
+            n_rows (int): number of the samples in the split
+            key (str, optional): identifier of the embedded texts and of the
+                encoder, the stored embeddings are discarded if it differs.
+                Defaults to "".
+        """
+        if not _has_numpy:
+            raise RuntimeError("numpy isn't installed, EmbeddingIndex needs it.")
+        self.directory = Path(directory)
+        self.n_rows = n_rows
+        self.key = key
+        self._embeddings: np.memmap | None = None
+        self._partitions: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+        meta = self._read_meta()
+        if meta is not None and (meta["n_rows"], meta["key"]) == (n_rows, key):
+            self.n_done: int = meta["n_done"]
+            self.n_partitions: int | None = meta["n_partitions"]
+        else:
+            self.n_done = 0
+            self.n_partitions = None
+            for name in [
+                _EMBEDDINGS_FILE,
+                _CENTROIDS_FILE,
+                _PARTITION_ROWS_FILE,
+                _PARTITION_OFFSETS_FILE,
+            ]:
+                (self.directory / name).unlink(missing_ok=True)
+
+    @property
+    def complete(self) -> bool:
+        return self.n_done == self.n_rows
+
+    def update(
+        self,
+        text_of_row: Callable[[int], str],
+        encode: Callable[[list[str]], Any],
+        batch_size: int = 256,
+        progress_callback: Callable[[int], None] | None = None,
+    ):
+        """Compute the embeddings of the rows which aren't computed yet.
+
+        Args:
+        ----
+            text_of_row (Callable[[int], str]): returns the text of the row
+            encode (Callable[[list[str]], Any]): encoder which returns a matrix
+                (anything convertible to numpy array) with one embedding per text
+            batch_size (int, optional): number of the texts encoded at once.
+                Defaults to 256.
+            progress_callback (Callable[[int], None] | None, optional): called
+                with the number of the computed rows after each batch.
+                Defaults to None.
+
+        """
+        import numpy as np
+
+        while self.n_done < self.n_rows:
+            end = min(self.n_done + batch_size, self.n_rows)
+            texts = [text_of_row(row) for row in range(self.n_done, end)]
+            batch = np.asarray(encode(texts), dtype=np.float32)
+            if batch.ndim != 2 or len(batch) != len(texts):
+                raise ValueError("The encoder must return one embedding per text")
+            norms = np.linalg.norm(batch, axis=1, keepdims=True)
+            batch /= np.maximum(norms, np.finfo(np.float32).tiny)
+
+            embeddings = self._open_embeddings(dimension=batch.shape[1])
+            embeddings[self.n_done : end] = batch
+            embeddings.flush()
+            # the progress is persisted only after the embeddings are flushed
+            self.n_done = end
+            self._write_meta()
+            if progress_callback is not None:
+                progress_callback(self.n_done)
+
+    def build_partitions(
+        self, n_partitions: int, iterations: int = 10, sample_size: int = 100000
+    ):
+        """Cluster the embeddings with spherical k-means and group the rows by
+        the closest centroid, so that `nearest` searches only a few partitions.
+
+        Args:
+        ----
+            n_partitions (int): number of the clusters, e.g. sqrt of the number of rows
+            iterations (int, optional): number of k-means iterations. Defaults to 10.
+            sample_size (int, optional): number of the rows the centroids are
+                computed from. Defaults to 100000.
+
+        """
+        import numpy as np
+
+        if not self.complete:
+            raise RuntimeError("The embeddings must be computed before partitioning")
+        embeddings = self._open_embeddings()
+        rng = np.random.default_rng(0)
+        n_sample = min(sample_size, self.n_rows)
+        sample = np.asarray(
+            embeddings[np.sort(rng.choice(self.n_rows, n_sample, replace=False))]
+        )
+        n_partitions = min(n_partitions, n_sample)
+        centroids = sample[rng.choice(n_sample, n_partitions, replace=False)]
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for partition in range(n_partitions):
+                members = sample[assignment == partition]
+                if len(members) != 0:
+                    centroid = members.sum(axis=0)
+                    centroids[partition] = centroid / max(
+                        np.linalg.norm(centroid), 1e-12
+                    )
+
+        assignment = np.concatenate(
+            [
+                np.argmax(embeddings[start : start + _CHUNK_ROWS] @ centroids.T, axis=1)
+                for start in range(0, self.n_rows, _CHUNK_ROWS)
+            ]
+        )
+        rows = np.argsort(assignment, kind="stable")
+        offsets = np.searchsorted(assignment[rows], np.arange(n_partitions + 1))
+        np.save(self.directory / _CENTROIDS_FILE, centroids)
+        np.save(self.directory / _PARTITION_ROWS_FILE, rows)
+        np.save(self.directory / _PARTITION_OFFSETS_FILE, offsets)
+        self.n_partitions = n_partitions
+        self._partitions = None
+        self._write_meta()
+
+    def nearest(self, row: int, k: int, n_probe: int = 8) -> list[tuple[int, float]]:
+        """Rows most similar to the `row` (which is excluded) with their cosine
+        similarities, sorted from the most similar. Only the computed rows are
+        searched, if the index is partitioned, only the rows from the `n_probe`
+        partitions closest to the `row` are searched.
+        """
+        import numpy as np
+
+        if not 0 <= row < self.n_done:
+            raise IndexError("The embedding of the row isn't computed yet")
+        embeddings = self._open_embeddings()
+        query = np.asarray(embeddings[row])
+
+        candidates: list[tuple[np.ndarray, np.ndarray]] = []
+        partitions = self._load_partitions() if self.complete else None
+        if partitions is not None:
+            centroids, partition_rows, offsets = partitions
+            probed = np.argsort(-(centroids @ query))[:n_probe]
+            rows = np.sort(
+                np.concatenate(
+                    [partition_rows[offsets[p] : offsets[p + 1]] for p in probed]
+                )
+            )
+            for start in range(0, len(rows), _CHUNK_ROWS):
+                chunk_rows = rows[start : start + _CHUNK_ROWS]
+                candidates.append(
+                    _top_k(chunk_rows, embeddings[chunk_rows] @ query, k + 1)
+                )
+        else:
+            for start in range(0, self.n_done, _CHUNK_ROWS):
+                end = min(start + _CHUNK_ROWS, self.n_done)
+                candidates.append(
+                    _top_k(np.arange(start, end), embeddings[start:end] @ query, k + 1)
+                )
+
+        rows = np.concatenate([rows for rows, _ in candidates])
+        scores = np.concatenate([scores for _, scores in candidates])
+        order = np.argsort(-scores, kind="stable")
+        return [(int(rows[i]), float(scores[i])) for i in order if rows[i] != row][:k]
+
+    def _open_embeddings(self, dimension: int | None = None) -> "np.memmap":
+        import numpy as np
+
+        if self._embeddings is None:
+            path = self.directory / _EMBEDDINGS_FILE
+            if path.exists():
+                self._embeddings = np.load(path, mmap_mode="r+")
+            elif dimension is None:
+                raise RuntimeError("No embeddings are computed yet")
+            else:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._embeddings = np.lib.format.open_memmap(
+                    path, mode="w+", dtype=np.float32, shape=(self.n_rows, dimension)
+                )
+        return self._embeddings
+
+    def _load_partitions(self) -> "tuple[np.ndarray, np.ndarray, np.ndarray] | None":
+        import numpy as np
+
+        if self.n_partitions is None:
+            return None
+        if self._partitions is None:
+            self._partitions = (
+                np.load(self.directory / _CENTROIDS_FILE),
+                np.load(self.directory / _PARTITION_ROWS_FILE, mmap_mode="r"),
+                np.load(self.directory / _PARTITION_OFFSETS_FILE),
+            )
+        return self._partitions
+
+    def _read_meta(self) -> dict[str, Any] | None:
+        try:
+            with (self.directory / _META_FILE).open() as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / f"{_META_FILE}.tmp"
+        with tmp_path.open("w") as f:
+            json.dump(
+                {
+                    "n_rows": self.n_rows,
+                    "key": self.key,
+                    "n_done": self.n_done,
+                    "n_partitions": self.n_partitions,
+                },
+                f,
+            )
+        tmp_path.replace(self.directory / _META_FILE)
+
+
+def _top_k(
+    rows: "np.ndarray", scores: "np.ndarray", k: int
+) -> "tuple[np.ndarray, np.ndarray]":
+    import numpy as np
+
+    if len(scores) > k:
+        best = np.argpartition(-scores, k)[:k]
+        return rows[best], scores[best]
+    return rows, scores
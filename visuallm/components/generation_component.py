@@ -1,7 +1,14 @@
+import dataclasses
 import logging
+from collections.abc import Sequence
+from typing import Any
 
 from visuallm.component_base import ComponentBase
-from visuallm.components.generators.base import Generator, OutputProbabilityInterface
+from visuallm.components.generators.base import (
+    GeneratedOutput,
+    Generator,
+    OutputProbabilityInterface,
+)
 from visuallm.components.mixins.data_preparation_mixin import (
     DATASET_TYPE,
     DATASETS_TYPE,
@@ -21,6 +28,7 @@ from visuallm.components.mixins.model_selection_mixin import (
     ModelSelectionMixin,
 )
 from visuallm.elements import CollapsibleElement, HeadingElement, PlainTextElement
+from visuallm.elements.barchart_element import BarChartColumns
 from visuallm.elements.element_base import ElementBase
 
 
@@ -38,6 +46,23 @@ class RetrieveTargetStrIsNoneError(Exception):
         )
 
 
+@dataclasses.dataclass
+class Generations:
+    output: GeneratedOutput
+    probs: Sequence[Any]
+    """Probabilities of the tokens of each generated output, None if the
+    generator doesn't measure them"""
+    output_sequences: Sequence[Any]
+    """Ids of the tokens of each generated output"""
+
+
+@dataclasses.dataclass
+class PrefetchedSample:
+    text_to_tokenizer: str
+    output: GeneratedOutput | None = None
+    """Generated output, available only if the generations are prefetched"""
+
+
 class GenerationComponent(
     ComponentBase,
     DataPreparationMixin,
@@ -55,6 +80,11 @@ class GenerationComponent(
         dataset: DATASET_TYPE | None = None,
         dataset_choices: DATASETS_TYPE | None = None,
         selectors: SELECTORS_TYPE | None = None,
+        prefetch_offsets: Sequence[int] = (),
+        prefetch_generations: bool = False,
+        dataset_snapshot_dir: str | None = None,
+        dataset_snapshot_version: str = "",
+        load_in_background: bool = False,
     ):
         """Provide generation capabilities. The user provides model, tokenizer
         and dataset, and this component displays all the elements needed to select element of the
@@ -77,6 +107,21 @@ class GenerationComponent(
                 dictionary of functions that load the dataset. Defaults to None.
             selectors (SELECTORS_TYPE): dictionary of all the selectors which should
                 be displayed on the frontend.
+            prefetch_offsets (Sequence[int], optional): Offsets of the dataset samples
+                (relative to the selected one) whose inputs to the model are prepared on
+                a background worker, e.g. `(1,)` prepares the next sample. Defaults to ().
+            prefetch_generations (bool, optional): Whether to generate the outputs for the
+                prefetched samples as well. Only the generations without sampling
+                (`do_sample` parameter unset) are prefetched, enable it only for
+                generators that are deterministic then. Defaults to False.
+            dataset_snapshot_dir (str | None, optional): Directory where the datasets
+                constructed by functions are stored, so that they are memory mapped after
+                the restart of the app. Defaults to None.
+            dataset_snapshot_version (str, optional): Version of the dataset constructors,
+                the snapshots are built again when it changes. Defaults to "".
+            load_in_background (bool, optional): Whether to load and warm up the generator
+                on a background thread, so that the server starts immediately and the
+                frontend displays that the model is loading. Defaults to False.
         """
         super().__init__(name="interactive_generation", title=title)
         self.main_heading_element = PlainTextElement(
@@ -86,11 +131,18 @@ class GenerationComponent(
             self,
             generator_choices=generator_choices,
             generator=generator,
+            load_in_background=load_in_background,
         )
-        self._check_generators(self.generator, generator_choices)
+        self._check_generators(generator, generator_choices)
         DataPreparationMixin.__init__(
-            self, dataset=dataset, dataset_choices=dataset_choices
+            self,
+            dataset=dataset,
+            dataset_choices=dataset_choices,
+            prefetch_offsets=prefetch_offsets,
+            dataset_snapshot_dir=dataset_snapshot_dir,
+            dataset_snapshot_version=dataset_snapshot_version,
         )
+        self._prefetch_generations = prefetch_generations
         GenerationSelectorsMixin.__init__(self, selectors=selectors)
         MetricsMixin.__init__(
             self,
@@ -113,9 +165,10 @@ class GenerationComponent(
         collapsible_element.add_subelements(input_display_elements)
         self.add_element(collapsible_element)
         self.add_elements(self.metrics_display_elements)
+        self.init_dependency_graph()
 
     def __post_init__(self, *args, **kwargs):
-        self.on_dataset_change_callback()
+        self.when_generator_ready(self.on_dataset_change_callback)
 
     def init_model_input_display(self) -> list[ElementBase]:
         """Init elements that should display the dataset sample.
@@ -132,90 +185,240 @@ class GenerationComponent(
     def update_model_input_display(self):
         """Update the elements that display the dataset sample.
 
-        This method is called each time a new dataset sample is loaded,
-        and the loaded dataset sample is stored in `self.loaded_sample`
+        This method is called each time a new dataset sample is loaded (or the
+        prompt changes), and the loaded dataset sample is stored in
+        `self.loaded_sample`
         """
-        if self.generator.create_text_to_tokenizer is None:
+        self.text_to_tokenizer_element.content = self.dependency_graph.get("prompt")
+
+    def prefetch_state(self) -> tuple[Generator, tuple[tuple[str, Any], ...]]:
+        return (
+            self.generator,
+            tuple(sorted(self.selected_generation_parameters.items())),
+        )
+
+    def prefetch_sample(
+        self,
+        sample: Any,
+        state: tuple[Generator, tuple[tuple[str, Any], ...]],
+    ) -> PrefetchedSample:
+        """Create the text to the tokenizer and if `prefetch_generations` is set
+        and the generation is deterministic, generate the outputs.
+        """
+        generator, generation_parameters = state
+        if generator.create_text_to_tokenizer is None:
             raise CreateTextToTokenizerIsNoneError()
-        self.text_to_tokenizer_element.content = (
-            self.generator.create_text_to_tokenizer(self.loaded_sample)
+        prefetched = PrefetchedSample(generator.create_text_to_tokenizer(sample))
+        parameters = dict(generation_parameters)
+        if self._prefetch_generations and not parameters.get("do_sample", False):
+            prefetched.output = generator.generate_output(
+                prefetched.text_to_tokenizer, **parameters
+            )
+        return prefetched
+
+    def init_dependency_graph(self):
+        """Declare how the displayed values depend on the inputs selected on
+        the frontend, so that e.g. the change of the generation parameters
+        doesn't construct the prompt and score the target again.
+        """
+        graph = self.dependency_graph
+        for name in [
+            "dataset",
+            "sample",
+            "generator",
+            "generation_parameters",
+            "metrics_selection",
+            "prefetched",
+        ]:
+            graph.add_input(name)
+        graph.add_node(
+            "prompt",
+            self.compute_prompt,
+            ["dataset", "sample", "generator", "prefetched"],
+        )
+        graph.add_node(
+            "generations",
+            self.compute_generations,
+            ["prompt", "sample", "generator", "generation_parameters", "prefetched"],
+        )
+        # the target is scored again only if the length of the tokenized
+        # input changes, not after each generation
+        graph.add_node(
+            "input_length",
+            lambda generations: generations.output.input_length,
+            ["generations"],
+        )
+        graph.add_node(
+            "target_probabilities",
+            self.compute_target_probabilities,
+            ["sample", "generator", "input_length"],
+        )
+        graph.add_node(
+            "metrics",
+            self.compute_metrics_on_generations,
+            ["generations", "sample", "generator", "metrics_selection"],
+        )
+        graph.add_node(
+            "target_metrics",
+            self.compute_metrics_on_target,
+            ["target_probabilities", "sample", "generator", "metrics_selection"],
+        )
+        # the elements are updated once all the values are computed
+        graph.add_effect(
+            "model_input_display",
+            lambda sample, prompt: self.update_model_input_display(),
+            ["sample", "prompt"],
+        )
+        graph.add_effect(
+            "metrics_display", self.display_metrics_on_predicted, ["metrics"]
+        )
+        graph.add_effect(
+            "target_metrics_display", self.display_metrics_on_target, ["target_metrics"]
         )
 
-    def update_generated_output_display(self):
-        """Generate outputs with the model, measure probabilities, compute all the
-        metrics and update metrics display elements.
+    def set_dependency_inputs(self):
+        """Set the inputs of the dependency graph to the values selected on
+        the frontend.
         """
-        if self.generator.retrieve_target_str is None:
-            raise RetrieveTargetStrIsNoneError()
-        text_to_tokenizer = self.text_to_tokenizer_element.content
-        output = self.generator.generate_output(
-            text_to_tokenizer, **self.selected_generation_parameters
+        graph = self.dependency_graph
+        graph.set_input("dataset", self.selected_dataset_name)
+        graph.set_input("sample", self.loaded_sample)
+        graph.set_input("generator", self.generator)
+        graph.set_input("generation_parameters", self.selected_generation_parameters)
+        graph.set_input("metrics_selection", self.selected_metrics)
+        # prefetched only once for all the values which are computed from it
+        graph.set_input(
+            "prefetched", self.prefetched_sample() if self.prefetches_samples else None
         )
 
-        # compute metrics on generated
-        probs, output_sequences = None, None
+    def update_displayed_values(self):
+        """Recompute the values affected by the inputs changed on the frontend
+        and update the elements which display them.
+        """
+        self.set_dependency_inputs()
+        self.dependency_graph.apply_effects()
+
+    def compute_prompt(
+        self,
+        dataset: str,
+        sample: Any,
+        generator: Generator,
+        prefetched: PrefetchedSample | None,
+    ) -> str:
+        """Create the text to the tokenizer, unless it was prefetched."""
+        if prefetched is not None:
+            return prefetched.text_to_tokenizer
+        if generator.create_text_to_tokenizer is None:
+            raise CreateTextToTokenizerIsNoneError()
+        return generator.create_text_to_tokenizer(sample)
+
+    def compute_generations(
+        self,
+        prompt: str,
+        sample: Any,
+        generator: Generator,
+        generation_parameters: dict[str, Any],
+        prefetched: PrefetchedSample | None,
+    ) -> Generations:
+        """Generate the outputs from the `prompt` and measure their probabilities."""
+        output = None
+        if prefetched is not None and prefetched.text_to_tokenizer == prompt:
+            output = prefetched.output
+        if output is None:
+            output = generator.generate_output(prompt, **generation_parameters)
 
         if (
-            isinstance(self.generator, OutputProbabilityInterface)
+            isinstance(generator, OutputProbabilityInterface)
             and output.input_length is not None
         ):
-            if self.generator.create_text_to_tokenizer is None:
+            if generator.create_text_to_tokenizer is None:
                 raise CreateTextToTokenizerIsNoneError()
             full_generated_texts = [
-                self.generator.create_text_to_tokenizer(self.loaded_sample, generated)
+                generator.create_text_to_tokenizer(sample, generated)
                 for generated in output.decoded_outputs
             ]
-            probs, output_sequences = self.generator.measure_output_probability(
+            probs, output_sequences = generator.measure_output_probability(
                 full_generated_texts, output.input_length
             )
         else:
             probs = [None] * len(output.decoded_outputs)
             output_sequences = probs
+        return Generations(output, probs, output_sequences)
 
-        self.compute_n_display_metrics_on_predicted(
-            output.decoded_outputs,
-            self.generator.retrieve_target_str(self.loaded_sample),
-            probs,
-            output_sequences,
-        )
-
-        # compute scores on target
+    def compute_target_probabilities(
+        self, sample: Any, generator: Generator, input_length: int | None
+    ) -> tuple[Sequence[Any], Sequence[Any]]:
+        """Measure the probabilities of the target of the `sample`."""
+        if generator.retrieve_target_str is None:
+            raise RetrieveTargetStrIsNoneError()
         if (
-            isinstance(self.generator, OutputProbabilityInterface)
-            and output.input_length is not None
+            isinstance(generator, OutputProbabilityInterface)
+            and input_length is not None
         ):
-            if self.generator.create_text_to_tokenizer is None:
+            if generator.create_text_to_tokenizer is None:
                 raise CreateTextToTokenizerIsNoneError()
-            probs, output_sequences = self.generator.measure_output_probability(
+            return generator.measure_output_probability(
                 [
-                    self.generator.create_text_to_tokenizer(
-                        self.loaded_sample,
-                        self.generator.retrieve_target_str(self.loaded_sample),
+                    generator.create_text_to_tokenizer(
+                        sample, generator.retrieve_target_str(sample)
                     )
                 ],
-                output.input_length,
+                input_length,
             )
-        else:
-            probs, output_sequences = [None], [None]
-        self.compute_n_display_metrics_on_target(
-            self.generator.retrieve_target_str(self.loaded_sample),
-            probs,
-            output_sequences,
+        return [None], [None]
+
+    def compute_metrics_on_generations(
+        self,
+        generations: Generations,
+        sample: Any,
+        generator: Generator,
+        metrics_selection: tuple[str, ...],
+    ) -> BarChartColumns:
+        if generator.retrieve_target_str is None:
+            raise RetrieveTargetStrIsNoneError()
+        return self.compute_metrics(
+            generations.output.decoded_outputs,
+            generator.retrieve_target_str(sample),
+            generations.probs,
+            generations.output_sequences,
         )
 
+    def compute_metrics_on_target(
+        self,
+        target_probabilities: tuple[Sequence[Any], Sequence[Any]],
+        sample: Any,
+        generator: Generator,
+        metrics_selection: tuple[str, ...],
+    ) -> BarChartColumns:
+        if generator.retrieve_target_str is None:
+            raise RetrieveTargetStrIsNoneError()
+        target = generator.retrieve_target_str(sample)
+        probs, output_sequences = target_probabilities
+        return self.compute_metrics([target], target, probs, output_sequences)
+
+    def update_generated_output_display(self):
+        """Generate outputs with the model, measure probabilities, compute all the
+        metrics and update metrics display elements. Only the values whose inputs
+        changed since they were computed are computed again.
+        """
+        self.dependency_graph.apply_effects()
+
     def after_on_generator_change_callback(self):
-        self.force_set_dataset_selector_updated()
-        self.on_dataset_change_callback()
+        self.update_displayed_values()
 
     def after_on_dataset_change_callback(self):
-        self.update_model_input_display()
-        self.update_generated_output_display()
+        # sending the dataset configuration again generates new outputs
+        self.dependency_graph.invalidate("generations")
+        self.update_displayed_values()
 
     def on_generation_changed_callback(self):
-        return self.after_on_dataset_change_callback()
+        # sending the same generation parameters again generates new outputs
+        # (e.g. with sampling), the prompt and the target scores are kept
+        self.dependency_graph.invalidate("generations")
+        self.update_displayed_values()
 
     def metrics_processing_callback(self):
-        return self.after_on_dataset_change_callback()
+        self.update_displayed_values()
 
     def _check_generators(
         self,
@@ -64,6 +64,21 @@ class Generator:
     def generate_output(self, text_to_tokenizer: str, **kwargs) -> GeneratedOutput:
         raise NotImplementedError()
 
+    @property
+    def memory_footprint(self) -> int:
+        """Number of bytes the generator keeps in memory (e.g. the parameters
+        of the model), used to fit the cached generators into a memory budget.
+        Defaults to 0, which is right for the generators that call remote APIs.
+        """
+        return 0
+
+    def warm_up(self) -> None:
+        """Prepare the generator for the first request, e.g. run the model once,
+        so that the lazy initializations don't slow down the first generation
+        requested by the user. By default nothing is done.
+        """
+        pass
+
 
 class NextTokenPredictionInterface(ABC):
 
@@ -1,9 +1,8 @@
 from collections.abc import Callable
 from heapq import nlargest
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
-from transformers.generation.utils import GenerateOutput
-
 from visuallm.components.generators.base import (
     CreateTextToTokenizer,
     CreateTextToTokenizerChat,
@@ -14,13 +13,9 @@ from visuallm.components.generators.base import (
     RetrieveTargetStr,
 )
 
-try:
-    import torch
-    import transformers  # noqa: F401
-except ImportError:
-    _has_torch = False
-else:
-    _has_torch = True
+# torch and transformers take seconds to import, hence they are imported only
+# when the generator is used
+_has_torch = find_spec("torch") is not None and find_spec("transformers") is not None
 
 
 if TYPE_CHECKING:
@@ -30,6 +25,7 @@ if TYPE_CHECKING:
         PreTrainedTokenizer,
         PreTrainedTokenizerFast,
     )
+    from transformers.generation.utils import GenerateOutput
 
     TOKENIZER_TYPE: TypeAlias = PreTrainedTokenizer | PreTrainedTokenizerFast
 
@@ -82,7 +78,7 @@ class HuggingFaceGenerator(
             return_dict_in_generate=True,
             **generation_arguments,
         )
-        output = cast(GenerateOutput, output)
+        output = cast("GenerateOutput", output)
         input_length: int = model_inputs.input_ids.size(1)
 
         decoded_outputs = self.decode_output(output, input_length)
@@ -93,7 +89,7 @@ class HuggingFaceGenerator(
 
     def decode_output(
         self,
-        output: GenerateOutput,
+        output: "GenerateOutput",
         input_length: int,
     ):
         """Decode generated output and remove the input part from it.
@@ -125,6 +121,8 @@ class HuggingFaceGenerator(
         -------
             np.NDArray: probabilities of the next token of shape (vocab_size, )
         """
+        import torch
+
         model_inputs = self._tokenizer(text_to_tokenizer, return_tensors="pt")
         with torch.no_grad():
             probs: torch.Tensor = self._model(**model_inputs).logits
@@ -133,6 +131,22 @@ class HuggingFaceGenerator(
 
         return self.get_n_largest_tokens_and_probs(np_probs)
 
+    def warm_up(self) -> None:
+        """Run the model on a short input, so that the memory allocations and
+        kernel initializations are done before the first user request.
+        """
+        import torch
+
+        model_inputs = self._tokenizer("warm up", return_tensors="pt")
+        with torch.inference_mode():
+            self._model(**model_inputs)
+
+    @property
+    def memory_footprint(self) -> int:
+        """Sum of the sizes of the parameters and the buffers of the model."""
+        tensors = [*self._model.parameters(), *self._model.buffers()]
+        return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
     def convert_token_to_string(self, token: str):
         return self._tokenizer.convert_tokens_to_string([token])
 
@@ -158,6 +172,8 @@ class HuggingFaceGenerator(
         -------
             List[torch.Tensor], List[torch.Tensor]: assigned probabilities, only generated ids tensor
         """
+        import torch
+
         probabilities: list[torch.Tensor] = []
         output_sequences_list: list[torch.Tensor] = []
         for text in texts:
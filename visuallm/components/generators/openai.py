@@ -1,5 +1,8 @@
 import dataclasses
 import json
+import os
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
 from visuallm.components.generators.base import (
     CreateTextToTokenizer,
@@ -9,15 +12,11 @@ from visuallm.components.generators.base import (
     RetrieveTargetStr,
 )
 
-try:
-    import openai
-    from openai.types.chat.chat_completion import ChatCompletion
-except ImportError:
-    _has_openai = False
-else:
-    _has_openai = True
+# openai is imported only when the generator is used, as it is slow to import
+_has_openai = find_spec("openai") is not None
 
-import os
+if TYPE_CHECKING:
+    from openai.types.chat.chat_completion import ChatCompletion
 
 
 @dataclasses.dataclass
@@ -61,6 +60,8 @@ class OpenAIGenerator(Generator):
         self.create_text_to_tokenizer = create_text_to_tokenizer
         self.create_text_to_tokenizer_chat = create_text_to_tokenizer_chat
         self.retrieve_target_str = retrieve_target_str
+        import openai
+
         if use_async_mode:
             self.client: openai.AsyncOpenAI | openai.Client = openai.AsyncOpenAI(
                 api_key=_api_key
@@ -71,6 +72,8 @@ class OpenAIGenerator(Generator):
     def generate_output(
         self, text_to_tokenizer: str, **generation_args
     ) -> GeneratedOutput:
+        import openai
+
         if not isinstance(self.client, openai.Client):
             raise TypeError()
         params = json.loads(text_to_tokenizer)
@@ -92,6 +95,8 @@ class OpenAIGenerator(Generator):
         )
 
     async def generate_output_async(self, text_to_tokenizer: str, **generation_args):
+        import openai
+
         if not isinstance(self.client, openai.AsyncOpenAI):
             raise TypeError()
         params = json.loads(text_to_tokenizer)
@@ -0,0 +1,215 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, KeysView, Mapping, Sequence
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, overload
+
+# pyarrow is imported only when an arrow file is opened
+_has_pyarrow = find_spec("pyarrow") is not None
+
+_INDEX_MAGIC = b"VLMJSONL"
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+"""magic, size of the indexed file, its modification time (ns), number of lines"""
+_OFFSET_TYPECODE = "Q"
+
+
+class MemoryMappedJSONL(Sequence[Any]):
+
+    """Random access to the lines of a JSONL file which may be bigger than the
+    memory. The file is memory mapped and the byte offsets of the lines are
+    stored in an index file next to it, so that only the accessed lines are
+    read and parsed. The index is built on the first open and rebuilt when the
+    file changes. Empty lines are skipped.
+    """
+
+    def __init__(self, path: str | os.PathLike, index_path: str | None = None):
+        """Args:
+        ----
+            path (str | os.PathLike): path to the JSONL file
+            index_path (str | None, optional): where to persist the offsets of the
+                lines. If the location isn't writable, the index is kept only in
+                memory. Defaults to `<path>.idx`.
+        """
+        self.path = Path(path)
+        self.index_path = Path(index_path or f"{self.path}.idx")
+        with self.path.open("rb") as f:
+            stat = os.fstat(f.fileno())
+            self._size = stat.st_size
+            self._data = _map(f, self._size)
+        offsets = self._load_index(stat)
+        if offsets is None:
+            offsets = self._build_index(stat)
+        self._offsets: Sequence[int] = offsets
+
+    @property
+    def nbytes(self) -> int:
+        # the mapped file is held by the page cache of the OS, not by the process
+        return 0
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        start = self._offsets[index]
+        end = self._data.find(b"\n", start)
+        if end == -1:
+            end = self._size
+        return json.loads(self._data[start:end])
+
+    def _load_index(self, stat: os.stat_result) -> Sequence[int] | None:
+        try:
+            with self.index_path.open("rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) != _INDEX_HEADER.size:
+                    return None
+                magic, size, mtime_ns, count = _INDEX_HEADER.unpack(header)
+                if (magic, size, mtime_ns) != (
+                    _INDEX_MAGIC,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ):
+                    return None
+                if count == 0:
+                    return array(_OFFSET_TYPECODE)
+                index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        item_size = array(_OFFSET_TYPECODE).itemsize
+        if len(index_map) != _INDEX_HEADER.size + count * item_size:
+            return None
+        # the offsets are read directly from the mapped index
+        return memoryview(index_map)[_INDEX_HEADER.size :].cast("Q")
+
+    def _build_index(self, stat: os.stat_result) -> Sequence[int]:
+        offsets = array(_OFFSET_TYPECODE)
+        line_start = 0
+        while line_start < self._size:
+            line_end = self._data.find(b"\n", line_start)
+            if line_end == -1:
+                line_end = self._size
+            if self._data[line_start:line_end].strip():
+                offsets.append(line_start)
+            line_start = line_end + 1
+
+        header = _INDEX_HEADER.pack(
+            _INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(offsets)
+        )
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                f.write(header)
+                offsets.tofile(f)
+            tmp_path.replace(self.index_path)
+        except OSError:
+            # e.g. read-only dataset directory, the index is kept in memory
+            return offsets
+        # the mapped index doesn't occupy the memory of the process
+        return self._load_index(stat) or offsets
+
+
+class MemoryMappedArrow(Sequence[dict[str, Any]]):
+
+    """Random access to the rows of an Arrow IPC file (both the file and the
+    stream format, e.g. the cache files of HuggingFace datasets) which is
+    memory mapped, so the rows are read only when accessed.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        if not _has_pyarrow:
+            raise RuntimeError("pyarrow isn't installed, MemoryMappedArrow needs it.")
+        import pyarrow as pa
+
+        self.path = Path(path)
+        source = pa.memory_map(str(self.path), "r")
+        try:
+            reader = pa.ipc.open_file(source)
+            batches = [reader.get_batch(i) for i in range(reader.num_record_batches)]
+        except pa.ArrowInvalid:
+            source.seek(0)
+            batches = list(pa.ipc.open_stream(source))
+        self._batches = batches
+        # index of the first row of each batch
+        self._batch_starts = [0]
+        for batch in batches:
+            self._batch_starts.append(self._batch_starts[-1] + batch.num_rows)
+
+    @property
+    def nbytes(self) -> int:
+        # the mapped file is held by the page cache of the OS, not by the process
+        return 0
+
+    def __len__(self) -> int:
+        return self._batch_starts[-1]
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        batch_index = bisect_right(self._batch_starts, index) - 1
+        row = index - self._batch_starts[batch_index]
+        return self._batches[batch_index].slice(row, 1).to_pylist()[0]
+
+
+class MemoryMappedDataset:
+
+    """Dataset (implements the `DatasetProtocol`) whose splits are memory mapped
+    JSONL (`.jsonl`) or Arrow (`.arrow`) files, e.g.
+    `MemoryMappedDataset({"train": "train.jsonl", "test": "test.jsonl"})`.
+    The splits are opened on the first access.
+    """
+
+    def __init__(self, splits: Mapping[str, str | os.PathLike]):
+        self._paths = dict(splits)
+        self._splits: dict[str, Sequence[Any]] = {}
+
+    def keys(self) -> KeysView[str]:
+        return self._paths.keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __getitem__(self, split: str) -> Sequence[Any]:
+        if split not in self._splits:
+            path = Path(self._paths[split])
+            if path.suffix == ".arrow":
+                self._splits[split] = MemoryMappedArrow(path)
+            else:
+                self._splits[split] = MemoryMappedJSONL(path)
+        return self._splits[split]
+
+
+def _map(f, size: int) -> mmap.mmap | bytes:
+    if size == 0:
+        # empty files cannot be memory mapped
+        return b""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
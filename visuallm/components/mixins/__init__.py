@@ -4,3 +4,5 @@ from visuallm.components.mixins.generation_selectors_mixin import (
 )
 from visuallm.components.mixins.metrics_mixin import MetricsMixin
 from visuallm.components.mixins.model_selection_mixin import ModelSelectionMixin
+from visuallm.components.mixins.sample_search_mixin import SampleSearchMixin
+from visuallm.components.mixins.similar_samples_mixin import SimilarSamplesMixin
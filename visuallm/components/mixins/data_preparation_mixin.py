@@ -1,7 +1,11 @@
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Callable, KeysView, Mapping, Sequence
+from collections.abc import Callable, Hashable, KeysView, Mapping, Sequence
+from functools import partial
+from itertools import islice
 from typing import Any, Protocol
 
+from visuallm.components.dataset_snapshots import DatasetSnapshotCache
 from visuallm.elements.element_base import ElementBase
 from visuallm.elements.plain_text_element import PlainTextElement
 from visuallm.elements.selector_elements import (
@@ -10,6 +14,12 @@ from visuallm.elements.selector_elements import (
     MinMaxSubElement,
     SelectorSubElement,
 )
+from visuallm.resource_registry import resource_registry
+from visuallm.utils.memory_budgeted_cache import (
+    CacheStatistics,
+    MemoryBudgetedLRUCache,
+)
+from visuallm.utils.prefetcher import Prefetcher
 
 
 class DatasetProtocol(Protocol):
@@ -25,6 +35,50 @@ DATASETS_TYPE = (
     Mapping[str, DatasetProtocol] | Mapping[str, Callable[[], DatasetProtocol]]
 )
 
+DEFAULT_DATASET_NAME = "default"
+"""Name under which the dataset is registered if it isn't selected from
+`dataset_choices`"""
+
+_N_SAMPLES_TO_ESTIMATE_SIZE = 32
+
+
+def estimate_dataset_size(dataset: DatasetProtocol) -> int:
+    """Estimate the number of bytes the dataset occupies in memory.
+
+    Arrow backed splits (e.g. HuggingFace `Dataset`) report their size exactly,
+    the size of the other splits is extrapolated from the size of their first
+    few samples.
+    """
+    # the datasets aren't required to be iterable, only to have the keys
+    return sum(
+        _estimate_split_size(dataset[key]) for key in dataset.keys()  # noqa: SIM118
+    )
+
+
+def _unmeasured_size(dataset: DatasetProtocol) -> int:
+    return 0
+
+
+def _estimate_split_size(split: Any) -> int:
+    table = getattr(split, "data", split)
+    nbytes = getattr(table, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if not isinstance(split, Sequence) or len(split) == 0:
+        return _deep_getsizeof(split)
+    samples = list(islice(split, _N_SAMPLES_TO_ESTIMATE_SIZE))
+    sample_size = sum(_deep_getsizeof(sample) for sample in samples) / len(samples)
+    return sys.getsizeof(split) + int(sample_size * len(split))
+
+
+def _deep_getsizeof(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, Mapping):
+        size += sum(_deep_getsizeof(k) + _deep_getsizeof(v) for k, v in obj.items())
+    elif isinstance(obj, list | tuple | set | frozenset):
+        size += sum(_deep_getsizeof(item) for item in obj)
+    return size
+
 
 class DataPreparationMixin(ABC):
     def __init__(
@@ -33,6 +87,13 @@ class DataPreparationMixin(ABC):
         dataset_choices: DATASETS_TYPE | None = None,
         keep_datasets_in_memory: bool = True,
         update_on_data_config_sent: bool = True,
+        dataset_cache_budget: int | None = None,
+        dataset_size_estimator: Callable[
+            [DatasetProtocol], int
+        ] = estimate_dataset_size,
+        prefetch_offsets: Sequence[int] = (),
+        dataset_snapshot_dir: str | None = None,
+        dataset_snapshot_version: str = "",
     ):
         """Mixin that implements dataset handling server methods. Each time the new sample
         is selected the mixin automatically loads a sample from the dataset according
@@ -61,14 +122,50 @@ class DataPreparationMixin(ABC):
                 `on_sample_change_callback` even when the config sent from the frontend is exactly
                 the same as what is already loaded. May be used for send as restart functionality,
                 Defaults to True.
+            dataset_cache_budget (int | None, optional): Maximal number of bytes of the
+                cached datasets. When exceeded, the least recently selected datasets are
+                evicted from the cache and loaded again once selected. If None the cache
+                is unbounded. Defaults to None.
+            dataset_size_estimator (Callable[[DatasetProtocol], int], optional): Function
+                that returns the number of bytes of a dataset, it is called only if
+                `dataset_cache_budget` is set. Defaults to `estimate_dataset_size`.
+            prefetch_offsets (Sequence[int], optional): Offsets of the samples (relative
+                to the selected one) for which `prefetch_sample` is computed on a background
+                worker, e.g. `(1,)` prepares the next sample while the user looks at the
+                selected one. Empty disables the prefetching. Defaults to ().
+            dataset_snapshot_dir (str | None, optional): Directory where the datasets
+                constructed by the functions from `dataset` or `dataset_choices` are
+                stored (see `DatasetSnapshotCache`), so that after the restart of the app
+                they are memory mapped instead of constructed again. If None, the datasets
+                are constructed on every start. Defaults to None.
+            dataset_snapshot_version (str, optional): Version of the dataset constructors,
+                change it whenever a constructor produces different samples, so that its
+                snapshot is built again. Defaults to "".
         """
         self._dataset_choices: DATASETS_TYPE | None = None
+        self._single_dataset = dataset
         self._dataset: DatasetProtocol | None = None
+        self._dataset_snapshots: DatasetSnapshotCache | None = None
+        if dataset_snapshot_dir is not None:
+            self._dataset_snapshots = DatasetSnapshotCache(
+                dataset_snapshot_dir, version=dataset_snapshot_version
+            )
 
-        if keep_datasets_in_memory:
-            self._dataset_cache: dict[str, DatasetProtocol] | None = {}
-        else:
-            self._dataset_cache = None
+        # the datasets are acquired from the process-wide resource registry,
+        # the cache holds the references of this component, without the caching
+        # only the reference to the selected dataset is held
+        self._keep_datasets_in_memory = keep_datasets_in_memory
+        if dataset_cache_budget is None:
+            # the sizes are needed only to keep the cache within the budget
+            dataset_size_estimator = _unmeasured_size
+        self._dataset_cache: MemoryBudgetedLRUCache[
+            str, DatasetProtocol
+        ] = MemoryBudgetedLRUCache(
+            size_of=dataset_size_estimator,
+            budget_bytes=dataset_cache_budget,
+            max_entries=None if keep_datasets_in_memory else 1,
+            on_evict=self._on_dataset_evicted,
+        )
 
         if dataset_choices is not None and dataset is None:
             if len(dataset_choices) == 0:
@@ -80,7 +177,9 @@ class DataPreparationMixin(ABC):
             def load_dataset_fn():
                 if dataset_choices is None:
                     raise RuntimeError("Dataset choices became None!")
-                return self.load_dataset(dataset_choices[default_dataset_key])
+                return self._load_dataset(
+                    default_dataset_key, dataset_choices[default_dataset_key]
+                )
 
             name = default_dataset_key
 
@@ -90,15 +189,24 @@ class DataPreparationMixin(ABC):
             def load_dataset_fn():
                 if dataset is None:
                     raise RuntimeError("Dataset became None!")
-                return self.load_dataset(dataset)
+                return self._load_dataset(DEFAULT_DATASET_NAME, dataset)
 
-            name = None
+            name = DEFAULT_DATASET_NAME
 
         else:
             raise ValueError(
                 "Cannot specify / not specify both dataset and dataset_choices!"
             )
 
+        self._prefetch_offsets = tuple(prefetch_offsets)
+        self._sample_prefetcher: Prefetcher[Hashable, Any] | None = None
+        if len(self._prefetch_offsets) != 0:
+            # the selected sample, its neighbours and the ones from the previous
+            # selection, which may be selected again
+            self._sample_prefetcher = Prefetcher(
+                max_entries=2 * (len(self._prefetch_offsets) + 1)
+            )
+
         self.load_cached_dataset(
             load_dataset_fn=load_dataset_fn, name=name, update_selectors=False
         )
@@ -137,6 +245,18 @@ class DataPreparationMixin(ABC):
         else:
             return dataset_constructor
 
+    def _load_dataset(
+        self,
+        name: str,
+        dataset_constructor: DatasetProtocol | Callable[[], DatasetProtocol],
+    ) -> DatasetProtocol:
+        """Load the dataset, the datasets constructed by functions are loaded
+        from their snapshots if `dataset_snapshot_dir` is set.
+        """
+        if self._dataset_snapshots is None or not callable(dataset_constructor):
+            return self.load_dataset(dataset_constructor)
+        return self._dataset_snapshots.load(name, dataset_constructor)
+
     def load_cached_dataset(
         self,
         load_dataset_fn: Callable[[], DatasetProtocol],
@@ -151,6 +271,10 @@ class DataPreparationMixin(ABC):
 
         If unset, the function just loads the dataset and returns it.
 
+        The datasets with `name` are constructed through the process-wide resource
+        registry, hence the components which share the `dataset_choices` construct
+        each dataset only once.
+
         Important:
         ---------
             The loaded dataset is stored in the property: `self.dataset`
@@ -162,12 +286,15 @@ class DataPreparationMixin(ABC):
             load_dataset_fn (Callable[[], DatasetProtocol]): function that loads the dataset.
             update_selectors (bool): update dataset selector elements after dataset change
         """
-        if self._dataset_cache is not None and name in self._dataset_cache:
-            self._dataset = self._dataset_cache[name]
-        else:
+        if name is None:
             self._dataset = load_dataset_fn()
-            if self._dataset_cache is not None and name is not None:
-                self._dataset_cache[name] = self._dataset
+        else:
+            self._dataset = self._dataset_cache.get_or_load(
+                name,
+                lambda: resource_registry.acquire(
+                    "dataset", name, self._dataset_constructor(name), load_dataset_fn
+                ),
+            )
 
         if update_selectors:
             self.dataset_split_selector_element.set_choices(self.get_dataset_splits())
@@ -179,11 +306,88 @@ class DataPreparationMixin(ABC):
         """Currently loaded dataset"""
         return self._dataset
 
+    @property
+    def dataset_cache_statistics(self) -> CacheStatistics | None:
+        """Hits, misses, evictions and load time of the dataset cache, None
+        if the datasets aren't kept in memory.
+        """
+        if not self._keep_datasets_in_memory:
+            return None
+        return self._dataset_cache.statistics
+
+    def _dataset_constructor(self, name: str) -> DATASET_TYPE:
+        if self._dataset_choices is not None:
+            return self._dataset_choices[name]
+        if self._single_dataset is None:
+            raise RuntimeError("Neither dataset nor dataset_choices are set!")
+        return self._single_dataset
+
+    def _on_dataset_evicted(self, name: str, dataset: DatasetProtocol):
+        resource_registry.release("dataset", name, self._dataset_constructor(name))
+
     @property
     def loaded_sample(self):
         """Currently loaded sample"""
         return self._loaded_sample
 
+    @property
+    def selected_dataset_name(self) -> str:
+        """Name of the selected dataset from `dataset_choices`, or
+        `DEFAULT_DATASET_NAME` if the dataset isn't selected from choices.
+        """
+        if self.dataset_selector_element is not None:
+            return self.dataset_selector_element.value_on_backend
+        return DEFAULT_DATASET_NAME
+
+    @property
+    def prefetches_samples(self) -> bool:
+        """Whether the neighbouring samples are prefetched."""
+        return self._sample_prefetcher is not None
+
+    def prefetch_state(self) -> Hashable:
+        """Everything apart from the sample that the result of `prefetch_sample`
+        depends on (e.g. the selected generator and the generation parameters).
+        The state is passed to `prefetch_sample`, so that the computation on the
+        background doesn't read the attributes of the component, which may change
+        in the meantime.
+        """
+        return None
+
+    def prefetch_sample(self, sample: Any, state: Any) -> Any:
+        """Compute everything that is needed to display the `sample`. When the
+        prefetching is enabled, it is called on a background worker for the
+        neighbouring samples, so it must not change any element.
+        """
+        raise NotImplementedError()
+
+    def prefetched_sample(self) -> Any:
+        """The result of `prefetch_sample` for the loaded sample, and schedule
+        the prefetching of the neighbouring samples. If the loaded sample was
+        prefetched, the result is returned without computing it again.
+        """
+        state = self.prefetch_state()
+        if self._sample_prefetcher is None:
+            return self.prefetch_sample(self.loaded_sample, state)
+
+        split = self.get_split()
+        index = int(self.sample_selector_element.value_on_backend)
+        dataset_name = self.selected_dataset_name
+        split_name = self.dataset_split_selector_element.value_on_backend
+
+        def key(i: int) -> Hashable:
+            return (dataset_name, split_name, i, state)
+
+        result = self._sample_prefetcher.get(
+            key(index), partial(self.prefetch_sample, self.loaded_sample, state)
+        )
+        neighbours = [index + offset for offset in self._prefetch_offsets]
+        self._sample_prefetcher.prefetch(
+            (key(i), partial(self.prefetch_sample, split[i], state))
+            for i in neighbours
+            if 0 <= i < len(split)
+        )
+        return result
+
     @property
     def dataset_choice_elements(self) -> list[ElementBase]:
         """Elements that allow user to select dataset, dataset split, and dataset sample."""
@@ -299,7 +503,7 @@ class DataPreparationMixin(ABC):
             key = self.dataset_selector_element.value_on_backend
             dataset_constructor = self._dataset_choices[key]
             self.load_cached_dataset(
-                load_dataset_fn=lambda: self.load_dataset(dataset_constructor),
+                load_dataset_fn=lambda: self._load_dataset(key, dataset_constructor),
                 name=key,
             )
         if self.dataset_split_selector_element.updated:
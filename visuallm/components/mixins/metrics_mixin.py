@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     import torch
 
-from visuallm.elements.barchart_element import BarChartElement, PieceInfo
+from visuallm.elements.barchart_element import BarChartColumns, BarChartElement
 from visuallm.elements.plain_text_element import PlainTextElement
 from visuallm.elements.selector_elements import ButtonElement, CheckBoxSubElement
 
@@ -129,6 +129,15 @@ class MetricsMixin(ABC):
         else:
             return []
 
+    @property
+    def selected_metrics(self) -> tuple[str, ...]:
+        """Names of the metrics selected to be displayed, in the display order."""
+        return tuple(
+            name
+            for name in self._ordering
+            if self._select_metrics_elements[name].value_on_backend
+        )
+
     @property
     def metrics_display_elements(self):
         """Elements that display the metrics on the target and on the
@@ -153,8 +162,25 @@ class MetricsMixin(ABC):
         generated_encoded_list: Sequence["torch.Tensor"] | Sequence[None],
         element: BarChartElement,
     ):
+        element.set_columns(
+            self.compute_metrics(
+                generated_text_list,
+                label_text,
+                probs_encoded_list,
+                generated_encoded_list,
+            )
+        )
+
+    def compute_metrics(
+        self,
+        generated_text_list: Sequence[str],
+        label_text: str,
+        probs_encoded_list: Sequence["torch.Tensor"] | Sequence[None],
+        generated_encoded_list: Sequence["torch.Tensor"] | Sequence[None],
+    ) -> BarChartColumns:
         """Calculate generation metrics for each element of `generated_text_list` and
-        probability metrics for each element of `probs_encoded_list`.
+        probability metrics for each element of `probs_encoded_list`, without
+        displaying them.
 
         Args:
         ----
@@ -163,9 +189,16 @@ class MetricsMixin(ABC):
             probs_encoded_list (Sequence['torch.Tensor']): Sequence of tensors of shape
             generated_encoded_list (Sequence['torch.Tensor']): Sequence of generated indices of tokens (sequence
                 of generated sequences of indices of tokens)
-            element (BarChartElement): Element where to display computed metrics.
+
+        Returns:
+        -------
+            BarChartColumns: one piece for each generation, one bar for each
+                selected metric
+
         """
-        piece_infos: list[PieceInfo] = []
+        bar_names = list(self.selected_metrics)
+        bar_heights: list[list[float]] = []
+        bar_annotations: list[list[str]] = []
         for (
             generated_text,
             probs_encoded,
@@ -173,14 +206,9 @@ class MetricsMixin(ABC):
         ) in zip(
             generated_text_list, probs_encoded_list, generated_encoded_list, strict=True
         ):
-            bar_names: list[str] = []
-            bar_annotations: list[str] = []
-            bar_heights: list[float] = []
-            for name in self._ordering:
-                if not self._select_metrics_elements[name].value_on_backend:
-                    continue
-                bar_names.append(name)
-
+            piece_heights: list[float] = []
+            piece_annotations: list[str] = []
+            for name in bar_names:
                 if name in self._metrics_on_generated_text:
                     metric_description: MetricDescription = (
                         self._metrics_on_generated_text[name]
@@ -198,21 +226,36 @@ class MetricsMixin(ABC):
                         )
 
                 if metric_description.scalable:
-                    bar_heights.append(min(result * 100, 100))
+                    piece_heights.append(min(result * 100, 100))
                 else:
-                    bar_heights.append(100)
-                bar_annotations.append(metric_description.format.format(result))
-
-            piece_infos.append(
-                PieceInfo(
-                    pieceTitle=generated_text,
-                    barHeights=bar_heights,
-                    barAnnotations=bar_annotations,
-                    barNames=bar_names,
-                )
-            )
+                    piece_heights.append(100)
+                piece_annotations.append(metric_description.format.format(result))
+
+            bar_heights.append(piece_heights)
+            bar_annotations.append(piece_annotations)
+
+        return BarChartColumns.create(
+            piece_titles=list(generated_text_list),
+            bar_heights=bar_heights,
+            bar_names=bar_names,
+            bar_annotations=bar_annotations,
+        )
 
-        element.set_piece_infos(piece_infos)
+    def display_metrics_on_predicted(self, columns: BarChartColumns):
+        """Display the metrics computed on the predictions of the model (see
+        `compute_metrics`), unless they are already displayed.
+        """
+        if self._display_metrics_on_predicted_element.columns != columns:
+            self._display_metrics_on_predicted_element.set_columns(columns)
+
+    def display_metrics_on_target(self, columns: BarChartColumns):
+        """Display the metrics computed on the target (see `compute_metrics`),
+        unless they are already displayed.
+        """
+        if not self.use_target_metrics:
+            raise ValueError("This component wasn't configured for target metrics!")
+        if self._display_metrics_on_target_element.columns != columns:
+            self._display_metrics_on_target_element.set_columns(columns)
 
     def compute_n_display_metrics_on_predicted(
         self,
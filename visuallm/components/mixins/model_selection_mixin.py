@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import threading
+import traceback
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from visuallm.background_jobs import BackgroundJob, JobState
 from visuallm.components.generators.base import Generator
 from visuallm.elements.plain_text_element import PlainTextElement
 from visuallm.elements.selector_elements import ButtonElement, ChoicesSubElement
+from visuallm.resource_registry import resource_registry
+from visuallm.utils.memory_budgeted_cache import (
+    CacheStatistics,
+    MemoryBudgetedLRUCache,
+)
 
 if TYPE_CHECKING:
     from visuallm.elements import ElementBase
@@ -19,13 +28,24 @@ GENERATOR_CHOICES = (
     ]
 )
 
+DEFAULT_GENERATOR_NAME = "default"
+"""Name under which the generator is reported if it isn't selected from
+`generator_choices`"""
+
 
 class ModelSelectionMixin:
+    # provided by the ComponentBase
+    background_jobs: dict[str, BackgroundJob]
+    update_background_job: Callable[..., None]
+
     def __init__(
         self,
         generator: Generator | None = None,
         generator_choices: GENERATOR_CHOICES | None = None,
         keep_generators_in_memory: bool = True,
+        generator_cache_budget: int | None = None,
+        load_in_background: bool = False,
+        preload_generators: bool = False,
     ):
         """Generator handling server methods. If only the
         generator is provided, the mixin just makes `self.generator` property available.
@@ -45,6 +65,16 @@ class ModelSelectionMixin:
             keep_generators_in_memory (bool, optional): Whether to load the tokenizer and model to cache, so that
                 when a new tokenizer and model is loaded, the old one remains in memory. It makes switching
                 between different tokenizers and models faster. Defaults to True.
+            generator_cache_budget (int | None, optional): Maximal number of bytes
+                (measured by `Generator.memory_footprint`) of the cached generators. When
+                exceeded, the least recently selected generators are evicted from the cache
+                and loaded again once selected. If None the cache is unbounded. Defaults to None.
+            load_in_background (bool, optional): Whether to load and warm up the generator on a background
+                thread, so that the server starts immediately and the frontend displays that the model
+                is loading. Defaults to False.
+            preload_generators (bool, optional): Whether to load all the `generator_choices` on the
+                background right after the selected one, so that switching between them is fast.
+                Requires `keep_generators_in_memory` and `load_in_background`. Defaults to False.
         """
         if generator is None and (
             generator_choices is None or len(generator_choices) == 0
@@ -54,6 +84,7 @@ class ModelSelectionMixin:
                 "empty generator_choices dictionary"
             )
 
+        self._generator: Generator | None = generator
         if generator is None:
             self._generator_choices = generator_choices
         elif generator_choices is not None:
@@ -64,16 +95,62 @@ class ModelSelectionMixin:
             )
         else:
             self._generator_choices = None
-            self._generator = generator
 
-        self._cache: dict[str, Generator] | None = None
-        if keep_generators_in_memory:
-            self._cache = {}
+        if preload_generators and not (
+            keep_generators_in_memory and load_in_background
+        ):
+            raise ValueError(
+                "preload_generators requires keep_generators_in_memory and "
+                "load_in_background to be set."
+            )
+
+        self._generator_futures: dict[str, Future[Generator]] = {}
+        # the generators are acquired from the process-wide resource registry,
+        # the cache holds the references of this component, without the caching
+        # only the reference to the selected generator is held
+        self._keep_generators_in_memory = keep_generators_in_memory
+        self._cache: MemoryBudgetedLRUCache[str, Generator] = MemoryBudgetedLRUCache(
+            size_of=lambda generator: generator.memory_footprint,
+            budget_bytes=generator_cache_budget,
+            max_entries=None if keep_generators_in_memory else 1,
+            on_evict=self._on_generator_evicted,
+        )
         self.init_generator_selection_elements()
 
-        if generator_choices is not None:
-            self._generator = self.load_generator(
-                generator_choices[self.generator_selector_element.value_on_backend]
+        self._startup_future: Future[Generator] | None = None
+        # once the user selects a generator, the loading of the startup
+        # generator mustn't replace it
+        self._generator_selected = False
+        self._generator_lock = threading.Lock()
+        self._on_generator_ready_callbacks: list[Callable[[], None]] | None = []
+        self._on_generator_ready_lock = threading.Lock()
+
+        if generator_choices is None:
+            startup_name = DEFAULT_GENERATOR_NAME
+        else:
+            startup_name = self.generator_selector_element.value_on_backend
+        # the selected generator is held by `self._generator` anyway, evicting
+        # it from the cache (e.g. by the preloaded ones) would only load it again
+        self._selected_generator_name = startup_name
+        self._cache.pin(startup_name)
+
+        if load_in_background:
+            # a single worker, so that the generators are loaded one after another
+            # instead of competing for the memory
+            self._generator_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="visuallm-generator"
+            )
+            self._startup_future = self._load_generator_in_background(
+                startup_name, blocking=True
+            )
+            if preload_generators and generator_choices is not None:
+                for name in generator_choices:
+                    if name != startup_name:
+                        self._load_generator_in_background(name, blocking=False)
+        elif generator_choices is not None:
+            startup_constructor = generator_choices[startup_name]
+            self.load_cached_generator(
+                lambda: self.load_generator(startup_constructor), startup_name
             )
 
     def load_generator(
@@ -101,9 +178,127 @@ class ModelSelectionMixin:
             return generator_constructor()
 
     @property
-    def generator(self):
+    def generator(self) -> Generator:
+        """The selected generator. If it is still loading on the background,
+        waits until it is loaded.
+        """
+        startup_future = self._startup_future
+        if self._generator is None and startup_future is not None:
+            # the loading thread stores the generator before resolving the future
+            startup_future.result()
+        if self._generator is None:
+            raise RuntimeError("The generator wasn't loaded!")
         return self._generator
 
+    @property
+    def selected_generator_name(self) -> str:
+        """Name of the selected generator from `generator_choices`, or
+        `DEFAULT_GENERATOR_NAME` if the generator was passed directly.
+        """
+        return self._selected_generator_name
+
+    @property
+    def generator_cache_statistics(self) -> CacheStatistics | None:
+        """Hits, misses, evictions and load time of the generator cache, None
+        if the generators aren't kept in memory.
+        """
+        if not self._keep_generators_in_memory:
+            return None
+        return self._cache.statistics
+
+    @property
+    def generator_states(self) -> dict[str, JobState]:
+        """States of the generators which are loaded on the background."""
+        return {
+            name: self.background_jobs[_generator_job(name)].state
+            for name in list(self._generator_futures)
+            if _generator_job(name) in self.background_jobs
+        }
+
+    def when_generator_ready(self, callback: Callable[[], None]):
+        """Call `callback` once the generator is loaded and warmed up. If the
+        generator is loaded on the background, the callback is called on the
+        loading thread and the frontend displays the component only after
+        the callback finishes. Otherwise it is called immediately.
+        """
+        with self._on_generator_ready_lock:
+            callbacks = self._on_generator_ready_callbacks
+            if callbacks is not None and self._startup_future is not None:
+                callbacks.append(callback)
+                return
+        callback()
+
+    def _generator_constructor(self, name: str) -> Generator | Callable[[], Generator]:
+        if self._generator_choices is not None:
+            return self._generator_choices[name]
+        if self._generator is None:
+            raise RuntimeError("Neither generator nor generator_choices are set!")
+        return self._generator
+
+    def _load_generator_in_background(
+        self, name: str, blocking: bool
+    ) -> Future[Generator]:
+        # reported before the submission, so that the component is never
+        # displayed before the loading starts
+        self.update_background_job(
+            _generator_job(name),
+            JobState.LOADING,
+            f"Loading generator '{name}'",
+            blocking,
+        )
+        future = self._generator_executor.submit(
+            self._load_n_warm_up_generator, name, blocking
+        )
+        self._generator_futures[name] = future
+        return future
+
+    def _load_n_warm_up_generator(self, name: str, blocking: bool) -> Generator:
+        """Load the generator, warm it up and if it is the generator displayed
+        on the startup (`blocking`), call all the `when_generator_ready`
+        callbacks. The progress is reported in the `background_jobs` of the
+        component.
+        """
+        job = _generator_job(name)
+
+        def load_n_warm_up() -> Generator:
+            generator = self.load_generator(self._generator_constructor(name))
+            self.update_background_job(
+                job, JobState.WARMING, f"Warming up generator '{name}'", blocking
+            )
+            generator.warm_up()
+            return generator
+
+        try:
+            generator = self._cache.get_or_load(
+                name, lambda: self._acquire_generator(name, load_n_warm_up)
+            )
+            if not blocking and name not in self._cache:
+                # the preloaded generator didn't fit into the budget next to the
+                # pinned one, the finished future mustn't keep it in memory
+                self._generator_futures.pop(name, None)
+            if blocking:
+                with self._generator_lock:
+                    if not self._generator_selected:
+                        self._generator = generator
+                with self._on_generator_ready_lock:
+                    callbacks = self._on_generator_ready_callbacks or []
+                    self._on_generator_ready_callbacks = None
+                for callback in callbacks:
+                    callback()
+        except Exception:
+            self.update_background_job(
+                job,
+                JobState.FAILED,
+                f"Generator '{name}' failed to load",
+                blocking,
+                error=traceback.format_exc(),
+            )
+            raise
+        self.update_background_job(
+            job, JobState.READY, f"Generator '{name}' is ready", blocking
+        )
+        return generator
+
     def load_cached_generator(
         self,
         generator_constructor: Callable[[], Generator],
@@ -118,6 +313,10 @@ class ModelSelectionMixin:
 
         If unset, the function just loads the generator and returns it.
 
+        The generators with `name` are constructed through the process-wide resource
+        registry, hence the components which share the `generator_choices` construct
+        each generator only once.
+
         Important:
         ---------
             The loaded generator is stored in property `self.generator`
@@ -128,12 +327,24 @@ class ModelSelectionMixin:
                 cache under this name.
             generator_constructor (Callable[[], Generator]): function that loads the generator.
         """
-        if self._cache is not None and name in self._cache:
-            self._generator = self._cache[name]
-            return
-        self._generator = generator_constructor()
-        if self._cache is not None and name is not None:
-            self._cache[name] = self._generator
+        if name is None:
+            self._generator = generator_constructor()
+        else:
+            self._generator = self._cache.get_or_load(
+                name, lambda: self._acquire_generator(name, generator_constructor)
+            )
+
+    def _acquire_generator(self, name: str, load: Callable[[], Generator]) -> Generator:
+        return resource_registry.acquire(
+            "generator", name, self._generator_constructor(name), load
+        )
+
+    def _on_generator_evicted(self, name: str, generator: Generator):
+        # the finished future would keep the evicted generator in memory
+        future = self._generator_futures.get(name)
+        if future is not None and future.done():
+            del self._generator_futures[name]
+        resource_registry.release("generator", name, self._generator_constructor(name))
 
     def init_generator_selection_elements(self):
         """Initializes a heading with text "Generator Settings" and a selector
@@ -173,5 +384,20 @@ class ModelSelectionMixin:
         if self.generator_selector_element.updated:
             name = self.generator_selector_element.value_on_backend
             generator = self._generator_choices[name]
+            future = self._generator_futures.get(name)
+            with self._generator_lock:
+                self._generator_selected = True
+                # the generator property doesn't have to wait for the startup anymore
+                self._startup_future = None
+            self._cache.unpin(self._selected_generator_name)
+            self._selected_generator_name = name
+            self._cache.pin(name)
+            if future is not None:
+                # wait until the background loading stores the generator to the cache
+                future.result()
             self.load_cached_generator(lambda: self.load_generator(generator), name)
             self.after_on_generator_change_callback()
+
+
+def _generator_job(name: str) -> str:
+    return f"generator '{name}'"
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from bisect import bisect_right
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from visuallm.background_jobs import BackgroundJob, JobState
+from visuallm.components.dataset_snapshots import split_fingerprint
+from visuallm.components.search_index import SearchIndex
+from visuallm.elements.plain_text_element import PlainTextElement
+from visuallm.elements.selector_elements import ButtonElement, TextInputSubElement
+
+if TYPE_CHECKING:
+    from visuallm.components.mixins.data_preparation_mixin import DatasetProtocol
+    from visuallm.elements import ElementBase
+    from visuallm.elements.selector_elements import ChoicesSubElement, MinMaxSubElement
+
+_SearchKey = tuple[str, str, str]
+"""Name of the dataset, name of the split and identifier of the searched text"""
+
+
+class SampleSearchMixin:
+
+    """Full-text search over the samples of the dataset. The search index of
+    each split is built on a background worker (and stored in `index_dir`), the
+    frontend displays a text input, and sending a query selects the next sample
+    that contains all the words of the query. The indices are built separately
+    for each searchable text of the samples (see `search_text_source`).
+
+    The mixin is meant to be used together with `DataPreparationMixin`.
+    """
+
+    # provided by the ComponentBase
+    background_jobs: dict[str, BackgroundJob]
+    update_background_job: Callable[..., None]
+    # provided by the DataPreparationMixin
+    if TYPE_CHECKING:
+
+        @property
+        def dataset(self) -> DatasetProtocol | None:
+            ...
+
+        @property
+        def selected_dataset_name(self) -> str:
+            ...
+
+    dataset_split_selector_element: ChoicesSubElement
+    sample_selector_element: MinMaxSubElement
+    get_dataset_splits: Callable[[], list[str]]
+    on_dataset_change_callback: Callable[[], None]
+
+    def __init__(
+        self,
+        sample_text: Callable[[Any], str] | None,
+        sample_text_key: str = "",
+        index_dir: str | None = None,
+        max_displayed_matches: int = 20,
+    ):
+        """Args:
+        ----
+            sample_text (Callable[[Any], str] | None): function that returns the
+                text of a sample which should be searchable. If None, the search
+                is disabled.
+            sample_text_key (str, optional): identifier of the `sample_text`
+                function, the indices stored in `index_dir` are reused only if
+                the key is the same. Change it when `sample_text` changes.
+                Defaults to "".
+            index_dir (str | None, optional): directory where the search indices
+                are stored, so that they aren't built again after the restart
+                of the app. If None, the indices are kept only in memory.
+                Defaults to None.
+            max_displayed_matches (int, optional): how many indices of the
+                matching samples are displayed. Defaults to 20.
+        """
+        self._sample_text = sample_text
+        self._sample_text_key = sample_text_key
+        self._index_dir = None if index_dir is None else Path(index_dir)
+        self._max_displayed_matches = max_displayed_matches
+        self._search_indices: dict[_SearchKey, SearchIndex] = {}
+        self._scheduled_search_indices: set[_SearchKey] = set()
+        self._search_lock = threading.Lock()
+        self._search_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="visuallm-search-index"
+        )
+        self.init_search_elements()
+
+    @property
+    def search_enabled(self) -> bool:
+        return self._sample_text is not None
+
+    def init_search_elements(self):
+        self.search_heading = PlainTextElement(
+            content="Search Samples", is_heading=True
+        )
+        self.search_query_element = TextInputSubElement(
+            placeholder_text="Words that the sample should contain",
+            blank_after_text_send=False,
+        )
+        self.search_button = ButtonElement(
+            processing_callback=self.on_search_callback,
+            button_text="Search",
+            subelements=[self.search_query_element],
+        )
+        self.search_results_element = PlainTextElement()
+
+    @property
+    def search_elements(self) -> list[ElementBase]:
+        """Elements that should be displayed on the frontend to search the samples."""
+        if not self.search_enabled:
+            return []
+        return [self.search_heading, self.search_button, self.search_results_element]
+
+    def search_text_source(self) -> tuple[Callable[[Any], str], str]:
+        """The function that returns the searchable text of a sample, and its
+        identifier. The components whose searchable text changes (e.g. with
+        the selected generator) override it and call `build_search_indices`
+        after the change. It is called only when the indices are scheduled or
+        looked up, the background worker uses the function it was given.
+        """
+        return self._required_sample_text(), self._sample_text_key
+
+    def build_search_indices(self):
+        """Schedule the building of the search indices of all the splits of the
+        selected dataset which aren't built yet.
+        """
+        if self._sample_text is None or self.dataset is None:
+            return
+        sample_text, text_key = self.search_text_source()
+        dataset_name = self.selected_dataset_name
+        for split_name in self.get_dataset_splits():
+            key = (dataset_name, split_name, text_key)
+            with self._search_lock:
+                if key in self._scheduled_search_indices:
+                    continue
+                self._scheduled_search_indices.add(key)
+            self.update_background_job(
+                _search_job(key), JobState.LOADING, _building_message(key, 0)
+            )
+            self._search_executor.submit(
+                self._build_search_index, key, sample_text, self.dataset[split_name]
+            )
+
+    def search_index(self) -> SearchIndex | None:
+        """Search index of the selected split, None if it isn't built yet."""
+        if self._sample_text is None:
+            return None
+        _, text_key = self.search_text_source()
+        key = (
+            self.selected_dataset_name,
+            self.dataset_split_selector_element.value_on_backend,
+            text_key,
+        )
+        return self._search_indices.get(key)
+
+    def on_search_callback(self):
+        """Select the first sample after the selected one that matches the query,
+        so that sending the same query repeatedly goes over all the matches.
+        """
+        query = self.search_query_element.value_on_backend
+        index = self.search_index()
+        if index is None:
+            self.build_search_indices()
+            self.search_results_element.content = (
+                "The search index of the split is being built, try again later."
+            )
+            return
+        matches = index.search(query)
+        if len(matches) == 0:
+            self.search_results_element.content = f"No sample matches '{query}'."
+            return
+
+        selected = int(self.sample_selector_element.value_on_backend)
+        following = bisect_right(matches, selected)
+        next_match = matches[following] if following < len(matches) else matches[0]
+        displayed = ", ".join(map(str, matches[: self._max_displayed_matches]))
+        if len(matches) > self._max_displayed_matches:
+            displayed += ", ..."
+        self.search_results_element.content = (
+            f"{len(matches)} samples match '{query}': {displayed}"
+        )
+        self.sample_selector_element.value_on_backend = next_match
+        self.on_dataset_change_callback()
+
+    def _build_search_index(
+        self, key: _SearchKey, sample_text: Callable[[Any], str], split: Any
+    ):
+        job = _search_job(key)
+        path = self._search_index_path(key, split)
+        if path is not None:
+            index = SearchIndex.load(path, key[2])
+            if index is not None and index.n_documents == len(split):
+                self._set_search_index(key, index)
+                return
+
+        def report_progress(n_documents: int):
+            percent = n_documents * 100 // max(len(split), 1)
+            self.update_background_job(
+                job, JobState.LOADING, _building_message(key, percent)
+            )
+
+        try:
+            index = SearchIndex.build(
+                (sample_text(sample) for sample in split),
+                progress_callback=report_progress,
+            )
+            if path is not None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                index.save(path, key[2])
+        except Exception as e:
+            with self._search_lock:
+                # allow another attempt
+                self._scheduled_search_indices.discard(key)
+            self.update_background_job(
+                job,
+                JobState.FAILED,
+                f"Building search index of '{key[1]}' failed",
+                error=repr(e),
+            )
+            return
+        self._set_search_index(key, index)
+
+    def _required_sample_text(self) -> Callable[[Any], str]:
+        if self._sample_text is None:
+            raise RuntimeError("Search is disabled, cannot build the index!")
+        return self._sample_text
+
+    def _set_search_index(self, key: _SearchKey, index: SearchIndex):
+        self._search_indices[key] = index
+        self.update_background_job(
+            _search_job(key), JobState.READY, f"Search index of '{key[1]}' is ready"
+        )
+
+    def _search_index_path(self, key: _SearchKey, split: Any) -> Path | None:
+        if self._index_dir is None:
+            return None
+        # the index of a changed split, or of another text, mustn't be reused
+        fingerprint = hashlib.sha1(usedforsecurity=False)
+        fingerprint.update(repr((key, split_fingerprint(split))).encode())
+        name = re.sub(r"[^\w.-]", "_", "-".join(key[:2]))
+        return self._index_dir / f"{name}-{fingerprint.hexdigest()[:16]}.index"
+
+
+def _search_job(key: _SearchKey) -> str:
+    return f"search index '{key[0]}/{key[1]}'"
+
+
+def _building_message(key: _SearchKey, percent: int) -> str:
+    return f"Building search index of '{key[1]}' ({percent}%)"
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from visuallm.background_jobs import BackgroundJob, JobState
+from visuallm.components.dataset_snapshots import split_fingerprint
+from visuallm.components.embedding_index import EmbeddingIndex
+from visuallm.elements.selector_elements import ButtonElement
+from visuallm.elements.table_element import TableElement
+
+if TYPE_CHECKING:
+    from visuallm.components.mixins.data_preparation_mixin import DatasetProtocol
+    from visuallm.elements import ElementBase
+    from visuallm.elements.selector_elements import ChoicesSubElement, MinMaxSubElement
+
+_DISPLAYED_TEXT_LENGTH = 200
+
+_EmbeddingsKey = tuple[str, str, str]
+"""Name of the dataset, name of the split and identifier of the embedded text"""
+
+
+class SimilarSamplesMixin:
+
+    """Display the samples most similar to the selected one. The embeddings of
+    all the samples of each split are computed on a background worker (see
+    `EmbeddingIndex`), the search then takes only the computed samples into
+    account. The embeddings are computed separately for each embedded text of
+    the samples (see `embedded_text_source`).
+
+    The mixin is meant to be used together with `DataPreparationMixin`.
+    """
+
+    # provided by the ComponentBase
+    background_jobs: dict[str, BackgroundJob]
+    update_background_job: Callable[..., None]
+    # provided by the DataPreparationMixin
+    if TYPE_CHECKING:
+
+        @property
+        def dataset(self) -> DatasetProtocol | None:
+            ...
+
+        @property
+        def selected_dataset_name(self) -> str:
+            ...
+
+    dataset_split_selector_element: ChoicesSubElement
+    sample_selector_element: MinMaxSubElement
+    get_dataset_splits: Callable[[], list[str]]
+    get_split: Callable[[], Any]
+
+    def __init__(
+        self,
+        sample_text: Callable[[Any], str],
+        encode: Callable[[list[str]], Any] | None,
+        encoder_key: str = "",
+        embeddings_dir: str | None = None,
+        n_partitions: int | None = None,
+        n_similar_samples: int = 5,
+        batch_size: int = 256,
+    ):
+        """Args:
+        ----
+            sample_text (Callable[[Any], str]): function that returns the text
+                of a sample which is embedded.
+            encode (Callable[[list[str]], Any] | None): encoder which returns a
+                matrix with one embedding per text (e.g. `encode` method of
+                a sentence-transformers model). If None, the feature is disabled.
+            encoder_key (str, optional): identifier of the encoder, the embeddings
+                stored in `embeddings_dir` are reused only if the key and the
+                identifier of the embedded text (see `embedded_text_source`) are
+                the same. Defaults to "".
+            embeddings_dir (str | None, optional): directory where the embeddings
+                are stored, so that an interrupted computation continues after the
+                restart of the app. If None, a temporary directory is used, which
+                is removed by `cleanup_embeddings` or once the component is
+                garbage collected. Defaults to None.
+            n_partitions (int | None, optional): if set, the embeddings of each
+                split are partitioned (IVF) once computed, which makes the search
+                on large splits faster, at the cost of not always finding the exact
+                nearest samples. Defaults to None.
+            n_similar_samples (int, optional): number of the displayed samples.
+                Defaults to 5.
+            batch_size (int, optional): number of the samples encoded at once.
+                Defaults to 256.
+        """
+        self._embedded_text = sample_text
+        self._encode = encode
+        self._encoder_key = encoder_key
+        self._embeddings_tmp_dir: tempfile.TemporaryDirectory | None = None
+        if embeddings_dir is None and encode is not None:
+            self._embeddings_tmp_dir = tempfile.TemporaryDirectory(
+                prefix="visuallm-embeddings-"
+            )
+            embeddings_dir = self._embeddings_tmp_dir.name
+        self._embeddings_dir = None if embeddings_dir is None else Path(embeddings_dir)
+        self._n_partitions = n_partitions
+        self._n_similar_samples = n_similar_samples
+        self._embedding_batch_size = batch_size
+        self._embedding_indices: dict[_EmbeddingsKey, EmbeddingIndex] = {}
+        self._scheduled_embeddings: set[_EmbeddingsKey] = set()
+        self._embedding_lock = threading.Lock()
+        self._embedding_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="visuallm-embeddings"
+        )
+        self.init_similar_samples_elements()
+
+    @property
+    def similar_samples_enabled(self) -> bool:
+        return self._encode is not None
+
+    def init_similar_samples_elements(self):
+        self.similar_samples_button = ButtonElement(
+            processing_callback=self.on_similar_samples_callback,
+            button_text="Show Similar Samples",
+        )
+        self.similar_samples_table = TableElement()
+
+    @property
+    def similar_samples_elements(self) -> list[ElementBase]:
+        """Elements that should be displayed on the frontend to show the similar samples."""
+        if not self.similar_samples_enabled:
+            return []
+        return [self.similar_samples_button, self.similar_samples_table]
+
+    def embedded_text_source(self) -> tuple[Callable[[Any], str], str]:
+        """The function that returns the embedded text of a sample, and its
+        identifier. The components whose embedded text changes (e.g. with the
+        selected generator) override it and call `compute_embeddings` after
+        the change. It is called only when the embeddings are scheduled or
+        looked up, the background worker uses the function it was given.
+        """
+        return self._embedded_text, ""
+
+    def compute_embeddings(self):
+        """Schedule the computation of the embeddings of all the splits of the
+        selected dataset which aren't scheduled yet.
+        """
+        if self._embeddings_dir is None or self.dataset is None:
+            return
+        embedded_text, text_key = self.embedded_text_source()
+        dataset_name = self.selected_dataset_name
+        for split_name in self.get_dataset_splits():
+            key = (dataset_name, split_name, text_key)
+            with self._embedding_lock:
+                if key in self._scheduled_embeddings:
+                    continue
+                self._scheduled_embeddings.add(key)
+            self.update_background_job(
+                _embeddings_job(key), JobState.LOADING, _computing_message(key, 0)
+            )
+            self._embedding_executor.submit(
+                self._compute_embeddings, key, embedded_text, self.dataset[split_name]
+            )
+
+    def cleanup_embeddings(self):
+        """Stop the computation of the embeddings, no more embeddings are computed
+        afterwards. Removes the temporary directory with the embeddings (if
+        `embeddings_dir` wasn't set).
+        """
+        self._embedding_executor.shutdown(wait=True, cancel_futures=True)
+        with self._embedding_lock:
+            self._embedding_indices.clear()
+            self._scheduled_embeddings.clear()
+        self._embeddings_dir = None
+        if self._embeddings_tmp_dir is not None:
+            self._embeddings_tmp_dir.cleanup()
+            self._embeddings_tmp_dir = None
+
+    def embedding_index(self) -> EmbeddingIndex | None:
+        """Embedding index of the selected split, None if its computation
+        hasn't started yet.
+        """
+        _, text_key = self.embedded_text_source()
+        key = (
+            self.selected_dataset_name,
+            self.dataset_split_selector_element.value_on_backend,
+            text_key,
+        )
+        return self._embedding_indices.get(key)
+
+    def on_similar_samples_callback(self):
+        """Display the samples most similar to the selected one."""
+        self.similar_samples_table.clear()
+        index = self.embedding_index()
+        row = int(self.sample_selector_element.value_on_backend)
+        if index is None or row >= index.n_done:
+            self.compute_embeddings()
+            self.similar_samples_table.add_table(
+                "Similar Samples",
+                ["Message"],
+                [
+                    [
+                        "The embeddings of the samples are being computed, try again later."
+                    ]
+                ],
+            )
+            return
+        split = self.get_split()
+        embedded_text, _ = self.embedded_text_source()
+        rows = [
+            [
+                str(similar),
+                f"{score:.3f}",
+                _shorten(embedded_text(split[similar])),
+            ]
+            for similar, score in index.nearest(row, self._n_similar_samples)
+        ]
+        title = "Similar Samples"
+        if not index.complete:
+            title += f" (from the first {index.n_done} samples)"
+        self.similar_samples_table.add_table(
+            title, ["Sample", "Similarity", "Text"], rows
+        )
+
+    def _compute_embeddings(
+        self, key: _EmbeddingsKey, embedded_text: Callable[[Any], str], split: Any
+    ):
+        job = _embeddings_job(key)
+        try:
+            encode = self._required_encode()
+            index = EmbeddingIndex(
+                self._embeddings_path(key, split),
+                len(split),
+                key=f"{self._encoder_key}:{key[2]}",
+            )
+            with self._embedding_lock:
+                # the embeddings computed so far are searched already
+                self._embedding_indices[key] = index
+            index.update(
+                lambda row: embedded_text(split[row]),
+                encode,
+                batch_size=self._embedding_batch_size,
+                progress_callback=lambda n_done: self.update_background_job(
+                    job,
+                    JobState.LOADING,
+                    _computing_message(key, n_done * 100 // max(len(split), 1)),
+                ),
+            )
+            if self._n_partitions is not None and index.n_partitions is None:
+                self.update_background_job(
+                    job, JobState.LOADING, f"Partitioning embeddings of '{key[1]}'"
+                )
+                index.build_partitions(self._n_partitions)
+        except Exception as e:
+            with self._embedding_lock:
+                # allow another attempt, which continues from the computed rows
+                self._embedding_indices.pop(key, None)
+                self._scheduled_embeddings.discard(key)
+            self.update_background_job(
+                job,
+                JobState.FAILED,
+                f"Computing embeddings of '{key[1]}' failed",
+                error=repr(e),
+            )
+            return
+        self.update_background_job(
+            job, JobState.READY, f"Embeddings of '{key[1]}' are computed"
+        )
+
+    def _required_encode(self) -> Callable[[list[str]], Any]:
+        if self._encode is None:
+            raise RuntimeError("Encoder isn't set, cannot compute embeddings!")
+        return self._encode
+
+    def _embeddings_path(self, key: _EmbeddingsKey, split: Any) -> Path:
+        if self._embeddings_dir is None:
+            raise RuntimeError("Embeddings directory isn't set!")
+        # the embeddings of a changed split, of another text or of another
+        # encoder mustn't be reused
+        fingerprint = hashlib.sha1(usedforsecurity=False)
+        fingerprint.update(
+            repr((key, self._encoder_key, split_fingerprint(split))).encode()
+        )
+        name = re.sub(r"[^\w.-]", "_", "-".join(key[:2]))
+        return self._embeddings_dir / f"{name}-{fingerprint.hexdigest()[:16]}"
+
+
+def _shorten(text: str) -> str:
+    if len(text) <= _DISPLAYED_TEXT_LENGTH:
+        return text
+    return text[: _DISPLAYED_TEXT_LENGTH - 3] + "..."
+
+
+def _embeddings_job(key: _EmbeddingsKey) -> str:
+    return f"embeddings '{key[0]}/{key[1]}'"
+
+
+def _computing_message(key: _EmbeddingsKey, percent: int) -> str:
+    return f"Computing embeddings of '{key[1]}' ({percent}%)"
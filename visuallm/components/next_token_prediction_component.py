@@ -12,7 +12,7 @@ from visuallm.components.mixins.model_selection_mixin import (
     ModelSelectionMixin,
 )
 from visuallm.elements import CollapsibleElement, HeadingElement, PlainTextElement
-from visuallm.elements.barchart_element import BarChartElement, PieceInfo
+from visuallm.elements.barchart_element import BarChartColumns, BarChartElement
 from visuallm.elements.element_base import ElementBase
 
 
@@ -47,6 +47,9 @@ class NextTokenPredictionComponent(
         generator_choices: GENERATOR_CHOICES | None = None,
         dataset: DATASET_TYPE | None = None,
         dataset_choices: DATASETS_TYPE | None = None,
+        dataset_snapshot_dir: str | None = None,
+        dataset_snapshot_version: str = "",
+        load_in_background: bool = False,
     ):
         """Enable user to step by step visualize what is the distribution of the
         next token during the generation of the sequence, and select the next token in the process.
@@ -62,6 +65,14 @@ class NextTokenPredictionComponent(
                 the dataset. Defaults to None.
             dataset_choices (Optional[DATASETS_TYPE]): Dictionary of datasets, or
                 dictionary of functions that load the dataset. Defaults to None.
+            dataset_snapshot_dir (str | None, optional): Directory where the datasets
+                constructed by functions are stored, so that they are memory mapped after
+                the restart of the app. Defaults to None.
+            dataset_snapshot_version (str, optional): Version of the dataset constructors,
+                the snapshots are built again when it changes. Defaults to "".
+            load_in_background (bool, optional): Whether to load and warm up the generator
+                on a background thread, so that the server starts immediately and the
+                frontend displays that the model is loading. Defaults to False.
         """
         super().__init__(name="next_token_prediction", title=title)
         self.main_heading_element = PlainTextElement(
@@ -71,12 +82,15 @@ class NextTokenPredictionComponent(
             self,
             generator_choices=generator_choices,
             generator=generator,
+            load_in_background=load_in_background,
         )
-        self._check_generators(self.generator, generator_choices)
+        self._check_generators(generator, generator_choices)
         DataPreparationMixin.__init__(
             self,
             dataset=dataset,
             dataset_choices=dataset_choices,
+            dataset_snapshot_dir=dataset_snapshot_dir,
+            dataset_snapshot_version=dataset_snapshot_version,
         )
         token_probs_display_elements = self.init_token_probs_display_elements()
         input_display_elements = self.init_model_input_display_elements()
@@ -99,7 +113,7 @@ class NextTokenPredictionComponent(
         self.add_elements(token_probs_display_elements)
 
     def __post_init__(self, *args, **kwargs):
-        self.on_dataset_change_callback()
+        self.when_generator_ready(self.on_dataset_change_callback)
 
     def init_token_probs_display_elements(self) -> list[ElementBase]:
         """Init all the elements that display the next token predictions.
@@ -189,17 +203,16 @@ class NextTokenPredictionComponent(
             raise GeneratorDoesNotSupportNextTokenPredictionError()
         n_largest_probs_tokens = self.generator.one_step_prediction(text_to_tokenizer)
 
-        piece_infos: list[PieceInfo] = []
-        for prob, token in n_largest_probs_tokens:
-            piece_infos.append(
-                PieceInfo(
-                    pieceTitle=token,
-                    barHeights=[prob],
-                    barAnnotations=[f"{prob:.3f}%"],
-                    barNames=[""],
-                )
+        self.token_probs_element.set_columns(
+            BarChartColumns.create(
+                piece_titles=[token for _, token in n_largest_probs_tokens],
+                bar_heights=[[prob] for prob, _ in n_largest_probs_tokens],
+                bar_names=[""],
+                bar_annotations=[
+                    [f"{prob:.3f}%"] for prob, _ in n_largest_probs_tokens
+                ],
             )
-        self.token_probs_element.set_piece_infos(piece_infos)
+        )
 
     def on_next_token_selected(self):
         """Callback that is called when the user selects next token in the frontend. Basically
@@ -0,0 +1,155 @@
+import json
+import mmap
+import os
+import re
+import struct
+from array import array
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_FORMAT_VERSION = 1
+_HEADER_LENGTH = struct.Struct("<Q")
+_POSTING_TYPECODE = "I"
+
+
+def tokenize(text: str) -> list[str]:
+    """Split the text into lowercase words, the same way for the indexed texts
+    and for the queries.
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+
+    """Inverted index which maps each word to the sorted indices of the samples
+    that contain it. A query matches the samples that contain all its words.
+    """
+
+    def __init__(self, postings: Mapping[str, Sequence[int]], n_documents: int):
+        self._postings = postings
+        self.n_documents = n_documents
+
+    @classmethod
+    def build(
+        cls,
+        texts: Iterable[str],
+        progress_callback: Callable[[int], None] | None = None,
+        progress_interval: int = 10000,
+    ) -> "SearchIndex":
+        """Index the `texts`, the index of the text in the iterable is the
+        index of the sample.
+
+        Args:
+        ----
+            texts (Iterable[str]): texts of the samples
+            progress_callback (Callable[[int], None] | None, optional): called
+                with the number of the indexed texts every `progress_interval`
+                texts. Defaults to None.
+            progress_interval (int, optional): Defaults to 10000.
+
+        """
+        postings: dict[str, array] = {}
+        n_documents = 0
+        for document, text in enumerate(texts):
+            for term in set(tokenize(text)):
+                term_postings = postings.get(term)
+                if term_postings is None:
+                    term_postings = postings[term] = array(_POSTING_TYPECODE)
+                term_postings.append(document)
+            n_documents = document + 1
+            if progress_callback is not None and n_documents % progress_interval == 0:
+                progress_callback(n_documents)
+        return cls(postings, n_documents)
+
+    def search(self, query: str) -> list[int]:
+        """Sorted indices of the samples which contain all the words of the `query`."""
+        terms = set(tokenize(query))
+        if len(terms) == 0:
+            return []
+        term_postings = []
+        for term in terms:
+            if term not in self._postings:
+                return []
+            term_postings.append(self._postings[term])
+        # intersect starting with the rarest term, so that the candidate set is small
+        term_postings.sort(key=len)
+        matches = set(term_postings[0])
+        for postings in term_postings[1:]:
+            matches.intersection_update(postings)
+            if len(matches) == 0:
+                break
+        return sorted(matches)
+
+    def save(self, path: str | os.PathLike, key: str = ""):
+        """Persist the index. The file consists of a json header with the terms
+        and the offsets of their postings, followed by all the postings.
+
+        Args:
+        ----
+            path (str | os.PathLike): where the index is stored
+            key (str): identifier of the indexed texts, `load` returns None if
+                the stored key differs
+
+        """
+        terms: dict[str, tuple[int, int]] = {}
+        offset = 0
+        for term, postings in self._postings.items():
+            terms[term] = (offset, len(postings))
+            offset += len(postings)
+        header = json.dumps(
+            {
+                "version": _FORMAT_VERSION,
+                "key": key,
+                "n_documents": self.n_documents,
+                "terms": terms,
+            }
+        ).encode()
+        # align the postings, so that they can be read directly from the mapped file
+        header += b" " * (-(_HEADER_LENGTH.size + len(header)) % 8)
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            f.write(_HEADER_LENGTH.pack(len(header)))
+            f.write(header)
+            for postings in self._postings.values():
+                array(_POSTING_TYPECODE, postings).tofile(f)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, key: str = "") -> "SearchIndex | None":
+        """Load the index stored by `save`, the postings are memory mapped.
+        Returns None if the file doesn't exist or was saved with another `key`.
+        """
+        try:
+            with Path(path).open("rb") as f:
+                (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+                header = json.loads(f.read(header_length))
+                if header["version"] != _FORMAT_VERSION or header["key"] != key:
+                    return None
+                data_start = _HEADER_LENGTH.size + header_length
+                if os.fstat(f.fileno()).st_size == data_start:
+                    # empty files cannot be memory mapped
+                    return cls({}, header["n_documents"])
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        postings = memoryview(data)[data_start:].cast("I")
+        return cls(_MappedPostings(header["terms"], postings), header["n_documents"])
+
+
+class _MappedPostings(Mapping[str, Sequence[int]]):
+    def __init__(self, terms: dict[str, list[int]], postings: memoryview):
+        self._terms = terms
+        self._postings = postings
+
+    def __getitem__(self, term: str) -> Sequence[int]:
+        offset, length = self._terms[term]
+        return self._postings[offset : offset + length]
+
+    def __iter__(self):
+        return iter(self._terms)
+
+    def __len__(self) -> int:
+        return len(self._terms)
@@ -0,0 +1,176 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+_MISSING: Any = object()
+
+
+@dataclass
+class _Node:
+    compute: Callable[..., Any] | None
+    """Computes the value from the values of the dependencies, None for inputs"""
+    dependencies: tuple[str, ...] = ()
+    value: Any = _MISSING
+    version: int = 0
+    """Incremented each time the value changes"""
+    computed_from: tuple[int, ...] | None = None
+    """Versions of the dependencies the value was computed from"""
+    invalidated: bool = False
+
+
+@dataclass
+class _Effect:
+    apply: Callable[..., Any]
+    """Called with the values of the dependencies (in the same order)"""
+    dependencies: tuple[str, ...]
+    applied_from: tuple[int, ...] | None = None
+    """Versions of the dependencies the effect was last applied with"""
+
+
+class DependencyGraph:
+
+    """Declarative graph of the values a component displays. The inputs are
+    set from the selectors (e.g. the selected sample or the generation
+    parameters), the derived nodes are computed from the values of their
+    dependencies and memoized.
+
+    When a node is requested by `get`, only the nodes whose dependencies
+    changed since they were computed (or which were invalidated by
+    `invalidate`) are recomputed. A recomputed node whose value is equal to
+    the previous one doesn't make its dependants recompute.
+
+    The functions which compute the nodes should be pure, the changes of the
+    component (e.g. the updates of the elements) are done by the effects,
+    which `apply_effects` runs once all the nodes they depend on are computed.
+    """
+
+    def __init__(self):
+        self._nodes: dict[str, _Node] = {}
+        self._effects: dict[str, _Effect] = {}
+
+    def add_input(self, name: str):
+        """Add the input `name`, its value is set by `set_input`."""
+        self._add(name, _Node(compute=None))
+
+    def add_node(
+        self, name: str, compute: Callable[..., Any], dependencies: Sequence[str]
+    ):
+        """Add the derived node `name`.
+
+        Args:
+        ----
+            name (str): name of the node
+            compute (Callable[..., Any]): called with the values of the
+                `dependencies` (in the same order), returns the value of the node
+            dependencies (Sequence[str]): names of the inputs and of the nodes
+                the node is computed from, they must be added before the node
+
+        """
+        self._check_dependencies(name, dependencies)
+        self._add(name, _Node(compute=compute, dependencies=tuple(dependencies)))
+
+    def add_effect(
+        self, name: str, apply: Callable[..., Any], dependencies: Sequence[str]
+    ):
+        """Add the effect `name`, e.g. the update of the elements which display
+        the values of the `dependencies`.
+
+        Args:
+        ----
+            name (str): name of the effect
+            apply (Callable[..., Any]): called by `apply_effects` with the values
+                of the `dependencies` (in the same order) if any of them changed
+                since the effect was last applied
+            dependencies (Sequence[str]): names of the inputs and of the nodes
+                the effect depends on, they must be added before the effect
+
+        """
+        self._check_dependencies(name, dependencies)
+        if name in self._effects:
+            raise ValueError(f"Effect '{name}' is already in the graph")
+        self._effects[name] = _Effect(apply=apply, dependencies=tuple(dependencies))
+
+    def set_input(self, name: str, value: Any):
+        """Set the value of the input `name`, the nodes which depend on it are
+        recomputed only if the value differs from the previous one.
+        """
+        node = self._node(name)
+        if node.compute is not None:
+            raise ValueError(f"'{name}' is a derived node, not an input")
+        if node.value is _MISSING or not _equal(node.value, value):
+            node.value = value
+            node.version += 1
+
+    def invalidate(self, name: str):
+        """Recompute the node `name` (and the nodes which depend on it) on the
+        next `get` even if its dependencies didn't change, e.g. when the
+        generation with sampling should be repeated.
+        """
+        node = self._node(name)
+        if node.compute is None:
+            node.version += 1
+        else:
+            node.invalidated = True
+
+    def get(self, name: str) -> Any:
+        """Value of the node `name`, the invalidated nodes it depends on are
+        recomputed.
+        """
+        node = self._node(name)
+        if node.compute is None:
+            if node.value is _MISSING:
+                raise RuntimeError(f"Input '{name}' wasn't set")
+            return node.value
+
+        values = [self.get(dependency) for dependency in node.dependencies]
+        versions = tuple(self._nodes[d].version for d in node.dependencies)
+        if node.invalidated or node.computed_from != versions:
+            value = node.compute(*values)
+            if node.value is _MISSING or not _equal(node.value, value):
+                node.version += 1
+            node.value = value
+            node.computed_from = versions
+            node.invalidated = False
+        return node.value
+
+    def apply_effects(self):
+        """Compute all the nodes which the effects depend on, and then apply
+        the effects whose dependencies changed since they were last applied,
+        in the order in which the effects were added.
+        """
+        values = {
+            name: [self.get(dependency) for dependency in effect.dependencies]
+            for name, effect in self._effects.items()
+        }
+        for name, effect in self._effects.items():
+            versions = tuple(self._nodes[d].version for d in effect.dependencies)
+            if effect.applied_from != versions:
+                effect.apply(*values[name])
+                effect.applied_from = versions
+
+    def _check_dependencies(self, name: str, dependencies: Sequence[str]):
+        for dependency in dependencies:
+            if dependency not in self._nodes:
+                raise KeyError(
+                    f"Dependency '{dependency}' of '{name}' isn't in the graph"
+                )
+
+    def _add(self, name: str, node: _Node):
+        if name in self._nodes:
+            raise ValueError(f"Node '{name}' is already in the graph")
+        self._nodes[name] = node
+
+    def _node(self, name: str) -> _Node:
+        if name not in self._nodes:
+            raise KeyError(f"Node '{name}' isn't in the graph")
+        return self._nodes[name]
+
+
+def _equal(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except Exception:
+        # e.g. the comparison of tensors is ambiguous, consider them changed
+        return False
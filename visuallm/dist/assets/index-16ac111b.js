@@ -18,8 +18,8 @@ var gu=Object.defineProperty;var yu=(e,t,n)=>t in e?gu(e,t,{enumerable:!0,config
   * vue-router v4.2.5
   * (c) 2023 Eduardo San Martin Morote
   * @license MIT
-  */const _s=typeof window<"u";function Gd(e){return e.__esModule||e[Symbol.toStringTag]==="Module"}const lt=Object.assign;function bo(e,t){const n={};for(const i in t){const o=t[i];n[i]=gn(o)?o.map(e):e(o)}return n}const qs=()=>{},gn=Array.isArray,zd=/\/$/,Ud=e=>e.replace(zd,"");function vo(e,t,n="/"){let i,o={},r="",u="";const d=t.indexOf("#");let f=t.indexOf("?");return d<f&&d>=0&&(f=-1),f>-1&&(i=t.slice(0,f),r=t.slice(f+1,d>-1?d:t.length),o=e(r)),d>-1&&(i=i||t.slice(0,d),u=t.slice(d,t.length)),i=Zd(i??t,n),{fullPath:i+(r&&"?")+r+u,path:i,query:o,hash:u}}function Kd(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function ol(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function qd(e,t,n){const i=t.matched.length-1,o=n.matched.length-1;return i>-1&&i===o&&Is(t.matched[i],n.matched[o])&&Va(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function Is(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function Va(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!Yd(e[n],t[n]))return!1;return!0}function Yd(e,t){return gn(e)?rl(e,t):gn(t)?rl(t,e):e===t}function rl(e,t){return gn(t)?e.length===t.length&&e.every((n,i)=>n===t[i]):e.length===1&&e[0]===t}function Zd(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),i=e.split("/"),o=i[i.length-1];(o===".."||o===".")&&i.push("");let r=n.length-1,u,d;for(u=0;u<i.length;u++)if(d=i[u],d!==".")if(d==="..")r>1&&r--;else break;return n.slice(0,r).join("/")+"/"+i.slice(u-(u===i.length?1:0)).join("/")}var ti;(function(e){e.pop="pop",e.push="push"})(ti||(ti={}));var Ys;(function(e){e.back="back",e.forward="forward",e.unknown=""})(Ys||(Ys={}));function Xd(e){if(!e)if(_s){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),Ud(e)}const Qd=/^[^#]+#/;function Jd(e,t){return e.replace(Qd,"#")+t}function eh(e,t){const n=document.documentElement.getBoundingClientRect(),i=e.getBoundingClientRect();return{behavior:t.behavior,left:i.left-n.left-(t.left||0),top:i.top-n.top-(t.top||0)}}const eo=()=>({left:window.pageXOffset,top:window.pageYOffset});function th(e){let t;if("el"in e){const n=e.el,i=typeof n=="string"&&n.startsWith("#"),o=typeof n=="string"?i?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!o)return;t=eh(o,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.pageXOffset,t.top!=null?t.top:window.pageYOffset)}function ll(e,t){return(history.state?history.state.position-t:-1)+e}const Bo=new Map;function nh(e,t){Bo.set(e,t)}function sh(e){const t=Bo.get(e);return Bo.delete(e),t}let ih=()=>location.protocol+"//"+location.host;function Na(e,t){const{pathname:n,search:i,hash:o}=t,r=e.indexOf("#");if(r>-1){let d=o.includes(e.slice(r))?e.slice(r).length:1,f=o.slice(d);return f[0]!=="/"&&(f="/"+f),ol(f,"")}return ol(n,e)+i+o}function oh(e,t,n,i){let o=[],r=[],u=null;const d=({state:M})=>{const q=Na(e,location),ce=n.value,me=t.value;let ke=0;if(M){if(n.value=q,t.value=M,u&&u===ce){u=null;return}ke=me?M.position-me.position:0}else i(q);o.forEach(ye=>{ye(n.value,ce,{delta:ke,type:ti.pop,direction:ke?ke>0?Ys.forward:Ys.back:Ys.unknown})})};function f(){u=n.value}function b(M){o.push(M);const q=()=>{const ce=o.indexOf(M);ce>-1&&o.splice(ce,1)};return r.push(q),q}function g(){const{history:M}=window;M.state&&M.replaceState(lt({},M.state,{scroll:eo()}),"")}function E(){for(const M of r)M();r=[],window.removeEventListener("popstate",d),window.removeEventListener("beforeunload",g)}return window.addEventListener("popstate",d),window.addEventListener("beforeunload",g,{passive:!0}),{pauseListeners:f,listen:b,destroy:E}}function al(e,t,n,i=!1,o=!1){return{back:e,current:t,forward:n,replaced:i,position:window.history.length,scroll:o?eo():null}}function rh(e){const{history:t,location:n}=window,i={value:Na(e,n)},o={value:t.state};o.value||r(i.value,{back:null,current:i.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function r(f,b,g){const E=e.indexOf("#"),M=E>-1?(n.host&&document.querySelector("base")?e:e.slice(E))+f:ih()+e+f;try{t[g?"replaceState":"pushState"](b,"",M),o.value=b}catch(q){console.error(q),n[g?"replace":"assign"](M)}}function u(f,b){const g=lt({},t.state,al(o.value.back,f,o.value.forward,!0),b,{position:o.value.position});r(f,g,!0),i.value=f}function d(f,b){const g=lt({},o.value,t.state,{forward:f,scroll:eo()});r(g.current,g,!0);const E=lt({},al(i.value,f,null),{position:g.position+1},b);r(f,E,!1),i.value=f}return{location:i,state:o,push:d,replace:u}}function lh(e){e=Xd(e);const t=rh(e),n=oh(e,t.state,t.location,t.replace);function i(r,u=!0){u||n.pauseListeners(),history.go(r)}const o=lt({location:"",base:e,go:i,createHref:Jd.bind(null,e)},t,n);return Object.defineProperty(o,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(o,"state",{enumerable:!0,get:()=>t.state.value}),o}function ah(e){return e=location.host?e||location.pathname+location.search:"",e.includes("#")||(e+="#"),lh(e)}function uh(e){return typeof e=="string"||e&&typeof e=="object"}function Ba(e){return typeof e=="string"||typeof e=="symbol"}const Fn={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0},Fa=Symbol("");var ul;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(ul||(ul={}));function Ps(e,t){return lt(new Error,{type:e,[Fa]:!0},t)}function Mn(e,t){return e instanceof Error&&Fa in e&&(t==null||!!(e.type&t))}const cl="[^/]+?",ch={sensitive:!1,strict:!1,start:!0,end:!0},dh=/[.+*?^${}()[\]/\\]/g;function hh(e,t){const n=lt({},ch,t),i=[];let o=n.start?"^":"";const r=[];for(const b of e){const g=b.length?[]:[90];n.strict&&!b.length&&(o+="/");for(let E=0;E<b.length;E++){const M=b[E];let q=40+(n.sensitive?.25:0);if(M.type===0)E||(o+="/"),o+=M.value.replace(dh,"\\$&"),q+=40;else if(M.type===1){const{value:ce,repeatable:me,optional:ke,regexp:ye}=M;r.push({name:ce,repeatable:me,optional:ke});const Ce=ye||cl;if(Ce!==cl){q+=10;try{new RegExp(`(${Ce})`)}catch(We){throw new Error(`Invalid custom RegExp for param "${ce}" (${Ce}): `+We.message)}}let Le=me?`((?:${Ce})(?:/(?:${Ce}))*)`:`(${Ce})`;E||(Le=ke&&b.length<2?`(?:/${Le})`:"/"+Le),ke&&(Le+="?"),o+=Le,q+=20,ke&&(q+=-8),me&&(q+=-20),Ce===".*"&&(q+=-50)}g.push(q)}i.push(g)}if(n.strict&&n.end){const b=i.length-1;i[b][i[b].length-1]+=.7000000000000001}n.strict||(o+="/?"),n.end?o+="$":n.strict&&(o+="(?:/|$)");const u=new RegExp(o,n.sensitive?"":"i");function d(b){const g=b.match(u),E={};if(!g)return null;for(let M=1;M<g.length;M++){const q=g[M]||"",ce=r[M-1];E[ce.name]=q&&ce.repeatable?q.split("/"):q}return E}function f(b){let g="",E=!1;for(const M of e){(!E||!g.endsWith("/"))&&(g+="/"),E=!1;for(const q of M)if(q.type===0)g+=q.value;else if(q.type===1){const{value:ce,repeatable:me,optional:ke}=q,ye=ce in b?b[ce]:"";if(gn(ye)&&!me)throw new Error(`Provided param "${ce}" is an array but it is not repeatable (* or + modifiers)`);const Ce=gn(ye)?ye.join("/"):ye;if(!Ce)if(ke)M.length<2&&(g.endsWith("/")?g=g.slice(0,-1):E=!0);else throw new Error(`Missing required param "${ce}"`);g+=Ce}}return g||"/"}return{re:u,score:i,keys:r,parse:d,stringify:f}}function fh(e,t){let n=0;for(;n<e.length&&n<t.length;){const i=t[n]-e[n];if(i)return i;n++}return e.length<t.length?e.length===1&&e[0]===40+40?-1:1:e.length>t.length?t.length===1&&t[0]===40+40?1:-1:0}function ph(e,t){let n=0;const i=e.score,o=t.score;for(;n<i.length&&n<o.length;){const r=fh(i[n],o[n]);if(r)return r;n++}if(Math.abs(o.length-i.length)===1){if(dl(i))return 1;if(dl(o))return-1}return o.length-i.length}function dl(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const mh={type:0,value:""},gh=/[a-zA-Z0-9_]/;function yh(e){if(!e)return[[]];if(e==="/")return[[mh]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(q){throw new Error(`ERR (${n})/"${b}": ${q}`)}let n=0,i=n;const o=[];let r;function u(){r&&o.push(r),r=[]}let d=0,f,b="",g="";function E(){b&&(n===0?r.push({type:0,value:b}):n===1||n===2||n===3?(r.length>1&&(f==="*"||f==="+")&&t(`A repeatable param (${b}) must be alone in its segment. eg: '/:ids+.`),r.push({type:1,value:b,regexp:g,repeatable:f==="*"||f==="+",optional:f==="*"||f==="?"})):t("Invalid state to consume buffer"),b="")}function M(){b+=f}for(;d<e.length;){if(f=e[d++],f==="\\"&&n!==2){i=n,n=4;continue}switch(n){case 0:f==="/"?(b&&E(),u()):f===":"?(E(),n=1):M();break;case 4:M(),n=i;break;case 1:f==="("?n=2:gh.test(f)?M():(E(),n=0,f!=="*"&&f!=="?"&&f!=="+"&&d--);break;case 2:f===")"?g[g.length-1]=="\\"?g=g.slice(0,-1)+f:n=3:g+=f;break;case 3:E(),n=0,f!=="*"&&f!=="?"&&f!=="+"&&d--,g="";break;default:t("Unknown state");break}}return n===2&&t(`Unfinished custom RegExp for param "${b}"`),E(),u(),o}function bh(e,t,n){const i=hh(yh(e.path),n),o=lt(i,{record:e,parent:t,children:[],alias:[]});return t&&!o.record.aliasOf==!t.record.aliasOf&&t.children.push(o),o}function vh(e,t){const n=[],i=new Map;t=pl({strict:!1,end:!0,sensitive:!1},t);function o(g){return i.get(g)}function r(g,E,M){const q=!M,ce=_h(g);ce.aliasOf=M&&M.record;const me=pl(t,g),ke=[ce];if("alias"in g){const Le=typeof g.alias=="string"?[g.alias]:g.alias;for(const We of Le)ke.push(lt({},ce,{components:M?M.record.components:ce.components,path:We,aliasOf:M?M.record:ce}))}let ye,Ce;for(const Le of ke){const{path:We}=Le;if(E&&We[0]!=="/"){const Ue=E.record.path,Re=Ue[Ue.length-1]==="/"?"":"/";Le.path=E.record.path+(We&&Re+We)}if(ye=bh(Le,E,me),M?M.alias.push(ye):(Ce=Ce||ye,Ce!==ye&&Ce.alias.push(ye),q&&g.name&&!fl(ye)&&u(g.name)),ce.children){const Ue=ce.children;for(let Re=0;Re<Ue.length;Re++)r(Ue[Re],ye,M&&M.children[Re])}M=M||ye,(ye.record.components&&Object.keys(ye.record.components).length||ye.record.name||ye.record.redirect)&&f(ye)}return Ce?()=>{u(Ce)}:qs}function u(g){if(Ba(g)){const E=i.get(g);E&&(i.delete(g),n.splice(n.indexOf(E),1),E.children.forEach(u),E.alias.forEach(u))}else{const E=n.indexOf(g);E>-1&&(n.splice(E,1),g.record.name&&i.delete(g.record.name),g.children.forEach(u),g.alias.forEach(u))}}function d(){return n}function f(g){let E=0;for(;E<n.length&&ph(g,n[E])>=0&&(g.record.path!==n[E].record.path||!Da(g,n[E]));)E++;n.splice(E,0,g),g.record.name&&!fl(g)&&i.set(g.record.name,g)}function b(g,E){let M,q={},ce,me;if("name"in g&&g.name){if(M=i.get(g.name),!M)throw Ps(1,{location:g});me=M.record.name,q=lt(hl(E.params,M.keys.filter(Ce=>!Ce.optional).map(Ce=>Ce.name)),g.params&&hl(g.params,M.keys.map(Ce=>Ce.name))),ce=M.stringify(q)}else if("path"in g)ce=g.path,M=n.find(Ce=>Ce.re.test(ce)),M&&(q=M.parse(ce),me=M.record.name);else{if(M=E.name?i.get(E.name):n.find(Ce=>Ce.re.test(E.path)),!M)throw Ps(1,{location:g,currentLocation:E});me=M.record.name,q=lt({},E.params,g.params),ce=M.stringify(q)}const ke=[];let ye=M;for(;ye;)ke.unshift(ye.record),ye=ye.parent;return{name:me,path:ce,params:q,matched:ke,meta:Eh(ke)}}return e.forEach(g=>r(g)),{addRoute:r,resolve:b,removeRoute:u,getRoutes:d,getRecordMatcher:o}}function hl(e,t){const n={};for(const i of t)i in e&&(n[i]=e[i]);return n}function _h(e){return{path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:void 0,beforeEnter:e.beforeEnter,props:Sh(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}}}function Sh(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const i in e.components)t[i]=typeof n=="object"?n[i]:n;return t}function fl(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Eh(e){return e.reduce((t,n)=>lt(t,n.meta),{})}function pl(e,t){const n={};for(const i in e)n[i]=i in t?t[i]:e[i];return n}function Da(e,t){return t.children.some(n=>n===e||Da(e,n))}const Ha=/#/g,wh=/&/g,xh=/\//g,kh=/=/g,Oh=/\?/g,Wa=/\+/g,Ch=/%5B/g,Mh=/%5D/g,ja=/%5E/g,Lh=/%60/g,Ga=/%7B/g,Ih=/%7C/g,za=/%7D/g,Ph=/%20/g;function lr(e){return encodeURI(""+e).replace(Ih,"|").replace(Ch,"[").replace(Mh,"]")}function Ah(e){return lr(e).replace(Ga,"{").replace(za,"}").replace(ja,"^")}function Fo(e){return lr(e).replace(Wa,"%2B").replace(Ph,"+").replace(Ha,"%23").replace(wh,"%26").replace(Lh,"`").replace(Ga,"{").replace(za,"}").replace(ja,"^")}function Th(e){return Fo(e).replace(kh,"%3D")}function Rh(e){return lr(e).replace(Ha,"%23").replace(Oh,"%3F")}function $h(e){return e==null?"":Rh(e).replace(xh,"%2F")}function Fi(e){try{return decodeURIComponent(""+e)}catch{}return""+e}function Vh(e){const t={};if(e===""||e==="?")return t;const i=(e[0]==="?"?e.slice(1):e).split("&");for(let o=0;o<i.length;++o){const r=i[o].replace(Wa," "),u=r.indexOf("="),d=Fi(u<0?r:r.slice(0,u)),f=u<0?null:Fi(r.slice(u+1));if(d in t){let b=t[d];gn(b)||(b=t[d]=[b]),b.push(f)}else t[d]=f}return t}function ml(e){let t="";for(let n in e){const i=e[n];if(n=Th(n),i==null){i!==void 0&&(t+=(t.length?"&":"")+n);continue}(gn(i)?i.map(r=>r&&Fo(r)):[i&&Fo(i)]).forEach(r=>{r!==void 0&&(t+=(t.length?"&":"")+n,r!=null&&(t+="="+r))})}return t}function Nh(e){const t={};for(const n in e){const i=e[n];i!==void 0&&(t[n]=gn(i)?i.map(o=>o==null?null:""+o):i==null?i:""+i)}return t}const Bh=Symbol(""),gl=Symbol(""),ar=Symbol(""),Ua=Symbol(""),Do=Symbol("");function Ws(){let e=[];function t(i){return e.push(i),()=>{const o=e.indexOf(i);o>-1&&e.splice(o,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function Gn(e,t,n,i,o){const r=i&&(i.enterCallbacks[o]=i.enterCallbacks[o]||[]);return()=>new Promise((u,d)=>{const f=E=>{E===!1?d(Ps(4,{from:n,to:t})):E instanceof Error?d(E):uh(E)?d(Ps(2,{from:t,to:E})):(r&&i.enterCallbacks[o]===r&&typeof E=="function"&&r.push(E),u())},b=e.call(i&&i.instances[o],t,n,f);let g=Promise.resolve(b);e.length<3&&(g=g.then(f)),g.catch(E=>d(E))})}function _o(e,t,n,i){const o=[];for(const r of e)for(const u in r.components){let d=r.components[u];if(!(t!=="beforeRouteEnter"&&!r.instances[u]))if(Fh(d)){const b=(d.__vccOpts||d)[t];b&&o.push(Gn(b,n,i,r,u))}else{let f=d();o.push(()=>f.then(b=>{if(!b)return Promise.reject(new Error(`Couldn't resolve component "${u}" at "${r.path}"`));const g=Gd(b)?b.default:b;r.components[u]=g;const M=(g.__vccOpts||g)[t];return M&&Gn(M,n,i,r,u)()}))}}return o}function Fh(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function yl(e){const t=Pn(ar),n=Pn(Ua),i=pn(()=>t.resolve(xs(e.to))),o=pn(()=>{const{matched:f}=i.value,{length:b}=f,g=f[b-1],E=n.matched;if(!g||!E.length)return-1;const M=E.findIndex(Is.bind(null,g));if(M>-1)return M;const q=bl(f[b-2]);return b>1&&bl(g)===q&&E[E.length-1].path!==q?E.findIndex(Is.bind(null,f[b-2])):M}),r=pn(()=>o.value>-1&&jh(n.params,i.value.params)),u=pn(()=>o.value>-1&&o.value===n.matched.length-1&&Va(n.params,i.value.params));function d(f={}){return Wh(f)?t[xs(e.replace)?"replace":"push"](xs(e.to)).catch(qs):Promise.resolve()}return{route:i,href:pn(()=>i.value.href),isActive:r,isExactActive:u,navigate:d}}const Dh=jt({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:yl,setup(e,{slots:t}){const n=si(yl(e)),{options:i}=Pn(ar),o=pn(()=>({[vl(e.activeClass,i.linkActiveClass,"router-link-active")]:n.isActive,[vl(e.exactActiveClass,i.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const r=t.default&&t.default(n);return e.custom?r:or("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:o.value},r)}}}),Hh=Dh;function Wh(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function jh(e,t){for(const n in t){const i=t[n],o=e[n];if(typeof i=="string"){if(i!==o)return!1}else if(!gn(o)||o.length!==i.length||i.some((r,u)=>r!==o[u]))return!1}return!0}function bl(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const vl=(e,t,n)=>e??t??n,Gh=jt({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const i=Pn(Do),o=pn(()=>e.route||i.value),r=Pn(gl,0),u=pn(()=>{let b=xs(r);const{matched:g}=o.value;let E;for(;(E=g[b])&&!E.components;)b++;return b}),d=pn(()=>o.value.matched[u.value]);Ci(gl,pn(()=>u.value+1)),Ci(Bh,d),Ci(Do,o);const f=ec();return Oi(()=>[f.value,d.value,e.name],([b,g,E],[M,q,ce])=>{g&&(g.instances[E]=b,q&&q!==g&&b&&b===M&&(g.leaveGuards.size||(g.leaveGuards=q.leaveGuards),g.updateGuards.size||(g.updateGuards=q.updateGuards))),b&&g&&(!q||!Is(g,q)||!M)&&(g.enterCallbacks[E]||[]).forEach(me=>me(b))},{flush:"post"}),()=>{const b=o.value,g=e.name,E=d.value,M=E&&E.components[g];if(!M)return _l(n.default,{Component:M,route:b});const q=E.props[g],ce=q?q===!0?b.params:typeof q=="function"?q(b):q:null,ke=or(M,lt({},ce,t,{onVnodeUnmounted:ye=>{ye.component.isUnmounted&&(E.instances[g]=null)},ref:f}));return _l(n.default,{Component:ke,route:b})||ke}}});function _l(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const zh=Gh;function Uh(e){const t=vh(e.routes,e),n=e.parseQuery||Vh,i=e.stringifyQuery||ml,o=e.history,r=Ws(),u=Ws(),d=Ws(),f=tc(Fn);let b=Fn;_s&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const g=bo.bind(null,G=>""+G),E=bo.bind(null,$h),M=bo.bind(null,Fi);function q(G,fe){let re,Ee;return Ba(G)?(re=t.getRecordMatcher(G),Ee=fe):Ee=G,t.addRoute(Ee,re)}function ce(G){const fe=t.getRecordMatcher(G);fe&&t.removeRoute(fe)}function me(){return t.getRoutes().map(G=>G.record)}function ke(G){return!!t.getRecordMatcher(G)}function ye(G,fe){if(fe=lt({},fe||f.value),typeof G=="string"){const v=vo(n,G,fe.path),V=t.resolve({path:v.path},fe),Y=o.createHref(v.fullPath);return lt(v,V,{params:M(V.params),hash:Fi(v.hash),redirectedFrom:void 0,href:Y})}let re;if("path"in G)re=lt({},G,{path:vo(n,G.path,fe.path).path});else{const v=lt({},G.params);for(const V in v)v[V]==null&&delete v[V];re=lt({},G,{params:E(v)}),fe.params=E(fe.params)}const Ee=t.resolve(re,fe),Je=G.hash||"";Ee.params=g(M(Ee.params));const ft=Kd(i,lt({},G,{hash:Ah(Je),path:Ee.path})),p=o.createHref(ft);return lt({fullPath:ft,hash:Je,query:i===ml?Nh(G.query):G.query||{}},Ee,{redirectedFrom:void 0,href:p})}function Ce(G){return typeof G=="string"?vo(n,G,f.value.path):lt({},G)}function Le(G,fe){if(b!==G)return Ps(8,{from:fe,to:G})}function We(G){return St(G)}function Ue(G){return We(lt(Ce(G),{replace:!0}))}function Re(G){const fe=G.matched[G.matched.length-1];if(fe&&fe.redirect){const{redirect:re}=fe;let Ee=typeof re=="function"?re(G):re;return typeof Ee=="string"&&(Ee=Ee.includes("?")||Ee.includes("#")?Ee=Ce(Ee):{path:Ee},Ee.params={}),lt({query:G.query,hash:G.hash,params:"path"in Ee?{}:G.params},Ee)}}function St(G,fe){const re=b=ye(G),Ee=f.value,Je=G.state,ft=G.force,p=G.replace===!0,v=Re(re);if(v)return St(lt(Ce(v),{state:typeof v=="object"?lt({},Je,v.state):Je,force:ft,replace:p}),fe||re);const V=re;V.redirectedFrom=fe;let Y;return!ft&&qd(i,Ee,re)&&(Y=Ps(16,{to:V,from:Ee}),en(Ee,Ee,!0,!1)),(Y?Promise.resolve(Y):Ne(V,Ee)).catch(W=>Mn(W)?Mn(W,2)?W:dn(W):Ze(W,V,Ee)).then(W=>{if(W){if(Mn(W,2))return St(lt({replace:p},Ce(W.to),{state:typeof W.to=="object"?lt({},Je,W.to.state):Je,force:ft}),fe||V)}else W=ge(V,Ee,!0,p,Je);return ot(V,Ee,W),W})}function Ve(G,fe){const re=Le(G,fe);return re?Promise.reject(re):Promise.resolve()}function at(G){const fe=$n.values().next().value;return fe&&typeof fe.runWithContext=="function"?fe.runWithContext(G):G()}function Ne(G,fe){let re;const[Ee,Je,ft]=Kh(G,fe);re=_o(Ee.reverse(),"beforeRouteLeave",G,fe);for(const v of Ee)v.leaveGuards.forEach(V=>{re.push(Gn(V,G,fe))});const p=Ve.bind(null,G,fe);return re.push(p),Ct(re).then(()=>{re=[];for(const v of r.list())re.push(Gn(v,G,fe));return re.push(p),Ct(re)}).then(()=>{re=_o(Je,"beforeRouteUpdate",G,fe);for(const v of Je)v.updateGuards.forEach(V=>{re.push(Gn(V,G,fe))});return re.push(p),Ct(re)}).then(()=>{re=[];for(const v of ft)if(v.beforeEnter)if(gn(v.beforeEnter))for(const V of v.beforeEnter)re.push(Gn(V,G,fe));else re.push(Gn(v.beforeEnter,G,fe));return re.push(p),Ct(re)}).then(()=>(G.matched.forEach(v=>v.enterCallbacks={}),re=_o(ft,"beforeRouteEnter",G,fe),re.push(p),Ct(re))).then(()=>{re=[];for(const v of u.list())re.push(Gn(v,G,fe));return re.push(p),Ct(re)}).catch(v=>Mn(v,8)?v:Promise.reject(v))}function ot(G,fe,re){d.list().forEach(Ee=>at(()=>Ee(G,fe,re)))}function ge(G,fe,re,Ee,Je){const ft=Le(G,fe);if(ft)return ft;const p=fe===Fn,v=_s?history.state:{};re&&(Ee||p?o.replace(G.fullPath,lt({scroll:p&&v&&v.scroll},Je)):o.push(G.fullPath,Je)),f.value=G,en(G,fe,re,p),dn()}let Ke;function bt(){Ke||(Ke=o.listen((G,fe,re)=>{if(!On.listening)return;const Ee=ye(G),Je=Re(Ee);if(Je){St(lt(Je,{replace:!0}),Ee).catch(qs);return}b=Ee;const ft=f.value;_s&&nh(ll(ft.fullPath,re.delta),eo()),Ne(Ee,ft).catch(p=>Mn(p,12)?p:Mn(p,2)?(St(p.to,Ee).then(v=>{Mn(v,20)&&!re.delta&&re.type===ti.pop&&o.go(-1,!1)}).catch(qs),Promise.reject()):(re.delta&&o.go(-re.delta,!1),Ze(p,Ee,ft))).then(p=>{p=p||ge(Ee,ft,!1),p&&(re.delta&&!Mn(p,8)?o.go(-re.delta,!1):re.type===ti.pop&&Mn(p,20)&&o.go(-1,!1)),ot(Ee,ft,p)}).catch(qs)}))}let qt=Ws(),Et=Ws(),nt;function Ze(G,fe,re){dn(G);const Ee=Et.list();return Ee.length?Ee.forEach(Je=>Je(G,fe,re)):console.error(G),Promise.reject(G)}function Jt(){return nt&&f.value!==Fn?Promise.resolve():new Promise((G,fe)=>{qt.add([G,fe])})}function dn(G){return nt||(nt=!G,bt(),qt.list().forEach(([fe,re])=>G?re(G):fe()),qt.reset()),G}function en(G,fe,re,Ee){const{scrollBehavior:Je}=e;if(!_s||!Je)return Promise.resolve();const ft=!re&&sh(ll(G.fullPath,0))||(Ee||!re)&&history.state&&history.state.scroll||null;return Ql().then(()=>Je(G,fe,ft)).then(p=>p&&th(p)).catch(p=>Ze(p,G,fe))}const vt=G=>o.go(G);let Rn;const $n=new Set,On={currentRoute:f,listening:!0,addRoute:q,removeRoute:ce,hasRoute:ke,getRoutes:me,resolve:ye,options:e,push:We,replace:Ue,go:vt,back:()=>vt(-1),forward:()=>vt(1),beforeEach:r.add,beforeResolve:u.add,afterEach:d.add,onError:Et.add,isReady:Jt,install(G){const fe=this;G.component("RouterLink",Hh),G.component("RouterView",zh),G.config.globalProperties.$router=fe,Object.defineProperty(G.config.globalProperties,"$route",{enumerable:!0,get:()=>xs(f)}),_s&&!Rn&&f.value===Fn&&(Rn=!0,We(o.location).catch(Je=>{}));const re={};for(const Je in Fn)Object.defineProperty(re,Je,{get:()=>f.value[Je],enumerable:!0});G.provide(ar,fe),G.provide(Ua,jl(re)),G.provide(Do,f);const Ee=G.unmount;$n.add(G),G.unmount=function(){$n.delete(G),$n.size<1&&(b=Fn,Ke&&Ke(),Ke=null,f.value=Fn,Rn=!1,nt=!1),Ee()}}};function Ct(G){return G.reduce((fe,re)=>fe.then(()=>at(re)),Promise.resolve())}return On}function Kh(e,t){const n=[],i=[],o=[],r=Math.max(t.matched.length,e.matched.length);for(let u=0;u<r;u++){const d=t.matched[u];d&&(e.matched.find(b=>Is(b,d))?i.push(d):n.push(d));const f=e.matched[u];f&&(t.matched.find(b=>Is(b,f))||o.push(f))}return[n,i,o]}class Ka{constructor(t,n,i=500){Yt(this,"backendAddress");Yt(this,"responseCallback");Yt(this,"pollingInterval",!1);Yt(this,"howOftenToPoll");this.backendAddress=t,this.responseCallback=n,this.howOftenToPoll=i}isPending(){return typeof this.pollingInterval=="number"}async newRequest(){if(this.isPending()){console.log("Request not processed, another one is still pending!");return}await this._fetchFromBackend()}async _fetchFromBackend(){try{const t=await this._fetchMethod();if(t.result==="success"||t.result==="exception"){this.responseCallback(t),this.clear();return}}catch(t){console.log("Error - PollUntilSuccess"),console.log(t)}typeof this.pollingInterval=="boolean"&&(this.pollingInterval=setInterval(this._fetchFromBackend.bind(this),this.howOftenToPoll))}clear(){this.isPending()&&(clearInterval(this.pollingInterval),this.pollingInterval=!1)}}class qa extends Ka{async _fetchMethod(){return await fetch(this.backendAddress,{method:"GET",headers:{Accept:"application/json"}}).then(t=>t.json())}}class Ya extends Ka{constructor(n,i,o=500,r){super(n,i,o);Yt(this,"body");this.body=r}async _fetchMethod(){return await fetch(this.backendAddress,{method:"POST",headers:{Accept:"application/json","Content-Type":"application/json"},body:JSON.stringify(this.body)}).then(n=>n.json())}static async startPoll(n,i,o,r,u){if(n[i]==null)n[i]=new this(o,r,500,u);else if(!n[i].isPending())n[i].body=u;else return;await n[i].newRequest()}}const Te=si({});function De(e,t){return`${e}>>${t}`}function qh(e){let t=e.split(">>");return t[t.length-1]}function oi(e,t,n){const i={};for(const o of Object.keys(n)){const r=n[o];i[De(e,r)]=t[o]}return i}class Yh{constructor(){Yt(this,"name");Yt(this,"type")}}function*Za(e){for(const t of Object.keys(e))yield[t,e[t]]}class Zh{constructor(){Yt(this,"registeredElements");this.registeredElements={}}createElementDataFromDescription(t){if(t===void 0)throw RangeError("Context is undefined!");if(!(t.type in this.registeredElements))throw RangeError(`context.type: "${t.type}" isn't registered in formatter!`);const n=this.registeredElements[t.type];return{component:n.component,data:n.process(t)}}retrieveElementsFromResponse(t,n,i=void 0,o=!1){if(t.result==="exception"){alert(`Exception: ${t.reason}`);return}const r=t.elementDescriptions;for(let u=0;u<r.length;u++){const d=r[u],f=this.createElementDataFromDescription(d);i!==void 0&&i.push({component:f.component,name:d.name});for(const[b,g]of Za(f.data)){let E=De(d.name,b);if(o&&!n.hasOwnProperty(E)&&i===void 0)throw TypeError(`reactiveStore doesn't contain property '${E}'`);n[E]=g}}}install(t){t.config.globalProperties.$elementRegistry=this}}function fs(e,t){for(const n of t)if(!(n in e))throw RangeError(`Invalid configuration! ('${n}' not in configuration)`)}function to(e,t,n,i){e.registeredElements[t]={component:n,process:o=>Xh(o,i)}}function Xh(e,t){fs(e,Object.keys(t));let n={};for(const i of Object.keys(t))n[t[i]]=e[i];return n}function Qh(e){return e.replace(/[.*+?^${}()|[\]\\]/g,"\\$&")}function Xa(e){let t=["<br />","<code>","</code>","<b>","</b>","<em>","</em>"];t=t.map(Qh);let n=e.replace(new RegExp(t.join("|"),"g"),"");return!n.includes("<")&&!n.includes(">")}function Jh(e){return e.replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#039;")}function ef(e){return e=e.replace(/(?:\r\n|\r|\n)/g,"<br>"),e}let tf=jt({props:{name:{type:String,required:!0}},computed:{headingLevel(){return Te[De(this.name,"headingLevel")]},heading(){return Te[De(this.name,"heading")]},value(){let e=Te[De(this.name,"value")];if(!Xa(e))throw Error("Invalid value arrived from backend");return e}}}),nf={value:"value",heading:"heading",heading_level:"headingLevel"};function sf(e){to(e,"plain","PlainText",nf)}const Kt=(e,t)=>{const n=e.__vccOpts||e;for(const[i,o]of t)n[i]=o;return n},of={key:0},rf={key:0},lf={key:1},af={key:2},uf={key:3},cf={key:4},df={key:5},hf=["innerHTML"];function ff(e,t,n,i,o,r){return e.heading?(he(),Ae("span",of,[e.headingLevel===1?(he(),Ae("h1",rf,it(e.value),1)):e.headingLevel===2?(he(),Ae("h2",lf,it(e.value),1)):e.headingLevel===3?(he(),Ae("h3",af,it(e.value),1)):e.headingLevel===4?(he(),Ae("h4",uf,it(e.value),1)):e.headingLevel===5?(he(),Ae("h5",cf,it(e.value),1)):e.headingLevel===6?(he(),Ae("h6",df,it(e.value),1)):Pt("",!0)])):(he(),Ae("div",{key:1,class:"wrapElement plainText",innerHTML:e.value},null,8,hf))}const Qa=Kt(tf,[["render",ff]]);let pf=jt({props:{item:{type:Object,required:!0},longContexts:{type:Boolean,required:!0},maxTextWidth:{type:String,required:!0}},data(){return{showProbs:!1}},computed:{useInlineLayout(){return!this.longContexts&&this.item.barHeights.length==1},content(){return this.item.pieceTitle},barHeights(){return this.item.barHeights},annotations(){return this.item.barAnnotations},names(){return this.item.barNames},trackWidth(){let e=90;return this.useInlineLayout||(e=100),`${e}%`}},methods:{barWidth(e){return e.toString()+"%"}}});const mf={key:0,class:"inline-bar-block"},gf={class:"track rounded"},yf={class:"prob-text"},bf={key:1},vf={class:"single-bar-wrapper"},_f={class:"inline-bar-block-text"},Sf={class:"track rounded"},Ef={class:"prob-text"};function wf(e,t,n,i,o,r){return he(),Ae("span",null,[e.useInlineLayout?(he(),Ae("span",mf,[Fe("span",{class:"word-text",style:Ln({width:e.maxTextWidth})},it(e.content),5),Fe("span",gf,[Fe("span",{style:Ln({width:e.barWidth(e.barHeights[0])}),class:"track-fill rounded"},[Fe("span",yf,it(e.annotations[0]),1)],4)])])):(he(),Ae("span",bf,[Fe("div",{class:"context-text",onMouseover:t[0]||(t[0]=u=>e.showProbs=!0),onMouseleave:t[1]||(t[1]=u=>e.showProbs=!1)},'"'+it(e.content)+'"',33),Fe("div",{class:"multiline-bar-block",style:Ln({width:e.trackWidth})},[(he(!0),Ae(ht,null,rn(e.barHeights,(u,d)=>(he(),Ae("span",vf,[Fe("div",_f,it(e.names[d]),1),Fe("div",Sf,[Fe("div",{style:Ln({width:e.barWidth(u)}),class:"track-fill rounded"},[Fe("span",Ef,it(e.annotations[d]),1)],4)])]))),256))],4)]))])}const xf=Kt(pf,[["render",wf],["__scopeId","data-v-d902367c"]]);function kf(e){return e.toString().length*7+35}function Ja(e){let t=e.length;return t*=8,t+=30,t}let Of=jt({props:{name:{type:String,required:!0}},inject:["backendAddress"],computed:{barInfos(){return Te[De(this.name,"barInfos")]},address(){return Te[De(this.name,"address")]},longContexts(){return Te[De(this.name,"longContexts")]},selectable(){return Te[De(this.name,"selectable")]},percentageElementWidth(){return this.selectable===!0?"90%":"100%"},maxTextWidth(){let e=0;for(let t of this.barInfos){let n=Ja(t.pieceTitle);n>e&&(e=n)}return e.toString()+"px"}},components:{DisplayPercentageComponent:xf},watch:{barInfos:{immediate:!0,handler(e){if(e!==void 0&&e.length!=0){this.selected=e[0].pieceTitle;let t=[];for(let n=0;n<e.length;n++)t.push(!1);this.focusedBarInfos=t}}}},data(){return{selected:"",reactiveStore:Te,selectPossibilityPoll:void 0,focusedBarInfos:[]}},unmounted(){var e;(e=this.selectPossibilityPoll)==null||e.clear()},methods:{submit(){Ya.startPoll(this,"selectPossibilityPoll",`${this.backendAddress}/${this.address}`,this.processResponse.bind(this),{selected:this.selected})},processResponse(e){this.$elementRegistry.retrieveElementsFromResponse(e,this.reactiveStore)}}}),Cf={address:"address",piece_infos:"barInfos",long_contexts:"longContexts",selectable:"selectable"};function Mf(e){to(e,"softmax","BarChartSelect",Cf)}const Lf=["value","onFocus","onBlur"],If={key:0,style:{"text-align":"center","margin-top":"10px"}},Pf={class:"button",type:"submit"};function Af(e,t,n,i,o,r){const u=Ms("DisplayPercentageComponent");return he(),Ae("form",{class:"wrapElement barChartSelect",onSubmit:t[1]||(t[1]=dt((...d)=>e.submit&&e.submit(...d),["prevent"]))},[(he(!0),Ae(ht,null,rn(e.barInfos,(d,f)=>(he(),Ae("div",{class:kn({"progress-bar":!0,focused:e.focusedBarInfos[f]})},[e.selectable?wn((he(),Ae("input",{key:0,class:"input-radio",type:"radio","onUpdate:modelValue":t[0]||(t[0]=b=>e.selected=b),value:d.pieceTitle,onFocus:b=>e.focusedBarInfos[f]=!0,onBlur:b=>e.focusedBarInfos[f]=!1},null,40,Lf)),[[Ta,e.selected]]):Pt("",!0),Xe(u,{style:Ln({display:"inline-block",width:e.percentageElementWidth}),item:d,longContexts:e.longContexts,maxTextWidth:e.maxTextWidth},null,8,["style","item","longContexts","maxTextWidth"])],2))),256)),e.selectable?(he(),Ae("div",If,[Fe("button",Pf,'Select "'+it(e.selected)+'"',1)])):Pt("",!0)],32)}const eu=Kt(Of,[["render",Af],["__scopeId","data-v-2068ad37"]]);const Tf={},ps=e=>(sa("data-v-9f8887ba"),e=e(),ia(),e),Rf={class:"load"},$f=ps(()=>Fe("div",null,"G",-1)),Vf=ps(()=>Fe("div",null,"N",-1)),Nf=ps(()=>Fe("div",null,"I",-1)),Bf=ps(()=>Fe("div",null,"D",-1)),Ff=ps(()=>Fe("div",null,"A",-1)),Df=ps(()=>Fe("div",null,"O",-1)),Hf=ps(()=>Fe("div",null,"L",-1)),Wf=[$f,Vf,Nf,Bf,Ff,Df,Hf];function jf(e,t){return he(),Ae("div",Rf,Wf)}const Gf=Kt(Tf,[["render",jf],["__scopeId","data-v-9f8887ba"]]);let zf=jt({props:{name:{type:String,required:!0}},computed:{max(){return Te[De(this.name,"max")]},min(){return Te[De(this.name,"min")]},stepSize(){return Te[De(this.name,"stepSize")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]},text(){return Te[De(this.name,"text")]},inputWidth(){return kf(this.selected).toString()+"px"}},data(){return{reactiveStore:Te,selected:0,isFocused:!1}},watch:{selected:{handler(e){this.selected=Math.max(Math.min(e,this.max),this.min);let t=De(this.name,"selected");Te[t]=this.selected},immediate:!0},defaultSelected:{handler(e){this.selected=e},immediate:!0}}}),Uf="min_max";function Kf(e,t){let n={min:"min",max:"max",selected:"defaultSelected",text:"text",step_size:"stepSize"};return fs(t,Object.keys(n)),oi(e,t,n)}const qf={class:"selector-text"},Yf={class:"selector"},Zf=["min","max","step"];function Xf(e,t,n,i,o,r){return he(),Ae("div",{class:kn({"sample-selector":!0,wrapElement:!0,focused:e.isFocused,"selector-wrapper":!0})},[Fe("span",qf,it(e.text),1),Fe("span",Yf,[wn(Fe("input",{style:Ln({width:e.inputWidth}),type:"number",min:e.min,max:e.max,"onUpdate:modelValue":t[0]||(t[0]=u=>e.selected=u),step:e.stepSize,onFocus:t[1]||(t[1]=u=>e.isFocused=!0),onBlur:t[2]||(t[2]=u=>e.isFocused=!1)},null,44,Zf),[[Aa,e.selected]])])],2)}const tu=Kt(zf,[["render",Xf],["__scopeId","data-v-6b22d2a9"]]);let Qf=jt({props:{name:{type:String,required:!0}},data(){return{selected:""}},computed:{choices(){return Te[De(this.name,"choices")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]},text(){return Te[De(this.name,"text")]},isHorizontal(){return Te[De(this.name,"isHorizontal")]},randomNumber(){return Te[De(this.name,"randomNumber")]}},watch:{selected:{handler(e){Te[De(this.name,"selected")]=e},immediate:!0},randomNumber:{handler(e){this.selected=this.defaultSelected},immediate:!0}}}),Jf="multi-radio";function ep(e,t){let n={choices:"choices",selected:"defaultSelected",text:"text",is_horizontal:"isHorizontal",random_number:"randomNumber"};return fs(t,Object.keys(n)),oi(e,t,n)}const tp={key:0,class:"descr"},np={class:"input-radio"},sp=["value"];function ip(e,t,n,i,o,r){return he(),Ae("div",{class:kn({"hmr-wrapper":!0,wrapElement:!0,vertical:!e.isHorizontal})},[e.text.length>0?(he(),Ae("div",tp,it(e.text),1)):Pt("",!0),(he(!0),Ae(ht,null,rn(e.choices,u=>(he(),Ae("div",np,[wn(Fe("input",{type:"radio","onUpdate:modelValue":t[0]||(t[0]=d=>e.selected=d),value:u},null,8,sp),[[Ta,e.selected]]),qn(" "+it(u),1)]))),256))],2)}const nu=Kt(Qf,[["render",ip],["__scopeId","data-v-b6b3ab34"]]);function So(e){return e===0?!1:Array.isArray(e)&&e.length===0?!0:!e}function op(e){return(...t)=>!e(...t)}function rp(e,t){return e===void 0&&(e="undefined"),e===null&&(e="null"),e===!1&&(e="false"),e.toString().toLowerCase().indexOf(t.trim())!==-1}function su(e,t,n,i){return t?e.filter(o=>rp(i(o,n),t)).sort((o,r)=>i(o,n).length-i(r,n).length):e}function lp(e){return e.filter(t=>!t.$isLabel)}function Eo(e,t){return n=>n.reduce((i,o)=>o[e]&&o[e].length?(i.push({$groupLabel:o[t],$isLabel:!0}),i.concat(o[e])):i,[])}function ap(e,t,n,i,o){return r=>r.map(u=>{if(!u[n])return console.warn("Options passed to vue-multiselect do not contain groups, despite the config."),[];const d=su(u[n],e,t,o);return d.length?{[i]:u[i],[n]:d}:[]})}const Sl=(...e)=>t=>e.reduce((n,i)=>i(n),t);var up={data(){return{search:"",isOpen:!1,preferredOpenDirection:"below",optimizedHeight:this.maxHeight}},props:{internalSearch:{type:Boolean,default:!0},options:{type:Array,required:!0},multiple:{type:Boolean,default:!1},trackBy:{type:String},label:{type:String},searchable:{type:Boolean,default:!0},clearOnSelect:{type:Boolean,default:!0},hideSelected:{type:Boolean,default:!1},placeholder:{type:String,default:"Select option"},allowEmpty:{type:Boolean,default:!0},resetAfter:{type:Boolean,default:!1},closeOnSelect:{type:Boolean,default:!0},customLabel:{type:Function,default(e,t){return So(e)?"":t?e[t]:e}},taggable:{type:Boolean,default:!1},tagPlaceholder:{type:String,default:"Press enter to create a tag"},tagPosition:{type:String,default:"top"},max:{type:[Number,Boolean],default:!1},id:{default:null},optionsLimit:{type:Number,default:1e3},groupValues:{type:String},groupLabel:{type:String},groupSelect:{type:Boolean,default:!1},blockKeys:{type:Array,default(){return[]}},preserveSearch:{type:Boolean,default:!1},preselectFirst:{type:Boolean,default:!1},preventAutofocus:{type:Boolean,default:!1}},mounted(){!this.multiple&&this.max&&console.warn("[Vue-Multiselect warn]: Max prop should not be used when prop Multiple equals false."),this.preselectFirst&&!this.internalValue.length&&this.options.length&&this.select(this.filteredOptions[0])},computed:{internalValue(){return this.modelValue||this.modelValue===0?Array.isArray(this.modelValue)?this.modelValue:[this.modelValue]:[]},filteredOptions(){const e=this.search||"",t=e.toLowerCase().trim();let n=this.options.concat();return this.internalSearch?n=this.groupValues?this.filterAndFlat(n,t,this.label):su(n,t,this.label,this.customLabel):n=this.groupValues?Eo(this.groupValues,this.groupLabel)(n):n,n=this.hideSelected?n.filter(op(this.isSelected)):n,this.taggable&&t.length&&!this.isExistingOption(t)&&(this.tagPosition==="bottom"?n.push({isTag:!0,label:e}):n.unshift({isTag:!0,label:e})),n.slice(0,this.optionsLimit)},valueKeys(){return this.trackBy?this.internalValue.map(e=>e[this.trackBy]):this.internalValue},optionKeys(){return(this.groupValues?this.flatAndStrip(this.options):this.options).map(t=>this.customLabel(t,this.label).toString().toLowerCase())},currentOptionLabel(){return this.multiple?this.searchable?"":this.placeholder:this.internalValue.length?this.getOptionLabel(this.internalValue[0]):this.searchable?"":this.placeholder}},watch:{internalValue:{handler(){this.resetAfter&&this.internalValue.length&&(this.search="",this.$emit("update:modelValue",this.multiple?[]:null))},deep:!0},search(){this.$emit("search-change",this.search)}},emits:["open","search-change","close","select","update:modelValue","remove","tag"],methods:{getValue(){return this.multiple?this.internalValue:this.internalValue.length===0?null:this.internalValue[0]},filterAndFlat(e,t,n){return Sl(ap(t,n,this.groupValues,this.groupLabel,this.customLabel),Eo(this.groupValues,this.groupLabel))(e)},flatAndStrip(e){return Sl(Eo(this.groupValues,this.groupLabel),lp)(e)},updateSearch(e){this.search=e},isExistingOption(e){return this.options?this.optionKeys.indexOf(e)>-1:!1},isSelected(e){const t=this.trackBy?e[this.trackBy]:e;return this.valueKeys.indexOf(t)>-1},isOptionDisabled(e){return!!e.$isDisabled},getOptionLabel(e){if(So(e))return"";if(e.isTag)return e.label;if(e.$isLabel)return e.$groupLabel;const t=this.customLabel(e,this.label);return So(t)?"":t},select(e,t){if(e.$isLabel&&this.groupSelect){this.selectGroup(e);return}if(!(this.blockKeys.indexOf(t)!==-1||this.disabled||e.$isDisabled||e.$isLabel)&&!(this.max&&this.multiple&&this.internalValue.length===this.max)&&!(t==="Tab"&&!this.pointerDirty)){if(e.isTag)this.$emit("tag",e.label,this.id),this.search="",this.closeOnSelect&&!this.multiple&&this.deactivate();else{if(this.isSelected(e)){t!=="Tab"&&this.removeElement(e);return}this.multiple?this.$emit("update:modelValue",this.internalValue.concat([e])):this.$emit("update:modelValue",e),this.$emit("select",e,this.id),this.clearOnSelect&&(this.search="")}this.closeOnSelect&&this.deactivate()}},selectGroup(e){const t=this.options.find(n=>n[this.groupLabel]===e.$groupLabel);if(t){if(this.wholeGroupSelected(t)){this.$emit("remove",t[this.groupValues],this.id);const n=this.internalValue.filter(i=>t[this.groupValues].indexOf(i)===-1);this.$emit("update:modelValue",n)}else{let n=t[this.groupValues].filter(i=>!(this.isOptionDisabled(i)||this.isSelected(i)));this.max&&n.splice(this.max-this.internalValue.length),this.$emit("select",n,this.id),this.$emit("update:modelValue",this.internalValue.concat(n))}this.closeOnSelect&&this.deactivate()}},wholeGroupSelected(e){return e[this.groupValues].every(t=>this.isSelected(t)||this.isOptionDisabled(t))},wholeGroupDisabled(e){return e[this.groupValues].every(this.isOptionDisabled)},removeElement(e,t=!0){if(this.disabled||e.$isDisabled)return;if(!this.allowEmpty&&this.internalValue.length<=1){this.deactivate();return}const n=typeof e=="object"?this.valueKeys.indexOf(e[this.trackBy]):this.valueKeys.indexOf(e);if(this.multiple){const i=this.internalValue.slice(0,n).concat(this.internalValue.slice(n+1));this.$emit("update:modelValue",i)}else this.$emit("update:modelValue",null);this.$emit("remove",e,this.id),this.closeOnSelect&&t&&this.deactivate()},removeLastElement(){this.blockKeys.indexOf("Delete")===-1&&this.search.length===0&&Array.isArray(this.internalValue)&&this.internalValue.length&&this.removeElement(this.internalValue[this.internalValue.length-1],!1)},activate(){this.isOpen||this.disabled||(this.adjustPosition(),this.groupValues&&this.pointer===0&&this.filteredOptions.length&&(this.pointer=1),this.isOpen=!0,this.searchable?(this.preserveSearch||(this.search=""),this.preventAutofocus||this.$nextTick(()=>this.$refs.search&&this.$refs.search.focus())):this.preventAutofocus||typeof this.$el<"u"&&this.$el.focus(),this.$emit("open",this.id))},deactivate(){this.isOpen&&(this.isOpen=!1,this.searchable?this.$refs.search!==null&&typeof this.$refs.search<"u"&&this.$refs.search.blur():typeof this.$el<"u"&&this.$el.blur(),this.preserveSearch||(this.search=""),this.$emit("close",this.getValue(),this.id))},toggle(){this.isOpen?this.deactivate():this.activate()},adjustPosition(){if(typeof window>"u")return;const e=this.$el.getBoundingClientRect().top,t=window.innerHeight-this.$el.getBoundingClientRect().bottom;t>this.maxHeight||t>e||this.openDirection==="below"||this.openDirection==="bottom"?(this.preferredOpenDirection="below",this.optimizedHeight=Math.min(t-40,this.maxHeight)):(this.preferredOpenDirection="above",this.optimizedHeight=Math.min(e-40,this.maxHeight))}}},cp={data(){return{pointer:0,pointerDirty:!1}},props:{showPointer:{type:Boolean,default:!0},optionHeight:{type:Number,default:40}},computed:{pointerPosition(){return this.pointer*this.optionHeight},visibleElements(){return this.optimizedHeight/this.optionHeight}},watch:{filteredOptions(){this.pointerAdjust()},isOpen(){this.pointerDirty=!1},pointer(){this.$refs.search&&this.$refs.search.setAttribute("aria-activedescendant",this.id+"-"+this.pointer.toString())}},methods:{optionHighlight(e,t){return{"multiselect__option--highlight":e===this.pointer&&this.showPointer,"multiselect__option--selected":this.isSelected(t)}},groupHighlight(e,t){if(!this.groupSelect)return["multiselect__option--disabled",{"multiselect__option--group":t.$isLabel}];const n=this.options.find(i=>i[this.groupLabel]===t.$groupLabel);return n&&!this.wholeGroupDisabled(n)?["multiselect__option--group",{"multiselect__option--highlight":e===this.pointer&&this.showPointer},{"multiselect__option--group-selected":this.wholeGroupSelected(n)}]:"multiselect__option--disabled"},addPointerElement({key:e}="Enter"){this.filteredOptions.length>0&&this.select(this.filteredOptions[this.pointer],e),this.pointerReset()},pointerForward(){this.pointer<this.filteredOptions.length-1&&(this.pointer++,this.$refs.list.scrollTop<=this.pointerPosition-(this.visibleElements-1)*this.optionHeight&&(this.$refs.list.scrollTop=this.pointerPosition-(this.visibleElements-1)*this.optionHeight),this.filteredOptions[this.pointer]&&this.filteredOptions[this.pointer].$isLabel&&!this.groupSelect&&this.pointerForward()),this.pointerDirty=!0},pointerBackward(){this.pointer>0?(this.pointer--,this.$refs.list.scrollTop>=this.pointerPosition&&(this.$refs.list.scrollTop=this.pointerPosition),this.filteredOptions[this.pointer]&&this.filteredOptions[this.pointer].$isLabel&&!this.groupSelect&&this.pointerBackward()):this.filteredOptions[this.pointer]&&this.filteredOptions[0].$isLabel&&!this.groupSelect&&this.pointerForward(),this.pointerDirty=!0},pointerReset(){this.closeOnSelect&&(this.pointer=0,this.$refs.list&&(this.$refs.list.scrollTop=0))},pointerAdjust(){this.pointer>=this.filteredOptions.length-1&&(this.pointer=this.filteredOptions.length?this.filteredOptions.length-1:0),this.filteredOptions.length>0&&this.filteredOptions[this.pointer].$isLabel&&!this.groupSelect&&this.pointerForward()},pointerSet(e){this.pointer=e,this.pointerDirty=!0}}},iu={name:"vue-multiselect",mixins:[up,cp],compatConfig:{MODE:3,ATTR_ENUMERATED_COERCION:!1},props:{name:{type:String,default:""},modelValue:{type:null,default(){return[]}},selectLabel:{type:String,default:"Press enter to select"},selectGroupLabel:{type:String,default:"Press enter to select group"},selectedLabel:{type:String,default:"Selected"},deselectLabel:{type:String,default:"Press enter to remove"},deselectGroupLabel:{type:String,default:"Press enter to deselect group"},showLabels:{type:Boolean,default:!0},limit:{type:Number,default:99999},maxHeight:{type:Number,default:300},limitText:{type:Function,default:e=>`and ${e} more`},loading:{type:Boolean,default:!1},disabled:{type:Boolean,default:!1},openDirection:{type:String,default:""},showNoOptions:{type:Boolean,default:!0},showNoResults:{type:Boolean,default:!0},tabindex:{type:Number,default:0}},computed:{hasOptionGroup(){return this.groupValues&&this.groupLabel&&this.groupSelect},isSingleLabelVisible(){return(this.singleValue||this.singleValue===0)&&(!this.isOpen||!this.searchable)&&!this.visibleValues.length},isPlaceholderVisible(){return!this.internalValue.length&&(!this.searchable||!this.isOpen)},visibleValues(){return this.multiple?this.internalValue.slice(0,this.limit):[]},singleValue(){return this.internalValue[0]},deselectLabelText(){return this.showLabels?this.deselectLabel:""},deselectGroupLabelText(){return this.showLabels?this.deselectGroupLabel:""},selectLabelText(){return this.showLabels?this.selectLabel:""},selectGroupLabelText(){return this.showLabels?this.selectGroupLabel:""},selectedLabelText(){return this.showLabels?this.selectedLabel:""},inputStyle(){return this.searchable||this.multiple&&this.modelValue&&this.modelValue.length?this.isOpen?{width:"100%"}:{width:"0",position:"absolute",padding:"0"}:""},contentStyle(){return this.options.length?{display:"inline-block"}:{display:"block"}},isAbove(){return this.openDirection==="above"||this.openDirection==="top"?!0:this.openDirection==="below"||this.openDirection==="bottom"?!1:this.preferredOpenDirection==="above"},showSearchInput(){return this.searchable&&(this.hasSingleSelectedSlot&&(this.visibleSingleValue||this.visibleSingleValue===0)?this.isOpen:!0)}}};const dp={ref:"tags",class:"multiselect__tags"},hp={class:"multiselect__tags-wrap"},fp={class:"multiselect__spinner"},pp={key:0},mp={class:"multiselect__option"},gp={class:"multiselect__option"},yp=qn("No elements found. Consider changing the search query."),bp={class:"multiselect__option"},vp=qn("List is empty.");function _p(e,t,n,i,o,r){return he(),It("div",{tabindex:e.searchable?-1:n.tabindex,class:[{"multiselect--active":e.isOpen,"multiselect--disabled":n.disabled,"multiselect--above":r.isAbove,"multiselect--has-options-group":r.hasOptionGroup},"multiselect"],onFocus:t[14]||(t[14]=u=>e.activate()),onBlur:t[15]||(t[15]=u=>e.searchable?!1:e.deactivate()),onKeydown:[t[16]||(t[16]=Ht(dt(u=>e.pointerForward(),["self","prevent"]),["down"])),t[17]||(t[17]=Ht(dt(u=>e.pointerBackward(),["self","prevent"]),["up"]))],onKeypress:t[18]||(t[18]=Ht(dt(u=>e.addPointerElement(u),["stop","self"]),["enter","tab"])),onKeyup:t[19]||(t[19]=Ht(u=>e.deactivate(),["esc"])),role:"combobox","aria-owns":"listbox-"+e.id},[zt(e.$slots,"caret",{toggle:e.toggle},()=>[Xe("div",{onMousedown:t[1]||(t[1]=dt(u=>e.toggle(),["prevent","stop"])),class:"multiselect__select"},null,32)]),zt(e.$slots,"clear",{search:e.search}),Xe("div",dp,[zt(e.$slots,"selection",{search:e.search,remove:e.removeElement,values:r.visibleValues,isOpen:e.isOpen},()=>[wn(Xe("div",hp,[(he(!0),It(ht,null,rn(r.visibleValues,(u,d)=>zt(e.$slots,"tag",{option:u,search:e.search,remove:e.removeElement},()=>[(he(),It("span",{class:"multiselect__tag",key:d},[Xe("span",{textContent:it(e.getOptionLabel(u))},null,8,["textContent"]),Xe("i",{tabindex:"1",onKeypress:Ht(dt(f=>e.removeElement(u),["prevent"]),["enter"]),onMousedown:dt(f=>e.removeElement(u),["prevent"]),class:"multiselect__tag-icon"},null,40,["onKeypress","onMousedown"])]))])),256))],512),[[Ds,r.visibleValues.length>0]]),e.internalValue&&e.internalValue.length>n.limit?zt(e.$slots,"limit",{key:0},()=>[Xe("strong",{class:"multiselect__strong",textContent:it(n.limitText(e.internalValue.length-n.limit))},null,8,["textContent"])]):Pt("v-if",!0)]),Xe(Bi,{name:"multiselect__loading"},{default:Ti(()=>[zt(e.$slots,"loading",{},()=>[wn(Xe("div",fp,null,512),[[Ds,n.loading]])])]),_:3}),e.searchable?(he(),It("input",{key:0,ref:"search",name:n.name,id:e.id,type:"text",autocomplete:"off",spellcheck:!1,placeholder:e.placeholder,style:r.inputStyle,value:e.search,disabled:n.disabled,tabindex:n.tabindex,onInput:t[2]||(t[2]=u=>e.updateSearch(u.target.value)),onFocus:t[3]||(t[3]=dt(u=>e.activate(),["prevent"])),onBlur:t[4]||(t[4]=dt(u=>e.deactivate(),["prevent"])),onKeyup:t[5]||(t[5]=Ht(u=>e.deactivate(),["esc"])),onKeydown:[t[6]||(t[6]=Ht(dt(u=>e.pointerForward(),["prevent"]),["down"])),t[7]||(t[7]=Ht(dt(u=>e.pointerBackward(),["prevent"]),["up"])),t[9]||(t[9]=Ht(dt(u=>e.removeLastElement(),["stop"]),["delete"]))],onKeypress:t[8]||(t[8]=Ht(dt(u=>e.addPointerElement(u),["prevent","stop","self"]),["enter"])),class:"multiselect__input","aria-controls":"listbox-"+e.id},null,44,["name","id","placeholder","value","disabled","tabindex","aria-controls"])):Pt("v-if",!0),r.isSingleLabelVisible?(he(),It("span",{key:1,class:"multiselect__single",onMousedown:t[10]||(t[10]=dt((...u)=>e.toggle&&e.toggle(...u),["prevent"]))},[zt(e.$slots,"singleLabel",{option:r.singleValue},()=>[qn(it(e.currentOptionLabel),1)])],32)):Pt("v-if",!0),r.isPlaceholderVisible?(he(),It("span",{key:2,class:"multiselect__placeholder",onMousedown:t[11]||(t[11]=dt((...u)=>e.toggle&&e.toggle(...u),["prevent"]))},[zt(e.$slots,"placeholder",{},()=>[qn(it(e.placeholder),1)])],32)):Pt("v-if",!0)],512),Xe(Bi,{name:"multiselect"},{default:Ti(()=>[wn(Xe("div",{class:"multiselect__content-wrapper",onFocus:t[12]||(t[12]=(...u)=>e.activate&&e.activate(...u)),tabindex:"-1",onMousedown:t[13]||(t[13]=dt(()=>{},["prevent"])),style:{maxHeight:e.optimizedHeight+"px"},ref:"list"},[Xe("ul",{class:"multiselect__content",style:r.contentStyle,role:"listbox",id:"listbox-"+e.id},[zt(e.$slots,"beforeList"),e.multiple&&e.max===e.internalValue.length?(he(),It("li",pp,[Xe("span",mp,[zt(e.$slots,"maxElements",{},()=>[qn("Maximum of "+it(e.max)+" options selected. First remove a selected option to select another.",1)])])])):Pt("v-if",!0),!e.max||e.internalValue.length<e.max?(he(!0),It(ht,{key:1},rn(e.filteredOptions,(u,d)=>(he(),It("li",{class:"multiselect__element",key:d,id:e.id+"-"+d,role:u&&(u.$isLabel||u.$isDisabled)?null:"option"},[u&&(u.$isLabel||u.$isDisabled)?Pt("v-if",!0):(he(),It("span",{key:0,class:[e.optionHighlight(d,u),"multiselect__option"],onClick:dt(f=>e.select(u),["stop"]),onMouseenter:dt(f=>e.pointerSet(d),["self"]),"data-select":u&&u.isTag?e.tagPlaceholder:r.selectLabelText,"data-selected":r.selectedLabelText,"data-deselect":r.deselectLabelText},[zt(e.$slots,"option",{option:u,search:e.search,index:d},()=>[Xe("span",null,it(e.getOptionLabel(u)),1)])],42,["onClick","onMouseenter","data-select","data-selected","data-deselect"])),u&&(u.$isLabel||u.$isDisabled)?(he(),It("span",{key:1,"data-select":e.groupSelect&&r.selectGroupLabelText,"data-deselect":e.groupSelect&&r.deselectGroupLabelText,class:[e.groupHighlight(d,u),"multiselect__option"],onMouseenter:dt(f=>e.groupSelect&&e.pointerSet(d),["self"]),onMousedown:dt(f=>e.selectGroup(u),["prevent"])},[zt(e.$slots,"option",{option:u,search:e.search,index:d},()=>[Xe("span",null,it(e.getOptionLabel(u)),1)])],42,["data-select","data-deselect","onMouseenter","onMousedown"])):Pt("v-if",!0)],8,["id","role"]))),128)):Pt("v-if",!0),wn(Xe("li",null,[Xe("span",gp,[zt(e.$slots,"noResult",{search:e.search},()=>[yp])])],512),[[Ds,n.showNoResults&&e.filteredOptions.length===0&&e.search&&!n.loading]]),wn(Xe("li",null,[Xe("span",bp,[zt(e.$slots,"noOptions",{},()=>[vp])])],512),[[Ds,n.showNoOptions&&(e.options.length===0||r.hasOptionGroup===!0&&e.filteredOptions.length===0)&&!e.search&&!n.loading]]),zt(e.$slots,"afterList")],12,["id"])],36),[[Ds,e.isOpen]])]),_:3})],42,["tabindex","aria-owns"])}iu.render=_p;function ou(e,t){let n=e.getBoundingClientRect(),i=10;return n.y+n.height+t+i}let Sp=jt({components:{VueMultiselect:iu},props:{name:{type:String,required:!0}},emits:["submit","makeBigger","makeSmaller"],computed:{choices(){return Te[De(this.name,"choices")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]},text(){return Te[De(this.name,"text")]},inputWidth(){return Ja(this.selected).toString()+"px"},isFocused(){return this.innerSelectFocused||this.outerDivFocused}},watch:{defaultSelected:{handler(e){this.selected=e},immediate:!0},selected:{handler(e){this.selected=e;let t=De(this.name,"selected");Te[t]=this.selected},immediate:!0}},data(){return{reactiveStore:Te,selected:"",outerDivFocused:!1,innerSelectFocused:!1}},methods:{spacePressed(){let e=this.$refs.multiselect;this.outerDivFocused&&(this.selected=e.filteredOptions[e.pointer],e.deactivate(),this.outerDivFocused=!1,setTimeout(e.activate,5))},onClose(){this.outerDivFocused=!1,this.innerSelectFocused=!1,this.$emit("makeSmaller",this.name)},onOpen(){let e=this.computeRequiredDropdownHeight(),t=this.$refs.text,n=ou(t,e);this.innerSelectFocused=!0,this.$emit("makeBigger",n,this.name)},computeRequiredDropdownHeight(){let e=this.$refs.multiselect,t=this.choices.length*e.optionHeight,n=e.optimizedHeight;return n>t&&(n=t),n},switchFocusToOuterDiv(){this.innerSelectFocused=!1;let e=this.$refs.content_wrapper;e!==void 0&&this.$nextTick(()=>{e.focus()})},onSelect(){this.innerSelectFocused=!1,this.outerDivFocused=!0,this.switchFocusToOuterDiv()},onRemove(e,t){this.innerSelectFocused=!1;let n=this.$refs.multiselect;this.$nextTick(()=>{n.select(e)})},arrowUp(){let e=this.$refs.multiselect;if(e===void 0){console.log("multiselectref undefined");return}let t=e.filteredOptions.length;e.pointer==0?e.pointer=t-1:e.pointer-=1,e.select(e.filteredOptions[e.pointer])},arrowDown(){let e=this.$refs.multiselect;if(e===void 0){console.log("multiselectRef Undefined");return}let t=e.filteredOptions.length;e.pointer==t-1?e.pointer=0:e.pointer+=1,e.select(e.filteredOptions[e.pointer])}}}),Ep="choices";function wp(e,t){let n={choices:"choices",selected:"defaultSelected",text:"text"};if(fs(t,Object.keys(n)),t.choices.length===0)throw RangeError("Choices cannot be of zero length");return oi(e,t,n)}function xp(e,t,n,i,o,r){const u=Ms("VueMultiselect");return he(),Ae("div",{class:kn({"sample-selector":!0,wrapElement:!0,focused:e.isFocused,"multi-select-wrapper":!0}),onFocus:t[1]||(t[1]=d=>e.outerDivFocused=!0),onBlur:t[2]||(t[2]=d=>e.outerDivFocused=!1),ref:"content_wrapper",tabindex:"0",onKeydown:[t[3]||(t[3]=Ht(dt((...d)=>e.arrowDown&&e.arrowDown(...d),["self","prevent"]),["down"])),t[4]||(t[4]=Ht(dt((...d)=>e.arrowUp&&e.arrowUp(...d),["self","prevent"]),["up"])),t[5]||(t[5]=Ht(dt((...d)=>e.spacePressed&&e.spacePressed(...d),["self"]),["space"]))]},[Fe("span",{class:"multi-select-inline multi-select-text",ref:"text"},it(e.text),513),Xe(u,{ref:"multiselect",onOpen:e.onOpen,onSelect:e.onSelect,onRemove:e.onRemove,onClose:e.onClose,class:"multi-select-inline",modelValue:e.selected,"onUpdate:modelValue":t[0]||(t[0]=d=>e.selected=d),options:e.choices,placeholder:e.selected,deselectLabel:"",selectLabel:"",openDirection:"bottom","close-on-select":!0,tabindex:-1},null,8,["onOpen","onSelect","onRemove","onClose","modelValue","options","placeholder"])],34)}const ru=Kt(Sp,[["render",xp],["__scopeId","data-v-8ca66913"]]);let kp=jt({props:{name:{type:String,required:!0}},computed:{text(){return Te[De(this.name,"text")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]}},data(){return{selected:!1,isFocused:!1}},watch:{selected:{handler(e){let t=De(this.name,"selected");Te[t]=e},immediate:!0},defaultSelected:{handler(e){this.selected=e},immediate:!0}}}),Op="check_box";function Cp(e,t){let n={text:"text",selected:"defaultSelected"};return fs(t,Object.keys(n)),oi(e,t,n)}const Mp={class:"checkbox-text"};function Lp(e,t,n,i,o,r){return he(),Ae("div",{class:kn({wrapElement:!0,focused:e.isFocused,"checkbox-wrapper":!0})},[Fe("span",Mp,it(e.text),1),wn(Fe("input",{type:"checkbox","onUpdate:modelValue":t[0]||(t[0]=u=>e.selected=u),onFocus:t[1]||(t[1]=u=>e.isFocused=!0),onBlur:t[2]||(t[2]=u=>e.isFocused=!1)},null,544),[[$d,e.selected]])],2)}const lu=Kt(kp,[["render",Lp],["__scopeId","data-v-a46bb2a3"]]);let Ip=jt({data(){return{selected:""}},props:{name:{type:String,required:!0}},computed:{buttonText(){return Te[De(this.name,"buttonText")]},placeholderText(){return Te[De(this.name,"placeholderText")]},textInputFromBackend(){return Te[De(this.name,"valueFromBackend")]},blankAfterTextSend(){return Te[De(this.name,"blankAfterTextSend")]},randomNumber(){return Te[De(this.name,"randomNumber")]}},methods:{submit(e){let n=this.$refs.textarea.form;if(n==null){this.selected="TEXTAREA.FORM is NULL";return}if(!n.requestSubmit)throw this.selected="UNSUPPORTED BROWSER VERSION!",Error("not supported browser");n.requestSubmit()},addNewLine(){this.selected+=`
-`}},watch:{textInputFromBackend:{handler(e){this.selected=e},immediate:!0},randomNumber:{handler(e){this.blankAfterTextSend&&(this.selected=this.textInputFromBackend)},immediate:!0},selected:{handler(e){let t=De(this.name,"selected");Te[t]=e},immediate:!0}}});function Pp(e,t){let n={placeholder_text:"placeholderText",selected:"valueFromBackend",blank_after_text_send:"blankAfterTextSend",random_number:"randomNumber"};return fs(t,Object.keys(n)),oi(e,t,n)}let Ap="text_input";const Tp=["placeholder"];function Rp(e,t,n,i,o,r){return wn((he(),Ae("textarea",{ref:"textarea",placeholder:e.placeholderText,"onUpdate:modelValue":t[0]||(t[0]=u=>e.selected=u),onKeydown:[t[1]||(t[1]=Ht(dt((...u)=>e.submit&&e.submit(...u),["exact","prevent"]),["enter"])),t[2]||(t[2]=Ht(dt((...u)=>e.addNewLine&&e.addNewLine(...u),["shift","exact","prevent"]),["enter"]))]},null,40,Tp)),[[Aa,e.selected]])}const au=Kt(Ip,[["render",Rp],["__scopeId","data-v-76713692"]]);let $p=jt({props:{name:{type:String,required:!0}},computed:{subElementConfigurationsFE(){return Te[De(this.name,"subElementConfigs")]},callbackAddress(){return Te[De(this.name,"address")]},buttonText(){return Te[De(this.name,"buttonText")]},buttonDisabled(){return Te[De(this.name,"disabled")]},reloadPage(){return Te[De(this.name,"reloadPage")]}},inject:["backendAddress"],emits:["makeBigger","makeSmaller","reloadPage"],data(){return{selectSamplePoll:void 0,loadingInProgress:!1,loadingBarId:""}},unmounted(){var e;(e=this.selectSamplePoll)==null||e.clear()},created(){this.loadingBarId=`${this.name}>loadingBar`},components:{MinMaxSubElement:tu,ChoicesSubElement:ru,CheckBoxSubElement:lu,TextInputSubElement:au,HorizontalMultiRadioSubElement:nu,DesignLoading:Gf},methods:{submit(){let e={};for(let n in Object.keys(this.subElementConfigurationsFE)){let i=this.subElementConfigurationsFE[n],o=De(i.name,"selected"),r=qh(i.name),u=Te[o];e[r]=u}this.loadingInProgress=!0;let t=this.$refs.button;this.onMakeBigger(ou(t,36),this.loadingBarId),Ya.startPoll(this,"selectSamplePoll",`${this.backendAddress}/${this.callbackAddress}`,this.setContexts.bind(this),e)},setContexts(e){if(this.reloadPage){this.$emit("reloadPage",e);return}this.$elementRegistry.retrieveElementsFromResponse(e,Te),this.loadingInProgress&&this.onMakeSmaller(this.loadingBarId),this.loadingInProgress=!1},getComponent(e){return Li[e].component},onMakeBigger(e,t){this.$emit("makeBigger",e,t)},onMakeSmaller(e){this.$emit("makeSmaller",e)}}});function js(e){return Object.keys(e)[0]}let Li={[Uf]:{process:Kf,component:js({MinMaxSubElement:tu})},[Ep]:{process:wp,component:js({ChoicesSubElement:ru})},[Op]:{process:Cp,component:js({CheckBoxSubElement:lu})},[Ap]:{process:Pp,component:js({TextInputSubElement:au})},[Jf]:{process:ep,component:js({HorizontalMultiRadioSubElement:nu})}};class Vp extends Yh{constructor(){super(...arguments);Yt(this,"subelement_configs");Yt(this,"address");Yt(this,"button_text");Yt(this,"disabled");Yt(this,"reload_page")}}function Np(e){e.registeredElements.button={component:"Selector",process:Bp}}function Bp(e){fs(e,Object.keys(Vp));let t={address:e.address,buttonText:e.button_text,disabled:e.disabled,reloadPage:e.reload_page,subElementConfigs:[]};for(let n of e.subelement_configs){if(!(n.subtype in Li))throw RangeError(`Wrong subtype: ${n.subtype} not in ${Object.keys(Li)}`);t.subElementConfigs.push({name:De(n.parent_name,n.name),subtype:n.subtype});let o=Li[n.subtype].process(n.name,n.configuration);for(let[r,u]of Za(o))t[r]=u}return t}const Fp={class:"subSelectorsWrapper"},Dp={class:"buttonWrapper"},Hp=["disabled"];function Wp(e,t,n,i,o,r){const u=Ms("DesignLoading");return he(),Ae("form",{class:"wrapElement",onSubmit:t[0]||(t[0]=dt((...d)=>e.submit&&e.submit(...d),["prevent"])),onKeypress:t[1]||(t[1]=Ht((...d)=>e.submit&&e.submit(...d),["enter"]))},[Fe("div",Fp,[(he(!0),Ae(ht,null,rn(e.subElementConfigurationsFE,d=>(he(),It(tr(e.getComponent(d.subtype)),{name:d.name,onMakeBigger:e.onMakeBigger,onMakeSmaller:e.onMakeSmaller},null,40,["name","onMakeBigger","onMakeSmaller"]))),256))]),Fe("div",Dp,[Fe("button",{class:"button",disabled:e.buttonDisabled||e.loadingInProgress,type:"submit",ref:"button"},it(e.buttonText),9,Hp),e.loadingInProgress?(he(),It(u,{key:0,class:"loading-indicator"})):Pt("",!0)])],32)}const uu=Kt($p,[["render",Wp],["__scopeId","data-v-ae1c642d"]]);var jp=typeof globalThis<"u"?globalThis:typeof window<"u"?window:typeof global<"u"?global:typeof self<"u"?self:{};function Gp(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var cu={exports:{}};/*! LeaderLine v1.1.5 (c) anseki https://anseki.github.io/leader-line/ */(function(e,t){var n=function(){var i,o,r,u,d,f,b,g,E,M,q,ce,me,ke,ye,Ce,Le,We,Ue,Re,St,Ve,at,Ne="leader-line",ot=1,ge=2,Ke=3,bt=4,qt={top:ot,right:ge,bottom:Ke,left:bt},Et=1,nt=2,Ze=3,Jt=4,dn=5,en={straight:Et,arc:nt,fluid:Ze,magnet:Jt,grid:dn},vt="behind",Rn=Ne+"-defs",$n='<svg xmlns="http://www.w3.org/2000/svg" version="1.1" id="leader-line-defs"><style><![CDATA[.leader-line{position:absolute;overflow:visible!important;pointer-events:none!important;font-size:16px}#leader-line-defs{width:0;height:0;position:absolute;left:0;top:0}.leader-line-line-path{fill:none}.leader-line-mask-bg-rect{fill:#fff}.leader-line-caps-mask-anchor,.leader-line-caps-mask-marker-shape{fill:#000}.leader-line-caps-mask-anchor{stroke:#000}.leader-line-caps-mask-line,.leader-line-plugs-face{stroke:transparent}.leader-line-line-mask-shape{stroke:#fff}.leader-line-line-outline-mask-shape{stroke:#000}.leader-line-plug-mask-shape{fill:#fff;stroke:#000}.leader-line-plug-outline-mask-shape{fill:#000;stroke:#fff}.leader-line-areaAnchor{position:absolute;overflow:visible!important}]]></style><defs><circle id="leader-line-disc" cx="0" cy="0" r="5"/><rect id="leader-line-square" x="-5" y="-5" width="10" height="10"/><polygon id="leader-line-arrow1" points="-8,-8 8,0 -8,8 -5,0"/><polygon id="leader-line-arrow2" points="-4,-8 4,0 -4,8 -7,5 -2,0 -7,-5"/><polygon id="leader-line-arrow3" points="-4,-5 8,0 -4,5"/><g id="leader-line-hand"><path style="fill: #fcfcfc" d="M9.19 11.14h4.75c1.38 0 2.49-1.11 2.49-2.49 0-.51-.15-.98-.41-1.37h1.3c1.38 0 2.49-1.11 2.49-2.49s-1.11-2.53-2.49-2.53h1.02c1.38 0 2.49-1.11 2.49-2.49s-1.11-2.49-2.49-2.49h14.96c1.37 0 2.49-1.11 2.49-2.49s-1.11-2.49-2.49-2.49H16.58C16-9.86 14.28-11.14 9.7-11.14c-4.79 0-6.55 3.42-7.87 4.73H-2.14v13.23h3.68C3.29 9.97 5.47 11.14 9.19 11.14L9.19 11.14Z"/><path style="fill: black" d="M13.95 12c1.85 0 3.35-1.5 3.35-3.35 0-.17-.02-.34-.04-.51h.07c1.85 0 3.35-1.5 3.35-3.35 0-.79-.27-1.51-.72-2.08 1.03-.57 1.74-1.67 1.74-2.93 0-.59-.16-1.15-.43-1.63h12.04c1.85 0 3.35-1.5 3.35-3.35 0-1.85-1.5-3.35-3.35-3.35H17.2C16.26-10.93 13.91-12 9.7-12 5.36-12 3.22-9.4 1.94-7.84c0 0-.29.33-.5.57-.63 0-3.58 0-3.58 0C-2.61-7.27-3-6.88-3-6.41v13.23c0 .47.39.86.86.86 0 0 2.48 0 3.2 0C2.9 10.73 5.29 12 9.19 12L13.95 12ZM9.19 10.28c-3.46 0-5.33-1.05-6.9-3.87-.15-.27-.44-.44-.75-.44 0 0-1.81 0-2.82 0V-5.55c1.06 0 3.11 0 3.11 0 .25 0 .44-.06.61-.25l.83-.95c1.23-1.49 2.91-3.53 6.43-3.53 3.45 0 4.9.74 5.57 1.72h-4.3c-.48 0-.86.38-.86.86s.39.86.86.86h22.34c.9 0 1.63.73 1.63 1.63 0 .9-.73 1.63-1.63 1.63H15.83c-.48 0-.86.38-.86.86 0 .47.39.86.86.86h2.52c.9 0 1.63.73 1.63 1.63s-.73 1.63-1.63 1.63h-3.12c-.48 0-.86.38-.86.86 0 .47.39.86.86.86h2.11c.88 0 1.63.76 1.63 1.67 0 .9-.73 1.63-1.63 1.63h-3.2c-.48 0-.86.39-.86.86 0 .47.39.86.86.86h1.36c.05.16.09.34.09.51 0 .9-.73 1.63-1.63 1.63C13.95 10.28 9.19 10.28 9.19 10.28Z"/></g><g id="leader-line-crosshair"><path d="M0-78.97c-43.54 0-78.97 35.43-78.97 78.97 0 43.54 35.43 78.97 78.97 78.97s78.97-35.43 78.97-78.97C78.97-43.54 43.55-78.97 0-78.97ZM76.51-1.21h-9.91v-9.11h-2.43v9.11h-11.45c-.64-28.12-23.38-50.86-51.5-51.5V-64.17h9.11V-66.6h-9.11v-9.91C42.46-75.86 75.86-42.45 76.51-1.21ZM-1.21-30.76h-9.11v2.43h9.11V-4.2c-1.44.42-2.57 1.54-2.98 2.98H-28.33v-9.11h-2.43v9.11H-50.29C-49.65-28-27.99-49.65-1.21-50.29V-30.76ZM-30.76 1.21v9.11h2.43v-9.11H-4.2c.42 1.44 1.54 2.57 2.98 2.98v24.13h-9.11v2.43h9.11v19.53C-27.99 49.65-49.65 28-50.29 1.21H-30.76ZM1.22 30.75h9.11v-2.43h-9.11V4.2c1.44-.42 2.56-1.54 2.98-2.98h24.13v9.11h2.43v-9.11h19.53C49.65 28 28 49.65 1.22 50.29V30.75ZM30.76-1.21v-9.11h-2.43v9.11H4.2c-.42-1.44-1.54-2.56-2.98-2.98V-28.33h9.11v-2.43h-9.11V-50.29C28-49.65 49.65-28 50.29-1.21H30.76ZM-1.21-76.51v9.91h-9.11v2.43h9.11v11.45c-28.12.64-50.86 23.38-51.5 51.5H-64.17v-9.11H-66.6v9.11h-9.91C-75.86-42.45-42.45-75.86-1.21-76.51ZM-76.51 1.21h9.91v9.11h2.43v-9.11h11.45c.64 28.12 23.38 50.86 51.5 51.5v11.45h-9.11v2.43h9.11v9.91C-42.45 75.86-75.86 42.45-76.51 1.21ZM1.22 76.51v-9.91h9.11v-2.43h-9.11v-11.45c28.12-.64 50.86-23.38 51.5-51.5h11.45v9.11h2.43v-9.11h9.91C75.86 42.45 42.45 75.86 1.22 76.51Z"/><path d="M0 83.58-7.1 96 7.1 96Z"/><path d="M0-83.58 7.1-96-7.1-96"/><path d="M83.58 0 96 7.1 96-7.1Z"/><path d="M-83.58 0-96-7.1-96 7.1Z"/></g></defs></svg>',On={disc:{elmId:"leader-line-disc",noRotate:!0,bBox:{left:-5,top:-5,width:10,height:10,right:5,bottom:5},widthR:2.5,heightR:2.5,bCircle:5,sideLen:5,backLen:5,overhead:0,outlineBase:1,outlineMax:4},square:{elmId:"leader-line-square",noRotate:!0,bBox:{left:-5,top:-5,width:10,height:10,right:5,bottom:5},widthR:2.5,heightR:2.5,bCircle:5,sideLen:5,backLen:5,overhead:0,outlineBase:1,outlineMax:4},arrow1:{elmId:"leader-line-arrow1",bBox:{left:-8,top:-8,width:16,height:16,right:8,bottom:8},widthR:4,heightR:4,bCircle:8,sideLen:8,backLen:8,overhead:8,outlineBase:2,outlineMax:1.5},arrow2:{elmId:"leader-line-arrow2",bBox:{left:-7,top:-8,width:11,height:16,right:4,bottom:8},widthR:2.75,heightR:4,bCircle:8,sideLen:8,backLen:7,overhead:4,outlineBase:1,outlineMax:1.75},arrow3:{elmId:"leader-line-arrow3",bBox:{left:-4,top:-5,width:12,height:10,right:8,bottom:5},widthR:3,heightR:2.5,bCircle:8,sideLen:5,backLen:4,overhead:8,outlineBase:1,outlineMax:2.5},hand:{elmId:"leader-line-hand",bBox:{left:-3,top:-12,width:40,height:24,right:37,bottom:12},widthR:10,heightR:6,bCircle:37,sideLen:12,backLen:3,overhead:37},crosshair:{elmId:"leader-line-crosshair",noRotate:!0,bBox:{left:-96,top:-96,width:192,height:192,right:96,bottom:96},widthR:48,heightR:48,bCircle:96,sideLen:96,backLen:96,overhead:0}},Ct={behind:vt,disc:"disc",square:"square",arrow1:"arrow1",arrow2:"arrow2",arrow3:"arrow3",hand:"hand",crosshair:"crosshair"},G={disc:"disc",square:"square",arrow1:"arrow1",arrow2:"arrow2",arrow3:"arrow3",hand:"hand",crosshair:"crosshair"},fe=[ot,ge,Ke,bt],re="auto",Ee={x:"left",y:"top",width:"width",height:"height"},Je=80,ft=4,p=5,v=120,V=8,Y=3.75,W=10,Q=30,ae=.5522847,ne=.25*Math.PI,oe=/^\s*(\-?[\d\.]+)\s*(\%)?\s*$/,$="http://www.w3.org/2000/svg",de="-ms-scroll-limit"in document.documentElement.style&&"-ms-ime-align"in document.documentElement.style&&!window.navigator.msPointerEnabled,Se=!de&&!!document.uniqueID,we="MozAppearance"in document.documentElement.style,$e=!(de||we||!window.chrome||!window.CSS),Oe=!de&&!Se&&!we&&!$e&&!window.chrome&&"WebkitAppearance"in document.documentElement.style,st=Se||de?.2:.1,je={path:Ze,lineColor:"coral",lineSize:4,plugSE:[vt,"arrow1"],plugSizeSE:[1,1],lineOutlineEnabled:!1,lineOutlineColor:"indianred",lineOutlineSize:.25,plugOutlineEnabledSE:[!1,!1],plugOutlineSizeSE:[1,1]},ut=(St={}.toString,Ve={}.hasOwnProperty.toString,at=Ve.call(Object),function(s){var l,a;return s&&St.call(s)==="[object Object]"&&(!(l=Object.getPrototypeOf(s))||(a=l.hasOwnProperty("constructor")&&l.constructor)&&typeof a=="function"&&Ve.call(a)===at)}),pt=Number.isFinite||function(s){return typeof s=="number"&&window.isFinite(s)},gt=(ke={ease:[.25,.1,.25,1],linear:[0,0,1,1],"ease-in":[.42,0,1,1],"ease-out":[0,0,.58,1],"ease-in-out":[.42,0,.58,1]},ye=1e3/60/2,Ce=window.requestAnimationFrame||window.mozRequestAnimationFrame||window.webkitRequestAnimationFrame||window.msRequestAnimationFrame||function(s){setTimeout(s,ye)},Le=window.cancelAnimationFrame||window.mozCancelAnimationFrame||window.webkitCancelAnimationFrame||window.msCancelAnimationFrame||function(s){clearTimeout(s)},We=Number.isFinite||function(s){return typeof s=="number"&&window.isFinite(s)},Ue=[],Re=0,{add:function(s,l,a,c,h,y,x){var S,L,w,U,ee,T,O,D,I,B,N,H,K,A=++Re;function k(le,Z){return{value:s(Z),timeRatio:le,outputRatio:Z}}if(typeof h=="string"&&(h=ke[h]),s=s||function(){},a<ye)L=[k(0,0),k(1,1)];else{if(w=ye/a,L=[k(0,0)],h[0]===0&&h[1]===0&&h[2]===1&&h[3]===1)for(ee=w;ee<=1;ee+=w)L.push(k(ee,ee));else for(T=U=(ee=w)/10;T<=1;T+=U)K=H=N=B=I=void 0,B=(I=(D=T)*D)*D,K=3*(N=1-D)*I,ee<=(O={x:(H=N*N*3*D)*h[0]+K*h[2]+B,y:H*h[1]+K*h[3]+B}).x&&(L.push(k(O.x,O.y)),ee+=w);L.push(k(1,1))}return S={animId:A,frameCallback:l,duration:a,count:c,frames:L,reverse:!!y},Ue.push(S),x!==!1&&cr(S,x),A},remove:function(s){var l;Ue.some(function(a,c){return a.animId===s&&(l=c,!(a.framesStart=null))})&&Ue.splice(l,1)},start:function(s,l,a){Ue.some(function(c){return c.animId===s&&(c.reverse=!!l,cr(c,a),!0)})},stop:function(s,l){var a;return Ue.some(function(c){return c.animId===s&&(l?c.lastFrame!=null&&(a=c.frames[c.lastFrame].timeRatio):(a=(Date.now()-c.framesStart)/c.duration,c.reverse&&(a=1-a),a<0?a=0:1<a&&(a=1)),!(c.framesStart=null))}),a},validTiming:function(s){return typeof s=="string"?ke[s]:Array.isArray(s)&&[0,1,2,3].every(function(l){return We(s[l])&&0<=s[l]&&s[l]<=1})?[s[0],s[1],s[2],s[3]]:null}}),ri=function(s){s.SVGPathElement.prototype.getPathData&&s.SVGPathElement.prototype.setPathData||function(){function l(T){this._string=T,this._currentIndex=0,this._endIndex=this._string.length,this._prevCommand=null,this._skipOptionalSpaces()}var a={Z:"Z",M:"M",L:"L",C:"C",Q:"Q",A:"A",H:"H",V:"V",S:"S",T:"T",z:"Z",m:"m",l:"l",c:"c",q:"q",a:"a",h:"h",v:"v",s:"s",t:"t"},c=s.navigator.userAgent.indexOf("MSIE ")!==-1;l.prototype={parseSegment:function(){var T=this._string[this._currentIndex],O=a[T]?a[T]:null;if(O===null){if(this._prevCommand===null||(O=(T==="+"||T==="-"||T==="."||"0"<=T&&T<="9")&&this._prevCommand!=="Z"?this._prevCommand==="M"?"L":this._prevCommand==="m"?"l":this._prevCommand:null)===null)return null}else this._currentIndex+=1;var D=null,I=(this._prevCommand=O).toUpperCase();return I==="H"||I==="V"?D=[this._parseNumber()]:I==="M"||I==="L"||I==="T"?D=[this._parseNumber(),this._parseNumber()]:I==="S"||I==="Q"?D=[this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber()]:I==="C"?D=[this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber()]:I==="A"?D=[this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseArcFlag(),this._parseArcFlag(),this._parseNumber(),this._parseNumber()]:I==="Z"&&(this._skipOptionalSpaces(),D=[]),D===null||0<=D.indexOf(null)?null:{type:O,values:D}},hasMoreData:function(){return this._currentIndex<this._endIndex},peekSegmentType:function(){var T=this._string[this._currentIndex];return a[T]?a[T]:null},initialCommandIsMoveTo:function(){if(!this.hasMoreData())return!0;var T=this.peekSegmentType();return T==="M"||T==="m"},_isCurrentSpace:function(){var T=this._string[this._currentIndex];return T<=" "&&(T===" "||T===`
+  */const _s=typeof window<"u";function Gd(e){return e.__esModule||e[Symbol.toStringTag]==="Module"}const lt=Object.assign;function bo(e,t){const n={};for(const i in t){const o=t[i];n[i]=gn(o)?o.map(e):e(o)}return n}const qs=()=>{},gn=Array.isArray,zd=/\/$/,Ud=e=>e.replace(zd,"");function vo(e,t,n="/"){let i,o={},r="",u="";const d=t.indexOf("#");let f=t.indexOf("?");return d<f&&d>=0&&(f=-1),f>-1&&(i=t.slice(0,f),r=t.slice(f+1,d>-1?d:t.length),o=e(r)),d>-1&&(i=i||t.slice(0,d),u=t.slice(d,t.length)),i=Zd(i??t,n),{fullPath:i+(r&&"?")+r+u,path:i,query:o,hash:u}}function Kd(e,t){const n=t.query?e(t.query):"";return t.path+(n&&"?")+n+(t.hash||"")}function ol(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function qd(e,t,n){const i=t.matched.length-1,o=n.matched.length-1;return i>-1&&i===o&&Is(t.matched[i],n.matched[o])&&Va(t.params,n.params)&&e(t.query)===e(n.query)&&t.hash===n.hash}function Is(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function Va(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const n in e)if(!Yd(e[n],t[n]))return!1;return!0}function Yd(e,t){return gn(e)?rl(e,t):gn(t)?rl(t,e):e===t}function rl(e,t){return gn(t)?e.length===t.length&&e.every((n,i)=>n===t[i]):e.length===1&&e[0]===t}function Zd(e,t){if(e.startsWith("/"))return e;if(!e)return t;const n=t.split("/"),i=e.split("/"),o=i[i.length-1];(o===".."||o===".")&&i.push("");let r=n.length-1,u,d;for(u=0;u<i.length;u++)if(d=i[u],d!==".")if(d==="..")r>1&&r--;else break;return n.slice(0,r).join("/")+"/"+i.slice(u-(u===i.length?1:0)).join("/")}var ti;(function(e){e.pop="pop",e.push="push"})(ti||(ti={}));var Ys;(function(e){e.back="back",e.forward="forward",e.unknown=""})(Ys||(Ys={}));function Xd(e){if(!e)if(_s){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),Ud(e)}const Qd=/^[^#]+#/;function Jd(e,t){return e.replace(Qd,"#")+t}function eh(e,t){const n=document.documentElement.getBoundingClientRect(),i=e.getBoundingClientRect();return{behavior:t.behavior,left:i.left-n.left-(t.left||0),top:i.top-n.top-(t.top||0)}}const eo=()=>({left:window.pageXOffset,top:window.pageYOffset});function th(e){let t;if("el"in e){const n=e.el,i=typeof n=="string"&&n.startsWith("#"),o=typeof n=="string"?i?document.getElementById(n.slice(1)):document.querySelector(n):n;if(!o)return;t=eh(o,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.pageXOffset,t.top!=null?t.top:window.pageYOffset)}function ll(e,t){return(history.state?history.state.position-t:-1)+e}const Bo=new Map;function nh(e,t){Bo.set(e,t)}function sh(e){const t=Bo.get(e);return Bo.delete(e),t}let ih=()=>location.protocol+"//"+location.host;function Na(e,t){const{pathname:n,search:i,hash:o}=t,r=e.indexOf("#");if(r>-1){let d=o.includes(e.slice(r))?e.slice(r).length:1,f=o.slice(d);return f[0]!=="/"&&(f="/"+f),ol(f,"")}return ol(n,e)+i+o}function oh(e,t,n,i){let o=[],r=[],u=null;const d=({state:M})=>{const q=Na(e,location),ce=n.value,me=t.value;let ke=0;if(M){if(n.value=q,t.value=M,u&&u===ce){u=null;return}ke=me?M.position-me.position:0}else i(q);o.forEach(ye=>{ye(n.value,ce,{delta:ke,type:ti.pop,direction:ke?ke>0?Ys.forward:Ys.back:Ys.unknown})})};function f(){u=n.value}function b(M){o.push(M);const q=()=>{const ce=o.indexOf(M);ce>-1&&o.splice(ce,1)};return r.push(q),q}function g(){const{history:M}=window;M.state&&M.replaceState(lt({},M.state,{scroll:eo()}),"")}function E(){for(const M of r)M();r=[],window.removeEventListener("popstate",d),window.removeEventListener("beforeunload",g)}return window.addEventListener("popstate",d),window.addEventListener("beforeunload",g,{passive:!0}),{pauseListeners:f,listen:b,destroy:E}}function al(e,t,n,i=!1,o=!1){return{back:e,current:t,forward:n,replaced:i,position:window.history.length,scroll:o?eo():null}}function rh(e){const{history:t,location:n}=window,i={value:Na(e,n)},o={value:t.state};o.value||r(i.value,{back:null,current:i.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function r(f,b,g){const E=e.indexOf("#"),M=E>-1?(n.host&&document.querySelector("base")?e:e.slice(E))+f:ih()+e+f;try{t[g?"replaceState":"pushState"](b,"",M),o.value=b}catch(q){console.error(q),n[g?"replace":"assign"](M)}}function u(f,b){const g=lt({},t.state,al(o.value.back,f,o.value.forward,!0),b,{position:o.value.position});r(f,g,!0),i.value=f}function d(f,b){const g=lt({},o.value,t.state,{forward:f,scroll:eo()});r(g.current,g,!0);const E=lt({},al(i.value,f,null),{position:g.position+1},b);r(f,E,!1),i.value=f}return{location:i,state:o,push:d,replace:u}}function lh(e){e=Xd(e);const t=rh(e),n=oh(e,t.state,t.location,t.replace);function i(r,u=!0){u||n.pauseListeners(),history.go(r)}const o=lt({location:"",base:e,go:i,createHref:Jd.bind(null,e)},t,n);return Object.defineProperty(o,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(o,"state",{enumerable:!0,get:()=>t.state.value}),o}function ah(e){return e=location.host?e||location.pathname+location.search:"",e.includes("#")||(e+="#"),lh(e)}function uh(e){return typeof e=="string"||e&&typeof e=="object"}function Ba(e){return typeof e=="string"||typeof e=="symbol"}const Fn={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0},Fa=Symbol("");var ul;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(ul||(ul={}));function Ps(e,t){return lt(new Error,{type:e,[Fa]:!0},t)}function Mn(e,t){return e instanceof Error&&Fa in e&&(t==null||!!(e.type&t))}const cl="[^/]+?",ch={sensitive:!1,strict:!1,start:!0,end:!0},dh=/[.+*?^${}()[\]/\\]/g;function hh(e,t){const n=lt({},ch,t),i=[];let o=n.start?"^":"";const r=[];for(const b of e){const g=b.length?[]:[90];n.strict&&!b.length&&(o+="/");for(let E=0;E<b.length;E++){const M=b[E];let q=40+(n.sensitive?.25:0);if(M.type===0)E||(o+="/"),o+=M.value.replace(dh,"\\$&"),q+=40;else if(M.type===1){const{value:ce,repeatable:me,optional:ke,regexp:ye}=M;r.push({name:ce,repeatable:me,optional:ke});const Ce=ye||cl;if(Ce!==cl){q+=10;try{new RegExp(`(${Ce})`)}catch(We){throw new Error(`Invalid custom RegExp for param "${ce}" (${Ce}): `+We.message)}}let Le=me?`((?:${Ce})(?:/(?:${Ce}))*)`:`(${Ce})`;E||(Le=ke&&b.length<2?`(?:/${Le})`:"/"+Le),ke&&(Le+="?"),o+=Le,q+=20,ke&&(q+=-8),me&&(q+=-20),Ce===".*"&&(q+=-50)}g.push(q)}i.push(g)}if(n.strict&&n.end){const b=i.length-1;i[b][i[b].length-1]+=.7000000000000001}n.strict||(o+="/?"),n.end?o+="$":n.strict&&(o+="(?:/|$)");const u=new RegExp(o,n.sensitive?"":"i");function d(b){const g=b.match(u),E={};if(!g)return null;for(let M=1;M<g.length;M++){const q=g[M]||"",ce=r[M-1];E[ce.name]=q&&ce.repeatable?q.split("/"):q}return E}function f(b){let g="",E=!1;for(const M of e){(!E||!g.endsWith("/"))&&(g+="/"),E=!1;for(const q of M)if(q.type===0)g+=q.value;else if(q.type===1){const{value:ce,repeatable:me,optional:ke}=q,ye=ce in b?b[ce]:"";if(gn(ye)&&!me)throw new Error(`Provided param "${ce}" is an array but it is not repeatable (* or + modifiers)`);const Ce=gn(ye)?ye.join("/"):ye;if(!Ce)if(ke)M.length<2&&(g.endsWith("/")?g=g.slice(0,-1):E=!0);else throw new Error(`Missing required param "${ce}"`);g+=Ce}}return g||"/"}return{re:u,score:i,keys:r,parse:d,stringify:f}}function fh(e,t){let n=0;for(;n<e.length&&n<t.length;){const i=t[n]-e[n];if(i)return i;n++}return e.length<t.length?e.length===1&&e[0]===40+40?-1:1:e.length>t.length?t.length===1&&t[0]===40+40?1:-1:0}function ph(e,t){let n=0;const i=e.score,o=t.score;for(;n<i.length&&n<o.length;){const r=fh(i[n],o[n]);if(r)return r;n++}if(Math.abs(o.length-i.length)===1){if(dl(i))return 1;if(dl(o))return-1}return o.length-i.length}function dl(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const mh={type:0,value:""},gh=/[a-zA-Z0-9_]/;function yh(e){if(!e)return[[]];if(e==="/")return[[mh]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(q){throw new Error(`ERR (${n})/"${b}": ${q}`)}let n=0,i=n;const o=[];let r;function u(){r&&o.push(r),r=[]}let d=0,f,b="",g="";function E(){b&&(n===0?r.push({type:0,value:b}):n===1||n===2||n===3?(r.length>1&&(f==="*"||f==="+")&&t(`A repeatable param (${b}) must be alone in its segment. eg: '/:ids+.`),r.push({type:1,value:b,regexp:g,repeatable:f==="*"||f==="+",optional:f==="*"||f==="?"})):t("Invalid state to consume buffer"),b="")}function M(){b+=f}for(;d<e.length;){if(f=e[d++],f==="\\"&&n!==2){i=n,n=4;continue}switch(n){case 0:f==="/"?(b&&E(),u()):f===":"?(E(),n=1):M();break;case 4:M(),n=i;break;case 1:f==="("?n=2:gh.test(f)?M():(E(),n=0,f!=="*"&&f!=="?"&&f!=="+"&&d--);break;case 2:f===")"?g[g.length-1]=="\\"?g=g.slice(0,-1)+f:n=3:g+=f;break;case 3:E(),n=0,f!=="*"&&f!=="?"&&f!=="+"&&d--,g="";break;default:t("Unknown state");break}}return n===2&&t(`Unfinished custom RegExp for param "${b}"`),E(),u(),o}function bh(e,t,n){const i=hh(yh(e.path),n),o=lt(i,{record:e,parent:t,children:[],alias:[]});return t&&!o.record.aliasOf==!t.record.aliasOf&&t.children.push(o),o}function vh(e,t){const n=[],i=new Map;t=pl({strict:!1,end:!0,sensitive:!1},t);function o(g){return i.get(g)}function r(g,E,M){const q=!M,ce=_h(g);ce.aliasOf=M&&M.record;const me=pl(t,g),ke=[ce];if("alias"in g){const Le=typeof g.alias=="string"?[g.alias]:g.alias;for(const We of Le)ke.push(lt({},ce,{components:M?M.record.components:ce.components,path:We,aliasOf:M?M.record:ce}))}let ye,Ce;for(const Le of ke){const{path:We}=Le;if(E&&We[0]!=="/"){const Ue=E.record.path,Re=Ue[Ue.length-1]==="/"?"":"/";Le.path=E.record.path+(We&&Re+We)}if(ye=bh(Le,E,me),M?M.alias.push(ye):(Ce=Ce||ye,Ce!==ye&&Ce.alias.push(ye),q&&g.name&&!fl(ye)&&u(g.name)),ce.children){const Ue=ce.children;for(let Re=0;Re<Ue.length;Re++)r(Ue[Re],ye,M&&M.children[Re])}M=M||ye,(ye.record.components&&Object.keys(ye.record.components).length||ye.record.name||ye.record.redirect)&&f(ye)}return Ce?()=>{u(Ce)}:qs}function u(g){if(Ba(g)){const E=i.get(g);E&&(i.delete(g),n.splice(n.indexOf(E),1),E.children.forEach(u),E.alias.forEach(u))}else{const E=n.indexOf(g);E>-1&&(n.splice(E,1),g.record.name&&i.delete(g.record.name),g.children.forEach(u),g.alias.forEach(u))}}function d(){return n}function f(g){let E=0;for(;E<n.length&&ph(g,n[E])>=0&&(g.record.path!==n[E].record.path||!Da(g,n[E]));)E++;n.splice(E,0,g),g.record.name&&!fl(g)&&i.set(g.record.name,g)}function b(g,E){let M,q={},ce,me;if("name"in g&&g.name){if(M=i.get(g.name),!M)throw Ps(1,{location:g});me=M.record.name,q=lt(hl(E.params,M.keys.filter(Ce=>!Ce.optional).map(Ce=>Ce.name)),g.params&&hl(g.params,M.keys.map(Ce=>Ce.name))),ce=M.stringify(q)}else if("path"in g)ce=g.path,M=n.find(Ce=>Ce.re.test(ce)),M&&(q=M.parse(ce),me=M.record.name);else{if(M=E.name?i.get(E.name):n.find(Ce=>Ce.re.test(E.path)),!M)throw Ps(1,{location:g,currentLocation:E});me=M.record.name,q=lt({},E.params,g.params),ce=M.stringify(q)}const ke=[];let ye=M;for(;ye;)ke.unshift(ye.record),ye=ye.parent;return{name:me,path:ce,params:q,matched:ke,meta:Eh(ke)}}return e.forEach(g=>r(g)),{addRoute:r,resolve:b,removeRoute:u,getRoutes:d,getRecordMatcher:o}}function hl(e,t){const n={};for(const i of t)i in e&&(n[i]=e[i]);return n}function _h(e){return{path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:void 0,beforeEnter:e.beforeEnter,props:Sh(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}}}function Sh(e){const t={},n=e.props||!1;if("component"in e)t.default=n;else for(const i in e.components)t[i]=typeof n=="object"?n[i]:n;return t}function fl(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function Eh(e){return e.reduce((t,n)=>lt(t,n.meta),{})}function pl(e,t){const n={};for(const i in e)n[i]=i in t?t[i]:e[i];return n}function Da(e,t){return t.children.some(n=>n===e||Da(e,n))}const Ha=/#/g,wh=/&/g,xh=/\//g,kh=/=/g,Oh=/\?/g,Wa=/\+/g,Ch=/%5B/g,Mh=/%5D/g,ja=/%5E/g,Lh=/%60/g,Ga=/%7B/g,Ih=/%7C/g,za=/%7D/g,Ph=/%20/g;function lr(e){return encodeURI(""+e).replace(Ih,"|").replace(Ch,"[").replace(Mh,"]")}function Ah(e){return lr(e).replace(Ga,"{").replace(za,"}").replace(ja,"^")}function Fo(e){return lr(e).replace(Wa,"%2B").replace(Ph,"+").replace(Ha,"%23").replace(wh,"%26").replace(Lh,"`").replace(Ga,"{").replace(za,"}").replace(ja,"^")}function Th(e){return Fo(e).replace(kh,"%3D")}function Rh(e){return lr(e).replace(Ha,"%23").replace(Oh,"%3F")}function $h(e){return e==null?"":Rh(e).replace(xh,"%2F")}function Fi(e){try{return decodeURIComponent(""+e)}catch{}return""+e}function Vh(e){const t={};if(e===""||e==="?")return t;const i=(e[0]==="?"?e.slice(1):e).split("&");for(let o=0;o<i.length;++o){const r=i[o].replace(Wa," "),u=r.indexOf("="),d=Fi(u<0?r:r.slice(0,u)),f=u<0?null:Fi(r.slice(u+1));if(d in t){let b=t[d];gn(b)||(b=t[d]=[b]),b.push(f)}else t[d]=f}return t}function ml(e){let t="";for(let n in e){const i=e[n];if(n=Th(n),i==null){i!==void 0&&(t+=(t.length?"&":"")+n);continue}(gn(i)?i.map(r=>r&&Fo(r)):[i&&Fo(i)]).forEach(r=>{r!==void 0&&(t+=(t.length?"&":"")+n,r!=null&&(t+="="+r))})}return t}function Nh(e){const t={};for(const n in e){const i=e[n];i!==void 0&&(t[n]=gn(i)?i.map(o=>o==null?null:""+o):i==null?i:""+i)}return t}const Bh=Symbol(""),gl=Symbol(""),ar=Symbol(""),Ua=Symbol(""),Do=Symbol("");function Ws(){let e=[];function t(i){return e.push(i),()=>{const o=e.indexOf(i);o>-1&&e.splice(o,1)}}function n(){e=[]}return{add:t,list:()=>e.slice(),reset:n}}function Gn(e,t,n,i,o){const r=i&&(i.enterCallbacks[o]=i.enterCallbacks[o]||[]);return()=>new Promise((u,d)=>{const f=E=>{E===!1?d(Ps(4,{from:n,to:t})):E instanceof Error?d(E):uh(E)?d(Ps(2,{from:t,to:E})):(r&&i.enterCallbacks[o]===r&&typeof E=="function"&&r.push(E),u())},b=e.call(i&&i.instances[o],t,n,f);let g=Promise.resolve(b);e.length<3&&(g=g.then(f)),g.catch(E=>d(E))})}function _o(e,t,n,i){const o=[];for(const r of e)for(const u in r.components){let d=r.components[u];if(!(t!=="beforeRouteEnter"&&!r.instances[u]))if(Fh(d)){const b=(d.__vccOpts||d)[t];b&&o.push(Gn(b,n,i,r,u))}else{let f=d();o.push(()=>f.then(b=>{if(!b)return Promise.reject(new Error(`Couldn't resolve component "${u}" at "${r.path}"`));const g=Gd(b)?b.default:b;r.components[u]=g;const M=(g.__vccOpts||g)[t];return M&&Gn(M,n,i,r,u)()}))}}return o}function Fh(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function yl(e){const t=Pn(ar),n=Pn(Ua),i=pn(()=>t.resolve(xs(e.to))),o=pn(()=>{const{matched:f}=i.value,{length:b}=f,g=f[b-1],E=n.matched;if(!g||!E.length)return-1;const M=E.findIndex(Is.bind(null,g));if(M>-1)return M;const q=bl(f[b-2]);return b>1&&bl(g)===q&&E[E.length-1].path!==q?E.findIndex(Is.bind(null,f[b-2])):M}),r=pn(()=>o.value>-1&&jh(n.params,i.value.params)),u=pn(()=>o.value>-1&&o.value===n.matched.length-1&&Va(n.params,i.value.params));function d(f={}){return Wh(f)?t[xs(e.replace)?"replace":"push"](xs(e.to)).catch(qs):Promise.resolve()}return{route:i,href:pn(()=>i.value.href),isActive:r,isExactActive:u,navigate:d}}const Dh=jt({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:yl,setup(e,{slots:t}){const n=si(yl(e)),{options:i}=Pn(ar),o=pn(()=>({[vl(e.activeClass,i.linkActiveClass,"router-link-active")]:n.isActive,[vl(e.exactActiveClass,i.linkExactActiveClass,"router-link-exact-active")]:n.isExactActive}));return()=>{const r=t.default&&t.default(n);return e.custom?r:or("a",{"aria-current":n.isExactActive?e.ariaCurrentValue:null,href:n.href,onClick:n.navigate,class:o.value},r)}}}),Hh=Dh;function Wh(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function jh(e,t){for(const n in t){const i=t[n],o=e[n];if(typeof i=="string"){if(i!==o)return!1}else if(!gn(o)||o.length!==i.length||i.some((r,u)=>r!==o[u]))return!1}return!0}function bl(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const vl=(e,t,n)=>e??t??n,Gh=jt({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:n}){const i=Pn(Do),o=pn(()=>e.route||i.value),r=Pn(gl,0),u=pn(()=>{let b=xs(r);const{matched:g}=o.value;let E;for(;(E=g[b])&&!E.components;)b++;return b}),d=pn(()=>o.value.matched[u.value]);Ci(gl,pn(()=>u.value+1)),Ci(Bh,d),Ci(Do,o);const f=ec();return Oi(()=>[f.value,d.value,e.name],([b,g,E],[M,q,ce])=>{g&&(g.instances[E]=b,q&&q!==g&&b&&b===M&&(g.leaveGuards.size||(g.leaveGuards=q.leaveGuards),g.updateGuards.size||(g.updateGuards=q.updateGuards))),b&&g&&(!q||!Is(g,q)||!M)&&(g.enterCallbacks[E]||[]).forEach(me=>me(b))},{flush:"post"}),()=>{const b=o.value,g=e.name,E=d.value,M=E&&E.components[g];if(!M)return _l(n.default,{Component:M,route:b});const q=E.props[g],ce=q?q===!0?b.params:typeof q=="function"?q(b):q:null,ke=or(M,lt({},ce,t,{onVnodeUnmounted:ye=>{ye.component.isUnmounted&&(E.instances[g]=null)},ref:f}));return _l(n.default,{Component:ke,route:b})||ke}}});function _l(e,t){if(!e)return null;const n=e(t);return n.length===1?n[0]:n}const zh=Gh;function Uh(e){const t=vh(e.routes,e),n=e.parseQuery||Vh,i=e.stringifyQuery||ml,o=e.history,r=Ws(),u=Ws(),d=Ws(),f=tc(Fn);let b=Fn;_s&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const g=bo.bind(null,G=>""+G),E=bo.bind(null,$h),M=bo.bind(null,Fi);function q(G,fe){let re,Ee;return Ba(G)?(re=t.getRecordMatcher(G),Ee=fe):Ee=G,t.addRoute(Ee,re)}function ce(G){const fe=t.getRecordMatcher(G);fe&&t.removeRoute(fe)}function me(){return t.getRoutes().map(G=>G.record)}function ke(G){return!!t.getRecordMatcher(G)}function ye(G,fe){if(fe=lt({},fe||f.value),typeof G=="string"){const v=vo(n,G,fe.path),V=t.resolve({path:v.path},fe),Y=o.createHref(v.fullPath);return lt(v,V,{params:M(V.params),hash:Fi(v.hash),redirectedFrom:void 0,href:Y})}let re;if("path"in G)re=lt({},G,{path:vo(n,G.path,fe.path).path});else{const v=lt({},G.params);for(const V in v)v[V]==null&&delete v[V];re=lt({},G,{params:E(v)}),fe.params=E(fe.params)}const Ee=t.resolve(re,fe),Je=G.hash||"";Ee.params=g(M(Ee.params));const ft=Kd(i,lt({},G,{hash:Ah(Je),path:Ee.path})),p=o.createHref(ft);return lt({fullPath:ft,hash:Je,query:i===ml?Nh(G.query):G.query||{}},Ee,{redirectedFrom:void 0,href:p})}function Ce(G){return typeof G=="string"?vo(n,G,f.value.path):lt({},G)}function Le(G,fe){if(b!==G)return Ps(8,{from:fe,to:G})}function We(G){return St(G)}function Ue(G){return We(lt(Ce(G),{replace:!0}))}function Re(G){const fe=G.matched[G.matched.length-1];if(fe&&fe.redirect){const{redirect:re}=fe;let Ee=typeof re=="function"?re(G):re;return typeof Ee=="string"&&(Ee=Ee.includes("?")||Ee.includes("#")?Ee=Ce(Ee):{path:Ee},Ee.params={}),lt({query:G.query,hash:G.hash,params:"path"in Ee?{}:G.params},Ee)}}function St(G,fe){const re=b=ye(G),Ee=f.value,Je=G.state,ft=G.force,p=G.replace===!0,v=Re(re);if(v)return St(lt(Ce(v),{state:typeof v=="object"?lt({},Je,v.state):Je,force:ft,replace:p}),fe||re);const V=re;V.redirectedFrom=fe;let Y;return!ft&&qd(i,Ee,re)&&(Y=Ps(16,{to:V,from:Ee}),en(Ee,Ee,!0,!1)),(Y?Promise.resolve(Y):Ne(V,Ee)).catch(W=>Mn(W)?Mn(W,2)?W:dn(W):Ze(W,V,Ee)).then(W=>{if(W){if(Mn(W,2))return St(lt({replace:p},Ce(W.to),{state:typeof W.to=="object"?lt({},Je,W.to.state):Je,force:ft}),fe||V)}else W=ge(V,Ee,!0,p,Je);return ot(V,Ee,W),W})}function Ve(G,fe){const re=Le(G,fe);return re?Promise.reject(re):Promise.resolve()}function at(G){const fe=$n.values().next().value;return fe&&typeof fe.runWithContext=="function"?fe.runWithContext(G):G()}function Ne(G,fe){let re;const[Ee,Je,ft]=Kh(G,fe);re=_o(Ee.reverse(),"beforeRouteLeave",G,fe);for(const v of Ee)v.leaveGuards.forEach(V=>{re.push(Gn(V,G,fe))});const p=Ve.bind(null,G,fe);return re.push(p),Ct(re).then(()=>{re=[];for(const v of r.list())re.push(Gn(v,G,fe));return re.push(p),Ct(re)}).then(()=>{re=_o(Je,"beforeRouteUpdate",G,fe);for(const v of Je)v.updateGuards.forEach(V=>{re.push(Gn(V,G,fe))});return re.push(p),Ct(re)}).then(()=>{re=[];for(const v of ft)if(v.beforeEnter)if(gn(v.beforeEnter))for(const V of v.beforeEnter)re.push(Gn(V,G,fe));else re.push(Gn(v.beforeEnter,G,fe));return re.push(p),Ct(re)}).then(()=>(G.matched.forEach(v=>v.enterCallbacks={}),re=_o(ft,"beforeRouteEnter",G,fe),re.push(p),Ct(re))).then(()=>{re=[];for(const v of u.list())re.push(Gn(v,G,fe));return re.push(p),Ct(re)}).catch(v=>Mn(v,8)?v:Promise.reject(v))}function ot(G,fe,re){d.list().forEach(Ee=>at(()=>Ee(G,fe,re)))}function ge(G,fe,re,Ee,Je){const ft=Le(G,fe);if(ft)return ft;const p=fe===Fn,v=_s?history.state:{};re&&(Ee||p?o.replace(G.fullPath,lt({scroll:p&&v&&v.scroll},Je)):o.push(G.fullPath,Je)),f.value=G,en(G,fe,re,p),dn()}let Ke;function bt(){Ke||(Ke=o.listen((G,fe,re)=>{if(!On.listening)return;const Ee=ye(G),Je=Re(Ee);if(Je){St(lt(Je,{replace:!0}),Ee).catch(qs);return}b=Ee;const ft=f.value;_s&&nh(ll(ft.fullPath,re.delta),eo()),Ne(Ee,ft).catch(p=>Mn(p,12)?p:Mn(p,2)?(St(p.to,Ee).then(v=>{Mn(v,20)&&!re.delta&&re.type===ti.pop&&o.go(-1,!1)}).catch(qs),Promise.reject()):(re.delta&&o.go(-re.delta,!1),Ze(p,Ee,ft))).then(p=>{p=p||ge(Ee,ft,!1),p&&(re.delta&&!Mn(p,8)?o.go(-re.delta,!1):re.type===ti.pop&&Mn(p,20)&&o.go(-1,!1)),ot(Ee,ft,p)}).catch(qs)}))}let qt=Ws(),Et=Ws(),nt;function Ze(G,fe,re){dn(G);const Ee=Et.list();return Ee.length?Ee.forEach(Je=>Je(G,fe,re)):console.error(G),Promise.reject(G)}function Jt(){return nt&&f.value!==Fn?Promise.resolve():new Promise((G,fe)=>{qt.add([G,fe])})}function dn(G){return nt||(nt=!G,bt(),qt.list().forEach(([fe,re])=>G?re(G):fe()),qt.reset()),G}function en(G,fe,re,Ee){const{scrollBehavior:Je}=e;if(!_s||!Je)return Promise.resolve();const ft=!re&&sh(ll(G.fullPath,0))||(Ee||!re)&&history.state&&history.state.scroll||null;return Ql().then(()=>Je(G,fe,ft)).then(p=>p&&th(p)).catch(p=>Ze(p,G,fe))}const vt=G=>o.go(G);let Rn;const $n=new Set,On={currentRoute:f,listening:!0,addRoute:q,removeRoute:ce,hasRoute:ke,getRoutes:me,resolve:ye,options:e,push:We,replace:Ue,go:vt,back:()=>vt(-1),forward:()=>vt(1),beforeEach:r.add,beforeResolve:u.add,afterEach:d.add,onError:Et.add,isReady:Jt,install(G){const fe=this;G.component("RouterLink",Hh),G.component("RouterView",zh),G.config.globalProperties.$router=fe,Object.defineProperty(G.config.globalProperties,"$route",{enumerable:!0,get:()=>xs(f)}),_s&&!Rn&&f.value===Fn&&(Rn=!0,We(o.location).catch(Je=>{}));const re={};for(const Je in Fn)Object.defineProperty(re,Je,{get:()=>f.value[Je],enumerable:!0});G.provide(ar,fe),G.provide(Ua,jl(re)),G.provide(Do,f);const Ee=G.unmount;$n.add(G),G.unmount=function(){$n.delete(G),$n.size<1&&(b=Fn,Ke&&Ke(),Ke=null,f.value=Fn,Rn=!1,nt=!1),Ee()}}};function Ct(G){return G.reduce((fe,re)=>fe.then(()=>at(re)),Promise.resolve())}return On}function Kh(e,t){const n=[],i=[],o=[],r=Math.max(t.matched.length,e.matched.length);for(let u=0;u<r;u++){const d=t.matched[u];d&&(e.matched.find(b=>Is(b,d))?i.push(d):n.push(d));const f=e.matched[u];f&&(t.matched.find(b=>Is(b,f))||o.push(f))}return[n,i,o]}class Ka{constructor(t,n,i=500){Yt(this,"backendAddress");Yt(this,"responseCallback");Yt(this,"pollingInterval",!1);Yt(this,"howOftenToPoll");this.backendAddress=t,this.responseCallback=n,this.howOftenToPoll=i}isPending(){return typeof this.pollingInterval=="number"}async newRequest(){if(this.isPending()){console.log("Request not processed, another one is still pending!");return}await this._fetchFromBackend()}async _fetchFromBackend(){try{const t=await this._fetchMethod();if(t.result==="success"||t.result==="exception"){this.responseCallback(t),this.clear();return}}catch(t){console.log("Error - PollUntilSuccess"),console.log(t)}typeof this.pollingInterval=="boolean"&&(this.pollingInterval=setInterval(this._fetchFromBackend.bind(this),this.howOftenToPoll))}clear(){this.isPending()&&(clearInterval(this.pollingInterval),this.pollingInterval=!1)}}class qa extends Ka{async _fetchMethod(){return await fetch(this.backendAddress,{method:"GET",headers:{Accept:"application/json"}}).then(t=>t.json())}}class Ya extends Ka{constructor(n,i,o=500,r){super(n,i,o);Yt(this,"body");this.body=r}async _fetchMethod(){return await fetch(this.backendAddress,{method:"POST",headers:{Accept:"application/json","Content-Type":"application/json"},body:JSON.stringify(this.body)}).then(n=>n.json())}static async startPoll(n,i,o,r,u){if(n[i]==null)n[i]=new this(o,r,500,u);else if(!n[i].isPending())n[i].body=u;else return;await n[i].newRequest()}}const Te=si({});function De(e,t){return`${e}>>${t}`}function qh(e){let t=e.split(">>");return t[t.length-1]}function oi(e,t,n){const i={};for(const o of Object.keys(n)){const r=n[o];i[De(e,r)]=t[o]}return i}class Yh{constructor(){Yt(this,"name");Yt(this,"type")}}function*Za(e){for(const t of Object.keys(e))yield[t,e[t]]}class Zh{constructor(){Yt(this,"registeredElements");this.registeredElements={}}createElementDataFromDescription(t){if(t===void 0)throw RangeError("Context is undefined!");if(!(t.type in this.registeredElements))throw RangeError(`context.type: "${t.type}" isn't registered in formatter!`);const n=this.registeredElements[t.type];return{component:n.component,data:n.process(t)}}retrieveElementsFromResponse(t,n,i=void 0,o=!1){if(t.result==="exception"){alert(`Exception: ${t.reason}`);return}const r=t.elementDescriptions;for(let u=0;u<r.length;u++){const d=r[u],f=this.createElementDataFromDescription(d);i!==void 0&&i.push({component:f.component,name:d.name});for(const[b,g]of Za(f.data)){let E=De(d.name,b);if(o&&!n.hasOwnProperty(E)&&i===void 0)throw TypeError(`reactiveStore doesn't contain property '${E}'`);n[E]=g}}}install(t){t.config.globalProperties.$elementRegistry=this}}function fs(e,t){for(const n of t)if(!(n in e))throw RangeError(`Invalid configuration! ('${n}' not in configuration)`)}function to(e,t,n,i){e.registeredElements[t]={component:n,process:o=>Xh(o,i)}}function Xh(e,t){fs(e,Object.keys(t));let n={};for(const i of Object.keys(t))n[t[i]]=e[i];return n}function Qh(e){return e.replace(/[.*+?^${}()|[\]\\]/g,"\\$&")}function Xa(e){let t=["<br />","<code>","</code>","<b>","</b>","<em>","</em>"];t=t.map(Qh);let n=e.replace(new RegExp(t.join("|"),"g"),"");return!n.includes("<")&&!n.includes(">")}function Jh(e){return e.replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#039;")}function ef(e){return e=e.replace(/(?:\r\n|\r|\n)/g,"<br>"),e}let tf=jt({props:{name:{type:String,required:!0}},computed:{headingLevel(){return Te[De(this.name,"headingLevel")]},heading(){return Te[De(this.name,"heading")]},value(){let e=Te[De(this.name,"value")];if(!Xa(e))throw Error("Invalid value arrived from backend");return e}}}),nf={value:"value",heading:"heading",heading_level:"headingLevel"};function sf(e){to(e,"plain","PlainText",nf)}const Kt=(e,t)=>{const n=e.__vccOpts||e;for(const[i,o]of t)n[i]=o;return n},of={key:0},rf={key:0},lf={key:1},af={key:2},uf={key:3},cf={key:4},df={key:5},hf=["innerHTML"];function ff(e,t,n,i,o,r){return e.heading?(he(),Ae("span",of,[e.headingLevel===1?(he(),Ae("h1",rf,it(e.value),1)):e.headingLevel===2?(he(),Ae("h2",lf,it(e.value),1)):e.headingLevel===3?(he(),Ae("h3",af,it(e.value),1)):e.headingLevel===4?(he(),Ae("h4",uf,it(e.value),1)):e.headingLevel===5?(he(),Ae("h5",cf,it(e.value),1)):e.headingLevel===6?(he(),Ae("h6",df,it(e.value),1)):Pt("",!0)])):(he(),Ae("div",{key:1,class:"wrapElement plainText",innerHTML:e.value},null,8,hf))}const Qa=Kt(tf,[["render",ff]]);let pf=jt({props:{item:{type:Object,required:!0},longContexts:{type:Boolean,required:!0},maxTextWidth:{type:String,required:!0}},data(){return{showProbs:!1}},computed:{useInlineLayout(){return!this.longContexts&&this.item.barHeights.length==1},content(){return this.item.pieceTitle},barHeights(){return this.item.barHeights},annotations(){return this.item.barAnnotations},names(){return this.item.barNames},trackWidth(){let e=90;return this.useInlineLayout||(e=100),`${e}%`}},methods:{barWidth(e){return e.toString()+"%"}}});const mf={key:0,class:"inline-bar-block"},gf={class:"track rounded"},yf={class:"prob-text"},bf={key:1},vf={class:"single-bar-wrapper"},_f={class:"inline-bar-block-text"},Sf={class:"track rounded"},Ef={class:"prob-text"};function wf(e,t,n,i,o,r){return he(),Ae("span",null,[e.useInlineLayout?(he(),Ae("span",mf,[Fe("span",{class:"word-text",style:Ln({width:e.maxTextWidth})},it(e.content),5),Fe("span",gf,[Fe("span",{style:Ln({width:e.barWidth(e.barHeights[0])}),class:"track-fill rounded"},[Fe("span",yf,it(e.annotations[0]),1)],4)])])):(he(),Ae("span",bf,[Fe("div",{class:"context-text",onMouseover:t[0]||(t[0]=u=>e.showProbs=!0),onMouseleave:t[1]||(t[1]=u=>e.showProbs=!1)},'"'+it(e.content)+'"',33),Fe("div",{class:"multiline-bar-block",style:Ln({width:e.trackWidth})},[(he(!0),Ae(ht,null,rn(e.barHeights,(u,d)=>(he(),Ae("span",vf,[Fe("div",_f,it(e.names[d]),1),Fe("div",Sf,[Fe("div",{style:Ln({width:e.barWidth(u)}),class:"track-fill rounded"},[Fe("span",Ef,it(e.annotations[d]),1)],4)])]))),256))],4)]))])}const xf=Kt(pf,[["render",wf],["__scopeId","data-v-d902367c"]]);function kf(e){return e.toString().length*7+35}function Ja(e){let t=e.length;return t*=8,t+=30,t}let Of=jt({props:{name:{type:String,required:!0}},inject:["backendAddress"],computed:{barInfos(){return Te[De(this.name,"barInfos")]},address(){return Te[De(this.name,"address")]},longContexts(){return Te[De(this.name,"longContexts")]},selectable(){return Te[De(this.name,"selectable")]},percentageElementWidth(){return this.selectable===!0?"90%":"100%"},maxTextWidth(){let e=0;for(let t of this.barInfos){let n=Ja(t.pieceTitle);n>e&&(e=n)}return e.toString()+"px"}},components:{DisplayPercentageComponent:xf},watch:{barInfos:{immediate:!0,handler(e){if(e!==void 0&&e.length!=0){this.selected=e[0].pieceTitle;let t=[];for(let n=0;n<e.length;n++)t.push(!1);this.focusedBarInfos=t}}}},data(){return{selected:"",reactiveStore:Te,selectPossibilityPoll:void 0,focusedBarInfos:[]}},unmounted(){var e;(e=this.selectPossibilityPoll)==null||e.clear()},methods:{submit(){Ya.startPoll(this,"selectPossibilityPoll",`${this.backendAddress}/${this.address}`,this.processResponse.bind(this),{selected:this.selected})},processResponse(e){this.$elementRegistry.retrieveElementsFromResponse(e,this.reactiveStore)}}}),Cf={address:"address",piece_infos:"barInfos",long_contexts:"longContexts",selectable:"selectable"};function Mf(e){to(e,"softmax","BarChartSelect",Cf)}const Lf=["value","onFocus","onBlur"],If={key:0,style:{"text-align":"center","margin-top":"10px"}},Pf={class:"button",type:"submit"};function Af(e,t,n,i,o,r){const u=Ms("DisplayPercentageComponent");return he(),Ae("form",{class:"wrapElement barChartSelect",onSubmit:t[1]||(t[1]=dt((...d)=>e.submit&&e.submit(...d),["prevent"]))},[(he(!0),Ae(ht,null,rn(e.barInfos,(d,f)=>(he(),Ae("div",{class:kn({"progress-bar":!0,focused:e.focusedBarInfos[f]})},[e.selectable?wn((he(),Ae("input",{key:0,class:"input-radio",type:"radio","onUpdate:modelValue":t[0]||(t[0]=b=>e.selected=b),value:d.pieceTitle,onFocus:b=>e.focusedBarInfos[f]=!0,onBlur:b=>e.focusedBarInfos[f]=!1},null,40,Lf)),[[Ta,e.selected]]):Pt("",!0),Xe(u,{style:Ln({display:"inline-block",width:e.percentageElementWidth}),item:d,longContexts:e.longContexts,maxTextWidth:e.maxTextWidth},null,8,["style","item","longContexts","maxTextWidth"])],2))),256)),e.selectable?(he(),Ae("div",If,[Fe("button",Pf,'Select "'+it(e.selected)+'"',1)])):Pt("",!0)],32)}const eu=Kt(Of,[["render",Af],["__scopeId","data-v-2068ad37"]]);const Tf={},ps=e=>(sa("data-v-9f8887ba"),e=e(),ia(),e),Rf={class:"load"},$f=ps(()=>Fe("div",null,"G",-1)),Vf=ps(()=>Fe("div",null,"N",-1)),Nf=ps(()=>Fe("div",null,"I",-1)),Bf=ps(()=>Fe("div",null,"D",-1)),Ff=ps(()=>Fe("div",null,"A",-1)),Df=ps(()=>Fe("div",null,"O",-1)),Hf=ps(()=>Fe("div",null,"L",-1)),Wf=[$f,Vf,Nf,Bf,Ff,Df,Hf];function jf(e,t){return he(),Ae("div",Rf,Wf)}const Gf=Kt(Tf,[["render",jf],["__scopeId","data-v-9f8887ba"]]);let zf=jt({props:{name:{type:String,required:!0}},computed:{max(){return Te[De(this.name,"max")]},min(){return Te[De(this.name,"min")]},stepSize(){return Te[De(this.name,"stepSize")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]},text(){return Te[De(this.name,"text")]},inputWidth(){return kf(this.selected).toString()+"px"}},data(){return{reactiveStore:Te,selected:0,isFocused:!1}},watch:{selected:{handler(e){this.selected=Math.max(Math.min(e,this.max),this.min);let t=De(this.name,"selected");Te[t]=this.selected},immediate:!0},defaultSelected:{handler(e){this.selected=e},immediate:!0}}}),Uf="min_max";function Kf(e,t){let n={min:"min",max:"max",selected:"defaultSelected",text:"text",step_size:"stepSize"};return fs(t,Object.keys(n)),oi(e,t,n)}const qf={class:"selector-text"},Yf={class:"selector"},Zf=["min","max","step"];function Xf(e,t,n,i,o,r){return he(),Ae("div",{class:kn({"sample-selector":!0,wrapElement:!0,focused:e.isFocused,"selector-wrapper":!0})},[Fe("span",qf,it(e.text),1),Fe("span",Yf,[wn(Fe("input",{style:Ln({width:e.inputWidth}),type:"number",min:e.min,max:e.max,"onUpdate:modelValue":t[0]||(t[0]=u=>e.selected=u),step:e.stepSize,onFocus:t[1]||(t[1]=u=>e.isFocused=!0),onBlur:t[2]||(t[2]=u=>e.isFocused=!1)},null,44,Zf),[[Aa,e.selected]])])],2)}const tu=Kt(zf,[["render",Xf],["__scopeId","data-v-6b22d2a9"]]);let Qf=jt({props:{name:{type:String,required:!0}},data(){return{selected:""}},computed:{choices(){return Te[De(this.name,"choices")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]},text(){return Te[De(this.name,"text")]},isHorizontal(){return Te[De(this.name,"isHorizontal")]},randomNumber(){return Te[De(this.name,"randomNumber")]}},watch:{selected:{handler(e){Te[De(this.name,"selected")]=e},immediate:!0},randomNumber:{handler(e){this.selected=this.defaultSelected},immediate:!0}}}),Jf="multi-radio";function ep(e,t){let n={choices:"choices",selected:"defaultSelected",text:"text",is_horizontal:"isHorizontal",version:"randomNumber"};return fs(t,Object.keys(n)),oi(e,t,n)}const tp={key:0,class:"descr"},np={class:"input-radio"},sp=["value"];function ip(e,t,n,i,o,r){return he(),Ae("div",{class:kn({"hmr-wrapper":!0,wrapElement:!0,vertical:!e.isHorizontal})},[e.text.length>0?(he(),Ae("div",tp,it(e.text),1)):Pt("",!0),(he(!0),Ae(ht,null,rn(e.choices,u=>(he(),Ae("div",np,[wn(Fe("input",{type:"radio","onUpdate:modelValue":t[0]||(t[0]=d=>e.selected=d),value:u},null,8,sp),[[Ta,e.selected]]),qn(" "+it(u),1)]))),256))],2)}const nu=Kt(Qf,[["render",ip],["__scopeId","data-v-b6b3ab34"]]);function So(e){return e===0?!1:Array.isArray(e)&&e.length===0?!0:!e}function op(e){return(...t)=>!e(...t)}function rp(e,t){return e===void 0&&(e="undefined"),e===null&&(e="null"),e===!1&&(e="false"),e.toString().toLowerCase().indexOf(t.trim())!==-1}function su(e,t,n,i){return t?e.filter(o=>rp(i(o,n),t)).sort((o,r)=>i(o,n).length-i(r,n).length):e}function lp(e){return e.filter(t=>!t.$isLabel)}function Eo(e,t){return n=>n.reduce((i,o)=>o[e]&&o[e].length?(i.push({$groupLabel:o[t],$isLabel:!0}),i.concat(o[e])):i,[])}function ap(e,t,n,i,o){return r=>r.map(u=>{if(!u[n])return console.warn("Options passed to vue-multiselect do not contain groups, despite the config."),[];const d=su(u[n],e,t,o);return d.length?{[i]:u[i],[n]:d}:[]})}const Sl=(...e)=>t=>e.reduce((n,i)=>i(n),t);var up={data(){return{search:"",isOpen:!1,preferredOpenDirection:"below",optimizedHeight:this.maxHeight}},props:{internalSearch:{type:Boolean,default:!0},options:{type:Array,required:!0},multiple:{type:Boolean,default:!1},trackBy:{type:String},label:{type:String},searchable:{type:Boolean,default:!0},clearOnSelect:{type:Boolean,default:!0},hideSelected:{type:Boolean,default:!1},placeholder:{type:String,default:"Select option"},allowEmpty:{type:Boolean,default:!0},resetAfter:{type:Boolean,default:!1},closeOnSelect:{type:Boolean,default:!0},customLabel:{type:Function,default(e,t){return So(e)?"":t?e[t]:e}},taggable:{type:Boolean,default:!1},tagPlaceholder:{type:String,default:"Press enter to create a tag"},tagPosition:{type:String,default:"top"},max:{type:[Number,Boolean],default:!1},id:{default:null},optionsLimit:{type:Number,default:1e3},groupValues:{type:String},groupLabel:{type:String},groupSelect:{type:Boolean,default:!1},blockKeys:{type:Array,default(){return[]}},preserveSearch:{type:Boolean,default:!1},preselectFirst:{type:Boolean,default:!1},preventAutofocus:{type:Boolean,default:!1}},mounted(){!this.multiple&&this.max&&console.warn("[Vue-Multiselect warn]: Max prop should not be used when prop Multiple equals false."),this.preselectFirst&&!this.internalValue.length&&this.options.length&&this.select(this.filteredOptions[0])},computed:{internalValue(){return this.modelValue||this.modelValue===0?Array.isArray(this.modelValue)?this.modelValue:[this.modelValue]:[]},filteredOptions(){const e=this.search||"",t=e.toLowerCase().trim();let n=this.options.concat();return this.internalSearch?n=this.groupValues?this.filterAndFlat(n,t,this.label):su(n,t,this.label,this.customLabel):n=this.groupValues?Eo(this.groupValues,this.groupLabel)(n):n,n=this.hideSelected?n.filter(op(this.isSelected)):n,this.taggable&&t.length&&!this.isExistingOption(t)&&(this.tagPosition==="bottom"?n.push({isTag:!0,label:e}):n.unshift({isTag:!0,label:e})),n.slice(0,this.optionsLimit)},valueKeys(){return this.trackBy?this.internalValue.map(e=>e[this.trackBy]):this.internalValue},optionKeys(){return(this.groupValues?this.flatAndStrip(this.options):this.options).map(t=>this.customLabel(t,this.label).toString().toLowerCase())},currentOptionLabel(){return this.multiple?this.searchable?"":this.placeholder:this.internalValue.length?this.getOptionLabel(this.internalValue[0]):this.searchable?"":this.placeholder}},watch:{internalValue:{handler(){this.resetAfter&&this.internalValue.length&&(this.search="",this.$emit("update:modelValue",this.multiple?[]:null))},deep:!0},search(){this.$emit("search-change",this.search)}},emits:["open","search-change","close","select","update:modelValue","remove","tag"],methods:{getValue(){return this.multiple?this.internalValue:this.internalValue.length===0?null:this.internalValue[0]},filterAndFlat(e,t,n){return Sl(ap(t,n,this.groupValues,this.groupLabel,this.customLabel),Eo(this.groupValues,this.groupLabel))(e)},flatAndStrip(e){return Sl(Eo(this.groupValues,this.groupLabel),lp)(e)},updateSearch(e){this.search=e},isExistingOption(e){return this.options?this.optionKeys.indexOf(e)>-1:!1},isSelected(e){const t=this.trackBy?e[this.trackBy]:e;return this.valueKeys.indexOf(t)>-1},isOptionDisabled(e){return!!e.$isDisabled},getOptionLabel(e){if(So(e))return"";if(e.isTag)return e.label;if(e.$isLabel)return e.$groupLabel;const t=this.customLabel(e,this.label);return So(t)?"":t},select(e,t){if(e.$isLabel&&this.groupSelect){this.selectGroup(e);return}if(!(this.blockKeys.indexOf(t)!==-1||this.disabled||e.$isDisabled||e.$isLabel)&&!(this.max&&this.multiple&&this.internalValue.length===this.max)&&!(t==="Tab"&&!this.pointerDirty)){if(e.isTag)this.$emit("tag",e.label,this.id),this.search="",this.closeOnSelect&&!this.multiple&&this.deactivate();else{if(this.isSelected(e)){t!=="Tab"&&this.removeElement(e);return}this.multiple?this.$emit("update:modelValue",this.internalValue.concat([e])):this.$emit("update:modelValue",e),this.$emit("select",e,this.id),this.clearOnSelect&&(this.search="")}this.closeOnSelect&&this.deactivate()}},selectGroup(e){const t=this.options.find(n=>n[this.groupLabel]===e.$groupLabel);if(t){if(this.wholeGroupSelected(t)){this.$emit("remove",t[this.groupValues],this.id);const n=this.internalValue.filter(i=>t[this.groupValues].indexOf(i)===-1);this.$emit("update:modelValue",n)}else{let n=t[this.groupValues].filter(i=>!(this.isOptionDisabled(i)||this.isSelected(i)));this.max&&n.splice(this.max-this.internalValue.length),this.$emit("select",n,this.id),this.$emit("update:modelValue",this.internalValue.concat(n))}this.closeOnSelect&&this.deactivate()}},wholeGroupSelected(e){return e[this.groupValues].every(t=>this.isSelected(t)||this.isOptionDisabled(t))},wholeGroupDisabled(e){return e[this.groupValues].every(this.isOptionDisabled)},removeElement(e,t=!0){if(this.disabled||e.$isDisabled)return;if(!this.allowEmpty&&this.internalValue.length<=1){this.deactivate();return}const n=typeof e=="object"?this.valueKeys.indexOf(e[this.trackBy]):this.valueKeys.indexOf(e);if(this.multiple){const i=this.internalValue.slice(0,n).concat(this.internalValue.slice(n+1));this.$emit("update:modelValue",i)}else this.$emit("update:modelValue",null);this.$emit("remove",e,this.id),this.closeOnSelect&&t&&this.deactivate()},removeLastElement(){this.blockKeys.indexOf("Delete")===-1&&this.search.length===0&&Array.isArray(this.internalValue)&&this.internalValue.length&&this.removeElement(this.internalValue[this.internalValue.length-1],!1)},activate(){this.isOpen||this.disabled||(this.adjustPosition(),this.groupValues&&this.pointer===0&&this.filteredOptions.length&&(this.pointer=1),this.isOpen=!0,this.searchable?(this.preserveSearch||(this.search=""),this.preventAutofocus||this.$nextTick(()=>this.$refs.search&&this.$refs.search.focus())):this.preventAutofocus||typeof this.$el<"u"&&this.$el.focus(),this.$emit("open",this.id))},deactivate(){this.isOpen&&(this.isOpen=!1,this.searchable?this.$refs.search!==null&&typeof this.$refs.search<"u"&&this.$refs.search.blur():typeof this.$el<"u"&&this.$el.blur(),this.preserveSearch||(this.search=""),this.$emit("close",this.getValue(),this.id))},toggle(){this.isOpen?this.deactivate():this.activate()},adjustPosition(){if(typeof window>"u")return;const e=this.$el.getBoundingClientRect().top,t=window.innerHeight-this.$el.getBoundingClientRect().bottom;t>this.maxHeight||t>e||this.openDirection==="below"||this.openDirection==="bottom"?(this.preferredOpenDirection="below",this.optimizedHeight=Math.min(t-40,this.maxHeight)):(this.preferredOpenDirection="above",this.optimizedHeight=Math.min(e-40,this.maxHeight))}}},cp={data(){return{pointer:0,pointerDirty:!1}},props:{showPointer:{type:Boolean,default:!0},optionHeight:{type:Number,default:40}},computed:{pointerPosition(){return this.pointer*this.optionHeight},visibleElements(){return this.optimizedHeight/this.optionHeight}},watch:{filteredOptions(){this.pointerAdjust()},isOpen(){this.pointerDirty=!1},pointer(){this.$refs.search&&this.$refs.search.setAttribute("aria-activedescendant",this.id+"-"+this.pointer.toString())}},methods:{optionHighlight(e,t){return{"multiselect__option--highlight":e===this.pointer&&this.showPointer,"multiselect__option--selected":this.isSelected(t)}},groupHighlight(e,t){if(!this.groupSelect)return["multiselect__option--disabled",{"multiselect__option--group":t.$isLabel}];const n=this.options.find(i=>i[this.groupLabel]===t.$groupLabel);return n&&!this.wholeGroupDisabled(n)?["multiselect__option--group",{"multiselect__option--highlight":e===this.pointer&&this.showPointer},{"multiselect__option--group-selected":this.wholeGroupSelected(n)}]:"multiselect__option--disabled"},addPointerElement({key:e}="Enter"){this.filteredOptions.length>0&&this.select(this.filteredOptions[this.pointer],e),this.pointerReset()},pointerForward(){this.pointer<this.filteredOptions.length-1&&(this.pointer++,this.$refs.list.scrollTop<=this.pointerPosition-(this.visibleElements-1)*this.optionHeight&&(this.$refs.list.scrollTop=this.pointerPosition-(this.visibleElements-1)*this.optionHeight),this.filteredOptions[this.pointer]&&this.filteredOptions[this.pointer].$isLabel&&!this.groupSelect&&this.pointerForward()),this.pointerDirty=!0},pointerBackward(){this.pointer>0?(this.pointer--,this.$refs.list.scrollTop>=this.pointerPosition&&(this.$refs.list.scrollTop=this.pointerPosition),this.filteredOptions[this.pointer]&&this.filteredOptions[this.pointer].$isLabel&&!this.groupSelect&&this.pointerBackward()):this.filteredOptions[this.pointer]&&this.filteredOptions[0].$isLabel&&!this.groupSelect&&this.pointerForward(),this.pointerDirty=!0},pointerReset(){this.closeOnSelect&&(this.pointer=0,this.$refs.list&&(this.$refs.list.scrollTop=0))},pointerAdjust(){this.pointer>=this.filteredOptions.length-1&&(this.pointer=this.filteredOptions.length?this.filteredOptions.length-1:0),this.filteredOptions.length>0&&this.filteredOptions[this.pointer].$isLabel&&!this.groupSelect&&this.pointerForward()},pointerSet(e){this.pointer=e,this.pointerDirty=!0}}},iu={name:"vue-multiselect",mixins:[up,cp],compatConfig:{MODE:3,ATTR_ENUMERATED_COERCION:!1},props:{name:{type:String,default:""},modelValue:{type:null,default(){return[]}},selectLabel:{type:String,default:"Press enter to select"},selectGroupLabel:{type:String,default:"Press enter to select group"},selectedLabel:{type:String,default:"Selected"},deselectLabel:{type:String,default:"Press enter to remove"},deselectGroupLabel:{type:String,default:"Press enter to deselect group"},showLabels:{type:Boolean,default:!0},limit:{type:Number,default:99999},maxHeight:{type:Number,default:300},limitText:{type:Function,default:e=>`and ${e} more`},loading:{type:Boolean,default:!1},disabled:{type:Boolean,default:!1},openDirection:{type:String,default:""},showNoOptions:{type:Boolean,default:!0},showNoResults:{type:Boolean,default:!0},tabindex:{type:Number,default:0}},computed:{hasOptionGroup(){return this.groupValues&&this.groupLabel&&this.groupSelect},isSingleLabelVisible(){return(this.singleValue||this.singleValue===0)&&(!this.isOpen||!this.searchable)&&!this.visibleValues.length},isPlaceholderVisible(){return!this.internalValue.length&&(!this.searchable||!this.isOpen)},visibleValues(){return this.multiple?this.internalValue.slice(0,this.limit):[]},singleValue(){return this.internalValue[0]},deselectLabelText(){return this.showLabels?this.deselectLabel:""},deselectGroupLabelText(){return this.showLabels?this.deselectGroupLabel:""},selectLabelText(){return this.showLabels?this.selectLabel:""},selectGroupLabelText(){return this.showLabels?this.selectGroupLabel:""},selectedLabelText(){return this.showLabels?this.selectedLabel:""},inputStyle(){return this.searchable||this.multiple&&this.modelValue&&this.modelValue.length?this.isOpen?{width:"100%"}:{width:"0",position:"absolute",padding:"0"}:""},contentStyle(){return this.options.length?{display:"inline-block"}:{display:"block"}},isAbove(){return this.openDirection==="above"||this.openDirection==="top"?!0:this.openDirection==="below"||this.openDirection==="bottom"?!1:this.preferredOpenDirection==="above"},showSearchInput(){return this.searchable&&(this.hasSingleSelectedSlot&&(this.visibleSingleValue||this.visibleSingleValue===0)?this.isOpen:!0)}}};const dp={ref:"tags",class:"multiselect__tags"},hp={class:"multiselect__tags-wrap"},fp={class:"multiselect__spinner"},pp={key:0},mp={class:"multiselect__option"},gp={class:"multiselect__option"},yp=qn("No elements found. Consider changing the search query."),bp={class:"multiselect__option"},vp=qn("List is empty.");function _p(e,t,n,i,o,r){return he(),It("div",{tabindex:e.searchable?-1:n.tabindex,class:[{"multiselect--active":e.isOpen,"multiselect--disabled":n.disabled,"multiselect--above":r.isAbove,"multiselect--has-options-group":r.hasOptionGroup},"multiselect"],onFocus:t[14]||(t[14]=u=>e.activate()),onBlur:t[15]||(t[15]=u=>e.searchable?!1:e.deactivate()),onKeydown:[t[16]||(t[16]=Ht(dt(u=>e.pointerForward(),["self","prevent"]),["down"])),t[17]||(t[17]=Ht(dt(u=>e.pointerBackward(),["self","prevent"]),["up"]))],onKeypress:t[18]||(t[18]=Ht(dt(u=>e.addPointerElement(u),["stop","self"]),["enter","tab"])),onKeyup:t[19]||(t[19]=Ht(u=>e.deactivate(),["esc"])),role:"combobox","aria-owns":"listbox-"+e.id},[zt(e.$slots,"caret",{toggle:e.toggle},()=>[Xe("div",{onMousedown:t[1]||(t[1]=dt(u=>e.toggle(),["prevent","stop"])),class:"multiselect__select"},null,32)]),zt(e.$slots,"clear",{search:e.search}),Xe("div",dp,[zt(e.$slots,"selection",{search:e.search,remove:e.removeElement,values:r.visibleValues,isOpen:e.isOpen},()=>[wn(Xe("div",hp,[(he(!0),It(ht,null,rn(r.visibleValues,(u,d)=>zt(e.$slots,"tag",{option:u,search:e.search,remove:e.removeElement},()=>[(he(),It("span",{class:"multiselect__tag",key:d},[Xe("span",{textContent:it(e.getOptionLabel(u))},null,8,["textContent"]),Xe("i",{tabindex:"1",onKeypress:Ht(dt(f=>e.removeElement(u),["prevent"]),["enter"]),onMousedown:dt(f=>e.removeElement(u),["prevent"]),class:"multiselect__tag-icon"},null,40,["onKeypress","onMousedown"])]))])),256))],512),[[Ds,r.visibleValues.length>0]]),e.internalValue&&e.internalValue.length>n.limit?zt(e.$slots,"limit",{key:0},()=>[Xe("strong",{class:"multiselect__strong",textContent:it(n.limitText(e.internalValue.length-n.limit))},null,8,["textContent"])]):Pt("v-if",!0)]),Xe(Bi,{name:"multiselect__loading"},{default:Ti(()=>[zt(e.$slots,"loading",{},()=>[wn(Xe("div",fp,null,512),[[Ds,n.loading]])])]),_:3}),e.searchable?(he(),It("input",{key:0,ref:"search",name:n.name,id:e.id,type:"text",autocomplete:"off",spellcheck:!1,placeholder:e.placeholder,style:r.inputStyle,value:e.search,disabled:n.disabled,tabindex:n.tabindex,onInput:t[2]||(t[2]=u=>e.updateSearch(u.target.value)),onFocus:t[3]||(t[3]=dt(u=>e.activate(),["prevent"])),onBlur:t[4]||(t[4]=dt(u=>e.deactivate(),["prevent"])),onKeyup:t[5]||(t[5]=Ht(u=>e.deactivate(),["esc"])),onKeydown:[t[6]||(t[6]=Ht(dt(u=>e.pointerForward(),["prevent"]),["down"])),t[7]||(t[7]=Ht(dt(u=>e.pointerBackward(),["prevent"]),["up"])),t[9]||(t[9]=Ht(dt(u=>e.removeLastElement(),["stop"]),["delete"]))],onKeypress:t[8]||(t[8]=Ht(dt(u=>e.addPointerElement(u),["prevent","stop","self"]),["enter"])),class:"multiselect__input","aria-controls":"listbox-"+e.id},null,44,["name","id","placeholder","value","disabled","tabindex","aria-controls"])):Pt("v-if",!0),r.isSingleLabelVisible?(he(),It("span",{key:1,class:"multiselect__single",onMousedown:t[10]||(t[10]=dt((...u)=>e.toggle&&e.toggle(...u),["prevent"]))},[zt(e.$slots,"singleLabel",{option:r.singleValue},()=>[qn(it(e.currentOptionLabel),1)])],32)):Pt("v-if",!0),r.isPlaceholderVisible?(he(),It("span",{key:2,class:"multiselect__placeholder",onMousedown:t[11]||(t[11]=dt((...u)=>e.toggle&&e.toggle(...u),["prevent"]))},[zt(e.$slots,"placeholder",{},()=>[qn(it(e.placeholder),1)])],32)):Pt("v-if",!0)],512),Xe(Bi,{name:"multiselect"},{default:Ti(()=>[wn(Xe("div",{class:"multiselect__content-wrapper",onFocus:t[12]||(t[12]=(...u)=>e.activate&&e.activate(...u)),tabindex:"-1",onMousedown:t[13]||(t[13]=dt(()=>{},["prevent"])),style:{maxHeight:e.optimizedHeight+"px"},ref:"list"},[Xe("ul",{class:"multiselect__content",style:r.contentStyle,role:"listbox",id:"listbox-"+e.id},[zt(e.$slots,"beforeList"),e.multiple&&e.max===e.internalValue.length?(he(),It("li",pp,[Xe("span",mp,[zt(e.$slots,"maxElements",{},()=>[qn("Maximum of "+it(e.max)+" options selected. First remove a selected option to select another.",1)])])])):Pt("v-if",!0),!e.max||e.internalValue.length<e.max?(he(!0),It(ht,{key:1},rn(e.filteredOptions,(u,d)=>(he(),It("li",{class:"multiselect__element",key:d,id:e.id+"-"+d,role:u&&(u.$isLabel||u.$isDisabled)?null:"option"},[u&&(u.$isLabel||u.$isDisabled)?Pt("v-if",!0):(he(),It("span",{key:0,class:[e.optionHighlight(d,u),"multiselect__option"],onClick:dt(f=>e.select(u),["stop"]),onMouseenter:dt(f=>e.pointerSet(d),["self"]),"data-select":u&&u.isTag?e.tagPlaceholder:r.selectLabelText,"data-selected":r.selectedLabelText,"data-deselect":r.deselectLabelText},[zt(e.$slots,"option",{option:u,search:e.search,index:d},()=>[Xe("span",null,it(e.getOptionLabel(u)),1)])],42,["onClick","onMouseenter","data-select","data-selected","data-deselect"])),u&&(u.$isLabel||u.$isDisabled)?(he(),It("span",{key:1,"data-select":e.groupSelect&&r.selectGroupLabelText,"data-deselect":e.groupSelect&&r.deselectGroupLabelText,class:[e.groupHighlight(d,u),"multiselect__option"],onMouseenter:dt(f=>e.groupSelect&&e.pointerSet(d),["self"]),onMousedown:dt(f=>e.selectGroup(u),["prevent"])},[zt(e.$slots,"option",{option:u,search:e.search,index:d},()=>[Xe("span",null,it(e.getOptionLabel(u)),1)])],42,["data-select","data-deselect","onMouseenter","onMousedown"])):Pt("v-if",!0)],8,["id","role"]))),128)):Pt("v-if",!0),wn(Xe("li",null,[Xe("span",gp,[zt(e.$slots,"noResult",{search:e.search},()=>[yp])])],512),[[Ds,n.showNoResults&&e.filteredOptions.length===0&&e.search&&!n.loading]]),wn(Xe("li",null,[Xe("span",bp,[zt(e.$slots,"noOptions",{},()=>[vp])])],512),[[Ds,n.showNoOptions&&(e.options.length===0||r.hasOptionGroup===!0&&e.filteredOptions.length===0)&&!e.search&&!n.loading]]),zt(e.$slots,"afterList")],12,["id"])],36),[[Ds,e.isOpen]])]),_:3})],42,["tabindex","aria-owns"])}iu.render=_p;function ou(e,t){let n=e.getBoundingClientRect(),i=10;return n.y+n.height+t+i}let Sp=jt({components:{VueMultiselect:iu},props:{name:{type:String,required:!0}},emits:["submit","makeBigger","makeSmaller"],computed:{choices(){return Te[De(this.name,"choices")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]},text(){return Te[De(this.name,"text")]},inputWidth(){return Ja(this.selected).toString()+"px"},isFocused(){return this.innerSelectFocused||this.outerDivFocused}},watch:{defaultSelected:{handler(e){this.selected=e},immediate:!0},selected:{handler(e){this.selected=e;let t=De(this.name,"selected");Te[t]=this.selected},immediate:!0}},data(){return{reactiveStore:Te,selected:"",outerDivFocused:!1,innerSelectFocused:!1}},methods:{spacePressed(){let e=this.$refs.multiselect;this.outerDivFocused&&(this.selected=e.filteredOptions[e.pointer],e.deactivate(),this.outerDivFocused=!1,setTimeout(e.activate,5))},onClose(){this.outerDivFocused=!1,this.innerSelectFocused=!1,this.$emit("makeSmaller",this.name)},onOpen(){let e=this.computeRequiredDropdownHeight(),t=this.$refs.text,n=ou(t,e);this.innerSelectFocused=!0,this.$emit("makeBigger",n,this.name)},computeRequiredDropdownHeight(){let e=this.$refs.multiselect,t=this.choices.length*e.optionHeight,n=e.optimizedHeight;return n>t&&(n=t),n},switchFocusToOuterDiv(){this.innerSelectFocused=!1;let e=this.$refs.content_wrapper;e!==void 0&&this.$nextTick(()=>{e.focus()})},onSelect(){this.innerSelectFocused=!1,this.outerDivFocused=!0,this.switchFocusToOuterDiv()},onRemove(e,t){this.innerSelectFocused=!1;let n=this.$refs.multiselect;this.$nextTick(()=>{n.select(e)})},arrowUp(){let e=this.$refs.multiselect;if(e===void 0){console.log("multiselectref undefined");return}let t=e.filteredOptions.length;e.pointer==0?e.pointer=t-1:e.pointer-=1,e.select(e.filteredOptions[e.pointer])},arrowDown(){let e=this.$refs.multiselect;if(e===void 0){console.log("multiselectRef Undefined");return}let t=e.filteredOptions.length;e.pointer==t-1?e.pointer=0:e.pointer+=1,e.select(e.filteredOptions[e.pointer])}}}),Ep="choices";function wp(e,t){let n={choices:"choices",selected:"defaultSelected",text:"text"};if(fs(t,Object.keys(n)),t.choices.length===0)throw RangeError("Choices cannot be of zero length");return oi(e,t,n)}function xp(e,t,n,i,o,r){const u=Ms("VueMultiselect");return he(),Ae("div",{class:kn({"sample-selector":!0,wrapElement:!0,focused:e.isFocused,"multi-select-wrapper":!0}),onFocus:t[1]||(t[1]=d=>e.outerDivFocused=!0),onBlur:t[2]||(t[2]=d=>e.outerDivFocused=!1),ref:"content_wrapper",tabindex:"0",onKeydown:[t[3]||(t[3]=Ht(dt((...d)=>e.arrowDown&&e.arrowDown(...d),["self","prevent"]),["down"])),t[4]||(t[4]=Ht(dt((...d)=>e.arrowUp&&e.arrowUp(...d),["self","prevent"]),["up"])),t[5]||(t[5]=Ht(dt((...d)=>e.spacePressed&&e.spacePressed(...d),["self"]),["space"]))]},[Fe("span",{class:"multi-select-inline multi-select-text",ref:"text"},it(e.text),513),Xe(u,{ref:"multiselect",onOpen:e.onOpen,onSelect:e.onSelect,onRemove:e.onRemove,onClose:e.onClose,class:"multi-select-inline",modelValue:e.selected,"onUpdate:modelValue":t[0]||(t[0]=d=>e.selected=d),options:e.choices,placeholder:e.selected,deselectLabel:"",selectLabel:"",openDirection:"bottom","close-on-select":!0,tabindex:-1},null,8,["onOpen","onSelect","onRemove","onClose","modelValue","options","placeholder"])],34)}const ru=Kt(Sp,[["render",xp],["__scopeId","data-v-8ca66913"]]);let kp=jt({props:{name:{type:String,required:!0}},computed:{text(){return Te[De(this.name,"text")]},defaultSelected(){return Te[De(this.name,"defaultSelected")]}},data(){return{selected:!1,isFocused:!1}},watch:{selected:{handler(e){let t=De(this.name,"selected");Te[t]=e},immediate:!0},defaultSelected:{handler(e){this.selected=e},immediate:!0}}}),Op="check_box";function Cp(e,t){let n={text:"text",selected:"defaultSelected"};return fs(t,Object.keys(n)),oi(e,t,n)}const Mp={class:"checkbox-text"};function Lp(e,t,n,i,o,r){return he(),Ae("div",{class:kn({wrapElement:!0,focused:e.isFocused,"checkbox-wrapper":!0})},[Fe("span",Mp,it(e.text),1),wn(Fe("input",{type:"checkbox","onUpdate:modelValue":t[0]||(t[0]=u=>e.selected=u),onFocus:t[1]||(t[1]=u=>e.isFocused=!0),onBlur:t[2]||(t[2]=u=>e.isFocused=!1)},null,544),[[$d,e.selected]])],2)}const lu=Kt(kp,[["render",Lp],["__scopeId","data-v-a46bb2a3"]]);let Ip=jt({data(){return{selected:""}},props:{name:{type:String,required:!0}},computed:{buttonText(){return Te[De(this.name,"buttonText")]},placeholderText(){return Te[De(this.name,"placeholderText")]},textInputFromBackend(){return Te[De(this.name,"valueFromBackend")]},blankAfterTextSend(){return Te[De(this.name,"blankAfterTextSend")]},randomNumber(){return Te[De(this.name,"randomNumber")]}},methods:{submit(e){let n=this.$refs.textarea.form;if(n==null){this.selected="TEXTAREA.FORM is NULL";return}if(!n.requestSubmit)throw this.selected="UNSUPPORTED BROWSER VERSION!",Error("not supported browser");n.requestSubmit()},addNewLine(){this.selected+=`
+`}},watch:{textInputFromBackend:{handler(e){this.selected=e},immediate:!0},randomNumber:{handler(e){this.blankAfterTextSend&&(this.selected=this.textInputFromBackend)},immediate:!0},selected:{handler(e){let t=De(this.name,"selected");Te[t]=e},immediate:!0}}});function Pp(e,t){let n={placeholder_text:"placeholderText",selected:"valueFromBackend",blank_after_text_send:"blankAfterTextSend",version:"randomNumber"};return fs(t,Object.keys(n)),oi(e,t,n)}let Ap="text_input";const Tp=["placeholder"];function Rp(e,t,n,i,o,r){return wn((he(),Ae("textarea",{ref:"textarea",placeholder:e.placeholderText,"onUpdate:modelValue":t[0]||(t[0]=u=>e.selected=u),onKeydown:[t[1]||(t[1]=Ht(dt((...u)=>e.submit&&e.submit(...u),["exact","prevent"]),["enter"])),t[2]||(t[2]=Ht(dt((...u)=>e.addNewLine&&e.addNewLine(...u),["shift","exact","prevent"]),["enter"]))]},null,40,Tp)),[[Aa,e.selected]])}const au=Kt(Ip,[["render",Rp],["__scopeId","data-v-76713692"]]);let $p=jt({props:{name:{type:String,required:!0}},computed:{subElementConfigurationsFE(){return Te[De(this.name,"subElementConfigs")]},callbackAddress(){return Te[De(this.name,"address")]},buttonText(){return Te[De(this.name,"buttonText")]},buttonDisabled(){return Te[De(this.name,"disabled")]},reloadPage(){return Te[De(this.name,"reloadPage")]}},inject:["backendAddress"],emits:["makeBigger","makeSmaller","reloadPage"],data(){return{selectSamplePoll:void 0,loadingInProgress:!1,loadingBarId:""}},unmounted(){var e;(e=this.selectSamplePoll)==null||e.clear()},created(){this.loadingBarId=`${this.name}>loadingBar`},components:{MinMaxSubElement:tu,ChoicesSubElement:ru,CheckBoxSubElement:lu,TextInputSubElement:au,HorizontalMultiRadioSubElement:nu,DesignLoading:Gf},methods:{submit(){let e={};for(let n in Object.keys(this.subElementConfigurationsFE)){let i=this.subElementConfigurationsFE[n],o=De(i.name,"selected"),r=qh(i.name),u=Te[o];e[r]=u}this.loadingInProgress=!0;let t=this.$refs.button;this.onMakeBigger(ou(t,36),this.loadingBarId),Ya.startPoll(this,"selectSamplePoll",`${this.backendAddress}/${this.callbackAddress}`,this.setContexts.bind(this),e)},setContexts(e){if(this.reloadPage){this.$emit("reloadPage",e);return}this.$elementRegistry.retrieveElementsFromResponse(e,Te),this.loadingInProgress&&this.onMakeSmaller(this.loadingBarId),this.loadingInProgress=!1},getComponent(e){return Li[e].component},onMakeBigger(e,t){this.$emit("makeBigger",e,t)},onMakeSmaller(e){this.$emit("makeSmaller",e)}}});function js(e){return Object.keys(e)[0]}let Li={[Uf]:{process:Kf,component:js({MinMaxSubElement:tu})},[Ep]:{process:wp,component:js({ChoicesSubElement:ru})},[Op]:{process:Cp,component:js({CheckBoxSubElement:lu})},[Ap]:{process:Pp,component:js({TextInputSubElement:au})},[Jf]:{process:ep,component:js({HorizontalMultiRadioSubElement:nu})}};class Vp extends Yh{constructor(){super(...arguments);Yt(this,"subelement_configs");Yt(this,"address");Yt(this,"button_text");Yt(this,"disabled");Yt(this,"reload_page")}}function Np(e){e.registeredElements.button={component:"Selector",process:Bp}}function Bp(e){fs(e,Object.keys(Vp));let t={address:e.address,buttonText:e.button_text,disabled:e.disabled,reloadPage:e.reload_page,subElementConfigs:[]};for(let n of e.subelement_configs){if(!(n.subtype in Li))throw RangeError(`Wrong subtype: ${n.subtype} not in ${Object.keys(Li)}`);t.subElementConfigs.push({name:De(n.parent_name,n.name),subtype:n.subtype});let o=Li[n.subtype].process(n.name,n.configuration);for(let[r,u]of Za(o))t[r]=u}return t}const Fp={class:"subSelectorsWrapper"},Dp={class:"buttonWrapper"},Hp=["disabled"];function Wp(e,t,n,i,o,r){const u=Ms("DesignLoading");return he(),Ae("form",{class:"wrapElement",onSubmit:t[0]||(t[0]=dt((...d)=>e.submit&&e.submit(...d),["prevent"])),onKeypress:t[1]||(t[1]=Ht((...d)=>e.submit&&e.submit(...d),["enter"]))},[Fe("div",Fp,[(he(!0),Ae(ht,null,rn(e.subElementConfigurationsFE,d=>(he(),It(tr(e.getComponent(d.subtype)),{name:d.name,onMakeBigger:e.onMakeBigger,onMakeSmaller:e.onMakeSmaller},null,40,["name","onMakeBigger","onMakeSmaller"]))),256))]),Fe("div",Dp,[Fe("button",{class:"button",disabled:e.buttonDisabled||e.loadingInProgress,type:"submit",ref:"button"},it(e.buttonText),9,Hp),e.loadingInProgress?(he(),It(u,{key:0,class:"loading-indicator"})):Pt("",!0)])],32)}const uu=Kt($p,[["render",Wp],["__scopeId","data-v-ae1c642d"]]);var jp=typeof globalThis<"u"?globalThis:typeof window<"u"?window:typeof global<"u"?global:typeof self<"u"?self:{};function Gp(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var cu={exports:{}};/*! LeaderLine v1.1.5 (c) anseki https://anseki.github.io/leader-line/ */(function(e,t){var n=function(){var i,o,r,u,d,f,b,g,E,M,q,ce,me,ke,ye,Ce,Le,We,Ue,Re,St,Ve,at,Ne="leader-line",ot=1,ge=2,Ke=3,bt=4,qt={top:ot,right:ge,bottom:Ke,left:bt},Et=1,nt=2,Ze=3,Jt=4,dn=5,en={straight:Et,arc:nt,fluid:Ze,magnet:Jt,grid:dn},vt="behind",Rn=Ne+"-defs",$n='<svg xmlns="http://www.w3.org/2000/svg" version="1.1" id="leader-line-defs"><style><![CDATA[.leader-line{position:absolute;overflow:visible!important;pointer-events:none!important;font-size:16px}#leader-line-defs{width:0;height:0;position:absolute;left:0;top:0}.leader-line-line-path{fill:none}.leader-line-mask-bg-rect{fill:#fff}.leader-line-caps-mask-anchor,.leader-line-caps-mask-marker-shape{fill:#000}.leader-line-caps-mask-anchor{stroke:#000}.leader-line-caps-mask-line,.leader-line-plugs-face{stroke:transparent}.leader-line-line-mask-shape{stroke:#fff}.leader-line-line-outline-mask-shape{stroke:#000}.leader-line-plug-mask-shape{fill:#fff;stroke:#000}.leader-line-plug-outline-mask-shape{fill:#000;stroke:#fff}.leader-line-areaAnchor{position:absolute;overflow:visible!important}]]></style><defs><circle id="leader-line-disc" cx="0" cy="0" r="5"/><rect id="leader-line-square" x="-5" y="-5" width="10" height="10"/><polygon id="leader-line-arrow1" points="-8,-8 8,0 -8,8 -5,0"/><polygon id="leader-line-arrow2" points="-4,-8 4,0 -4,8 -7,5 -2,0 -7,-5"/><polygon id="leader-line-arrow3" points="-4,-5 8,0 -4,5"/><g id="leader-line-hand"><path style="fill: #fcfcfc" d="M9.19 11.14h4.75c1.38 0 2.49-1.11 2.49-2.49 0-.51-.15-.98-.41-1.37h1.3c1.38 0 2.49-1.11 2.49-2.49s-1.11-2.53-2.49-2.53h1.02c1.38 0 2.49-1.11 2.49-2.49s-1.11-2.49-2.49-2.49h14.96c1.37 0 2.49-1.11 2.49-2.49s-1.11-2.49-2.49-2.49H16.58C16-9.86 14.28-11.14 9.7-11.14c-4.79 0-6.55 3.42-7.87 4.73H-2.14v13.23h3.68C3.29 9.97 5.47 11.14 9.19 11.14L9.19 11.14Z"/><path style="fill: black" d="M13.95 12c1.85 0 3.35-1.5 3.35-3.35 0-.17-.02-.34-.04-.51h.07c1.85 0 3.35-1.5 3.35-3.35 0-.79-.27-1.51-.72-2.08 1.03-.57 1.74-1.67 1.74-2.93 0-.59-.16-1.15-.43-1.63h12.04c1.85 0 3.35-1.5 3.35-3.35 0-1.85-1.5-3.35-3.35-3.35H17.2C16.26-10.93 13.91-12 9.7-12 5.36-12 3.22-9.4 1.94-7.84c0 0-.29.33-.5.57-.63 0-3.58 0-3.58 0C-2.61-7.27-3-6.88-3-6.41v13.23c0 .47.39.86.86.86 0 0 2.48 0 3.2 0C2.9 10.73 5.29 12 9.19 12L13.95 12ZM9.19 10.28c-3.46 0-5.33-1.05-6.9-3.87-.15-.27-.44-.44-.75-.44 0 0-1.81 0-2.82 0V-5.55c1.06 0 3.11 0 3.11 0 .25 0 .44-.06.61-.25l.83-.95c1.23-1.49 2.91-3.53 6.43-3.53 3.45 0 4.9.74 5.57 1.72h-4.3c-.48 0-.86.38-.86.86s.39.86.86.86h22.34c.9 0 1.63.73 1.63 1.63 0 .9-.73 1.63-1.63 1.63H15.83c-.48 0-.86.38-.86.86 0 .47.39.86.86.86h2.52c.9 0 1.63.73 1.63 1.63s-.73 1.63-1.63 1.63h-3.12c-.48 0-.86.38-.86.86 0 .47.39.86.86.86h2.11c.88 0 1.63.76 1.63 1.67 0 .9-.73 1.63-1.63 1.63h-3.2c-.48 0-.86.39-.86.86 0 .47.39.86.86.86h1.36c.05.16.09.34.09.51 0 .9-.73 1.63-1.63 1.63C13.95 10.28 9.19 10.28 9.19 10.28Z"/></g><g id="leader-line-crosshair"><path d="M0-78.97c-43.54 0-78.97 35.43-78.97 78.97 0 43.54 35.43 78.97 78.97 78.97s78.97-35.43 78.97-78.97C78.97-43.54 43.55-78.97 0-78.97ZM76.51-1.21h-9.91v-9.11h-2.43v9.11h-11.45c-.64-28.12-23.38-50.86-51.5-51.5V-64.17h9.11V-66.6h-9.11v-9.91C42.46-75.86 75.86-42.45 76.51-1.21ZM-1.21-30.76h-9.11v2.43h9.11V-4.2c-1.44.42-2.57 1.54-2.98 2.98H-28.33v-9.11h-2.43v9.11H-50.29C-49.65-28-27.99-49.65-1.21-50.29V-30.76ZM-30.76 1.21v9.11h2.43v-9.11H-4.2c.42 1.44 1.54 2.57 2.98 2.98v24.13h-9.11v2.43h9.11v19.53C-27.99 49.65-49.65 28-50.29 1.21H-30.76ZM1.22 30.75h9.11v-2.43h-9.11V4.2c1.44-.42 2.56-1.54 2.98-2.98h24.13v9.11h2.43v-9.11h19.53C49.65 28 28 49.65 1.22 50.29V30.75ZM30.76-1.21v-9.11h-2.43v9.11H4.2c-.42-1.44-1.54-2.56-2.98-2.98V-28.33h9.11v-2.43h-9.11V-50.29C28-49.65 49.65-28 50.29-1.21H30.76ZM-1.21-76.51v9.91h-9.11v2.43h9.11v11.45c-28.12.64-50.86 23.38-51.5 51.5H-64.17v-9.11H-66.6v9.11h-9.91C-75.86-42.45-42.45-75.86-1.21-76.51ZM-76.51 1.21h9.91v9.11h2.43v-9.11h11.45c.64 28.12 23.38 50.86 51.5 51.5v11.45h-9.11v2.43h9.11v9.91C-42.45 75.86-75.86 42.45-76.51 1.21ZM1.22 76.51v-9.91h9.11v-2.43h-9.11v-11.45c28.12-.64 50.86-23.38 51.5-51.5h11.45v9.11h2.43v-9.11h9.91C75.86 42.45 42.45 75.86 1.22 76.51Z"/><path d="M0 83.58-7.1 96 7.1 96Z"/><path d="M0-83.58 7.1-96-7.1-96"/><path d="M83.58 0 96 7.1 96-7.1Z"/><path d="M-83.58 0-96-7.1-96 7.1Z"/></g></defs></svg>',On={disc:{elmId:"leader-line-disc",noRotate:!0,bBox:{left:-5,top:-5,width:10,height:10,right:5,bottom:5},widthR:2.5,heightR:2.5,bCircle:5,sideLen:5,backLen:5,overhead:0,outlineBase:1,outlineMax:4},square:{elmId:"leader-line-square",noRotate:!0,bBox:{left:-5,top:-5,width:10,height:10,right:5,bottom:5},widthR:2.5,heightR:2.5,bCircle:5,sideLen:5,backLen:5,overhead:0,outlineBase:1,outlineMax:4},arrow1:{elmId:"leader-line-arrow1",bBox:{left:-8,top:-8,width:16,height:16,right:8,bottom:8},widthR:4,heightR:4,bCircle:8,sideLen:8,backLen:8,overhead:8,outlineBase:2,outlineMax:1.5},arrow2:{elmId:"leader-line-arrow2",bBox:{left:-7,top:-8,width:11,height:16,right:4,bottom:8},widthR:2.75,heightR:4,bCircle:8,sideLen:8,backLen:7,overhead:4,outlineBase:1,outlineMax:1.75},arrow3:{elmId:"leader-line-arrow3",bBox:{left:-4,top:-5,width:12,height:10,right:8,bottom:5},widthR:3,heightR:2.5,bCircle:8,sideLen:5,backLen:4,overhead:8,outlineBase:1,outlineMax:2.5},hand:{elmId:"leader-line-hand",bBox:{left:-3,top:-12,width:40,height:24,right:37,bottom:12},widthR:10,heightR:6,bCircle:37,sideLen:12,backLen:3,overhead:37},crosshair:{elmId:"leader-line-crosshair",noRotate:!0,bBox:{left:-96,top:-96,width:192,height:192,right:96,bottom:96},widthR:48,heightR:48,bCircle:96,sideLen:96,backLen:96,overhead:0}},Ct={behind:vt,disc:"disc",square:"square",arrow1:"arrow1",arrow2:"arrow2",arrow3:"arrow3",hand:"hand",crosshair:"crosshair"},G={disc:"disc",square:"square",arrow1:"arrow1",arrow2:"arrow2",arrow3:"arrow3",hand:"hand",crosshair:"crosshair"},fe=[ot,ge,Ke,bt],re="auto",Ee={x:"left",y:"top",width:"width",height:"height"},Je=80,ft=4,p=5,v=120,V=8,Y=3.75,W=10,Q=30,ae=.5522847,ne=.25*Math.PI,oe=/^\s*(\-?[\d\.]+)\s*(\%)?\s*$/,$="http://www.w3.org/2000/svg",de="-ms-scroll-limit"in document.documentElement.style&&"-ms-ime-align"in document.documentElement.style&&!window.navigator.msPointerEnabled,Se=!de&&!!document.uniqueID,we="MozAppearance"in document.documentElement.style,$e=!(de||we||!window.chrome||!window.CSS),Oe=!de&&!Se&&!we&&!$e&&!window.chrome&&"WebkitAppearance"in document.documentElement.style,st=Se||de?.2:.1,je={path:Ze,lineColor:"coral",lineSize:4,plugSE:[vt,"arrow1"],plugSizeSE:[1,1],lineOutlineEnabled:!1,lineOutlineColor:"indianred",lineOutlineSize:.25,plugOutlineEnabledSE:[!1,!1],plugOutlineSizeSE:[1,1]},ut=(St={}.toString,Ve={}.hasOwnProperty.toString,at=Ve.call(Object),function(s){var l,a;return s&&St.call(s)==="[object Object]"&&(!(l=Object.getPrototypeOf(s))||(a=l.hasOwnProperty("constructor")&&l.constructor)&&typeof a=="function"&&Ve.call(a)===at)}),pt=Number.isFinite||function(s){return typeof s=="number"&&window.isFinite(s)},gt=(ke={ease:[.25,.1,.25,1],linear:[0,0,1,1],"ease-in":[.42,0,1,1],"ease-out":[0,0,.58,1],"ease-in-out":[.42,0,.58,1]},ye=1e3/60/2,Ce=window.requestAnimationFrame||window.mozRequestAnimationFrame||window.webkitRequestAnimationFrame||window.msRequestAnimationFrame||function(s){setTimeout(s,ye)},Le=window.cancelAnimationFrame||window.mozCancelAnimationFrame||window.webkitCancelAnimationFrame||window.msCancelAnimationFrame||function(s){clearTimeout(s)},We=Number.isFinite||function(s){return typeof s=="number"&&window.isFinite(s)},Ue=[],Re=0,{add:function(s,l,a,c,h,y,x){var S,L,w,U,ee,T,O,D,I,B,N,H,K,A=++Re;function k(le,Z){return{value:s(Z),timeRatio:le,outputRatio:Z}}if(typeof h=="string"&&(h=ke[h]),s=s||function(){},a<ye)L=[k(0,0),k(1,1)];else{if(w=ye/a,L=[k(0,0)],h[0]===0&&h[1]===0&&h[2]===1&&h[3]===1)for(ee=w;ee<=1;ee+=w)L.push(k(ee,ee));else for(T=U=(ee=w)/10;T<=1;T+=U)K=H=N=B=I=void 0,B=(I=(D=T)*D)*D,K=3*(N=1-D)*I,ee<=(O={x:(H=N*N*3*D)*h[0]+K*h[2]+B,y:H*h[1]+K*h[3]+B}).x&&(L.push(k(O.x,O.y)),ee+=w);L.push(k(1,1))}return S={animId:A,frameCallback:l,duration:a,count:c,frames:L,reverse:!!y},Ue.push(S),x!==!1&&cr(S,x),A},remove:function(s){var l;Ue.some(function(a,c){return a.animId===s&&(l=c,!(a.framesStart=null))})&&Ue.splice(l,1)},start:function(s,l,a){Ue.some(function(c){return c.animId===s&&(c.reverse=!!l,cr(c,a),!0)})},stop:function(s,l){var a;return Ue.some(function(c){return c.animId===s&&(l?c.lastFrame!=null&&(a=c.frames[c.lastFrame].timeRatio):(a=(Date.now()-c.framesStart)/c.duration,c.reverse&&(a=1-a),a<0?a=0:1<a&&(a=1)),!(c.framesStart=null))}),a},validTiming:function(s){return typeof s=="string"?ke[s]:Array.isArray(s)&&[0,1,2,3].every(function(l){return We(s[l])&&0<=s[l]&&s[l]<=1})?[s[0],s[1],s[2],s[3]]:null}}),ri=function(s){s.SVGPathElement.prototype.getPathData&&s.SVGPathElement.prototype.setPathData||function(){function l(T){this._string=T,this._currentIndex=0,this._endIndex=this._string.length,this._prevCommand=null,this._skipOptionalSpaces()}var a={Z:"Z",M:"M",L:"L",C:"C",Q:"Q",A:"A",H:"H",V:"V",S:"S",T:"T",z:"Z",m:"m",l:"l",c:"c",q:"q",a:"a",h:"h",v:"v",s:"s",t:"t"},c=s.navigator.userAgent.indexOf("MSIE ")!==-1;l.prototype={parseSegment:function(){var T=this._string[this._currentIndex],O=a[T]?a[T]:null;if(O===null){if(this._prevCommand===null||(O=(T==="+"||T==="-"||T==="."||"0"<=T&&T<="9")&&this._prevCommand!=="Z"?this._prevCommand==="M"?"L":this._prevCommand==="m"?"l":this._prevCommand:null)===null)return null}else this._currentIndex+=1;var D=null,I=(this._prevCommand=O).toUpperCase();return I==="H"||I==="V"?D=[this._parseNumber()]:I==="M"||I==="L"||I==="T"?D=[this._parseNumber(),this._parseNumber()]:I==="S"||I==="Q"?D=[this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber()]:I==="C"?D=[this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseNumber()]:I==="A"?D=[this._parseNumber(),this._parseNumber(),this._parseNumber(),this._parseArcFlag(),this._parseArcFlag(),this._parseNumber(),this._parseNumber()]:I==="Z"&&(this._skipOptionalSpaces(),D=[]),D===null||0<=D.indexOf(null)?null:{type:O,values:D}},hasMoreData:function(){return this._currentIndex<this._endIndex},peekSegmentType:function(){var T=this._string[this._currentIndex];return a[T]?a[T]:null},initialCommandIsMoveTo:function(){if(!this.hasMoreData())return!0;var T=this.peekSegmentType();return T==="M"||T==="m"},_isCurrentSpace:function(){var T=this._string[this._currentIndex];return T<=" "&&(T===" "||T===`
 `||T==="	"||T==="\r"||T==="\f")},_skipOptionalSpaces:function(){for(;this._currentIndex<this._endIndex&&this._isCurrentSpace();)this._currentIndex+=1;return this._currentIndex<this._endIndex},_skipOptionalSpacesOrDelimiter:function(){return!(this._currentIndex<this._endIndex&&!this._isCurrentSpace()&&this._string[this._currentIndex]!==",")&&(this._skipOptionalSpaces()&&this._currentIndex<this._endIndex&&this._string[this._currentIndex]===","&&(this._currentIndex+=1,this._skipOptionalSpaces()),this._currentIndex<this._endIndex)},_parseNumber:function(){var T=0,O=0,D=1,I=0,B=1,N=1,H=this._currentIndex;if(this._skipOptionalSpaces(),this._currentIndex<this._endIndex&&this._string[this._currentIndex]==="+"?this._currentIndex+=1:this._currentIndex<this._endIndex&&this._string[this._currentIndex]==="-"&&(this._currentIndex+=1,B=-1),this._currentIndex===this._endIndex||(this._string[this._currentIndex]<"0"||"9"<this._string[this._currentIndex])&&this._string[this._currentIndex]!==".")return null;for(var K=this._currentIndex;this._currentIndex<this._endIndex&&"0"<=this._string[this._currentIndex]&&this._string[this._currentIndex]<="9";)this._currentIndex+=1;if(this._currentIndex!==K)for(var A=this._currentIndex-1,k=1;K<=A;)O+=k*(this._string[A]-"0"),--A,k*=10;if(this._currentIndex<this._endIndex&&this._string[this._currentIndex]==="."){if(this._currentIndex+=1,this._currentIndex>=this._endIndex||this._string[this._currentIndex]<"0"||"9"<this._string[this._currentIndex])return null;for(;this._currentIndex<this._endIndex&&"0"<=this._string[this._currentIndex]&&this._string[this._currentIndex]<="9";)D*=10,I+=(this._string.charAt(this._currentIndex)-"0")/D,this._currentIndex+=1}if(this._currentIndex!==H&&this._currentIndex+1<this._endIndex&&(this._string[this._currentIndex]==="e"||this._string[this._currentIndex]==="E")&&this._string[this._currentIndex+1]!=="x"&&this._string[this._currentIndex+1]!=="m"){if(this._currentIndex+=1,this._string[this._currentIndex]==="+"?this._currentIndex+=1:this._string[this._currentIndex]==="-"&&(this._currentIndex+=1,N=-1),this._currentIndex>=this._endIndex||this._string[this._currentIndex]<"0"||"9"<this._string[this._currentIndex])return null;for(;this._currentIndex<this._endIndex&&"0"<=this._string[this._currentIndex]&&this._string[this._currentIndex]<="9";)T*=10,T+=this._string[this._currentIndex]-"0",this._currentIndex+=1}var le=O+I;return le*=B,T&&(le*=Math.pow(10,N*T)),H===this._currentIndex?null:(this._skipOptionalSpacesOrDelimiter(),le)},_parseArcFlag:function(){if(this._currentIndex>=this._endIndex)return null;var T=null,O=this._string[this._currentIndex];if(this._currentIndex+=1,O==="0")T=0;else{if(O!=="1")return null;T=1}return this._skipOptionalSpacesOrDelimiter(),T}};function h(T){if(!T||T.length===0)return[];var O=new l(T),D=[];if(O.initialCommandIsMoveTo())for(;O.hasMoreData();){var I=O.parseSegment();if(I===null)break;D.push(I)}return D}function y(T){return T.map(function(O){return{type:O.type,values:Array.prototype.slice.call(O.values)}})}function x(T){var O=[],D=null,I=null,B=null,N=null,H=null,K=null,A=null;return T.forEach(function(k){var le,Z,ve,z,P,m,_,F,J,te,X,C,xe,ie,j;k.type==="M"?(ie=k.values[0],j=k.values[1],O.push({type:"M",values:[ie,j]}),N=K=ie,H=A=j):k.type==="C"?(ve=k.values[0],z=k.values[1],le=k.values[2],Z=k.values[3],ie=k.values[4],j=k.values[5],O.push({type:"C",values:[ve,z,le,Z,ie,j]}),I=le,B=Z,N=ie,H=j):k.type==="L"?(ie=k.values[0],j=k.values[1],O.push({type:"L",values:[ie,j]}),N=ie,H=j):k.type==="H"?(ie=k.values[0],O.push({type:"L",values:[ie,H]}),N=ie):k.type==="V"?(j=k.values[0],O.push({type:"L",values:[N,j]}),H=j):k.type==="S"?(le=k.values[0],Z=k.values[1],ie=k.values[2],j=k.values[3],m=D==="C"||D==="S"?(P=N+(N-I),H+(H-B)):(P=N,H),O.push({type:"C",values:[P,m,le,Z,ie,j]}),I=le,B=Z,N=ie,H=j):k.type==="T"?(ie=k.values[0],j=k.values[1],z=D==="Q"||D==="T"?(ve=N+(N-I),H+(H-B)):(ve=N,H),P=N+2*(ve-N)/3,m=H+2*(z-H)/3,_=ie+2*(ve-ie)/3,F=j+2*(z-j)/3,O.push({type:"C",values:[P,m,_,F,ie,j]}),I=ve,B=z,N=ie,H=j):k.type==="Q"?(ve=k.values[0],z=k.values[1],ie=k.values[2],j=k.values[3],P=N+2*(ve-N)/3,m=H+2*(z-H)/3,_=ie+2*(ve-ie)/3,F=j+2*(z-j)/3,O.push({type:"C",values:[P,m,_,F,ie,j]}),I=ve,B=z,N=ie,H=j):k.type==="A"?(J=k.values[0],te=k.values[1],X=k.values[2],C=k.values[3],xe=k.values[4],ie=k.values[5],j=k.values[6],J===0||te===0?(O.push({type:"C",values:[N,H,ie,j,ie,j]}),N=ie,H=j):N===ie&&H===j||ee(N,H,ie,j,J,te,X,C,xe).forEach(function(se){O.push({type:"C",values:se}),N=ie,H=j})):k.type==="Z"&&(O.push(k),N=K,H=A),D=k.type}),O}var S=s.SVGPathElement.prototype.setAttribute,L=s.SVGPathElement.prototype.removeAttribute,w=s.Symbol?s.Symbol():"__cachedPathData",U=s.Symbol?s.Symbol():"__cachedNormalizedPathData",ee=function(T,O,D,I,B,N,H,K,A,k){function le(yt,rt,xt){return{x:yt*Math.cos(xt)-rt*Math.sin(xt),y:yt*Math.sin(xt)+rt*Math.cos(xt)}}var Z,ve,z,P,m,_,F,J,te,X,C,xe,ie,j,se,Ge=(Z=H,Math.PI*Z/180),qe=[];k?(j=k[0],se=k[1],xe=k[2],ie=k[3]):(T=(ve=le(T,O,-Ge)).x,O=ve.y,1<(_=(P=(T-(D=(z=le(D,I,-Ge)).x))/2)*P/(B*B)+(m=(O-(I=z.y))/2)*m/(N*N))&&(B*=_=Math.sqrt(_),N*=_),te=(F=B*B)*(J=N*N)-F*m*m-J*P*P,X=F*m*m+J*P*P,xe=(C=(K===A?-1:1)*Math.sqrt(Math.abs(te/X)))*B*m/N+(T+D)/2,ie=C*-N*P/B+(O+I)/2,j=Math.asin(parseFloat(((O-ie)/N).toFixed(9))),se=Math.asin(parseFloat(((I-ie)/N).toFixed(9))),T<xe&&(j=Math.PI-j),D<xe&&(se=Math.PI-se),j<0&&(j=2*Math.PI+j),se<0&&(se=2*Math.PI+se),A&&se<j&&(j-=2*Math.PI),!A&&j<se&&(se-=2*Math.PI));var ze,ln,Be,be=se-j;Math.abs(be)>120*Math.PI/180&&(ze=se,ln=D,Be=I,se=A&&j<se?j+120*Math.PI/180*1:j+120*Math.PI/180*-1,D=xe+B*Math.cos(se),I=ie+N*Math.sin(se),qe=ee(D,I,ln,Be,B,N,H,0,A,[se,ze,xe,ie])),be=se-j;var et=Math.cos(j),pe=Math.sin(j),Ie=Math.cos(se),_e=Math.sin(se),kt=Math.tan(be/4),Ye=4/3*B*kt,Gt=4/3*N*kt,yn=[T,O],bn=[T+Ye*pe,O-Gt*et],Cn=[D+Ye*_e,I-Gt*Ie],ct=[D,I];if(bn[0]=2*yn[0]-bn[0],bn[1]=2*yn[1]-bn[1],k)return[bn,Cn,ct].concat(qe);qe=[bn,Cn,ct].concat(qe).join().split(",");var R=[],Pe=[];return qe.forEach(function(yt,rt){rt%2?Pe.push(le(qe[rt-1],qe[rt],Ge).y):Pe.push(le(qe[rt],qe[rt+1],Ge).x),Pe.length===6&&(R.push(Pe),Pe=[])}),R};s.SVGPathElement.prototype.setAttribute=function(T,O){T==="d"&&(this[w]=null,this[U]=null),S.call(this,T,O)},s.SVGPathElement.prototype.removeAttribute=function(T,O){T==="d"&&(this[w]=null,this[U]=null),L.call(this,T)},s.SVGPathElement.prototype.getPathData=function(T){if(T&&T.normalize){if(this[U])return y(this[U]);this[w]?K=y(this[w]):(K=h(this.getAttribute("d")||""),this[w]=y(K));var O=x((D=[],H=N=B=I=null,K.forEach(function(A){var k,le,Z,ve,z,P,m=A.type;m==="M"?(z=A.values[0],P=A.values[1],D.push({type:"M",values:[z,P]}),I=N=z,B=H=P):m==="m"?(z=I+A.values[0],P=B+A.values[1],D.push({type:"M",values:[z,P]}),I=N=z,B=H=P):m==="L"?(z=A.values[0],P=A.values[1],D.push({type:"L",values:[z,P]}),I=z,B=P):m==="l"?(z=I+A.values[0],P=B+A.values[1],D.push({type:"L",values:[z,P]}),I=z,B=P):m==="C"?(k=A.values[0],le=A.values[1],Z=A.values[2],ve=A.values[3],z=A.values[4],P=A.values[5],D.push({type:"C",values:[k,le,Z,ve,z,P]}),I=z,B=P):m==="c"?(k=I+A.values[0],le=B+A.values[1],Z=I+A.values[2],ve=B+A.values[3],z=I+A.values[4],P=B+A.values[5],D.push({type:"C",values:[k,le,Z,ve,z,P]}),I=z,B=P):m==="Q"?(k=A.values[0],le=A.values[1],z=A.values[2],P=A.values[3],D.push({type:"Q",values:[k,le,z,P]}),I=z,B=P):m==="q"?(k=I+A.values[0],le=B+A.values[1],z=I+A.values[2],P=B+A.values[3],D.push({type:"Q",values:[k,le,z,P]}),I=z,B=P):m==="A"?(z=A.values[5],P=A.values[6],D.push({type:"A",values:[A.values[0],A.values[1],A.values[2],A.values[3],A.values[4],z,P]}),I=z,B=P):m==="a"?(z=I+A.values[5],P=B+A.values[6],D.push({type:"A",values:[A.values[0],A.values[1],A.values[2],A.values[3],A.values[4],z,P]}),I=z,B=P):m==="H"?(z=A.values[0],D.push({type:"H",values:[z]}),I=z):m==="h"?(z=I+A.values[0],D.push({type:"H",values:[z]}),I=z):m==="V"?(P=A.values[0],D.push({type:"V",values:[P]}),B=P):m==="v"?(P=B+A.values[0],D.push({type:"V",values:[P]}),B=P):m==="S"?(Z=A.values[0],ve=A.values[1],z=A.values[2],P=A.values[3],D.push({type:"S",values:[Z,ve,z,P]}),I=z,B=P):m==="s"?(Z=I+A.values[0],ve=B+A.values[1],z=I+A.values[2],P=B+A.values[3],D.push({type:"S",values:[Z,ve,z,P]}),I=z,B=P):m==="T"?(z=A.values[0],P=A.values[1],D.push({type:"T",values:[z,P]}),I=z,B=P):m==="t"?(z=I+A.values[0],P=B+A.values[1],D.push({type:"T",values:[z,P]}),I=z,B=P):m!=="Z"&&m!=="z"||(D.push({type:"Z",values:[]}),I=N,B=H)}),D));return this[U]=y(O),O}if(this[w])return y(this[w]);var D,I,B,N,H,K=h(this.getAttribute("d")||"");return this[w]=y(K),K},s.SVGPathElement.prototype.setPathData=function(T){if(T.length===0)c?this.setAttribute("d",""):this.removeAttribute("d");else{for(var O="",D=0,I=T.length;D<I;D+=1){var B=T[D];0<D&&(O+=" "),O+=B.type,B.values&&0<B.values.length&&(O+=" "+B.values.join(" "))}this.setAttribute("d",O)}},s.SVGRectElement.prototype.getPathData=function(T){var O=this.x.baseVal.value,D=this.y.baseVal.value,I=this.width.baseVal.value,B=this.height.baseVal.value,N=this.hasAttribute("rx")?this.rx.baseVal.value:this.ry.baseVal.value,H=this.hasAttribute("ry")?this.ry.baseVal.value:this.rx.baseVal.value;I/2<N&&(N=I/2),B/2<H&&(H=B/2);var K=(K=[{type:"M",values:[O+N,D]},{type:"H",values:[O+I-N]},{type:"A",values:[N,H,0,0,1,O+I,D+H]},{type:"V",values:[D+B-H]},{type:"A",values:[N,H,0,0,1,O+I-N,D+B]},{type:"H",values:[O+N]},{type:"A",values:[N,H,0,0,1,O,D+B-H]},{type:"V",values:[D+H]},{type:"A",values:[N,H,0,0,1,O+N,D]},{type:"Z",values:[]}]).filter(function(A){return A.type!=="A"||A.values[0]!==0&&A.values[1]!==0});return T&&T.normalize===!0&&(K=x(K)),K},s.SVGCircleElement.prototype.getPathData=function(T){var O=this.cx.baseVal.value,D=this.cy.baseVal.value,I=this.r.baseVal.value,B=[{type:"M",values:[O+I,D]},{type:"A",values:[I,I,0,0,1,O,D+I]},{type:"A",values:[I,I,0,0,1,O-I,D]},{type:"A",values:[I,I,0,0,1,O,D-I]},{type:"A",values:[I,I,0,0,1,O+I,D]},{type:"Z",values:[]}];return T&&T.normalize===!0&&(B=x(B)),B},s.SVGEllipseElement.prototype.getPathData=function(T){var O=this.cx.baseVal.value,D=this.cy.baseVal.value,I=this.rx.baseVal.value,B=this.ry.baseVal.value,N=[{type:"M",values:[O+I,D]},{type:"A",values:[I,B,0,0,1,O,D+B]},{type:"A",values:[I,B,0,0,1,O-I,D]},{type:"A",values:[I,B,0,0,1,O,D-B]},{type:"A",values:[I,B,0,0,1,O+I,D]},{type:"Z",values:[]}];return T&&T.normalize===!0&&(N=x(N)),N},s.SVGLineElement.prototype.getPathData=function(){return[{type:"M",values:[this.x1.baseVal.value,this.y1.baseVal.value]},{type:"L",values:[this.x2.baseVal.value,this.y2.baseVal.value]}]},s.SVGPolylineElement.prototype.getPathData=function(){for(var T=[],O=0;O<this.points.numberOfItems;O+=1){var D=this.points.getItem(O);T.push({type:O===0?"M":"L",values:[D.x,D.y]})}return T},s.SVGPolygonElement.prototype.getPathData=function(){for(var T=[],O=0;O<this.points.numberOfItems;O+=1){var D=this.points.getItem(O);T.push({type:O===0?"M":"L",values:[D.x,D.y]})}return T.push({type:"Z",values:[]}),T}}()},Qn=(ce={},Ft.m=q=[function(s,l,a){a.r(l);var c=500,h=[],y=window.requestAnimationFrame||window.mozRequestAnimationFrame||window.webkitRequestAnimationFrame||window.msRequestAnimationFrame||function(T){return setTimeout(T,1e3/60)},x=window.cancelAnimationFrame||window.mozCancelAnimationFrame||window.webkitCancelAnimationFrame||window.msCancelAnimationFrame||function(T){return clearTimeout(T)},S=Date.now(),L=void 0;function w(){var T=void 0,O=void 0;L&&(x.call(window,L),L=null),h.forEach(function(D){var I;(I=D.event)&&(D.event=null,D.listener(I),T=!0)}),T?(S=Date.now(),O=!0):Date.now()-S<c&&(O=!0),O&&(L=y.call(window,w))}function U(T){var O=-1;return h.some(function(D,I){return D.listener===T&&(O=I,!0)}),O}var ee={add:function(T){var O=void 0;return U(T)===-1?(h.push(O={listener:T}),function(D){O.event=D,L||w()}):null},remove:function(T){var O;-1<(O=U(T))&&(h.splice(O,1),!h.length&&L&&(x.call(window,L),L=null))}};l.default=ee}],Ft.c=ce,Ft.d=function(s,l,a){Ft.o(s,l)||Object.defineProperty(s,l,{enumerable:!0,get:a})},Ft.r=function(s){typeof Symbol<"u"&&Symbol.toStringTag&&Object.defineProperty(s,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(s,"__esModule",{value:!0})},Ft.t=function(s,l){if(1&l&&(s=Ft(s)),8&l||4&l&&typeof s=="object"&&s&&s.__esModule)return s;var a=Object.create(null);if(Ft.r(a),Object.defineProperty(a,"default",{enumerable:!0,value:s}),2&l&&typeof s!="string")for(var c in s)Ft.d(a,c,(function(h){return s[h]}).bind(null,c));return a},Ft.n=function(s){var l=s&&s.__esModule?function(){return s.default}:function(){return s};return Ft.d(l,"a",l),l},Ft.o=function(s,l){return Object.prototype.hasOwnProperty.call(s,l)},Ft.p="",Ft(Ft.s=0).default),ms={line_altColor:{iniValue:!1},line_color:{},line_colorTra:{iniValue:!1},line_strokeWidth:{},plug_enabled:{iniValue:!1},plug_enabledSE:{hasSE:!0,iniValue:!1},plug_plugSE:{hasSE:!0,iniValue:vt},plug_colorSE:{hasSE:!0},plug_colorTraSE:{hasSE:!0,iniValue:!1},plug_markerWidthSE:{hasSE:!0},plug_markerHeightSE:{hasSE:!0},lineOutline_enabled:{iniValue:!1},lineOutline_color:{},lineOutline_colorTra:{iniValue:!1},lineOutline_strokeWidth:{},lineOutline_inStrokeWidth:{},plugOutline_enabledSE:{hasSE:!0,iniValue:!1},plugOutline_plugSE:{hasSE:!0,iniValue:vt},plugOutline_colorSE:{hasSE:!0},plugOutline_colorTraSE:{hasSE:!0,iniValue:!1},plugOutline_strokeWidthSE:{hasSE:!0},plugOutline_inStrokeWidthSE:{hasSE:!0},position_socketXYSE:{hasSE:!0,hasProps:!0},position_plugOverheadSE:{hasSE:!0},position_path:{},position_lineStrokeWidth:{},position_socketGravitySE:{hasSE:!0},path_pathData:{},path_edge:{hasProps:!0},viewBox_bBox:{hasProps:!0},viewBox_plugBCircleSE:{hasSE:!0},lineMask_enabled:{iniValue:!1},lineMask_outlineMode:{iniValue:!1},lineMask_x:{},lineMask_y:{},lineOutlineMask_x:{},lineOutlineMask_y:{},maskBGRect_x:{},maskBGRect_y:{},capsMaskAnchor_enabledSE:{hasSE:!0,iniValue:!1},capsMaskAnchor_pathDataSE:{hasSE:!0},capsMaskAnchor_strokeWidthSE:{hasSE:!0},capsMaskMarker_enabled:{iniValue:!1},capsMaskMarker_enabledSE:{hasSE:!0,iniValue:!1},capsMaskMarker_plugSE:{hasSE:!0,iniValue:vt},capsMaskMarker_markerWidthSE:{hasSE:!0},capsMaskMarker_markerHeightSE:{hasSE:!0},caps_enabled:{iniValue:!1},attach_plugSideLenSE:{hasSE:!0},attach_plugBackLenSE:{hasSE:!0}},Bt={show_on:{},show_effect:{},show_animOptions:{},show_animId:{},show_inAnim:{}},tn="fade",gs=[],Vt={},fu=0,Rt={},pu=0;function Ft(s){if(ce[s])return ce[s].exports;var l=ce[s]={i:s,l:!1,exports:{}};return q[s].call(l.exports,l,l.exports,Ft),l.l=!0,l.exports}function ur(){var s=Date.now(),l=!1;me&&(Le.call(window,me),me=null),Ue.forEach(function(a){var c,h,y;if(a.framesStart){if((c=s-a.framesStart)>=a.duration&&a.count&&a.loopsLeft<=1)return y=a.frames[a.lastFrame=a.reverse?0:a.frames.length-1],a.frameCallback(y.value,!0,y.timeRatio,y.outputRatio),void(a.framesStart=null);if(c>a.duration){if(h=Math.floor(c/a.duration),a.count){if(h>=a.loopsLeft)return y=a.frames[a.lastFrame=a.reverse?0:a.frames.length-1],a.frameCallback(y.value,!0,y.timeRatio,y.outputRatio),void(a.framesStart=null);a.loopsLeft-=h}a.framesStart+=a.duration*h,c=s-a.framesStart}a.reverse&&(c=a.duration-c),y=a.frames[a.lastFrame=Math.round(c/ye)],a.frameCallback(y.value,!1,y.timeRatio,y.outputRatio)!==!1?l=!0:a.framesStart=null}}),l&&(me=Ce.call(window,ur))}function cr(s,l){s.framesStart=Date.now(),l!=null&&(s.framesStart-=s.duration*(s.reverse?1-l:l)),s.loopsLeft=s.count,s.lastFrame=null,ur()}function Jn(s,l){var a,c;return typeof s!=typeof l||(a=ut(s)?"obj":Array.isArray(s)?"array":"")!=(ut(l)?"obj":Array.isArray(l)?"array":"")||(a==="obj"?Jn(c=Object.keys(s).sort(),Object.keys(l).sort())||c.some(function(h){return Jn(s[h],l[h])}):a==="array"?s.length!==l.length||s.some(function(h,y){return Jn(h,l[y])}):s!==l)}function Dt(s){return s&&(ut(s)?Object.keys(s).reduce(function(l,a){return l[a]=Dt(s[a]),l},{}):Array.isArray(s)?s.map(Dt):s)}function Ts(s){var l,a,c,h=1,y=s=(s+"").trim();function x(S){var L=1,w=oe.exec(S);return w&&(L=parseFloat(w[1]),w[2]?L=0<=L&&L<=100?L/100:1:(L<0||1<L)&&(L=1)),L}return(l=/^(rgba|hsla|hwb|gray|device\-cmyk)\s*\(([\s\S]+)\)$/i.exec(s))?(a=l[1].toLowerCase(),c=l[2].trim().split(/\s*,\s*/),a==="rgba"&&c.length===4?(h=x(c[3]),y="rgb("+c.slice(0,3).join(", ")+")"):a==="hsla"&&c.length===4?(h=x(c[3]),y="hsl("+c.slice(0,3).join(", ")+")"):a==="hwb"&&c.length===4?(h=x(c[3]),y="hwb("+c.slice(0,3).join(", ")+")"):a==="gray"&&c.length===2?(h=x(c[1]),y="gray("+c[0]+")"):a==="device-cmyk"&&5<=c.length&&(h=x(c[4]),y="device-cmyk("+c.slice(0,4).join(", ")+")")):(l=/^\#(?:([\da-f]{6})([\da-f]{2})|([\da-f]{3})([\da-f]))$/i.exec(s))?y=l[1]?(h=parseInt(l[2],16)/255,"#"+l[1]):(h=parseInt(l[4]+l[4],16)/255,"#"+l[3]):s.toLocaleLowerCase()==="transparent"&&(h=0),[h,y]}function Rs(s){return!(!s||s.nodeType!==Node.ELEMENT_NODE||typeof s.getBoundingClientRect!="function")}function li(s,l){var a,c,h,y,x={};if(!(h=s.ownerDocument))return console.error("Cannot get document that contains the element."),null;if(s.compareDocumentPosition(h)&Node.DOCUMENT_POSITION_DISCONNECTED)return console.error("A disconnected element was passed."),null;for(c in a=s.getBoundingClientRect())x[c]=a[c];if(!l){if(!(y=h.defaultView))return console.error("Cannot get window that contains the element."),null;x.left+=y.pageXOffset,x.right+=y.pageXOffset,x.top+=y.pageYOffset,x.bottom+=y.pageYOffset}return x}function so(s,l){var a,c,h=[],y=s;for(l=l||window;;){if(!(a=y.ownerDocument))return console.error("Cannot get document that contains the element."),null;if(!(c=a.defaultView))return console.error("Cannot get window that contains the element."),null;if(c===l)break;if(!(y=c.frameElement))return console.error("`baseWindow` was not found."),null;h.unshift(y)}return h}function $s(s,l){var a,c,h=0,y=0;return(c=so(s,l=l||window))?c.length?(c.forEach(function(x,S){var L,w,U=li(x,0<S);h+=U.left,y+=U.top,w=(L=x).ownerDocument.defaultView.getComputedStyle(L,""),U={left:L.clientLeft+parseFloat(w.paddingLeft),top:L.clientTop+parseFloat(w.paddingTop)},h+=U.left,y+=U.top}),(a=li(s,!0)).left+=h,a.right+=h,a.top+=y,a.bottom+=y,a):li(s):null}function hn(s,l){var a=s.x-l.x,c=s.y-l.y;return Math.sqrt(a*a+c*c)}function Vs(s,l,a){var c=l.x-s.x,h=l.y-s.y;return{x:s.x+c*a,y:s.y+h*a,angle:Math.atan2(h,c)/(Math.PI/180)}}function ai(s,l,a){var c=Math.atan2(s.y-l.y,l.x-s.x);return{x:l.x+Math.cos(c)*a,y:l.y+Math.sin(c)*a*-1}}function ys(s,l,a,c,h){var y=h*h,x=y*h,S=1-h,L=S*S,w=L*S,U=w*s.x+3*L*h*l.x+3*S*y*a.x+x*c.x,ee=w*s.y+3*L*h*l.y+3*S*y*a.y+x*c.y,T=s.x+2*h*(l.x-s.x)+y*(a.x-2*l.x+s.x),O=s.y+2*h*(l.y-s.y)+y*(a.y-2*l.y+s.y),D=l.x+2*h*(a.x-l.x)+y*(c.x-2*a.x+l.x),I=l.y+2*h*(a.y-l.y)+y*(c.y-2*a.y+l.y),B=S*s.x+h*l.x,N=S*s.y+h*l.y,H=S*a.x+h*c.x,K=S*a.y+h*c.y,A=90-180*Math.atan2(T-D,O-I)/Math.PI;return{x:U,y:ee,fromP2:{x:T,y:O},toP1:{x:D,y:I},fromP1:{x:B,y:N},toP2:{x:H,y:K},angle:A+=180<A?-180:180}}function Ns(s,l,a,c,h){function y(O,D,I,B,N){return O*(O*(-3*D+9*I-9*B+3*N)+6*D-12*I+6*B)-3*D+3*I}var x,S,L,w,U=[.2491,.2491,.2335,.2335,.2032,.2032,.1601,.1601,.1069,.1069,.0472,.0472],ee=0,T=(h=h==null||1<h?1:h<0?0:h)/2;return[-.1252,.1252,-.3678,.3678,-.5873,.5873,-.7699,.7699,-.9041,.9041,-.9816,.9816].forEach(function(O,D){S=y(x=T*O+T,s.x,l.x,a.x,c.x),L=y(x,s.y,l.y,a.y,c.y),w=S*S+L*L,ee+=U[D]*Math.sqrt(w)}),T*ee}function io(s,l,a,c,h){for(var y,x=.5,S=1-x;y=Ns(s,l,a,c,S),!(Math.abs(y-h)<=.01);)S+=(y<h?1:-1)*(x/=2);return S}function oo(s,l){var a;return s.forEach(function(c){var h=l?c.map(function(y){var x={x:y.x,y:y.y};return l(x),x}):c;(a=a||[{type:"M",values:[h[0].x,h[0].y]}]).push(h.length?h.length===2?{type:"L",values:[h[1].x,h[1].y]}:{type:"C",values:[h[1].x,h[1].y,h[2].x,h[2].y,h[3].x,h[3].y]}:{type:"Z",values:[]})}),a}function dr(s){var l=[],a=0;return s.forEach(function(c){var h=(c.length===2?hn:Ns).apply(null,c);l.push(h),a+=h}),{segsLen:l,lenAll:a}}function ui(s,l){return s==null||l==null||s.length!==l.length||s.some(function(a,c){var h=l[c];return a.type!==h.type||a.values.some(function(y,x){return y!==h.values[x]})})}function Mt(s,l,a){s.events[l]?s.events[l].indexOf(a)<0&&s.events[l].push(a):s.events[l]=[a]}function Lt(s,l,a){var c;s.events[l]&&-1<(c=s.events[l].indexOf(a))&&s.events[l].splice(c,1)}function bs(s){b&&clearTimeout(b),gs.push(s),b=setTimeout(function(){gs.forEach(function(l){l()}),gs=[]},0)}function wt(s,l){s.reflowTargets.indexOf(l)<0&&s.reflowTargets.push(l)}function hr(s){s.reflowTargets.forEach(function(l){var a;a=l,setTimeout(function(){var c=a.parentNode,h=a.nextSibling;c.insertBefore(c.removeChild(a),h)},0)}),s.reflowTargets=[]}function fr(s,l,a,c,h,y,x){var S,L,w;a==="auto-start-reverse"?(typeof g!="boolean"&&(l.setAttribute("orient","auto-start-reverse"),g=l.orientType.baseVal===SVGMarkerElement.SVG_MARKER_ORIENT_UNKNOWN),g?l.setAttribute("orient",a):((S=h.createSVGTransform()).setRotate(180,0,0),y.transform.baseVal.appendItem(S),l.setAttribute("orient","auto"),w=!0)):(l.setAttribute("orient",a),g===!1&&y.transform.baseVal.clear()),L=l.viewBox.baseVal,w?(L.x=-c.right,L.y=-c.bottom):(L.x=c.left,L.y=c.top),L.width=c.width,L.height=c.height,Se&&wt(s,x)}function pr(s,l){return{prop:s?"markerEnd":"markerStart",orient:l?l.noRotate?"0":s?"auto":"auto-start-reverse":null}}function $t(s,l){Object.keys(l).forEach(function(a){var c=l[a];s[a]=c.iniValue!=null?c.hasSE?[c.iniValue,c.iniValue]:c.iniValue:c.hasSE?c.hasProps?[{},{}]:[]:c.hasProps?{}:null})}function ue(s,l,a,c,h){return c!==l[a]&&(l[a]=c,h&&h.forEach(function(y){y(s,c,a)}),!0)}function mr(s){function l(x,S){return x+parseFloat(S)}var a=s.document,c=s.getComputedStyle(a.documentElement,""),h=s.getComputedStyle(a.body,""),y={x:0,y:0};return h.position!=="static"?(y.x-=[c.marginLeft,c.borderLeftWidth,c.paddingLeft,h.marginLeft,h.borderLeftWidth].reduce(l,0),y.y-=[c.marginTop,c.borderTopWidth,c.paddingTop,h.marginTop,h.borderTopWidth].reduce(l,0)):c.position!=="static"&&(y.x-=[c.marginLeft,c.borderLeftWidth].reduce(l,0),y.y-=[c.marginTop,c.borderTopWidth].reduce(l,0)),y}function gr(s){var l,a=s.document;a.getElementById(Rn)||(l=new s.DOMParser().parseFromString($n,"image/svg+xml"),a.body.appendChild(l.documentElement),ri(s))}function mu(s){var l,a,c,h,y,x,S,L,w,U,ee,T,O,D,I,B,N,H,K,A=s.options,k=s.curStats,le=s.aplStats,Z=k.position_socketXYSE,ve=!1;function z(m,_){var F=_===ot?{x:m.left+m.width/2,y:m.top}:_===ge?{x:m.right,y:m.top+m.height/2}:_===Ke?{x:m.left+m.width/2,y:m.bottom}:{x:m.left,y:m.top+m.height/2};return F.socketId=_,F}function P(m){return{x:m.x,y:m.y}}if(k.position_path=A.path,k.position_lineStrokeWidth=k.line_strokeWidth,k.position_socketGravitySE=l=Dt(A.socketGravitySE),a=[0,1].map(function(m){var _,F,J,te=A.anchorSE[m],X=s.optionIsAttach.anchorSE[m],C=X!==!1?Rt[te._id]:null,xe=X!==!1&&C.conf.getStrokeWidth?C.conf.getStrokeWidth(C,s):0,ie=X!==!1&&C.conf.getBBoxNest?C.conf.getBBoxNest(C,s,xe):$s(te,s.baseWindow);return k.capsMaskAnchor_pathDataSE[m]=X!==!1&&C.conf.getPathData?C.conf.getPathData(C,s,xe):(F=(_=ie).right!=null?_.right:_.left+_.width,J=_.bottom!=null?_.bottom:_.top+_.height,[{type:"M",values:[_.left,_.top]},{type:"L",values:[F,_.top]},{type:"L",values:[F,J]},{type:"L",values:[_.left,J]},{type:"Z",values:[]}]),k.capsMaskAnchor_strokeWidthSE[m]=xe,ie}),S=-1,A.socketSE[0]&&A.socketSE[1]?(Z[0]=z(a[0],A.socketSE[0]),Z[1]=z(a[1],A.socketSE[1])):(A.socketSE[0]||A.socketSE[1]?(x=A.socketSE[0]?(y=0,1):(y=1,0),Z[y]=z(a[y],A.socketSE[y]),(h=fe.map(function(m){return z(a[x],m)})).forEach(function(m){var _=hn(m,Z[y]);(_<S||S===-1)&&(Z[x]=m,S=_)})):(h=fe.map(function(m){return z(a[1],m)}),fe.map(function(m){return z(a[0],m)}).forEach(function(m){h.forEach(function(_){var F=hn(m,_);(F<S||S===-1)&&(Z[0]=m,Z[1]=_,S=F)})})),[0,1].forEach(function(m){var _,F;A.socketSE[m]||(a[m].width||a[m].height?a[m].width||Z[m].socketId!==bt&&Z[m].socketId!==ge?a[m].height||Z[m].socketId!==ot&&Z[m].socketId!==Ke||(Z[m].socketId=0<=Z[m?0:1].y-a[m].top?Ke:ot):Z[m].socketId=0<=Z[m?0:1].x-a[m].left?ge:bt:(_=Z[m?0:1].x-a[m].left,F=Z[m?0:1].y-a[m].top,Z[m].socketId=Math.abs(_)>=Math.abs(F)?0<=_?ge:bt:0<=F?Ke:ot))})),k.position_path!==le.position_path||k.position_lineStrokeWidth!==le.position_lineStrokeWidth||[0,1].some(function(m){return k.position_plugOverheadSE[m]!==le.position_plugOverheadSE[m]||(te=Z[m],X=le.position_socketXYSE[m],te.x!==X.x||te.y!==X.y||te.socketId!==X.socketId)||(_=l[m],F=le.position_socketGravitySE[m],(J=_==null?"auto":Array.isArray(_)?"array":"number")!=(F==null?"auto":Array.isArray(F)?"array":"number")||(J=="array"?_[0]!==F[0]||_[1]!==F[1]:_!==F));var _,F,J,te,X})){switch(s.pathList.baseVal=c=[],s.pathList.animVal=null,k.position_path){case Et:c.push([P(Z[0]),P(Z[1])]);break;case nt:T=typeof l[0]=="number"&&0<l[0]||typeof l[1]=="number"&&0<l[1],O=ne*(T?-1:1),D=Math.atan2(Z[1].y-Z[0].y,Z[1].x-Z[0].x),I=O-D,B=Math.PI-D-O,N=hn(Z[0],Z[1])/Math.sqrt(2)*ae,H={x:Z[0].x+Math.cos(I)*N,y:Z[0].y+Math.sin(I)*N*-1},K={x:Z[1].x+Math.cos(B)*N,y:Z[1].y+Math.sin(B)*N*-1},c.push([P(Z[0]),H,K,P(Z[1])]);break;case Ze:case Jt:w=[l[0],k.position_path===Jt?0:l[1]],U=[],ee=[],Z.forEach(function(m,_){var F,J,te,X,C=w[_],xe=Array.isArray(C)?{x:C[0],y:C[1]}:typeof C=="number"?m.socketId===ot?{x:0,y:-C}:m.socketId===ge?{x:C,y:0}:m.socketId===Ke?{x:0,y:C}:{x:-C,y:0}:(F=Z[_?0:1],te=0<(J=k.position_plugOverheadSE[_])?v+(V<J?(J-V)*Y:0):Je+(k.position_lineStrokeWidth>ft?(k.position_lineStrokeWidth-ft)*p:0),m.socketId===ot?((X=(m.y-F.y)/2)<te&&(X=te),{x:0,y:-X}):m.socketId===ge?((X=(F.x-m.x)/2)<te&&(X=te),{x:X,y:0}):m.socketId===Ke?((X=(F.y-m.y)/2)<te&&(X=te),{x:0,y:X}):((X=(m.x-F.x)/2)<te&&(X=te),{x:-X,y:0}));U[_]=m.x+xe.x,ee[_]=m.y+xe.y}),c.push([P(Z[0]),{x:U[0],y:ee[0]},{x:U[1],y:ee[1]},P(Z[1])]);break;case dn:(function(){var m,_=1,F=2,J=3,te=4,X=[[],[]],C=[];function xe(Be){return Be===_?J:Be===F?te:Be===J?_:F}function ie(Be){return Be===F||Be===te?"x":"y"}function j(Be,be,et){var pe={x:Be.x,y:Be.y};if(et){if(et===xe(Be.dirId))throw new Error("Invalid dirId: "+et);pe.dirId=et}else pe.dirId=Be.dirId;return pe.dirId===_?pe.y-=be:pe.dirId===F?pe.x+=be:pe.dirId===J?pe.y+=be:pe.x-=be,pe}function se(Be,be){return be.dirId===_?Be.y<=be.y:be.dirId===F?Be.x>=be.x:be.dirId===J?Be.y>=be.y:Be.x<=be.x}function Ge(Be,be){return be.dirId===_||be.dirId===J?Be.x===be.x:Be.y===be.y}function qe(Be){return Be[0]?{contain:0,notContain:1}:{contain:1,notContain:0}}function ze(Be,be,et){return Math.abs(be[et]-Be[et])}function ln(Be,be,et){return et==="x"?Be.x<be.x?F:te:Be.y<be.y?J:_}for(Z.forEach(function(Be,be){var et,pe=P(Be),Ie=l[be];et=Array.isArray(Ie)?Ie[0]<0?[te,-Ie[0]]:0<Ie[0]?[F,Ie[0]]:Ie[1]<0?[_,-Ie[1]]:0<Ie[1]?[J,Ie[1]]:[Be.socketId,0]:typeof Ie!="number"?[Be.socketId,Q]:0<=Ie?[Be.socketId,Ie]:[xe(Be.socketId),-Ie],pe.dirId=et[0],Ie=et[1],X[be].push(pe),C[be]=j(pe,Ie)});function(){var Be,be,et,pe,Ie=[se(C[1],C[0]),se(C[0],C[1])],_e=[ie(C[0].dirId),ie(C[1].dirId)];if(_e[0]===_e[1]){if(Ie[0]&&Ie[1])return void(Ge(C[1],C[0])||(C[0][_e[0]]===C[1][_e[1]]?(X[0].push(C[0]),X[1].push(C[1])):(Be=C[0][_e[0]]+(C[1][_e[1]]-C[0][_e[0]])/2,X[0].push(j(C[0],Math.abs(Be-C[0][_e[0]]))),X[1].push(j(C[1],Math.abs(Be-C[1][_e[1]]))))));Ie[0]!==Ie[1]?(be=qe(Ie),(et=ze(C[be.notContain],C[be.contain],_e[be.notContain]))<Q&&(C[be.notContain]=j(C[be.notContain],Q-et)),X[be.notContain].push(C[be.notContain]),C[be.notContain]=j(C[be.notContain],Q,Ge(C[be.contain],C[be.notContain])?_e[be.notContain]==="x"?J:F:ln(C[be.notContain],C[be.contain],_e[be.notContain]==="x"?"y":"x"))):(et=ze(C[0],C[1],_e[0]==="x"?"y":"x"),X.forEach(function(kt,Ye){var Gt=Ye===0?1:0;kt.push(C[Ye]),C[Ye]=j(C[Ye],Q,2*Q<=et?ln(C[Ye],C[Gt],_e[Ye]==="x"?"y":"x"):_e[Ye]==="x"?J:F)}))}else{if(Ie[0]&&Ie[1])return void(Ge(C[1],C[0])?X[1].push(C[1]):Ge(C[0],C[1])?X[0].push(C[0]):X[0].push(_e[0]==="x"?{x:C[1].x,y:C[0].y}:{x:C[0].x,y:C[1].y}));Ie[0]!==Ie[1]?(be=qe(Ie),X[be.notContain].push(C[be.notContain]),C[be.notContain]=j(C[be.notContain],Q,ze(C[be.notContain],C[be.contain],_e[be.contain])>=Q?ln(C[be.notContain],C[be.contain],_e[be.contain]):C[be.contain].dirId)):(pe=[{x:C[0].x,y:C[0].y},{x:C[1].x,y:C[1].y}],X.forEach(function(kt,Ye){var Gt=Ye===0?1:0,yn=ze(pe[Ye],pe[Gt],_e[Ye]);yn<Q&&(C[Ye]=j(C[Ye],Q-yn)),kt.push(C[Ye]),C[Ye]=j(C[Ye],Q,ln(C[Ye],C[Gt],_e[Gt]))}))}return 1}(););X[1].reverse(),X[0].concat(X[1]).forEach(function(Be,be){var et={x:Be.x,y:Be.y};0<be&&c.push([m,et]),m=et})})()}L=[],k.position_plugOverheadSE.forEach(function(m,_){var F,J,te,X,C,xe,ie,j,se,Ge,qe,ze=!_;0<m?(F=c[J=ze?0:c.length-1]).length===2?(L[J]=L[J]||hn.apply(null,F),L[J]>W&&(L[J]-m<W&&(m=L[J]-W),te=Vs(F[0],F[1],(ze?m:L[J]-m)/L[J]),c[J]=ze?[te,F[1]]:[F[0],te],L[J]-=m)):(L[J]=L[J]||Ns.apply(null,F),L[J]>W&&(L[J]-m<W&&(m=L[J]-W),te=ys(F[0],F[1],F[2],F[3],io(F[0],F[1],F[2],F[3],ze?m:L[J]-m)),C=ze?(X=F[0],te.toP1):(X=F[3],te.fromP2),xe=Math.atan2(X.y-te.y,te.x-X.x),ie=hn(te,C),te.x=X.x+Math.cos(xe)*m,te.y=X.y+Math.sin(xe)*m*-1,C.x=te.x+Math.cos(xe)*ie,C.y=te.y+Math.sin(xe)*ie*-1,c[J]=ze?[te,te.toP1,te.toP2,F[3]]:[F[0],te.fromP1,te.fromP2,te],L[J]=null)):m<0&&(F=c[J=ze?0:c.length-1],j=Z[_].socketId,se=j===bt||j===ge?"x":"y",m<(qe=-a[_][se=="x"?"width":"height"])&&(m=qe),Ge=m*(j===bt||j===ot?-1:1),F.length===2?F[ze?0:F.length-1][se]+=Ge:(ze?[0,1]:[F.length-2,F.length-1]).forEach(function(ln){F[ln][se]+=Ge}),L[J]=null)}),le.position_socketXYSE=Dt(Z),le.position_plugOverheadSE=Dt(k.position_plugOverheadSE),le.position_path=k.position_path,le.position_lineStrokeWidth=k.position_lineStrokeWidth,le.position_socketGravitySE=Dt(l),ve=!0,s.events.apl_position&&s.events.apl_position.forEach(function(m){m(s,c)})}return ve}function vs(s,l){l!==s.isShown&&(!!l!=!!s.isShown&&(s.svg.style.visibility=l?"":"hidden"),s.isShown=l,s.events&&s.events.svgShow&&s.events.svgShow.forEach(function(a){a(s,l)}))}function nn(s,l){var a,c,h,y,x,S,L,w,U,ee,T,O,D,I,B,N,H,K,A,k,le,Z,ve,z,P,m,_,F,J,te,X,C,xe,ie,j,se,Ge,qe,ze,ln,Be,be,et,pe,Ie,_e,kt,Ye,Gt,yn,bn,Cn,ct={};l.line&&(ct.line=(c=(a=s).options,h=a.curStats,y=a.events,x=!1,x=ue(a,h,"line_color",c.lineColor,y.cur_line_color)||x,x=ue(a,h,"line_colorTra",Ts(h.line_color)[0]<1)||x,x=ue(a,h,"line_strokeWidth",c.lineSize,y.cur_line_strokeWidth)||x)),(l.plug||ct.line)&&(ct.plug=(L=(S=s).options,w=S.curStats,U=S.events,ee=!1,[0,1].forEach(function(R){var Pe,yt,rt,xt,vn,ro,lo,es,Bs=L.plugSE[R];ee=ue(S,w.plug_enabledSE,R,Bs!==vt)||ee,ee=ue(S,w.plug_plugSE,R,Bs)||ee,ee=ue(S,w.plug_colorSE,R,es=L.plugColorSE[R]||w.line_color,U.cur_plug_colorSE)||ee,ee=ue(S,w.plug_colorTraSE,R,Ts(es)[0]<1)||ee,Bs!==vt&&(xt=yt=(Pe=On[G[Bs]]).widthR*L.plugSizeSE[R],vn=rt=Pe.heightR*L.plugSizeSE[R],Oe&&(xt*=w.line_strokeWidth,vn*=w.line_strokeWidth),ee=ue(S,w.plug_markerWidthSE,R,xt)||ee,ee=ue(S,w.plug_markerHeightSE,R,vn)||ee,w.capsMaskMarker_markerWidthSE[R]=yt,w.capsMaskMarker_markerHeightSE[R]=rt),w.plugOutline_plugSE[R]=w.capsMaskMarker_plugSE[R]=Bs,w.plug_enabledSE[R]?(es=w.line_strokeWidth/je.lineSize*L.plugSizeSE[R],w.position_plugOverheadSE[R]=Pe.overhead*es,w.viewBox_plugBCircleSE[R]=Pe.bCircle*es,ro=Pe.sideLen*es,lo=Pe.backLen*es):(w.position_plugOverheadSE[R]=-w.line_strokeWidth/2,w.viewBox_plugBCircleSE[R]=ro=lo=0),ue(S,w.attach_plugSideLenSE,R,ro,U.cur_attach_plugSideLenSE),ue(S,w.attach_plugBackLenSE,R,lo,U.cur_attach_plugBackLenSE),w.capsMaskAnchor_enabledSE[R]=!w.plug_enabledSE[R]}),ee=ue(S,w,"plug_enabled",w.plug_enabledSE[0]||w.plug_enabledSE[1])||ee)),(l.lineOutline||ct.line)&&(ct.lineOutline=(D=(T=s).options,I=T.curStats,B=!1,B=ue(T,I,"lineOutline_enabled",D.lineOutlineEnabled)||B,B=ue(T,I,"lineOutline_color",D.lineOutlineColor)||B,B=ue(T,I,"lineOutline_colorTra",Ts(I.lineOutline_color)[0]<1)||B,O=I.line_strokeWidth*D.lineOutlineSize,B=ue(T,I,"lineOutline_strokeWidth",I.line_strokeWidth-2*O)||B,B=ue(T,I,"lineOutline_inStrokeWidth",I.lineOutline_colorTra?I.lineOutline_strokeWidth+2*st:I.line_strokeWidth-O)||B)),(l.plugOutline||ct.line||ct.plug||ct.lineOutline)&&(ct.plugOutline=(H=(N=s).options,K=N.curStats,A=!1,[0,1].forEach(function(R){var Pe,yt=K.plugOutline_plugSE[R],rt=yt!==vt?On[G[yt]]:null;A=ue(N,K.plugOutline_enabledSE,R,H.plugOutlineEnabledSE[R]&&K.plug_enabled&&K.plug_enabledSE[R]&&!!rt&&!!rt.outlineBase)||A,A=ue(N,K.plugOutline_colorSE,R,Pe=H.plugOutlineColorSE[R]||K.lineOutline_color)||A,A=ue(N,K.plugOutline_colorTraSE,R,Ts(Pe)[0]<1)||A,rt&&rt.outlineBase&&((Pe=H.plugOutlineSizeSE[R])>rt.outlineMax&&(Pe=rt.outlineMax),Pe*=2*rt.outlineBase,A=ue(N,K.plugOutline_strokeWidthSE,R,Pe)||A,A=ue(N,K.plugOutline_inStrokeWidthSE,R,K.plugOutline_colorTraSE[R]?Pe-st/(K.line_strokeWidth/je.lineSize)/H.plugSizeSE[R]*2:Pe/2)||A)}),A)),(l.faces||ct.line||ct.plug||ct.lineOutline||ct.plugOutline)&&(ct.faces=(Z=(k=s).curStats,ve=k.aplStats,z=k.events,P=!1,!Z.line_altColor&&ue(k,ve,"line_color",le=Z.line_color,z.apl_line_color)&&(k.lineFace.style.stroke=le,P=!0),ue(k,ve,"line_strokeWidth",le=Z.line_strokeWidth,z.apl_line_strokeWidth)&&(k.lineShape.style.strokeWidth=le+"px",P=!0,(we||Se)&&(wt(k,k.lineShape),Se&&(wt(k,k.lineFace),wt(k,k.lineMaskCaps)))),ue(k,ve,"lineOutline_enabled",le=Z.lineOutline_enabled,z.apl_lineOutline_enabled)&&(k.lineOutlineFace.style.display=le?"inline":"none",P=!0),Z.lineOutline_enabled&&(ue(k,ve,"lineOutline_color",le=Z.lineOutline_color,z.apl_lineOutline_color)&&(k.lineOutlineFace.style.stroke=le,P=!0),ue(k,ve,"lineOutline_strokeWidth",le=Z.lineOutline_strokeWidth,z.apl_lineOutline_strokeWidth)&&(k.lineOutlineMaskShape.style.strokeWidth=le+"px",P=!0,Se&&(wt(k,k.lineOutlineMaskCaps),wt(k,k.lineOutlineFace))),ue(k,ve,"lineOutline_inStrokeWidth",le=Z.lineOutline_inStrokeWidth,z.apl_lineOutline_inStrokeWidth)&&(k.lineMaskShape.style.strokeWidth=le+"px",P=!0,Se&&(wt(k,k.lineOutlineMaskCaps),wt(k,k.lineOutlineFace)))),ue(k,ve,"plug_enabled",le=Z.plug_enabled,z.apl_plug_enabled)&&(k.plugsFace.style.display=le?"inline":"none",P=!0),Z.plug_enabled&&[0,1].forEach(function(R){var Pe=Z.plug_plugSE[R],yt=Pe!==vt?On[G[Pe]]:null,rt=pr(R,yt);ue(k,ve.plug_enabledSE,R,le=Z.plug_enabledSE[R],z.apl_plug_enabledSE)&&(k.plugsFace.style[rt.prop]=le?"url(#"+k.plugMarkerIdSE[R]+")":"none",P=!0),Z.plug_enabledSE[R]&&(ue(k,ve.plug_plugSE,R,Pe,z.apl_plug_plugSE)&&(k.plugFaceSE[R].href.baseVal="#"+yt.elmId,fr(k,k.plugMarkerSE[R],rt.orient,yt.bBox,k.svg,k.plugMarkerShapeSE[R],k.plugsFace),P=!0,we&&wt(k,k.plugsFace)),ue(k,ve.plug_colorSE,R,le=Z.plug_colorSE[R],z.apl_plug_colorSE)&&(k.plugFaceSE[R].style.fill=le,P=!0,($e||Oe||Se)&&!Z.line_colorTra&&wt(k,Se?k.lineMaskCaps:k.capsMaskLine)),["markerWidth","markerHeight"].forEach(function(xt){var vn="plug_"+xt+"SE";ue(k,ve[vn],R,le=Z[vn][R],z["apl_"+vn])&&(k.plugMarkerSE[R][xt].baseVal.value=le,P=!0)}),ue(k,ve.plugOutline_enabledSE,R,le=Z.plugOutline_enabledSE[R],z.apl_plugOutline_enabledSE)&&(le?(k.plugFaceSE[R].style.mask="url(#"+k.plugMaskIdSE[R]+")",k.plugOutlineFaceSE[R].style.display="inline"):(k.plugFaceSE[R].style.mask="none",k.plugOutlineFaceSE[R].style.display="none"),P=!0),Z.plugOutline_enabledSE[R]&&(ue(k,ve.plugOutline_plugSE,R,Pe,z.apl_plugOutline_plugSE)&&(k.plugOutlineFaceSE[R].href.baseVal=k.plugMaskShapeSE[R].href.baseVal=k.plugOutlineMaskShapeSE[R].href.baseVal="#"+yt.elmId,[k.plugMaskSE[R],k.plugOutlineMaskSE[R]].forEach(function(xt){xt.x.baseVal.value=yt.bBox.left,xt.y.baseVal.value=yt.bBox.top,xt.width.baseVal.value=yt.bBox.width,xt.height.baseVal.value=yt.bBox.height}),P=!0),ue(k,ve.plugOutline_colorSE,R,le=Z.plugOutline_colorSE[R],z.apl_plugOutline_colorSE)&&(k.plugOutlineFaceSE[R].style.fill=le,P=!0,Se&&(wt(k,k.lineMaskCaps),wt(k,k.lineOutlineMaskCaps))),ue(k,ve.plugOutline_strokeWidthSE,R,le=Z.plugOutline_strokeWidthSE[R],z.apl_plugOutline_strokeWidthSE)&&(k.plugOutlineMaskShapeSE[R].style.strokeWidth=le+"px",P=!0),ue(k,ve.plugOutline_inStrokeWidthSE,R,le=Z.plugOutline_inStrokeWidthSE[R],z.apl_plugOutline_inStrokeWidthSE)&&(k.plugMaskShapeSE[R].style.strokeWidth=le+"px",P=!0)))}),P)),(l.position||ct.line||ct.plug)&&(ct.position=mu(s)),(l.path||ct.position)&&(ct.path=(F=(m=s).curStats,J=m.aplStats,te=m.pathList.animVal||m.pathList.baseVal,X=F.path_edge,C=!1,te&&(X.x1=X.x2=te[0][0].x,X.y1=X.y2=te[0][0].y,F.path_pathData=_=oo(te,function(R){R.x<X.x1&&(X.x1=R.x),R.y<X.y1&&(X.y1=R.y),R.x>X.x2&&(X.x2=R.x),R.y>X.y2&&(X.y2=R.y)}),ui(_,J.path_pathData)&&(m.linePath.setPathData(_),J.path_pathData=_,C=!0,Se?(wt(m,m.plugsFace),wt(m,m.lineMaskCaps)):we&&wt(m,m.linePath),m.events.apl_path&&m.events.apl_path.forEach(function(R){R(m,_)}))),C)),ct.viewBox=(ie=(xe=s).curStats,j=xe.aplStats,se=ie.path_edge,Ge=ie.viewBox_bBox,qe=j.viewBox_bBox,ze=xe.svg.viewBox.baseVal,ln=xe.svg.style,Be=!1,be=Math.max(ie.line_strokeWidth/2,ie.viewBox_plugBCircleSE[0]||0,ie.viewBox_plugBCircleSE[1]||0),et={x1:se.x1-be,y1:se.y1-be,x2:se.x2+be,y2:se.y2+be},xe.events.new_edge4viewBox&&xe.events.new_edge4viewBox.forEach(function(R){R(xe,et)}),Ge.x=ie.lineMask_x=ie.lineOutlineMask_x=ie.maskBGRect_x=et.x1,Ge.y=ie.lineMask_y=ie.lineOutlineMask_y=ie.maskBGRect_y=et.y1,Ge.width=et.x2-et.x1,Ge.height=et.y2-et.y1,["x","y","width","height"].forEach(function(R){var Pe;(Pe=Ge[R])!==qe[R]&&(ze[R]=qe[R]=Pe,ln[Ee[R]]=Pe+(R==="x"||R==="y"?xe.bodyOffset[R]:0)+"px",Be=!0)}),Be),ct.mask=(_e=(pe=s).curStats,kt=pe.aplStats,Ye=!1,_e.plug_enabled?[0,1].forEach(function(R){_e.capsMaskMarker_enabledSE[R]=_e.plug_enabledSE[R]&&_e.plug_colorTraSE[R]||_e.plugOutline_enabledSE[R]&&_e.plugOutline_colorTraSE[R]}):_e.capsMaskMarker_enabledSE[0]=_e.capsMaskMarker_enabledSE[1]=!1,_e.capsMaskMarker_enabled=_e.capsMaskMarker_enabledSE[0]||_e.capsMaskMarker_enabledSE[1],_e.lineMask_outlineMode=_e.lineOutline_enabled,_e.caps_enabled=_e.capsMaskMarker_enabled||_e.capsMaskAnchor_enabledSE[0]||_e.capsMaskAnchor_enabledSE[1],_e.lineMask_enabled=_e.caps_enabled||_e.lineMask_outlineMode,(_e.lineMask_enabled&&!_e.lineMask_outlineMode||_e.lineOutline_enabled)&&["x","y"].forEach(function(R){var Pe="maskBGRect_"+R;ue(pe,kt,Pe,Ie=_e[Pe])&&(pe.maskBGRect[R].baseVal.value=Ie,Ye=!0)}),ue(pe,kt,"lineMask_enabled",Ie=_e.lineMask_enabled)&&(pe.lineFace.style.mask=Ie?"url(#"+pe.lineMaskId+")":"none",Ye=!0,Oe&&wt(pe,pe.lineMask)),_e.lineMask_enabled&&(ue(pe,kt,"lineMask_outlineMode",Ie=_e.lineMask_outlineMode)&&(Ie?(pe.lineMaskBG.style.display="none",pe.lineMaskShape.style.display="inline"):(pe.lineMaskBG.style.display="inline",pe.lineMaskShape.style.display="none"),Ye=!0),["x","y"].forEach(function(R){var Pe="lineMask_"+R;ue(pe,kt,Pe,Ie=_e[Pe])&&(pe.lineMask[R].baseVal.value=Ie,Ye=!0)}),ue(pe,kt,"caps_enabled",Ie=_e.caps_enabled)&&(pe.lineMaskCaps.style.display=pe.lineOutlineMaskCaps.style.display=Ie?"inline":"none",Ye=!0,Oe&&wt(pe,pe.capsMaskLine)),_e.caps_enabled&&([0,1].forEach(function(R){var Pe;ue(pe,kt.capsMaskAnchor_enabledSE,R,Ie=_e.capsMaskAnchor_enabledSE[R])&&(pe.capsMaskAnchorSE[R].style.display=Ie?"inline":"none",Ye=!0,Oe&&wt(pe,pe.lineMask)),_e.capsMaskAnchor_enabledSE[R]&&(ui(Pe=_e.capsMaskAnchor_pathDataSE[R],kt.capsMaskAnchor_pathDataSE[R])&&(pe.capsMaskAnchorSE[R].setPathData(Pe),kt.capsMaskAnchor_pathDataSE[R]=Pe,Ye=!0),ue(pe,kt.capsMaskAnchor_strokeWidthSE,R,Ie=_e.capsMaskAnchor_strokeWidthSE[R])&&(pe.capsMaskAnchorSE[R].style.strokeWidth=Ie+"px",Ye=!0))}),ue(pe,kt,"capsMaskMarker_enabled",Ie=_e.capsMaskMarker_enabled)&&(pe.capsMaskLine.style.display=Ie?"inline":"none",Ye=!0),_e.capsMaskMarker_enabled&&[0,1].forEach(function(R){var Pe=_e.capsMaskMarker_plugSE[R],yt=Pe!==vt?On[G[Pe]]:null,rt=pr(R,yt);ue(pe,kt.capsMaskMarker_enabledSE,R,Ie=_e.capsMaskMarker_enabledSE[R])&&(pe.capsMaskLine.style[rt.prop]=Ie?"url(#"+pe.lineMaskMarkerIdSE[R]+")":"none",Ye=!0),_e.capsMaskMarker_enabledSE[R]&&(ue(pe,kt.capsMaskMarker_plugSE,R,Pe)&&(pe.capsMaskMarkerShapeSE[R].href.baseVal="#"+yt.elmId,fr(pe,pe.capsMaskMarkerSE[R],rt.orient,yt.bBox,pe.svg,pe.capsMaskMarkerShapeSE[R],pe.capsMaskLine),Ye=!0,we&&(wt(pe,pe.capsMaskLine),wt(pe,pe.lineFace))),["markerWidth","markerHeight"].forEach(function(xt){var vn="capsMaskMarker_"+xt+"SE";ue(pe,kt[vn],R,Ie=_e[vn][R])&&(pe.capsMaskMarkerSE[R][xt].baseVal.value=Ie,Ye=!0)}))}))),_e.lineOutline_enabled&&["x","y"].forEach(function(R){var Pe="lineOutlineMask_"+R;ue(pe,kt,Pe,Ie=_e[Pe])&&(pe.lineOutlineMask[R].baseVal.value=Ie,Ye=!0)}),Ye),l.effect&&(bn=(Gt=s).curStats,Cn=Gt.aplStats,Object.keys(i).forEach(function(R){var Pe=i[R],yt=R+"_enabled",rt=R+"_options",xt=bn[rt];ue(Gt,Cn,yt,yn=bn[yt])?(yn&&(Cn[rt]=Dt(xt)),Pe[yn?"init":"remove"](Gt)):yn&&Jn(xt,Cn[rt])&&(Pe.remove(Gt),Cn[yt]=!0,Cn[rt]=Dt(xt),Pe.init(Gt))})),($e||Oe)&&ct.line&&!ct.path&&wt(s,s.lineShape),$e&&ct.plug&&!ct.line&&wt(s,s.plugsFace),hr(s)}function ci(s,l){return{duration:pt(s.duration)&&0<s.duration?s.duration:l.duration,timing:gt.validTiming(s.timing)?s.timing:Dt(l.timing)}}function di(s,l,a,c){var h,y=s.curStats,x=s.aplStats,S={};function L(){["show_on","show_effect","show_animOptions"].forEach(function(w){x[w]=y[w]})}y.show_on=l,a&&o[a]&&(y.show_effect=a,y.show_animOptions=ci(ut(c)?c:{},o[a].defaultAnimOptions)),S.show_on=y.show_on!==x.show_on,S.show_effect=y.show_effect!==x.show_effect,S.show_animOptions=Jn(y.show_animOptions,x.show_animOptions),S.show_effect||S.show_animOptions?y.show_inAnim?(h=S.show_effect?o[x.show_effect].stop(s,!0,!0):o[x.show_effect].stop(s),L(),o[x.show_effect].init(s,h)):S.show_on&&(x.show_effect&&S.show_effect&&o[x.show_effect].stop(s,!0,!0),L(),o[x.show_effect].init(s)):S.show_on&&(L(),o[x.show_effect].start(s))}function yr(s,l,a){var c={props:s,optionName:a};return s.attachments.indexOf(l)<0&&(!l.conf.bind||l.conf.bind(l,c))&&(s.attachments.push(l),l.boundTargets.push(c),1)}function hi(s,l,a){var c=s.attachments.indexOf(l);-1<c&&s.attachments.splice(c,1),l.boundTargets.some(function(h,y){return h.props===s&&(l.conf.unbind&&l.conf.unbind(l,h),c=y,!0)})&&(l.boundTargets.splice(c,1),a||bs(function(){l.boundTargets.length||f(l)}))}function fi(s,l){var a,c,h,y,x,S,L,w,U,ee,T,O,D,I,B,N,H,K=s.options,A={};function k(m,_,F,J,te){var X={};return F?J!=null?(X.container=m[F],X.key=J):(X.container=m,X.key=F):(X.container=m,X.key=_),X.default=te,X.acceptsAuto=X.default==null,X}function le(m,_,F,J,te,X,C){var xe,ie,j,se=k(m,F,te,X,C);return _[F]!=null&&(ie=(_[F]+"").toLowerCase())&&(se.acceptsAuto&&ie===re||(j=J[ie]))&&j!==se.container[se.key]&&(se.container[se.key]=j,xe=!0),se.container[se.key]!=null||se.acceptsAuto||(se.container[se.key]=se.default,xe=!0),xe}function Z(m,_,F,J,te,X,C,xe,ie){var j,se,Ge,qe,ze=k(m,F,te,X,C);if(!J){if(ze.default==null)throw new Error("Invalid `type`: "+F);J=typeof ze.default}return _[F]!=null&&(ze.acceptsAuto&&(_[F]+"").toLowerCase()===re||(Ge=se=_[F],((qe=J)==="number"?pt(Ge):typeof Ge===qe)&&(se=ie&&J==="string"&&se?se.trim():se,1)&&(!xe||xe(se))))&&se!==ze.container[ze.key]&&(ze.container[ze.key]=se,j=!0),ze.container[ze.key]!=null||ze.acceptsAuto||(ze.container[ze.key]=ze.default,j=!0),j}if(l=l||{},["start","end"].forEach(function(m,_){var F=l[m],J=!1;if(F&&(Rs(F)||(J=d(F,"anchor")))&&F!==K.anchorSE[_]){if(s.optionIsAttach.anchorSE[_]!==!1&&hi(s,Rt[K.anchorSE[_]._id]),J&&!yr(s,Rt[F._id],m))throw new Error("Can't bind attachment");K.anchorSE[_]=F,s.optionIsAttach.anchorSE[_]=J,c=A.position=!0}}),!K.anchorSE[0]||!K.anchorSE[1]||K.anchorSE[0]===K.anchorSE[1])throw new Error("`start` and `end` are required.");function ve(m){var _=S.appendChild(N.createElementNS($,"mask"));return _.id=m,_.maskUnits.baseVal=SVGUnitTypes.SVG_UNIT_TYPE_USERSPACEONUSE,[_.x,_.y,_.width,_.height].forEach(function(F){F.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PX,0)}),_}function z(m){var _=S.appendChild(N.createElementNS($,"marker"));return _.id=m,_.markerUnits.baseVal=SVGMarkerElement.SVG_MARKERUNITS_STROKEWIDTH,_.viewBox.baseVal||_.setAttribute("viewBox","0 0 0 0"),_}function P(m){return[m.width,m.height].forEach(function(_){_.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PERCENTAGE,100)}),m}c&&(a=function(m,_){var F,J,te;if(!(F=so(m))||!(J=so(_)))throw new Error("Cannot get frames.");return F.length&&J.length&&(F.reverse(),J.reverse(),F.some(function(X){return J.some(function(C){return C===X&&(te=C.contentWindow,!0)})})),te||window}(s.optionIsAttach.anchorSE[0]!==!1?Rt[K.anchorSE[0]._id].element:K.anchorSE[0],s.optionIsAttach.anchorSE[1]!==!1?Rt[K.anchorSE[1]._id].element:K.anchorSE[1]))!==s.baseWindow&&(y=a,B=(h=s).aplStats,N=y.document,H=Ne+"-"+h._id,h.pathList={},$t(B,ms),Object.keys(i).forEach(function(m){var _=m+"_enabled";B[_]&&(i[m].remove(h),B[_]=!1)}),h.baseWindow&&h.svg&&h.baseWindow.document.body.removeChild(h.svg),gr(h.baseWindow=y),h.bodyOffset=mr(y),h.svg=x=N.createElementNS($,"svg"),x.className.baseVal=Ne,x.viewBox.baseVal||x.setAttribute("viewBox","0 0 0 0"),h.defs=S=x.appendChild(N.createElementNS($,"defs")),h.linePath=w=S.appendChild(N.createElementNS($,"path")),w.id=U=H+"-line-path",w.className.baseVal=Ne+"-line-path",Oe&&(w.style.fill="none"),h.lineShape=w=S.appendChild(N.createElementNS($,"use")),w.id=ee=H+"-line-shape",w.href.baseVal="#"+U,(L=S.appendChild(N.createElementNS($,"g"))).id=T=H+"-caps",h.capsMaskAnchorSE=[0,1].map(function(){var m=L.appendChild(N.createElementNS($,"path"));return m.className.baseVal=Ne+"-caps-mask-anchor",m}),h.lineMaskMarkerIdSE=[H+"-caps-mask-marker-0",H+"-caps-mask-marker-1"],h.capsMaskMarkerSE=[0,1].map(function(m){return z(h.lineMaskMarkerIdSE[m])}),h.capsMaskMarkerShapeSE=[0,1].map(function(m){var _=h.capsMaskMarkerSE[m].appendChild(N.createElementNS($,"use"));return _.className.baseVal=Ne+"-caps-mask-marker-shape",_}),h.capsMaskLine=w=L.appendChild(N.createElementNS($,"use")),w.className.baseVal=Ne+"-caps-mask-line",w.href.baseVal="#"+ee,h.maskBGRect=w=P(S.appendChild(N.createElementNS($,"rect"))),w.id=O=H+"-mask-bg-rect",w.className.baseVal=Ne+"-mask-bg-rect",Oe&&(w.style.fill="white"),h.lineMask=P(ve(h.lineMaskId=H+"-line-mask")),h.lineMaskBG=w=h.lineMask.appendChild(N.createElementNS($,"use")),w.href.baseVal="#"+O,h.lineMaskShape=w=h.lineMask.appendChild(N.createElementNS($,"use")),w.className.baseVal=Ne+"-line-mask-shape",w.href.baseVal="#"+U,w.style.display="none",h.lineMaskCaps=w=h.lineMask.appendChild(N.createElementNS($,"use")),w.href.baseVal="#"+T,h.lineOutlineMask=P(ve(D=H+"-line-outline-mask")),(w=h.lineOutlineMask.appendChild(N.createElementNS($,"use"))).href.baseVal="#"+O,h.lineOutlineMaskShape=w=h.lineOutlineMask.appendChild(N.createElementNS($,"use")),w.className.baseVal=Ne+"-line-outline-mask-shape",w.href.baseVal="#"+U,h.lineOutlineMaskCaps=w=h.lineOutlineMask.appendChild(N.createElementNS($,"use")),w.href.baseVal="#"+T,h.face=x.appendChild(N.createElementNS($,"g")),h.lineFace=w=h.face.appendChild(N.createElementNS($,"use")),w.href.baseVal="#"+ee,h.lineOutlineFace=w=h.face.appendChild(N.createElementNS($,"use")),w.href.baseVal="#"+ee,w.style.mask="url(#"+D+")",w.style.display="none",h.plugMaskIdSE=[H+"-plug-mask-0",H+"-plug-mask-1"],h.plugMaskSE=[0,1].map(function(m){return ve(h.plugMaskIdSE[m])}),h.plugMaskShapeSE=[0,1].map(function(m){var _=h.plugMaskSE[m].appendChild(N.createElementNS($,"use"));return _.className.baseVal=Ne+"-plug-mask-shape",_}),I=[],h.plugOutlineMaskSE=[0,1].map(function(m){return ve(I[m]=H+"-plug-outline-mask-"+m)}),h.plugOutlineMaskShapeSE=[0,1].map(function(m){var _=h.plugOutlineMaskSE[m].appendChild(N.createElementNS($,"use"));return _.className.baseVal=Ne+"-plug-outline-mask-shape",_}),h.plugMarkerIdSE=[H+"-plug-marker-0",H+"-plug-marker-1"],h.plugMarkerSE=[0,1].map(function(m){var _=z(h.plugMarkerIdSE[m]);return Oe&&(_.markerUnits.baseVal=SVGMarkerElement.SVG_MARKERUNITS_USERSPACEONUSE),_}),h.plugMarkerShapeSE=[0,1].map(function(m){return h.plugMarkerSE[m].appendChild(N.createElementNS($,"g"))}),h.plugFaceSE=[0,1].map(function(m){return h.plugMarkerShapeSE[m].appendChild(N.createElementNS($,"use"))}),h.plugOutlineFaceSE=[0,1].map(function(m){var _=h.plugMarkerShapeSE[m].appendChild(N.createElementNS($,"use"));return _.style.mask="url(#"+I[m]+")",_.style.display="none",_}),h.plugsFace=w=h.face.appendChild(N.createElementNS($,"use")),w.className.baseVal=Ne+"-plugs-face",w.href.baseVal="#"+ee,w.style.display="none",h.curStats.show_inAnim?(h.isShown=1,o[B.show_effect].stop(h,!0)):h.isShown||(x.style.visibility="hidden"),N.body.appendChild(x),[0,1,2].forEach(function(m){var _,F=h.options.labelSEM[m];F&&d(F,"label")&&(_=Rt[F._id]).conf.initSvg&&_.conf.initSvg(_,h)}),A.line=A.plug=A.lineOutline=A.plugOutline=A.faces=A.effect=!0),A.position=le(K,l,"path",en,null,null,je.path)||A.position,A.position=le(K,l,"startSocket",qt,"socketSE",0)||A.position,A.position=le(K,l,"endSocket",qt,"socketSE",1)||A.position,[l.startSocketGravity,l.endSocketGravity].forEach(function(m,_){var F,J,te=!1;m!=null&&(Array.isArray(m)?pt(m[0])&&pt(m[1])&&(te=[m[0],m[1]],Array.isArray(K.socketGravitySE[_])&&(F=te,J=K.socketGravitySE[_],F.length===J.length&&F.every(function(X,C){return X===J[C]}))&&(te=!1)):((m+"").toLowerCase()===re?te=null:pt(m)&&0<=m&&(te=m),te===K.socketGravitySE[_]&&(te=!1)),te!==!1&&(K.socketGravitySE[_]=te,A.position=!0))}),A.line=Z(K,l,"color",null,"lineColor",null,je.lineColor,null,!0)||A.line,A.line=Z(K,l,"size",null,"lineSize",null,je.lineSize,function(m){return 0<m})||A.line,["startPlug","endPlug"].forEach(function(m,_){A.plug=le(K,l,m,Ct,"plugSE",_,je.plugSE[_])||A.plug,A.plug=Z(K,l,m+"Color","string","plugColorSE",_,null,null,!0)||A.plug,A.plug=Z(K,l,m+"Size",null,"plugSizeSE",_,je.plugSizeSE[_],function(F){return 0<F})||A.plug}),A.lineOutline=Z(K,l,"outline",null,"lineOutlineEnabled",null,je.lineOutlineEnabled)||A.lineOutline,A.lineOutline=Z(K,l,"outlineColor",null,"lineOutlineColor",null,je.lineOutlineColor,null,!0)||A.lineOutline,A.lineOutline=Z(K,l,"outlineSize",null,"lineOutlineSize",null,je.lineOutlineSize,function(m){return 0<m&&m<=.48})||A.lineOutline,["startPlugOutline","endPlugOutline"].forEach(function(m,_){A.plugOutline=Z(K,l,m,null,"plugOutlineEnabledSE",_,je.plugOutlineEnabledSE[_])||A.plugOutline,A.plugOutline=Z(K,l,m+"Color","string","plugOutlineColorSE",_,null,null,!0)||A.plugOutline,A.plugOutline=Z(K,l,m+"Size",null,"plugOutlineSizeSE",_,je.plugOutlineSizeSE[_],function(F){return 1<=F})||A.plugOutline}),["startLabel","endLabel","middleLabel"].forEach(function(m,_){var F,J,te,X=l[m],C=K.labelSEM[_]&&!s.optionIsAttach.labelSEM[_]?Rt[K.labelSEM[_]._id].text:K.labelSEM[_],xe=!1;if((F=typeof X=="string")&&(X=X.trim()),(F||X&&(xe=d(X,"label")))&&X!==C){if(K.labelSEM[_]&&(hi(s,Rt[K.labelSEM[_]._id]),K.labelSEM[_]=""),X){if(xe?(J=Rt[(te=X)._id]).boundTargets.slice().forEach(function(ie){J.conf.removeOption(J,ie)}):te=new u(r.captionLabel,[X]),!yr(s,Rt[te._id],m))throw new Error("Can't bind attachment");K.labelSEM[_]=te}s.optionIsAttach.labelSEM[_]=xe}}),Object.keys(i).forEach(function(m){var _,F,J=i[m],te=m+"_enabled",X=m+"_options";function C(ie){var j={};return J.optionsConf.forEach(function(se){var Ge=se[0],qe=se[3];se[4]==null||j[qe]||(j[qe]=[]),(typeof Ge=="function"?Ge:Ge==="id"?le:Z).apply(null,[j,ie].concat(se.slice(1)))}),j}function xe(ie){var j,se=m+"_animOptions";return ie.hasOwnProperty("animation")?ut(ie.animation)?j=s.curStats[se]=ci(ie.animation,J.defaultAnimOptions):(j=!!ie.animation,s.curStats[se]=j?ci({},J.defaultAnimOptions):null):(j=!!J.defaultEnabled,s.curStats[se]=j?ci({},J.defaultAnimOptions):null),j}l.hasOwnProperty(m)&&(_=l[m],ut(_)?(s.curStats[te]=!0,F=s.curStats[X]=C(_),J.anim&&(s.curStats[X].animation=xe(_))):(F=s.curStats[te]=!!_)&&(s.curStats[X]=C({}),J.anim&&(s.curStats[X].animation=xe({}))),Jn(F,K[m])&&(K[m]=F,A.effect=!0))}),nn(s,A)}function sn(s,l,a){var c={options:{anchorSE:[],socketSE:[],socketGravitySE:[],plugSE:[],plugColorSE:[],plugSizeSE:[],plugOutlineEnabledSE:[],plugOutlineColorSE:[],plugOutlineSizeSE:[],labelSEM:["","",""]},optionIsAttach:{anchorSE:[!1,!1],labelSEM:[!1,!1,!1]},curStats:{},aplStats:{},attachments:[],events:{},reflowTargets:[]};$t(c.curStats,ms),$t(c.aplStats,ms),Object.keys(i).forEach(function(h){var y=i[h].stats;$t(c.curStats,y),$t(c.aplStats,y),c.options[h]=!1}),$t(c.curStats,Bt),$t(c.aplStats,Bt),c.curStats.show_effect=tn,c.curStats.show_animOptions=Dt(o[tn].defaultAnimOptions),Object.defineProperty(this,"_id",{value:++fu}),c._id=this._id,Vt[this._id]=c,arguments.length===1&&(a=s,s=null),a=a||{},(s||l)&&(a=Dt(a),s&&(a.start=s),l&&(a.end=l)),c.isShown=c.aplStats.show_on=!a.hide,this.setOptions(a)}function pi(s){return function(l){var a={};a[s]=l,this.setOptions(a)}}function br(s,l){var a,c={conf:s,curStats:{},aplStats:{},boundTargets:[]},h={};s.argOptions.every(function(y){return!(!l.length||(typeof y.type=="string"?typeof l[0]!==y.type:typeof y.type!="function"||!y.type(l[0])))&&(h[y.optionName]=l.shift(),!0)}),a=l.length&&ut(l[0])?Dt(l[0]):{},Object.keys(h).forEach(function(y){a[y]=h[y]}),s.stats&&($t(c.curStats,s.stats),$t(c.aplStats,s.stats)),Object.defineProperty(this,"_id",{value:++pu}),Object.defineProperty(this,"isRemoved",{get:function(){return!Rt[this._id]}}),c._id=this._id,s.init&&!s.init(c,a)||(Rt[this._id]=c)}return i={dash:{stats:{dash_len:{},dash_gap:{},dash_maxOffset:{}},anim:!0,defaultAnimOptions:{duration:1e3,timing:"linear"},optionsConf:[["type","len","number",null,null,null,function(s){return 0<s}],["type","gap","number",null,null,null,function(s){return 0<s}]],init:function(s){Mt(s,"apl_line_strokeWidth",i.dash.update),s.lineFace.style.strokeDashoffset=0,i.dash.update(s)},remove:function(s){var l=s.curStats;Lt(s,"apl_line_strokeWidth",i.dash.update),l.dash_animId&&(gt.remove(l.dash_animId),l.dash_animId=null),s.lineFace.style.strokeDasharray="none",s.lineFace.style.strokeDashoffset=0,$t(s.aplStats,i.dash.stats)},update:function(s){var l,a=s.curStats,c=s.aplStats,h=c.dash_options,y=!1;a.dash_len=h.len||2*c.line_strokeWidth,a.dash_gap=h.gap||c.line_strokeWidth,a.dash_maxOffset=a.dash_len+a.dash_gap,y=ue(s,c,"dash_len",a.dash_len)||y,(y=ue(s,c,"dash_gap",a.dash_gap)||y)&&(s.lineFace.style.strokeDasharray=c.dash_len+","+c.dash_gap),a.dash_animOptions?(y=ue(s,c,"dash_maxOffset",a.dash_maxOffset),c.dash_animOptions&&(y||Jn(a.dash_animOptions,c.dash_animOptions))&&(a.dash_animId&&(l=gt.stop(a.dash_animId),gt.remove(a.dash_animId)),c.dash_animOptions=null),c.dash_animOptions||(a.dash_animId=gt.add(function(x){return(1-x)*c.dash_maxOffset+"px"},function(x){s.lineFace.style.strokeDashoffset=x},a.dash_animOptions.duration,0,a.dash_animOptions.timing,!1,l),c.dash_animOptions=Dt(a.dash_animOptions))):c.dash_animOptions&&(a.dash_animId&&(gt.remove(a.dash_animId),a.dash_animId=null),s.lineFace.style.strokeDashoffset=0,c.dash_animOptions=null)}},gradient:{stats:{gradient_colorSE:{hasSE:!0},gradient_pointSE:{hasSE:!0,hasProps:!0}},optionsConf:[["type","startColor","string","colorSE",0,null,null,!0],["type","endColor","string","colorSE",1,null,null,!0]],init:function(s){var l,a=s.baseWindow.document,c=s.defs,h=Ne+"-"+s._id+"-gradient";s.efc_gradient_gradient=l=c.appendChild(a.createElementNS($,"linearGradient")),l.id=h,l.gradientUnits.baseVal=SVGUnitTypes.SVG_UNIT_TYPE_USERSPACEONUSE,[l.x1,l.y1,l.x2,l.y2].forEach(function(y){y.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PX,0)}),s.efc_gradient_stopSE=[0,1].map(function(y){var x=s.efc_gradient_gradient.appendChild(a.createElementNS($,"stop"));try{x.offset.baseVal=y}catch(S){if(S.code!==DOMException.NO_MODIFICATION_ALLOWED_ERR)throw S;x.setAttribute("offset",y)}return x}),Mt(s,"cur_plug_colorSE",i.gradient.update),Mt(s,"apl_path",i.gradient.update),s.curStats.line_altColor=!0,s.lineFace.style.stroke="url(#"+h+")",i.gradient.update(s)},remove:function(s){s.efc_gradient_gradient&&(s.defs.removeChild(s.efc_gradient_gradient),s.efc_gradient_gradient=s.efc_gradient_stopSE=null),Lt(s,"cur_plug_colorSE",i.gradient.update),Lt(s,"apl_path",i.gradient.update),s.curStats.line_altColor=!1,s.lineFace.style.stroke=s.curStats.line_color,$t(s.aplStats,i.gradient.stats)},update:function(s){var l,a,c=s.curStats,h=s.aplStats,y=h.gradient_options,x=s.pathList.animVal||s.pathList.baseVal;[0,1].forEach(function(S){c.gradient_colorSE[S]=y.colorSE[S]||c.plug_colorSE[S]}),a=x[0][0],c.gradient_pointSE[0]={x:a.x,y:a.y},a=(l=x[x.length-1])[l.length-1],c.gradient_pointSE[1]={x:a.x,y:a.y},[0,1].forEach(function(S){var L;ue(s,h.gradient_colorSE,S,L=c.gradient_colorSE[S])&&(Oe?(L=Ts(L),s.efc_gradient_stopSE[S].style.stopColor=L[1],s.efc_gradient_stopSE[S].style.stopOpacity=L[0]):s.efc_gradient_stopSE[S].style.stopColor=L),["x","y"].forEach(function(w){(L=c.gradient_pointSE[S][w])!==h.gradient_pointSE[S][w]&&(s.efc_gradient_gradient[w+(S+1)].baseVal.value=h.gradient_pointSE[S][w]=L)})})}},dropShadow:{stats:{dropShadow_dx:{},dropShadow_dy:{},dropShadow_blur:{},dropShadow_color:{},dropShadow_opacity:{},dropShadow_x:{},dropShadow_y:{}},optionsConf:[["type","dx",null,null,null,2],["type","dy",null,null,null,4],["type","blur",null,null,null,3,function(s){return 0<=s}],["type","color",null,null,null,"#000",null,!0],["type","opacity",null,null,null,.8,function(s){return 0<=s&&s<=1}]],init:function(s){var l,a,c,h,y,x=s.baseWindow.document,S=s.defs,L=Ne+"-"+s._id+"-dropShadow",w=(l=x,a=L,y={},typeof M!="boolean"&&(M=!!window.SVGFEDropShadowElement&&!Oe),y.elmsAppend=[y.elmFilter=c=l.createElementNS($,"filter")],c.filterUnits.baseVal=SVGUnitTypes.SVG_UNIT_TYPE_USERSPACEONUSE,c.x.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PX,0),c.y.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PX,0),c.width.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PERCENTAGE,100),c.height.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PERCENTAGE,100),c.id=a,M?(y.elmOffset=y.elmBlur=h=c.appendChild(l.createElementNS($,"feDropShadow")),y.styleFlood=h.style):(y.elmBlur=c.appendChild(l.createElementNS($,"feGaussianBlur")),y.elmOffset=h=c.appendChild(l.createElementNS($,"feOffset")),h.result.baseVal="offsetblur",h=c.appendChild(l.createElementNS($,"feFlood")),y.styleFlood=h.style,(h=c.appendChild(l.createElementNS($,"feComposite"))).in2.baseVal="offsetblur",h.operator.baseVal=SVGFECompositeElement.SVG_FECOMPOSITE_OPERATOR_IN,(h=c.appendChild(l.createElementNS($,"feMerge"))).appendChild(l.createElementNS($,"feMergeNode")),h.appendChild(l.createElementNS($,"feMergeNode")).in1.baseVal="SourceGraphic"),y);["elmFilter","elmOffset","elmBlur","styleFlood","elmsAppend"].forEach(function(U){s["efc_dropShadow_"+U]=w[U]}),w.elmsAppend.forEach(function(U){S.appendChild(U)}),s.face.setAttribute("filter","url(#"+L+")"),Mt(s,"new_edge4viewBox",i.dropShadow.adjustEdge),i.dropShadow.update(s)},remove:function(s){var l=s.defs;s.efc_dropShadow_elmsAppend&&(s.efc_dropShadow_elmsAppend.forEach(function(a){l.removeChild(a)}),s.efc_dropShadow_elmFilter=s.efc_dropShadow_elmOffset=s.efc_dropShadow_elmBlur=s.efc_dropShadow_styleFlood=s.efc_dropShadow_elmsAppend=null),Lt(s,"new_edge4viewBox",i.dropShadow.adjustEdge),nn(s,{}),s.face.removeAttribute("filter"),$t(s.aplStats,i.dropShadow.stats)},update:function(s){var l,a,c=s.curStats,h=s.aplStats,y=h.dropShadow_options;c.dropShadow_dx=l=y.dx,ue(s,h,"dropShadow_dx",l)&&(s.efc_dropShadow_elmOffset.dx.baseVal=l,a=!0),c.dropShadow_dy=l=y.dy,ue(s,h,"dropShadow_dy",l)&&(s.efc_dropShadow_elmOffset.dy.baseVal=l,a=!0),c.dropShadow_blur=l=y.blur,ue(s,h,"dropShadow_blur",l)&&(s.efc_dropShadow_elmBlur.setStdDeviation(l,l),a=!0),a&&nn(s,{}),c.dropShadow_color=l=y.color,ue(s,h,"dropShadow_color",l)&&(s.efc_dropShadow_styleFlood.floodColor=l),c.dropShadow_opacity=l=y.opacity,ue(s,h,"dropShadow_opacity",l)&&(s.efc_dropShadow_styleFlood.floodOpacity=l)},adjustEdge:function(s,l){var a,c,h=s.curStats,y=s.aplStats;h.dropShadow_dx!=null&&(a=3*h.dropShadow_blur,(c={x1:l.x1-a+h.dropShadow_dx,y1:l.y1-a+h.dropShadow_dy,x2:l.x2+a+h.dropShadow_dx,y2:l.y2+a+h.dropShadow_dy}).x1<l.x1&&(l.x1=c.x1),c.y1<l.y1&&(l.y1=c.y1),c.x2>l.x2&&(l.x2=c.x2),c.y2>l.y2&&(l.y2=c.y2),["x","y"].forEach(function(x){var S,L="dropShadow_"+x;h[L]=S=l[x+"1"],ue(s,y,L,S)&&(s.efc_dropShadow_elmFilter[x].baseVal.value=S)}))}}},Object.keys(i).forEach(function(s){var l=i[s],a=l.stats;a[s+"_enabled"]={iniValue:!1},a[s+"_options"]={hasProps:!0},l.anim&&(a[s+"_animOptions"]={},a[s+"_animId"]={})}),o={none:{defaultAnimOptions:{},init:function(s,l){var a=s.curStats;a.show_animId&&(gt.remove(a.show_animId),a.show_animId=null),o.none.start(s,l)},start:function(s,l){o.none.stop(s,!0)},stop:function(s,l,a){var c=s.curStats;return a=a??s.aplStats.show_on,c.show_inAnim=!1,l&&vs(s,a),a?1:0}},fade:{defaultAnimOptions:{duration:300,timing:"linear"},init:function(s,l){var a=s.curStats,c=s.aplStats;a.show_animId&&gt.remove(a.show_animId),a.show_animId=gt.add(function(h){return h},function(h,y){y?o.fade.stop(s,!0):(s.svg.style.opacity=h+"",Se&&(wt(s,s.svg),hr(s)))},c.show_animOptions.duration,1,c.show_animOptions.timing,null,!1),o.fade.start(s,l)},start:function(s,l){var a,c=s.curStats;c.show_inAnim&&(a=gt.stop(c.show_animId)),vs(s,1),c.show_inAnim=!0,gt.start(c.show_animId,!s.aplStats.show_on,l??a)},stop:function(s,l,a){var c,h=s.curStats;return a=a??s.aplStats.show_on,c=h.show_inAnim?gt.stop(h.show_animId):a?1:0,h.show_inAnim=!1,l&&(s.svg.style.opacity=a?"":"0",vs(s,a)),c}},draw:{defaultAnimOptions:{duration:500,timing:[.58,0,.42,1]},init:function(s,l){var a=s.curStats,c=s.aplStats,h=s.pathList.baseVal,y=dr(h),x=y.segsLen,S=y.lenAll;a.show_animId&&gt.remove(a.show_animId),a.show_animId=gt.add(function(L){var w,U,ee,T,O=-1;if(L===0)U=[[h[0][0],h[0][0]]];else if(L===1)U=h;else{for(w=S*L,U=[];w>=x[++O];)U.push(h[O]),w-=x[O];w&&((ee=h[O]).length===2?U.push([ee[0],Vs(ee[0],ee[1],w/x[O])]):(T=ys(ee[0],ee[1],ee[2],ee[3],io(ee[0],ee[1],ee[2],ee[3],w)),U.push([ee[0],T.fromP1,T.fromP2,T])))}return U},function(L,w){w?o.draw.stop(s,!0):(s.pathList.animVal=L,nn(s,{path:!0}))},c.show_animOptions.duration,1,c.show_animOptions.timing,null,!1),o.draw.start(s,l)},start:function(s,l){var a,c=s.curStats;c.show_inAnim&&(a=gt.stop(c.show_animId)),vs(s,1),c.show_inAnim=!0,Mt(s,"apl_position",o.draw.update),gt.start(c.show_animId,!s.aplStats.show_on,l??a)},stop:function(s,l,a){var c,h=s.curStats;return a=a??s.aplStats.show_on,c=h.show_inAnim?gt.stop(h.show_animId):a?1:0,h.show_inAnim=!1,l&&(s.pathList.animVal=a?null:[[s.pathList.baseVal[0][0],s.pathList.baseVal[0][0]]],nn(s,{path:!0}),vs(s,a)),c},update:function(s){Lt(s,"apl_position",o.draw.update),s.curStats.show_inAnim?o.draw.init(s,o.draw.stop(s)):s.aplStats.show_animOptions={}}}},[["start","anchorSE",0],["end","anchorSE",1],["color","lineColor"],["size","lineSize"],["startSocketGravity","socketGravitySE",0],["endSocketGravity","socketGravitySE",1],["startPlugColor","plugColorSE",0],["endPlugColor","plugColorSE",1],["startPlugSize","plugSizeSE",0],["endPlugSize","plugSizeSE",1],["outline","lineOutlineEnabled"],["outlineColor","lineOutlineColor"],["outlineSize","lineOutlineSize"],["startPlugOutline","plugOutlineEnabledSE",0],["endPlugOutline","plugOutlineEnabledSE",1],["startPlugOutlineColor","plugOutlineColorSE",0],["endPlugOutlineColor","plugOutlineColorSE",1],["startPlugOutlineSize","plugOutlineSizeSE",0],["endPlugOutlineSize","plugOutlineSizeSE",1]].forEach(function(s){var l=s[0],a=s[1],c=s[2];Object.defineProperty(sn.prototype,l,{get:function(){var h=c!=null?Vt[this._id].options[a][c]:a?Vt[this._id].options[a]:Vt[this._id].options[l];return h==null?re:Dt(h)},set:pi(l),enumerable:!0})}),[["path",en],["startSocket",qt,"socketSE",0],["endSocket",qt,"socketSE",1],["startPlug",Ct,"plugSE",0],["endPlug",Ct,"plugSE",1]].forEach(function(s){var l=s[0],a=s[1],c=s[2],h=s[3];Object.defineProperty(sn.prototype,l,{get:function(){var y,x=h!=null?Vt[this._id].options[c][h]:c?Vt[this._id].options[c]:Vt[this._id].options[l];return x?Object.keys(a).some(function(S){return a[S]===x&&(y=S,!0)})?y:new Error("It's broken"):re},set:pi(l),enumerable:!0})}),Object.keys(i).forEach(function(s){var l=i[s];Object.defineProperty(sn.prototype,s,{get:function(){var a,c,h=Vt[this._id].options[s];return ut(h)?(a=h,c=l.optionsConf.reduce(function(y,x){var S,L=x[0],w=x[1],U=x[2],ee=x[3],T=x[4],O=T!=null?a[ee][T]:ee?a[ee]:a[w];return y[w]=L==="id"?O?Object.keys(U).some(function(D){return U[D]===O&&(S=D,!0)})?S:new Error("It's broken"):re:O==null?re:Dt(O),y},{}),l.anim&&(c.animation=Dt(a.animation)),c):h},set:pi(s),enumerable:!0})}),["startLabel","endLabel","middleLabel"].forEach(function(s,l){Object.defineProperty(sn.prototype,s,{get:function(){var a=Vt[this._id],c=a.options;return c.labelSEM[l]&&!a.optionIsAttach.labelSEM[l]?Rt[c.labelSEM[l]._id].text:c.labelSEM[l]||""},set:pi(s),enumerable:!0})}),sn.prototype.setOptions=function(s){return fi(Vt[this._id],s),this},sn.prototype.position=function(){return nn(Vt[this._id],{position:!0}),this},sn.prototype.remove=function(){var s=Vt[this._id],l=s.curStats;Object.keys(i).forEach(function(a){var c=a+"_animId";l[c]&&gt.remove(l[c])}),l.show_animId&&gt.remove(l.show_animId),s.attachments.slice().forEach(function(a){hi(s,a)}),s.baseWindow&&s.svg&&s.baseWindow.document.body.removeChild(s.svg),delete Vt[this._id]},sn.prototype.show=function(s,l){return di(Vt[this._id],!0,s,l),this},sn.prototype.hide=function(s,l){return di(Vt[this._id],!1,s,l),this},f=function(s){s&&Rt[s._id]&&(s.boundTargets.slice().forEach(function(l){hi(l.props,s,!0)}),s.conf.remove&&s.conf.remove(s),delete Rt[s._id])},br.prototype.remove=function(){var s=this,l=Rt[s._id];l&&(l.boundTargets.slice().forEach(function(a){l.conf.removeOption(l,a)}),bs(function(){var a=Rt[s._id];a&&(console.error("LeaderLineAttachment was not removed by removeOption"),f(a))}))},u=br,window.LeaderLineAttachment=u,d=function(s,l){return s instanceof u&&(!(s.isRemoved||l&&Rt[s._id].conf.type!==l)||null)},r={pointAnchor:{type:"anchor",argOptions:[{optionName:"element",type:Rs}],init:function(s,l){return s.element=r.pointAnchor.checkElement(l.element),s.x=r.pointAnchor.parsePercent(l.x,!0)||[.5,!0],s.y=r.pointAnchor.parsePercent(l.y,!0)||[.5,!0],!0},removeOption:function(s,l){var a=l.props,c={},h=s.element,y=a.options.anchorSE[l.optionName==="start"?1:0];h===y&&(h=y===document.body?new u(r.pointAnchor,[h]):document.body),c[l.optionName]=h,fi(a,c)},getBBoxNest:function(s,l){var a=$s(s.element,l.baseWindow),c=a.width,h=a.height;return a.width=a.height=0,a.left=a.right=a.left+s.x[0]*(s.x[1]?c:1),a.top=a.bottom=a.top+s.y[0]*(s.y[1]?h:1),a},parsePercent:function(s,l){var a,c,h=!1;return pt(s)?c=s:typeof s=="string"&&(a=oe.exec(s))&&a[2]&&(h=(c=parseFloat(a[1])/100)!==0),c!=null&&(l||0<=c)?[c,h]:null},checkElement:function(s){if(s==null)s=document.body;else if(!Rs(s))throw new Error("`element` must be Element");return s}},areaAnchor:{type:"anchor",argOptions:[{optionName:"element",type:Rs},{optionName:"shape",type:"string"}],stats:{color:{},strokeWidth:{},elementWidth:{},elementHeight:{},elementLeft:{},elementTop:{},pathListRel:{},bBoxRel:{},pathData:{},viewBoxBBox:{hasProps:!0},dashLen:{},dashGap:{}},init:function(s,l){var a,c,h,y=[];return s.element=r.pointAnchor.checkElement(l.element),typeof l.color=="string"&&(s.color=l.color.trim()),typeof l.fillColor=="string"&&(s.fill=l.fillColor.trim()),pt(l.size)&&0<=l.size&&(s.size=l.size),l.dash&&(s.dash=!0,pt(l.dash.len)&&0<l.dash.len&&(s.dashLen=l.dash.len),pt(l.dash.gap)&&0<l.dash.gap&&(s.dashGap=l.dash.gap)),l.shape==="circle"?s.shape=l.shape:l.shape==="polygon"&&Array.isArray(l.points)&&3<=l.points.length&&l.points.every(function(x){var S={};return!(!(S.x=r.pointAnchor.parsePercent(x[0],!0))||!(S.y=r.pointAnchor.parsePercent(x[1],!0)))&&(y.push(S),(S.x[1]||S.y[1])&&(s.hasRatio=!0),!0)})?(s.shape=l.shape,s.points=y):(s.shape="rect",s.radius=pt(l.radius)&&0<=l.radius?l.radius:0),s.shape!=="rect"&&s.shape!=="circle"||(s.x=r.pointAnchor.parsePercent(l.x,!0)||[-.05,!0],s.y=r.pointAnchor.parsePercent(l.y,!0)||[-.05,!0],s.width=r.pointAnchor.parsePercent(l.width)||[1.1,!0],s.height=r.pointAnchor.parsePercent(l.height)||[1.1,!0],(s.x[1]||s.y[1]||s.width[1]||s.height[1])&&(s.hasRatio=!0)),a=s.element.ownerDocument,s.svg=c=a.createElementNS($,"svg"),c.className.baseVal=Ne+"-areaAnchor",c.viewBox.baseVal||c.setAttribute("viewBox","0 0 0 0"),s.path=c.appendChild(a.createElementNS($,"path")),s.path.style.fill=s.fill||"none",s.isShown=!1,c.style.visibility="hidden",a.body.appendChild(c),gr(h=a.defaultView),s.bodyOffset=mr(h),s.updateColor=function(){var x,S=s.curStats,L=s.aplStats,w=s.boundTargets.length?s.boundTargets[0].props.curStats:null;S.color=x=s.color||(w?w.line_color:je.lineColor),ue(s,L,"color",x)&&(s.path.style.stroke=x)},s.updateShow=function(){vs(s,s.boundTargets.some(function(x){return x.props.isShown===!0}))},!0},bind:function(s,l){var a=l.props;return s.color||Mt(a,"cur_line_color",s.updateColor),Mt(a,"svgShow",s.updateShow),bs(function(){s.updateColor(),s.updateShow()}),!0},unbind:function(s,l){var a=l.props;s.color||Lt(a,"cur_line_color",s.updateColor),Lt(a,"svgShow",s.updateShow),1<s.boundTargets.length&&bs(function(){s.updateColor(),s.updateShow(),r.areaAnchor.update(s)&&s.boundTargets.forEach(function(c){nn(c.props,{position:!0})})})},removeOption:function(s,l){r.pointAnchor.removeOption(s,l)},remove:function(s){s.boundTargets.length&&(console.error("LeaderLineAttachment was not unbound by remove"),s.boundTargets.forEach(function(l){r.areaAnchor.unbind(s,l)})),s.svg.parentNode.removeChild(s.svg)},getStrokeWidth:function(s,l){return r.areaAnchor.update(s)&&1<s.boundTargets.length&&bs(function(){s.boundTargets.forEach(function(a){a.props!==l&&nn(a.props,{position:!0})})}),s.curStats.strokeWidth},getPathData:function(s,l){var a=$s(s.element,l.baseWindow);return oo(s.curStats.pathListRel,function(c){c.x+=a.left,c.y+=a.top})},getBBoxNest:function(s,l){var a=$s(s.element,l.baseWindow),c=s.curStats.bBoxRel;return{left:c.left+a.left,top:c.top+a.top,right:c.right+a.left,bottom:c.bottom+a.top,width:c.width,height:c.height}},update:function(s){var l,a,c,h,y,x,S,L,w,U,ee,T,O,D,I,B,N,H,K,A,k,le,Z,ve,z,P,m,_,F,J,te,X,C=s.curStats,xe=s.aplStats,ie=s.boundTargets.length?s.boundTargets[0].props.curStats:null,j={};if(j.strokeWidth=ue(s,C,"strokeWidth",s.size!=null?s.size:ie?ie.line_strokeWidth:je.lineSize),l=li(s.element),j.elementWidth=ue(s,C,"elementWidth",l.width),j.elementHeight=ue(s,C,"elementHeight",l.height),j.elementLeft=ue(s,C,"elementLeft",l.left),j.elementTop=ue(s,C,"elementTop",l.top),j.strokeWidth||s.hasRatio&&(j.elementWidth||j.elementHeight)){switch(s.shape){case"rect":(_={left:s.x[0]*(s.x[1]?l.width:1),top:s.y[0]*(s.y[1]?l.height:1),width:s.width[0]*(s.width[1]?l.width:1),height:s.height[0]*(s.height[1]?l.height:1)}).right=_.left+_.width,_.bottom=_.top+_.height,Z=C.strokeWidth/2,k=(le=Math.min(_.width,_.height))?le/2*Math.SQRT2+Z:0,P=(A=s.radius?s.radius<=k?s.radius:k:0)?(z=A-(ve=(A-Z)/Math.SQRT2),m=A*ae,P=[{x:_.left-z,y:_.top+ve},{x:_.left+ve,y:_.top-z},{x:_.right-ve,y:_.top-z},{x:_.right+z,y:_.top+ve},{x:_.right+z,y:_.bottom-ve},{x:_.right-ve,y:_.bottom+z},{x:_.left+ve,y:_.bottom+z},{x:_.left-z,y:_.bottom-ve}],C.pathListRel=[[P[0],{x:P[0].x,y:P[0].y-m},{x:P[1].x-m,y:P[1].y},P[1]]],P[1].x!==P[2].x&&C.pathListRel.push([P[1],P[2]]),C.pathListRel.push([P[2],{x:P[2].x+m,y:P[2].y},{x:P[3].x,y:P[3].y-m},P[3]]),P[3].y!==P[4].y&&C.pathListRel.push([P[3],P[4]]),C.pathListRel.push([P[4],{x:P[4].x,y:P[4].y+m},{x:P[5].x+m,y:P[5].y},P[5]]),P[5].x!==P[6].x&&C.pathListRel.push([P[5],P[6]]),C.pathListRel.push([P[6],{x:P[6].x-m,y:P[6].y},{x:P[7].x,y:P[7].y+m},P[7]]),P[7].y!==P[0].y&&C.pathListRel.push([P[7],P[0]]),C.pathListRel.push([]),z=A-ve+C.strokeWidth/2,[{x:_.left-z,y:_.top-z},{x:_.right+z,y:_.bottom+z}]):(z=C.strokeWidth/2,P=[{x:_.left-z,y:_.top-z},{x:_.right+z,y:_.bottom+z}],C.pathListRel=[[P[0],{x:P[1].x,y:P[0].y}],[{x:P[1].x,y:P[0].y},P[1]],[P[1],{x:P[0].x,y:P[1].y}],[]],[{x:_.left-C.strokeWidth,y:_.top-C.strokeWidth},{x:_.right+C.strokeWidth,y:_.bottom+C.strokeWidth}]),C.bBoxRel={left:P[0].x,top:P[0].y,right:P[1].x,bottom:P[1].y,width:P[1].x-P[0].x,height:P[1].y-P[0].y};break;case"circle":(K={left:s.x[0]*(s.x[1]?l.width:1),top:s.y[0]*(s.y[1]?l.height:1),width:s.width[0]*(s.width[1]?l.width:1),height:s.height[0]*(s.height[1]?l.height:1)}).width||K.height||(K.width=K.height=10),K.width||(K.width=K.height),K.height||(K.height=K.width),K.right=K.left+K.width,K.bottom=K.top+K.height,S=K.left+K.width/2,L=K.top+K.height/2,O=C.strokeWidth/2,D=K.width/2,I=K.height/2,w=D*Math.SQRT2+O,U=I*Math.SQRT2+O,ee=w*ae,T=U*ae,H=[{x:S-w,y:L},{x:S,y:L-U},{x:S+w,y:L},{x:S,y:L+U}],C.pathListRel=[[H[0],{x:H[0].x,y:H[0].y-T},{x:H[1].x-ee,y:H[1].y},H[1]],[H[1],{x:H[1].x+ee,y:H[1].y},{x:H[2].x,y:H[2].y-T},H[2]],[H[2],{x:H[2].x,y:H[2].y+T},{x:H[3].x+ee,y:H[3].y},H[3]],[H[3],{x:H[3].x-ee,y:H[3].y},{x:H[0].x,y:H[0].y+T},H[0]],[]],B=w-D+C.strokeWidth/2,N=U-I+C.strokeWidth/2,H=[{x:K.left-B,y:K.top-N},{x:K.right+B,y:K.bottom+N}],C.bBoxRel={left:H[0].x,top:H[0].y,right:H[1].x,bottom:H[1].y,width:H[1].x-H[0].x,height:H[1].y-H[0].y};break;case"polygon":s.points.forEach(function(se){var Ge=se.x[0]*(se.x[1]?l.width:1),qe=se.y[0]*(se.y[1]?l.height:1);c?(Ge<c.left&&(c.left=Ge),Ge>c.right&&(c.right=Ge),qe<c.top&&(c.top=qe),qe>c.bottom&&(c.bottom=qe)):c={left:Ge,right:Ge,top:qe,bottom:qe},h?C.pathListRel.push([h,{x:Ge,y:qe}]):C.pathListRel=[],h={x:Ge,y:qe}}),C.pathListRel.push([]),y=C.strokeWidth/2,x=[{x:c.left-y,y:c.top-y},{x:c.right+y,y:c.bottom+y}],C.bBoxRel={left:x[0].x,top:x[0].y,right:x[1].x,bottom:x[1].y,width:x[1].x-x[0].x,height:x[1].y-x[0].y}}j.pathListRel=j.bBoxRel=!0}return(j.pathListRel||j.elementLeft||j.elementTop)&&(C.pathData=oo(C.pathListRel,function(se){se.x+=l.left,se.y+=l.top})),ue(s,xe,"strokeWidth",a=C.strokeWidth)&&(s.path.style.strokeWidth=a+"px"),ui(a=C.pathData,xe.pathData)&&(s.path.setPathData(a),xe.pathData=a,j.pathData=!0),s.dash&&(!j.pathData&&(!j.strokeWidth||s.dashLen&&s.dashGap)||(C.dashLen=s.dashLen||2*C.strokeWidth,C.dashGap=s.dashGap||C.strokeWidth),j.dash=ue(s,xe,"dashLen",C.dashLen)||j.dash,j.dash=ue(s,xe,"dashGap",C.dashGap)||j.dash,j.dash&&(s.path.style.strokeDasharray=xe.dashLen+","+xe.dashGap)),F=C.viewBoxBBox,J=xe.viewBoxBBox,te=s.svg.viewBox.baseVal,X=s.svg.style,F.x=C.bBoxRel.left+l.left,F.y=C.bBoxRel.top+l.top,F.width=C.bBoxRel.width,F.height=C.bBoxRel.height,["x","y","width","height"].forEach(function(se){(a=F[se])!==J[se]&&(te[se]=J[se]=a,X[Ee[se]]=a+(se==="x"||se==="y"?s.bodyOffset[se]:0)+"px")}),j.strokeWidth||j.pathListRel||j.bBoxRel}},mouseHoverAnchor:{type:"anchor",argOptions:[{optionName:"element",type:Rs},{optionName:"showEffectName",type:"string"}],style:{backgroundImage:"url('data:image/svg+xml;charset=utf-8;base64,PHN2ZyB2ZXJzaW9uPSIxLjEiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyIgd2lkdGg9IjI0IiBoZWlnaHQ9IjI0Ij48cG9seWdvbiBwb2ludHM9IjI0LDAgMCw4IDgsMTEgMCwxOSA1LDI0IDEzLDE2IDE2LDI0IiBmaWxsPSJjb3JhbCIvPjwvc3ZnPg==')",backgroundSize:"",backgroundRepeat:"no-repeat",backgroundColor:"#f8f881",cursor:"default"},hoverStyle:{backgroundImage:"none",backgroundColor:"#fadf8f"},padding:{top:1,right:15,bottom:1,left:2},minHeight:15,backgroundPosition:{right:2,top:2},backgroundSize:{width:12,height:12},dirKeys:[["top","Top"],["right","Right"],["bottom","Bottom"],["left","Left"]],init:function(s,l){var a,c,h,y,x,S,L,w,U,ee,T,O=r.mouseHoverAnchor,D={};if(s.element=r.pointAnchor.checkElement(l.element),w=s.element,!((ee=w.ownerDocument)&&(U=ee.defaultView)&&U.HTMLElement&&w instanceof U.HTMLElement))throw new Error("`element` must be HTML element");return O.style.backgroundSize=O.backgroundSize.width+"px "+O.backgroundSize.height+"px",["style","hoverStyle"].forEach(function(I){var B=O[I];s[I]=Object.keys(B).reduce(function(N,H){return N[H]=B[H],N},{})}),(a=s.element.ownerDocument.defaultView.getComputedStyle(s.element,"")).display==="inline"?s.style.display="inline-block":a.display==="none"&&(s.style.display="block"),r.mouseHoverAnchor.dirKeys.forEach(function(I){var B=I[0],N="padding"+I[1];parseFloat(a[N])<O.padding[B]&&(s.style[N]=O.padding[B]+"px")}),s.style.display&&(y=s.element.style.display,s.element.style.display=s.style.display),r.mouseHoverAnchor.dirKeys.forEach(function(I){var B="padding"+I[1];s.style[B]&&(D[B]=s.element.style[B],s.element.style[B]=s.style[B])}),(h=s.element.getBoundingClientRect()).height<O.minHeight&&(Se?(T=O.minHeight,a.boxSizing==="content-box"?T-=parseFloat(a.borderTopWidth)+parseFloat(a.borderBottomWidth)+parseFloat(a.paddingTop)+parseFloat(a.paddingBottom):a.boxSizing==="padding-box"&&(T-=parseFloat(a.borderTopWidth)+parseFloat(a.borderBottomWidth)),s.style.height=T+"px"):s.style.height=parseFloat(a.height)+(O.minHeight-h.height)+"px"),s.style.backgroundPosition=Oe?h.width-O.backgroundSize.width-O.backgroundPosition.right+"px "+O.backgroundPosition.top+"px":"right "+O.backgroundPosition.right+"px top "+O.backgroundPosition.top+"px",s.style.display&&(s.element.style.display=y),r.mouseHoverAnchor.dirKeys.forEach(function(I){var B="padding"+I[1];s.style[B]&&(s.element.style[B]=D[B])}),["style","hoverStyle"].forEach(function(I){var B=s[I],N=l[I];ut(N)&&Object.keys(N).forEach(function(H){typeof N[H]=="string"||pt(N[H])?B[H]=N[H]:N[H]==null&&delete B[H]})}),typeof l.onSwitch=="function"&&(L=l.onSwitch),l.showEffectName&&o[l.showEffectName]&&(s.showEffectName=x=l.showEffectName),S=l.animOptions,s.elmStyle=c=s.element.style,s.mouseenter=function(I){s.hoverStyleSave=O.getStyles(c,Object.keys(s.hoverStyle)),O.setStyles(c,s.hoverStyle),s.boundTargets.forEach(function(B){di(B.props,!0,x,S)}),L&&L(I)},s.mouseleave=function(I){O.setStyles(c,s.hoverStyleSave),s.boundTargets.forEach(function(B){di(B.props,!1,x,S)}),L&&L(I)},!0},bind:function(s,l){var a,c,h,y,x;return l.props.svg?r.mouseHoverAnchor.llShow(l.props,!1,s.showEffectName):bs(function(){r.mouseHoverAnchor.llShow(l.props,!1,s.showEffectName)}),s.enabled||(s.styleSave=r.mouseHoverAnchor.getStyles(s.elmStyle,Object.keys(s.style)),r.mouseHoverAnchor.setStyles(s.elmStyle,s.style),s.removeEventListener=(a=s.element,c=s.mouseenter,h=s.mouseleave,"onmouseenter"in a&&"onmouseleave"in a?(a.addEventListener("mouseenter",c,!1),a.addEventListener("mouseleave",h,!1),function(){a.removeEventListener("mouseenter",c,!1),a.removeEventListener("mouseleave",h,!1)}):(console.warn("mouseenter and mouseleave events polyfill is enabled."),y=function(S){S.relatedTarget&&(S.relatedTarget===this||this.compareDocumentPosition(S.relatedTarget)&Node.DOCUMENT_POSITION_CONTAINED_BY)||c.apply(this,arguments)},a.addEventListener("mouseover",y),x=function(S){S.relatedTarget&&(S.relatedTarget===this||this.compareDocumentPosition(S.relatedTarget)&Node.DOCUMENT_POSITION_CONTAINED_BY)||h.apply(this,arguments)},a.addEventListener("mouseout",x),function(){a.removeEventListener("mouseover",y,!1),a.removeEventListener("mouseout",x,!1)})),s.enabled=!0),!0},unbind:function(s,l){s.enabled&&s.boundTargets.length<=1&&(s.removeEventListener(),r.mouseHoverAnchor.setStyles(s.elmStyle,s.styleSave),s.enabled=!1),r.mouseHoverAnchor.llShow(l.props,!0,s.showEffectName)},removeOption:function(s,l){r.pointAnchor.removeOption(s,l)},remove:function(s){s.boundTargets.length&&(console.error("LeaderLineAttachment was not unbound by remove"),s.boundTargets.forEach(function(l){r.mouseHoverAnchor.unbind(s,l)}))},getBBoxNest:function(s,l){return $s(s.element,l.baseWindow)},llShow:function(s,l,a){o[a||s.curStats.show_effect].stop(s,!0,l),s.aplStats.show_on=l},getStyles:function(s,l){return l.reduce(function(a,c){return a[c]=s[c],a},{})},setStyles:function(s,l){Object.keys(l).forEach(function(a){s[a]=l[a]})}},captionLabel:{type:"label",argOptions:[{optionName:"text",type:"string"}],stats:{color:{},x:{},y:{}},textStyleProps:["fontFamily","fontStyle","fontVariant","fontWeight","fontStretch","fontSize","fontSizeAdjust","kerning","letterSpacing","wordSpacing","textDecoration"],init:function(s,l){return typeof l.text=="string"&&(s.text=l.text.trim()),!!s.text&&(typeof l.color=="string"&&(s.color=l.color.trim()),s.outlineColor=typeof l.outlineColor=="string"?l.outlineColor.trim():"#fff",Array.isArray(l.offset)&&pt(l.offset[0])&&pt(l.offset[1])&&(s.offset={x:l.offset[0],y:l.offset[1]}),pt(l.lineOffset)&&(s.lineOffset=l.lineOffset),r.captionLabel.textStyleProps.forEach(function(a){l[a]!=null&&(s[a]=l[a])}),s.updateColor=function(a){r.captionLabel.updateColor(s,a)},s.updateSocketXY=function(a){var c,h,y,x,S=s.curStats,L=s.aplStats,w=a.curStats,U=w.position_socketXYSE[s.socketIndex];U.x!=null&&(s.offset?(S.x=U.x+s.offset.x,S.y=U.y+s.offset.y):(c=s.height/2,h=Math.max(w.attach_plugSideLenSE[s.socketIndex]||0,w.line_strokeWidth/2),y=w.position_socketXYSE[s.socketIndex?0:1],U.socketId===bt||U.socketId===ge?(S.x=U.socketId===bt?U.x-c-s.width:U.x+c,S.y=y.y<U.y?U.y+h+c:U.y-h-c-s.height):(S.x=y.x<U.x?U.x+h+c:U.x-h-c-s.width,S.y=U.socketId===ot?U.y-c-s.height:U.y+c)),ue(s,L,"x",x=S.x)&&(s.elmPosition.x.baseVal.getItem(0).value=x),ue(s,L,"y",x=S.y)&&(s.elmPosition.y.baseVal.getItem(0).value=x+s.height))},s.updatePath=function(a){var c,h,y=s.curStats,x=s.aplStats,S=a.pathList.animVal||a.pathList.baseVal;S&&(c=r.captionLabel.getMidPoint(S,s.lineOffset),y.x=c.x-s.width/2,y.y=c.y-s.height/2,ue(s,x,"x",h=y.x)&&(s.elmPosition.x.baseVal.getItem(0).value=h),ue(s,x,"y",h=y.y)&&(s.elmPosition.y.baseVal.getItem(0).value=h+s.height))},s.updateShow=function(a){r.captionLabel.updateShow(s,a)},Oe&&(s.adjustEdge=function(a,c){var h=s.curStats;h.x!=null&&r.captionLabel.adjustEdge(c,{x:h.x,y:h.y,width:s.width,height:s.height},s.strokeWidth/2)}),!0)},updateColor:function(s,l){var a,c=s.curStats,h=s.aplStats,y=l.curStats;c.color=a=s.color||y.line_color,ue(s,h,"color",a)&&(s.styleFill.fill=a)},updateShow:function(s,l){var a=l.isShown===!0;a!==s.isShown&&(s.styleShow.visibility=a?"":"hidden",s.isShown=a)},adjustEdge:function(s,l,a){var c={x1:l.x-a,y1:l.y-a,x2:l.x+l.width+a,y2:l.y+l.height+a};c.x1<s.x1&&(s.x1=c.x1),c.y1<s.y1&&(s.y1=c.y1),c.x2>s.x2&&(s.x2=c.x2),c.y2>s.y2&&(s.y2=c.y2)},newText:function(s,l,a,c,h){var y,x,S,L,w,U=l.createElementNS($,"text");return U.textContent=s,[U.x,U.y].forEach(function(ee){var T=a.createSVGLength();T.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PX,0),ee.baseVal.initialize(T)}),typeof E!="boolean"&&(E="paintOrder"in U.style),h&&!E?(x=l.createElementNS($,"defs"),U.id=c,x.appendChild(U),(L=(y=l.createElementNS($,"g")).appendChild(l.createElementNS($,"use"))).href.baseVal="#"+c,(S=y.appendChild(l.createElementNS($,"use"))).href.baseVal="#"+c,(w=L.style).strokeLinejoin="round",{elmPosition:U,styleText:U.style,styleFill:S.style,styleStroke:w,styleShow:y.style,elmsAppend:[x,y]}):(w=U.style,h&&(w.strokeLinejoin="round",w.paintOrder="stroke"),{elmPosition:U,styleText:w,styleFill:w,styleStroke:h?w:null,styleShow:w,elmsAppend:[U]})},getMidPoint:function(s,l){var a,c,h=dr(s),y=h.segsLen,x=h.lenAll,S=-1,L=x/2+(l||0);if(L<=0)return(a=s[0]).length===2?Vs(a[0],a[1],0):ys(a[0],a[1],a[2],a[3],0);if(x<=L)return(a=s[s.length-1]).length===2?Vs(a[0],a[1],1):ys(a[0],a[1],a[2],a[3],1);for(c=[];L>y[++S];)c.push(s[S]),L-=y[S];return(a=s[S]).length===2?Vs(a[0],a[1],L/y[S]):ys(a[0],a[1],a[2],a[3],io(a[0],a[1],a[2],a[3],L))},initSvg:function(s,l){var a,c,h=r.captionLabel.newText(s.text,l.baseWindow.document,l.svg,Ne+"-captionLabel-"+s._id,s.outlineColor);["elmPosition","styleFill","styleShow","elmsAppend"].forEach(function(y){s[y]=h[y]}),s.isShown=!1,s.styleShow.visibility="hidden",r.captionLabel.textStyleProps.forEach(function(y){s[y]!=null&&(h.styleText[y]=s[y])}),h.elmsAppend.forEach(function(y){l.svg.appendChild(y)}),a=h.elmPosition.getBBox(),s.width=a.width,s.height=a.height,s.outlineColor&&(c=10<(c=a.height/9)?10:c<2?2:c,h.styleStroke.strokeWidth=c+"px",h.styleStroke.stroke=s.outlineColor),s.strokeWidth=c||0,$t(s.aplStats,r.captionLabel.stats),s.updateColor(l),s.refSocketXY?s.updateSocketXY(l):s.updatePath(l),Oe&&nn(l,{}),s.updateShow(l)},bind:function(s,l){var a=l.props;return s.color||Mt(a,"cur_line_color",s.updateColor),(s.refSocketXY=l.optionName==="startLabel"||l.optionName==="endLabel")?(s.socketIndex=l.optionName==="startLabel"?0:1,Mt(a,"apl_position",s.updateSocketXY),s.offset||(Mt(a,"cur_attach_plugSideLenSE",s.updateSocketXY),Mt(a,"cur_line_strokeWidth",s.updateSocketXY))):Mt(a,"apl_path",s.updatePath),Mt(a,"svgShow",s.updateShow),Oe&&Mt(a,"new_edge4viewBox",s.adjustEdge),r.captionLabel.initSvg(s,a),!0},unbind:function(s,l){var a=l.props;s.elmsAppend&&(s.elmsAppend.forEach(function(c){a.svg.removeChild(c)}),s.elmPosition=s.styleFill=s.styleShow=s.elmsAppend=null),$t(s.curStats,r.captionLabel.stats),$t(s.aplStats,r.captionLabel.stats),s.color||Lt(a,"cur_line_color",s.updateColor),s.refSocketXY?(Lt(a,"apl_position",s.updateSocketXY),s.offset||(Lt(a,"cur_attach_plugSideLenSE",s.updateSocketXY),Lt(a,"cur_line_strokeWidth",s.updateSocketXY))):Lt(a,"apl_path",s.updatePath),Lt(a,"svgShow",s.updateShow),Oe&&(Lt(a,"new_edge4viewBox",s.adjustEdge),nn(a,{}))},removeOption:function(s,l){var a=l.props,c={};c[l.optionName]="",fi(a,c)},remove:function(s){s.boundTargets.length&&(console.error("LeaderLineAttachment was not unbound by remove"),s.boundTargets.forEach(function(l){r.captionLabel.unbind(s,l)}))}},pathLabel:{type:"label",argOptions:[{optionName:"text",type:"string"}],stats:{color:{},startOffset:{},pathData:{}},init:function(s,l){return typeof l.text=="string"&&(s.text=l.text.trim()),!!s.text&&(typeof l.color=="string"&&(s.color=l.color.trim()),s.outlineColor=typeof l.outlineColor=="string"?l.outlineColor.trim():"#fff",pt(l.lineOffset)&&(s.lineOffset=l.lineOffset),r.captionLabel.textStyleProps.forEach(function(a){l[a]!=null&&(s[a]=l[a])}),s.updateColor=function(a){r.captionLabel.updateColor(s,a)},s.updatePath=function(a){var c,h=s.curStats,y=s.aplStats,x=a.curStats,S=a.pathList.animVal||a.pathList.baseVal;S&&(h.pathData=c=r.pathLabel.getOffsetPathData(S,x.line_strokeWidth/2+s.strokeWidth/2+s.height/4,1.25*s.height),ui(c,y.pathData)&&(s.elmPath.setPathData(c),y.pathData=c,s.bBox=s.elmPosition.getBBox(),s.updateStartOffset(a)))},s.updateStartOffset=function(a){var c,h,y,x,S=s.curStats,L=s.aplStats,w=a.curStats;S.pathData&&(s.semIndex===2&&!s.lineOffset||(y=S.pathData.reduce(function(U,ee){var T,O=ee.values;switch(ee.type){case"M":h={x:O[0],y:O[1]};break;case"L":T={x:O[0],y:O[1]},h&&(U+=hn(h,T)),h=T;break;case"C":T={x:O[4],y:O[5]},h&&(U+=Ns(h,{x:O[0],y:O[1]},{x:O[2],y:O[3]},T)),h=T}return U},0),x=s.semIndex===0?0:s.semIndex===1?y:y/2,s.semIndex!==2&&(c=Math.max(w.attach_plugBackLenSE[s.semIndex]||0,w.line_strokeWidth/2)+s.strokeWidth/2+s.height/4,x=(x+=s.semIndex===0?c:-c)<0?0:y<x?y:x),s.lineOffset&&(x=(x+=s.lineOffset)<0?0:y<x?y:x),S.startOffset=x,ue(s,L,"startOffset",x)&&(s.elmOffset.startOffset.baseVal.value=x)))},s.updateShow=function(a){r.captionLabel.updateShow(s,a)},Oe&&(s.adjustEdge=function(a,c){s.bBox&&r.captionLabel.adjustEdge(c,s.bBox,s.strokeWidth/2)}),!0)},getOffsetPathData:function(s,l,a){var c,h,y=[];function x(S,L){return Math.abs(S.x-L.x)<3&&Math.abs(S.y-L.y)<3}return s.forEach(function(S){var L,w,U,ee,T,O,D,I,B,N,H,K,A,k,le,Z,ve,z,P,m,_;S.length===2?(z=S[0],P=S[1],m=l,_=Math.atan2(z.y-P.y,P.x-z.x)+.5*Math.PI,L=[{x:z.x+Math.cos(_)*m,y:z.y+Math.sin(_)*m*-1},{x:P.x+Math.cos(_)*m,y:P.y+Math.sin(_)*m*-1}],c?(U=c.points,0<=(ee=Math.atan2(U[1].y-U[0].y,U[0].x-U[1].x)-Math.atan2(S[0].y-S[1].y,S[1].x-S[0].x))&&ee<=Math.PI?w={type:"line",points:L,inside:!0}:(O=ai(U[0],U[1],l),T=ai(L[1],L[0],l),I=U[0],N=T,H=L[1],K=(B=O).x-I.x,A=B.y-I.y,k=H.x-N.x,le=H.y-N.y,Z=(-A*(I.x-N.x)+K*(I.y-N.y))/(-k*A+K*le),ve=(k*(I.y-N.y)-le*(I.x-N.x))/(-k*A+K*le),w=(D=0<=Z&&Z<=1&&0<=ve&&ve<=1?{x:I.x+ve*K,y:I.y+ve*A}:null)?{type:"line",points:[U[1]=D,L[1]]}:(U[1]=x(T,O)?T:O,{type:"line",points:[T,L[1]]}),c.len=hn(U[0],U[1]))):w={type:"line",points:L},w.len=hn(w.points[0],w.points[1]),y.push(c=w)):(y.push({type:"cubic",points:function(F,J,te,X,C,xe){for(var ie,j,se=Ns(F,J,te,X)/xe,Ge=1/(xe<C?C/xe*se:se),qe=[],ze=0;j=(90-(ie=ys(F,J,te,X,ze)).angle)*(Math.PI/180),qe.push({x:ie.x+Math.cos(j)*C,y:ie.y+Math.sin(j)*C*-1}),!(1<=ze);)1<(ze+=Ge)&&(ze=1);return qe}(S[0],S[1],S[2],S[3],l,16)}),c=null)}),c=null,y.forEach(function(S){var L;c=S.type==="line"?(S.inside&&(c.len>l?((L=c.points)[1]=ai(L[0],L[1],-l),c.len=hn(L[0],L[1])):(c.points=null,c.len=0),S.len>l+a?((L=S.points)[0]=ai(L[1],L[0],-(l+a)),S.len=hn(L[0],L[1])):(S.points=null,S.len=0)),S):null}),y.reduce(function(S,L){var w=L.points;return w&&(h&&x(w[0],h)||S.push({type:"M",values:[w[0].x,w[0].y]}),L.type==="line"?S.push({type:"L",values:[w[1].x,w[1].y]}):(w.shift(),w.forEach(function(U){S.push({type:"L",values:[U.x,U.y]})})),h=w[w.length-1]),S},[])},newText:function(s,l,a,c){var h,y,x,S,L,w,U,ee,T=l.createElementNS($,"defs"),O=T.appendChild(l.createElementNS($,"path"));return O.id=h=a+"-path",(S=(x=l.createElementNS($,"text")).appendChild(l.createElementNS($,"textPath"))).href.baseVal="#"+h,S.startOffset.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PX,0),S.textContent=s,typeof E!="boolean"&&(E="paintOrder"in x.style),c&&!E?(x.id=y=a+"-text",T.appendChild(x),(U=(L=l.createElementNS($,"g")).appendChild(l.createElementNS($,"use"))).href.baseVal="#"+y,(w=L.appendChild(l.createElementNS($,"use"))).href.baseVal="#"+y,(ee=U.style).strokeLinejoin="round",{elmPosition:x,elmPath:O,elmOffset:S,styleText:x.style,styleFill:w.style,styleStroke:ee,styleShow:L.style,elmsAppend:[T,L]}):(ee=x.style,c&&(ee.strokeLinejoin="round",ee.paintOrder="stroke"),{elmPosition:x,elmPath:O,elmOffset:S,styleText:ee,styleFill:ee,styleStroke:c?ee:null,styleShow:ee,elmsAppend:[T,x]})},initSvg:function(s,l){var a,c,h=r.pathLabel.newText(s.text,l.baseWindow.document,Ne+"-pathLabel-"+s._id,s.outlineColor);["elmPosition","elmPath","elmOffset","styleFill","styleShow","elmsAppend"].forEach(function(y){s[y]=h[y]}),s.isShown=!1,s.styleShow.visibility="hidden",r.captionLabel.textStyleProps.forEach(function(y){s[y]!=null&&(h.styleText[y]=s[y])}),h.elmsAppend.forEach(function(y){l.svg.appendChild(y)}),h.elmPath.setPathData([{type:"M",values:[0,100]},{type:"h",values:[100]}]),a=h.elmPosition.getBBox(),h.styleText.textAnchor=["start","end","middle"][s.semIndex],s.semIndex!==2||s.lineOffset||h.elmOffset.startOffset.baseVal.newValueSpecifiedUnits(SVGLength.SVG_LENGTHTYPE_PERCENTAGE,50),s.height=a.height,s.outlineColor&&(c=10<(c=a.height/9)?10:c<2?2:c,h.styleStroke.strokeWidth=c+"px",h.styleStroke.stroke=s.outlineColor),s.strokeWidth=c||0,$t(s.aplStats,r.pathLabel.stats),s.updateColor(l),s.updatePath(l),s.updateStartOffset(l),Oe&&nn(l,{}),s.updateShow(l)},bind:function(s,l){var a=l.props;return s.color||Mt(a,"cur_line_color",s.updateColor),Mt(a,"cur_line_strokeWidth",s.updatePath),Mt(a,"apl_path",s.updatePath),s.semIndex=l.optionName==="startLabel"?0:l.optionName==="endLabel"?1:2,s.semIndex===2&&!s.lineOffset||Mt(a,"cur_attach_plugBackLenSE",s.updateStartOffset),Mt(a,"svgShow",s.updateShow),Oe&&Mt(a,"new_edge4viewBox",s.adjustEdge),r.pathLabel.initSvg(s,a),!0},unbind:function(s,l){var a=l.props;s.elmsAppend&&(s.elmsAppend.forEach(function(c){a.svg.removeChild(c)}),s.elmPosition=s.elmPath=s.elmOffset=s.styleFill=s.styleShow=s.elmsAppend=null),$t(s.curStats,r.pathLabel.stats),$t(s.aplStats,r.pathLabel.stats),s.color||Lt(a,"cur_line_color",s.updateColor),Lt(a,"cur_line_strokeWidth",s.updatePath),Lt(a,"apl_path",s.updatePath),s.semIndex===2&&!s.lineOffset||Lt(a,"cur_attach_plugBackLenSE",s.updateStartOffset),Lt(a,"svgShow",s.updateShow),Oe&&(Lt(a,"new_edge4viewBox",s.adjustEdge),nn(a,{}))},removeOption:function(s,l){var a=l.props,c={};c[l.optionName]="",fi(a,c)},remove:function(s){s.boundTargets.length&&(console.error("LeaderLineAttachment was not unbound by remove"),s.boundTargets.forEach(function(l){r.pathLabel.unbind(s,l)}))}}},Object.keys(r).forEach(function(s){sn[s]=function(){return new u(r[s],Array.prototype.slice.call(arguments))}}),sn.positionByWindowResize=!0,window.addEventListener("resize",Qn.add(function(){sn.positionByWindowResize&&Object.keys(Vt).forEach(function(s){nn(Vt[s],{position:!0})})}),!1),sn}();(function(i,o){e.exports=o()})(jp,function(){return n})})(cu);var zp=cu.exports;const El=Gp(zp);let Up=jt({props:{buttonText:{type:String,required:!0},onlyModal:{type:Boolean,default:!0}},emits:["downloadClicked"],data(){return{modalText:"",copyText:"",copyMessage:"",copyMessageTimeout:5e3,displayCopyMessage:!1,displayModal:!1}},methods:{buttonClicked(){this.$emit("downloadClicked")},displayCopySuccessMessage(){this.displayCopyMessage=!0,this.copyMessage="Copied!",setTimeout(()=>this.displayCopyMessage=!1,this.copyMessageTimeout)},displayCopyFailureMessage(e){this.displayCopyMessage=!0,this.copyMessage=`Copy failed! ${e}`,setTimeout(()=>this.displayCopyMessage=!1,this.copyMessageTimeout)},copyToClickboard(){this.$refs.refForCopy.focus(),navigator.clipboard.writeText(this.copyText).then(this.displayCopySuccessMessage.bind(this)).catch(t=>this.displayCopyFailureMessage.bind(this,t))},startDownloadOfFile(e){this.onlyModal?(this.modalText=ef(Jh(e)),this.copyText=e,this.displayModal=!0):this.download("file.txt",e)},download(e,t){let n=this.$refs.refForDownload;n.setAttribute("href","data:text/plain;charset=utf-8,"+encodeURIComponent(t)),n.setAttribute("download",e),n.click()}}});const Kp={key:0,ref:"modal",class:"modal"},qp={class:"modal-content"},Yp=["innerHTML"],Zp={class:"modal-button-wrapper"},Xp={key:0,class:"copy-message"},Qp=["value"],Jp={ref:"refForDownload",style:{display:"none"}};function em(e,t,n,i,o,r){return he(),Ae(ht,null,[Fe("button",{onClick:t[0]||(t[0]=(...u)=>e.buttonClicked&&e.buttonClicked(...u)),class:"download-button"},it(e.buttonText),1),e.displayModal?(he(),Ae("div",Kp,[Fe("div",qp,[Fe("div",{innerHTML:e.modalText,class:"wrapElement"},null,8,Yp),Fe("div",Zp,[e.displayCopyMessage?(he(),Ae("div",Xp,it(e.copyMessage),1)):Pt("",!0),Fe("button",{class:"download-button",onClick:t[1]||(t[1]=dt(u=>e.displayModal=!1,["prevent"]))},"Close"),Fe("button",{class:"download-button",onClick:t[2]||(t[2]=dt((...u)=>e.copyToClickboard&&e.copyToClickboard(...u),["prevent"]))},"Copy")])]),Fe("input",{style:{display:"none"},type:"textarea",ref:"refForCopy",value:e.copyText,readonly:""},null,8,Qp)],512)):Pt("",!0),Fe("a",Jp,null,512)],64)}const tm=Kt(Up,[["render",em],["__scopeId","data-v-52e7a79f"]]);function nm(e){let t=e.split(`
 `);if(t.length==1)return e;let n=Array(t.length).fill(0);for(let r=0;r<t.length;r++)n[r]=t[r].length;let i=Math.max(...n);return`\\multirow{${t.length}}{*}{\\parbox{${i/2}em}{\\centering ${t.join("\\\\")}}}`}function sm(e){const t=/<code>(.*?)<\/code>/g;let n=e.replace(t,"\\texttt{$1}");n=n.replace(/&lt;/g,"<"),n=n.replace(/&gt;/g,">");const i="<br />",o=new RegExp(i,"g");return n=n.replace(o,`
 `),n.includes(`
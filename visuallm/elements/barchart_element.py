@@ -1,11 +1,17 @@
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from importlib.util import find_spec
+from itertools import chain
 from typing import Any
 
-from flask import request
+from visuallm.utils.client_features import BAR_COLUMNS, client_supports
 
 from .element_base import ElementWithEndpoint
 
+# numpy is used only to validate the heights of the bars if it is installed
+_has_numpy = find_spec("numpy") is not None
+
 
 @dataclass
 class PieceInfo:
@@ -50,6 +56,115 @@ class PieceInfo:
             )
 
 
+@dataclass(frozen=True)
+class BarChartColumns:
+
+    """Columnar layout of the pieces of the BarChart element, where all the pieces
+    have the same bars (e.g. the same metrics, or a single bar with probability).
+    Unlike the list of `PieceInfo`s, the pieces are validated at once and serialized
+    as a few flat lists, which is cheaper for the bar charts with many pieces.
+
+    Create it with `BarChartColumns.create`.
+
+    Args:
+    ----
+        piece_titles (list[str]): Titles of the pieces
+        bar_names (list[str]): Names displayed above the bars, the same in each piece
+        bar_heights (array[float]): Heights of the bars of all the pieces, the bars
+            of the first piece are followed by the bars of the second piece...
+            Stored as a float array, which is packed as typed binary when the
+            responses are sent as MessagePack.
+        bar_annotations (list[str]): Annotations of the bars of all the pieces, in
+            the same order as `bar_heights`
+
+    """
+
+    piece_titles: list[str]
+    bar_names: list[str]
+    bar_heights: "array[float]"
+    bar_annotations: list[str]
+
+    @classmethod
+    def create(
+        cls,
+        piece_titles: Sequence[str],
+        bar_heights: Sequence[Sequence[float]] | Any,
+        bar_names: Sequence[str],
+        bar_annotations: Sequence[Sequence[str]],
+    ) -> "BarChartColumns":
+        """Validate and flatten the columns of the bar chart.
+
+        Args:
+        ----
+            piece_titles (Sequence[str]): Titles of the pieces
+            bar_heights (Sequence[Sequence[float]] | Any): Matrix with one row of
+                bar heights for each piece (anything convertible to numpy array,
+                e.g. tensor), the heights should be between 0 and 100
+            bar_names (Sequence[str]): Names displayed above the bars
+            bar_annotations (Sequence[Sequence[str]]): Matrix with one row of bar
+                annotations for each piece
+
+        """
+        shape = (len(piece_titles), len(bar_names))
+        if len(bar_annotations) != shape[0] or any(
+            len(row) != shape[1] for row in bar_annotations
+        ):
+            raise ValueError(
+                f"bar_annotations should be a matrix of shape {shape} (one row"
+                " for each piece title, one column for each bar name)"
+            )
+        return cls(
+            piece_titles=list(piece_titles),
+            bar_names=list(bar_names),
+            bar_heights=_flat_bar_heights(bar_heights, shape),
+            bar_annotations=list(chain.from_iterable(bar_annotations)),
+        )
+
+    def piece_infos(self) -> list[PieceInfo]:
+        """Convert the columns to the list of pieces."""
+        n_bars = len(self.bar_names)
+        return [
+            PieceInfo(
+                pieceTitle=title,
+                barHeights=self.bar_heights[i * n_bars : (i + 1) * n_bars].tolist(),
+                barAnnotations=self.bar_annotations[i * n_bars : (i + 1) * n_bars],
+                barNames=list(self.bar_names),
+            )
+            for i, title in enumerate(self.piece_titles)
+        ]
+
+
+def _flat_bar_heights(bar_heights: Any, shape: tuple[int, int]) -> "array[float]":
+    if _has_numpy:
+        import numpy as np
+
+        heights = np.asarray(bar_heights, dtype=np.float64)
+        if heights.size == 0:
+            heights = heights.reshape(shape)
+        if heights.shape != shape:
+            raise ValueError(
+                f"bar_heights should be a matrix of shape {shape} (currently"
+                f" {heights.shape})"
+            )
+        flat = heights.ravel()
+        if flat.size != 0 and not (flat.min() >= 0 and flat.max() <= 100):
+            raise ValueError(
+                "Heights should be between 0 and 100 (currently between"
+                f" {flat.min()} and {flat.max()})"
+            )
+        return array("d", flat.tobytes())
+
+    if len(bar_heights) != shape[0] or any(len(row) != shape[1] for row in bar_heights):
+        raise ValueError(f"bar_heights should be a matrix of shape {shape}")
+    flat_array = array("d", chain.from_iterable(bar_heights))
+    for height in flat_array:
+        if not 0 <= height <= 100:
+            raise ValueError(
+                f"Heights should be between 0 and 100 (currently {height})"
+            )
+    return flat_array
+
+
 class BarChartElement(ElementWithEndpoint):
     def __init__(
         self,
@@ -81,10 +196,34 @@ class BarChartElement(ElementWithEndpoint):
         """
         super().__init__(name=name, type="softmax", endpoint_url=endpoint_url)
 
-        self.processing_callback = processing_callback
+        self._processing_callback = processing_callback
         self._piece_infos: list[PieceInfo] = []
+        self._columns: BarChartColumns | None = None
         self._selected: str | None = None
-        self.long_contexts = long_contexts
+        self._long_contexts = long_contexts
+
+    @property
+    def long_contexts(self) -> bool:
+        """Whether the bars are displayed under the piece titles."""
+        return self._long_contexts
+
+    @long_contexts.setter
+    def long_contexts(self, value: bool):
+        if value != self._long_contexts:
+            self.set_changed()
+        self._long_contexts = value
+
+    @property
+    def processing_callback(self) -> Callable[[], Any] | None:
+        """Callback called after the user selects a value in the frontend."""
+        return self._processing_callback
+
+    @processing_callback.setter
+    def processing_callback(self, value: Callable[[], Any] | None):
+        # the frontend displays the `Select` button only if there is a callback
+        if (value is None) != (self._processing_callback is None):
+            self.set_changed()
+        self._processing_callback = value
 
     @property
     def selected(self) -> str:
@@ -106,17 +245,51 @@ class BarChartElement(ElementWithEndpoint):
 
     @property
     def piece_infos(self) -> list[PieceInfo]:
+        if self._columns is not None:
+            return self._columns.piece_infos()
         return self._piece_infos
 
+    @property
+    def columns(self) -> BarChartColumns | None:
+        """Columns of the bar chart if they were set by `set_columns`."""
+        return self._columns
+
     def set_piece_infos(self, piece_infos: list[PieceInfo]):
         # changed is a property that is checked to include every change
         # in the message from BE to FE, essential for the app to function
         self.set_changed()
         self._piece_infos = piece_infos
+        self._columns = None
+
+    @property
+    def client_features(self) -> tuple[str, ...]:
+        return () if self._columns is None else (BAR_COLUMNS,)
+
+    def set_columns(self, columns: BarChartColumns):
+        """Set all the pieces at once, in the columnar layout which is cheaper
+        to serialize than the list of `PieceInfo`s. The frontends which don't
+        support the columnar layout receive the list of `PieceInfo`s.
+        """
+        self.set_changed()
+        self._piece_infos = []
+        self._columns = columns
 
     def construct_element_configuration(self):
+        piece_infos = self._piece_infos
+        columns = None
+        if self._columns is not None and not client_supports(BAR_COLUMNS):
+            piece_infos = self._columns.piece_infos()
+        elif self._columns is not None:
+            # serialized without copying the lists of the columns
+            columns = {
+                "piece_titles": self._columns.piece_titles,
+                "bar_names": self._columns.bar_names,
+                "bar_heights": self._columns.bar_heights,
+                "bar_annotations": self._columns.bar_annotations,
+            }
         return {
-            "piece_infos": self.piece_infos,
+            "piece_infos": piece_infos,
+            "bar_columns": columns,
             "long_contexts": self.long_contexts,
             "selectable": self.selectable,
         }
@@ -128,25 +301,23 @@ class BarChartElement(ElementWithEndpoint):
 
         Isn't used at all if the processing callback isn't provided.
         """
-        if not request.is_json:
-            raise RuntimeError()
-
-        # just for the type checker
-        if request.json is None:
-            raise RuntimeError()
+        if self.parent_component is None:
+            raise RuntimeError(
+                "Cannot call endpoint_callback on an element not registered to any component!"
+            )
+        # the processing callback may remove the bar chart from the component
+        component = self.parent_component
+        self.apply_action(self.get_request_dict())
+        return component.fetch_info(fetch_all=False)
 
+    def apply_action(self, request_dict: dict[str, Any]) -> bool:
         # changed is simply set to True as we do not have any means of testing whether
         # the user simply didn't selected the same value multiple times
         self.set_changed()
-        self._selected = request.json.get("selected")
+        self._selected = request_dict.get("selected")
         if self.processing_callback is None:
             raise RuntimeError(
                 "Cannot call endpoint_callback on an element without `self.processing_callback()`"
             )
         self.processing_callback()
-
-        if self.parent_component is None:
-            raise RuntimeError(
-                "Cannot call endpoint_callback on an element not registered to any component!"
-            )
-        return self.parent_component.fetch_info(fetch_all=False)
+        return False
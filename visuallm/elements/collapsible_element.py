@@ -1,11 +1,13 @@
+import dataclasses
+from functools import partial
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from visuallm.component_base import ComponentBase
 from visuallm.elements.element_base import ElementBase, ElementWithEndpoint
-from visuallm.elements.utils import register_named
-from visuallm.named import NamedWrapper
-from visuallm.server import Server
+from visuallm.elements.utils import RegisteredNames, register_named
+from visuallm.utils.client_features import COLLAPSIBLE_DELTAS, client_supports
 
 
 class CollapsibleElement(ElementWithEndpoint):
@@ -20,7 +22,7 @@ class CollapsibleElement(ElementWithEndpoint):
         with text `title` that after click expands and shows all the other child subelements.
 
         This class is an instance of ElementWithEndpoint so that all the endpoints of the subelements could be added
-        to the server. However it doesn't have any API endpoint itself.
+        to the component. However it doesn't have any API endpoint itself.
 
         Args:
         ----
@@ -36,7 +38,10 @@ class CollapsibleElement(ElementWithEndpoint):
         self._title = title
         self._is_collapsed = is_collapsed
         self.subelements: list[ElementBase] = []
-        self.registered_subelement_names: set[str] = set()
+        self.registered_subelement_names: set[str] = RegisteredNames()
+        self._changed_subelements: set[str] | None = None
+        """Names of the subelements changed since the last constructed
+        description, None if the element changed otherwise."""
 
         if subelements is not None:
             self.add_subelements(subelements)
@@ -112,45 +117,98 @@ class CollapsibleElement(ElementWithEndpoint):
             self.registered_subelement_names,
             self.subelements,
         )
-        subelement.on_element_changed_callback = self._on_subelement_changed
+        # the subelements are kept sorted, so that they aren't sorted each
+        # time the description is constructed
+        self.subelements.sort(key=lambda e: e.order)
+        subelement.on_element_changed_callback = partial(
+            self._on_subelement_changed, subelement
+        )
+
+    @property
+    def client_features(self) -> tuple[str, ...]:
+        # the description contains the descriptions of the subelements
+        return tuple(
+            chain.from_iterable(
+                subelement.client_features for subelement in self.subelements
+            )
+        )
 
-    def _on_subelement_changed(self):
-        self.set_changed()
+    def set_changed(self):
+        # any change apart from the changes of the subelements needs the
+        # whole description
+        self._changed_subelements = None
+        super().set_changed()
+
+    def _on_subelement_changed(self, subelement: ElementBase):
+        if self._changed_subelements is None and not self.changed:
+            # the frontend displays the last constructed description
+            self._changed_subelements = set()
+        if self._changed_subelements is not None:
+            self._changed_subelements.add(subelement.name)
+        # doesn't discard the changed subelements, unlike `self.set_changed`
+        super().set_changed()
 
     def register_to_component(self, component: "ComponentBase"):
         ElementBase.register_to_component(self, component)
         # subelement shouldn't be stored in the component, therefore
-        # only the clashes in "endpoint_url" are checked
+        # only their endpoints are registered
         for subelement in self.subelements:
-            if not isinstance(subelement, ElementWithEndpoint):
-                continue
-            register_named(
-                NamedWrapper(subelement, "endpoint_url"),
-                component.registered_url_endpoints,
-            )
-            subelement._parent_component = component
+            if isinstance(subelement, ElementWithEndpoint):
+                component.register_endpoint(subelement)
 
-    def register_to_server(self, server: Server):
+    def unregister_from_component(self, component: "ComponentBase"):
+        ElementBase.unregister_from_component(self, component)
         for subelement in self.subelements:
-            if not isinstance(subelement, ElementWithEndpoint):
-                continue
-            subelement.register_to_server(server)
+            if isinstance(subelement, ElementWithEndpoint):
+                component.unregister_endpoint(subelement)
+
+    def construct_element_description(self) -> dict[str, Any]:
+        # the changed subelements are part of the whole description
+        self._changed_subelements = None
+        return super().construct_element_description()
+
+    def construct_element_update(self) -> dict[str, Any]:
+        """If only some subelements changed since the last constructed
+        description, describe only their changes, addressed by the names
+        `parent>>child` under which the frontend stores the subelements. The
+        frontends which don't support it receive the whole description.
+        """
+        if self._changed_subelements is None or not client_supports(COLLAPSIBLE_DELTAS):
+            return self.construct_element_description()
+        updated_subelements = [
+            self._subelement_description(subelement.construct_element_update())
+            for subelement in self.subelements
+            if subelement.name in self._changed_subelements
+        ]
+        self._changed_subelements = None
+        self._changed = False
+        return {
+            "name": self.name,
+            "type": self.type,
+            "version": self.version,
+            "updated_subelements": updated_subelements,
+        }
+
+    def _subelement_description(self, descr: dict[str, Any]) -> dict[str, Any]:
+        # the descriptions of the subelements are cached, hence they are
+        # copied instead of modified in place
+        name = self.name + ">>" + descr["name"]
+        descr = {**descr, "name": name}
+        if "subelement_configs" in descr:
+            descr["subelement_configs"] = [
+                dataclasses.replace(config, parent_name=name)
+                for config in descr["subelement_configs"]
+            ]
+        return descr
 
     def construct_element_configuration(self) -> dict[str, Any]:
-        subelements: list[dict[str, Any]] = []
-        for subelement in sorted(self.subelements, key=lambda e: e.order):
-            descr = subelement.construct_element_description()
-            descr["name"] = self.name + ">>" + descr["name"]
-            if "subelement_configs" not in descr:
-                subelements.append(descr)
-                continue
-            for config in descr["subelement_configs"]:
-                config.parent_name = descr["name"]
-            subelements.append(descr)
         return {
             "title": self.title,
             "is_collapsed": self.is_collapsed,
-            "subelements": subelements,
+            "subelements": [
+                self._subelement_description(subelement.construct_element_description())
+                for subelement in self.subelements
+            ],
         }
 
     def endpoint_callback(self):
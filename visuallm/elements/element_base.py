@@ -5,7 +5,9 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from flask import request
 
-from visuallm.named import Named, NamedWrapper
+from visuallm.named import Named
+from visuallm.utils.client_features import client_supports
+from visuallm.utils.msgpack_encoding import request_body
 
 from .utils import register_named, sanitize_url
 
@@ -48,6 +50,8 @@ class ElementBase(Named, ABC):
         self._type = type
         self._order: float | None = None
         self._changed = True
+        self._version = 0
+        self._descriptions: dict[frozenset[str], dict[str, Any]] = {}
         self._is_registered_to_component: bool = False
         self.on_element_changed_callback = on_element_changed_callback
         self._is_displayed = True
@@ -74,8 +78,19 @@ class ElementBase(Named, ABC):
     def changed(self):
         return self._changed
 
+    @property
+    def version(self) -> int:
+        """Number incremented on each change of the element."""
+        return self._version
+
     def set_changed(self):
+        """Mark the element as changed, so that its description is constructed
+        again and sent to the frontend. Must be called after each change of
+        the element's state.
+        """
         self._changed = True
+        self._version += 1
+        self._descriptions.clear()
         if self.on_element_changed_callback is not None:
             self.on_element_changed_callback()
 
@@ -98,16 +113,56 @@ class ElementBase(Named, ABC):
     def type(self):
         return self._type
 
+    def set_name(self, value: str):
+        super().set_name(value)
+        self._descriptions.clear()
+
     def construct_element_description(self) -> dict[str, Any]:
         """Construct description of all the parts of the element to be
-        displayed on the frontend.
+        displayed on the frontend. The description is cached until the element
+        changes (see `set_changed`), hence the returned dict mustn't be modified.
+        The description is cached separately for each combination of the
+        `client_features` which the frontend supports.
 
         Sets changed to false!
         """
         self._changed = False
+        features = self.supported_client_features()
+        description = self._descriptions.get(features)
+        if description is None:
+            description = self._construct_element_description()
+            self._descriptions[features] = description
+        return description
+
+    @property
+    def client_features(self) -> tuple[str, ...]:
+        """Features of the frontend (see `visuallm.utils.client_features`)
+        which the description of the element depends on.
+        """
+        return ()
+
+    def supported_client_features(self) -> frozenset[str]:
+        """The `client_features` which the frontend that sent the current
+        request supports.
+        """
+        return frozenset(f for f in self.client_features if client_supports(f))
+
+    def construct_element_update(self) -> dict[str, Any]:
+        """Construct description of the changes of the element, sent to the
+        frontend which already displays the element (e.g. in the responses to
+        the callbacks). Elements which can describe their changes more cheaply
+        than by their whole description override it, by default the whole
+        description is returned.
+
+        Sets changed to false!
+        """
+        return self.construct_element_description()
+
+    def _construct_element_description(self) -> dict[str, Any]:
         return dict(
             name=self.name,
             type=self.type,
+            version=self.version,
             **self.construct_element_configuration(),
         )
 
@@ -141,6 +196,13 @@ class ElementBase(Named, ABC):
         )
         self._is_registered_to_component = True
 
+    def unregister_from_component(self, component: ComponentBase):
+        """Called when the element is removed from the `component` (see
+        `ComponentBase.remove_element`), afterwards the element may be
+        added to a component again.
+        """
+        self._is_registered_to_component = False
+
 
 class ElementWithEndpoint(ElementBase):
     def __init__(
@@ -160,19 +222,31 @@ class ElementWithEndpoint(ElementBase):
             type (str): string that matches the backend element to the
                 frontend element.
             endpoint_url (str, optional): url of the endpoint that the
-                frontend will call when communicating with this element. If
-                it is None, then a sanitized version of `name` will be used.
+                frontend will call when communicating with this element,
+                relative to the url of the component (the requests to all the
+                elements of the component are dispatched by a single route of
+                the component). If it is None, then a sanitized version of
+                `name` will be used.
         """
         super().__init__(name, type)
         if endpoint_url is None:
             endpoint_url = sanitize_url(self.name)
-        self.endpoint_url = endpoint_url
+        self._endpoint_url = endpoint_url
         self._parent_component: ComponentBase | None = None
         """The component that holds all the other elements. This is set
         in `ComponentBase.register_elements`
         """
         self._type = type
 
+    @property
+    def endpoint_url(self) -> str:
+        return self._endpoint_url
+
+    @endpoint_url.setter
+    def endpoint_url(self, value: str):
+        self._endpoint_url = value
+        self._descriptions.clear()
+
     @property
     def parent_component(self) -> ComponentBase:
         if self._parent_component is None:
@@ -189,35 +263,62 @@ class ElementWithEndpoint(ElementBase):
 
         Raises
         ------
-            RuntimeError: if the api call dict doesn't contain a json object
+            RuntimeError: if the api call dict doesn't contain a json (or
+                MessagePack) object
         """
-        if not request.is_json:
-            raise RuntimeError("The data in request should be json!")
-        return request.get_json()
+        return request_body(request)
 
     @abstractmethod
     def endpoint_callback(self):
         """Method that is called when the frontend sends data to the backend."""
         pass
 
-    def construct_element_description(self) -> dict[str, Any]:
-        return_dict = super().construct_element_description()
-        return_dict["address"] = self.endpoint_url.removeprefix("/")
-        return return_dict
-
-    def register_to_server(self, server: Server):
-        """Register the element's endpoint to the server.
+    def apply_action(self, request_dict: dict[str, Any]) -> bool:
+        """Apply the action which the frontend sends to the endpoint of the
+        element (e.g. select the values and run the processing callback),
+        without answering the request. Used to apply several actions in one
+        request (see `ComponentBase.apply_actions`).
 
         Args:
         ----
-            server (Server): server which will hold the endpoint to this element
+            request_dict (dict[str, Any]): the data that the frontend sends
+                to the endpoint of the element
+
+        Returns:
+        -------
+            bool: whether all the elements of the component should be sent to
+                the frontend, instead of only the changed ones
+
+        Raises:
+        ------
+            NotImplementedError: if the element doesn't have any action
+
         """
-        register_named(NamedWrapper(self, "endpoint_url"), server.registered_urls)
-        server.add_endpoint(self.endpoint_url, self.endpoint_callback, methods=["POST"])
+        raise NotImplementedError(
+            f"Element '{self.name}' of type '{self.type}' doesn't support actions"
+        )
+
+    @property
+    def address(self) -> str:
+        """Address (without the leading slash) to which the frontend sends the
+        requests for this element, the url of the endpoint prefixed by the url
+        of the parent component.
+        """
+        if self._parent_component is None:
+            return self.endpoint_url.removeprefix("/")
+        return self._parent_component.default_url.removeprefix("/") + (
+            self.endpoint_url
+        )
+
+    def _construct_element_description(self) -> dict[str, Any]:
+        return_dict = super()._construct_element_description()
+        return_dict["address"] = self.address
+        return return_dict
 
     def register_to_component(self, component: ComponentBase):
         super().register_to_component(component)
-        register_named(
-            NamedWrapper(self, "endpoint_url"), component.registered_url_endpoints
-        )
-        self._parent_component = component
+        component.register_endpoint(self)
+
+    def unregister_from_component(self, component: ComponentBase):
+        super().unregister_from_component(component)
+        component.unregister_endpoint(self)
@@ -17,8 +17,33 @@ class PlainTextElement(ElementBase):
     ):
         super().__init__(name=name, type="plain")
         self._content = Sanitizer.sanitize(content)
-        self.is_heading = is_heading
-        self.heading_level = heading_level
+        # the content which was already validated by `Sanitizer.is_sane`
+        self._sane_content = ""
+        self._validate_content()
+        self._is_heading = is_heading
+        self._heading_level = heading_level
+
+    @property
+    def is_heading(self) -> bool:
+        """Whether the content is displayed as a heading."""
+        return self._is_heading
+
+    @is_heading.setter
+    def is_heading(self, value: bool):
+        if value != self._is_heading:
+            self.set_changed()
+        self._is_heading = value
+
+    @property
+    def heading_level(self) -> int:
+        """Level of the heading if the content is displayed as a heading."""
+        return self._heading_level
+
+    @heading_level.setter
+    def heading_level(self, value: int):
+        if value != self._heading_level:
+            self.set_changed()
+        self._heading_level = value
 
     @property
     def content(self) -> str:
@@ -30,12 +55,21 @@ class PlainTextElement(ElementBase):
         if value != self._content:
             self.set_changed()
         self._content = value
+        self._validate_content()
 
-    def construct_element_configuration(self) -> dict[str, Any]:
-        if not Sanitizer.is_sane(self.content):
+    def _validate_content(self):
+        # the content is validated once when it is set, not on every serialization
+        if self._content is self._sane_content:
+            return
+        if not Sanitizer.is_sane(self._content):
             raise ValueError(
-                f"'{self.content}' is not allowed value of PlainText element."
+                f"'{self._content}' is not allowed value of PlainText element."
             )
+        self._sane_content = self._content
+
+    def construct_element_configuration(self) -> dict[str, Any]:
+        # revalidates the content only if it was set without the setter
+        self._validate_content()
         return {
             "value": self.content,
             "heading": self.is_heading,
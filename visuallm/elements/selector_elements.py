@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import secrets
 import traceback
 from abc import ABC, abstractmethod
 from collections.abc import Callable, MutableSet
@@ -10,7 +9,7 @@ from typing import Any, Generic, TypeVar
 from visuallm.named import Named
 
 from .element_base import ElementWithEndpoint
-from .utils import assign_if_none, register_named
+from .utils import RegisteredNames, assign_if_none, register_named
 
 
 @dataclass
@@ -73,7 +72,7 @@ class ButtonElement(ElementWithEndpoint):
         self._button_text = button_text
         self._subelements_dict: dict[str, SelectorSubElement] = {}
         self._subelements: list[SelectorSubElement] = []
-        self._subelement_names: MutableSet[str] = set()
+        self._subelement_names: MutableSet[str] = RegisteredNames()
         self._disabled = disabled
         self._reload_page = reload_page
 
@@ -150,17 +149,22 @@ class ButtonElement(ElementWithEndpoint):
         the control to the programmer for handling of the updated data and
         then returns everything updated to the frontend.
         """
+        # the processing callback may remove the button from the component
+        component = self.parent_component
         try:
-            response_json = self.get_request_dict()
-            for key, value in response_json.items():
-                self._set_value_on_frontend_on_subelement(
-                    self._subelements_dict[key], value
-                )
-
-            self.processing_callback()
-            return self.parent_component.fetch_info(fetch_all=self.reload_page)
+            reload_page = self.apply_action(self.get_request_dict())
+            return component.fetch_info(fetch_all=reload_page)
         except Exception:
-            return self.parent_component.fetch_exception(traceback.format_exc())
+            return component.fetch_exception(traceback.format_exc())
+
+    def apply_action(self, request_dict: dict[str, Any]) -> bool:
+        for key, value in request_dict.items():
+            self._set_value_on_frontend_on_subelement(
+                self._subelements_dict[key], value
+            )
+
+        self.processing_callback()
+        return self.reload_page
 
     def add_subelement(self, subelement: SelectorSubElement):
         if subelement.parent_element is not None:
@@ -204,6 +208,7 @@ class SelectorSubElement(ABC, Generic[SelectedType], Named):
         """
         super().__init__(name=str(subtype))
         self._updated = True
+        self._version = 0
         self._subtype = subtype
         self._value_from_frontend: SelectedType | None = default_value
         self._value_on_backend: SelectedType | None = default_value
@@ -220,6 +225,7 @@ class SelectorSubElement(ABC, Generic[SelectedType], Named):
             {
                 "selected": self.value_on_backend,
                 "text": self._text,
+                "version": self.version,
                 **self.construct_subelement_specifics(),
             },
             self.parent_element.name,
@@ -287,6 +293,14 @@ class SelectorSubElement(ABC, Generic[SelectedType], Named):
             )
         self.parent_element.set_changed()
         self._updated = True
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Number incremented on each update of the subelement, the frontend
+        refreshes the displayed value only when the version changes.
+        """
+        return self._version
 
     def unset_updated(self):
         """Set updated to False."""
@@ -479,7 +493,6 @@ class TextInputSubElement(SelectorSubElement[str]):
         return {
             "placeholder_text": self.placeholder_text,
             "blank_after_text_send": self.blank_after_text_send,
-            "random_number": secrets.randbelow(int(1e7)),
         }
 
 
@@ -551,5 +564,4 @@ class MultiRadioSubElement(SelectorSubElement[str]):
         return {
             "choices": self._choices,
             "is_horizontal": self._is_horizontal,
-            "random_number": secrets.randbelow(int(1e7)),
         }
@@ -1,10 +1,16 @@
 import dataclasses
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
+from visuallm.utils.client_features import (
+    TABLE_DELTAS,
+    TABLE_WINDOWS,
+    client_supports,
+)
 from visuallm.utils.sanitizer import Sanitizer
 
-from .element_base import ElementBase
+from .element_base import ElementWithEndpoint
 
 
 class Colors(Enum):
@@ -86,34 +92,139 @@ class TableNameNotRegisteredError(ValueError):
         )
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(frozen=True)
 class Table:
-    headers: list[str]
-    rows: list[list[str]]
+
+    """Table whose fields are sanitized strings. The fields are normalized
+    once when the table is created (see `Table.create`), hence the table is
+    immutable and its descriptions are built only once.
+    """
+
+    headers: tuple[str, ...]
+    rows: tuple[tuple[str, ...], ...]
     title: str
     is_latex_downloadable: bool
+    _descriptions: dict[int | None, dict] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    def construct_table_description(self):
-        """Transform all the fields in the table to strings."""
-        for i in range(len(self.headers)):
-            self.headers[i] = str(self.headers[i])
-        for rix in range(len(self.rows)):
-            for cix in range(len(self.rows[rix])):
-                self.rows[rix][cix] = str(self.rows[rix][cix])
-        self.title = str(self.title)
-        return {
-            "headers": self.headers,
-            "rows": self.rows,
-            "title": self.title,
-            "is_latex_downloadable": self.is_latex_downloadable,
-        }
+    @classmethod
+    def create(
+        cls,
+        title: str,
+        headers: list,
+        rows: list[list],
+        is_latex_downloadable: bool = False,
+    ) -> "Table":
+        """Sanitize all the fields and transform them to strings."""
+        return cls(
+            headers=tuple(Sanitizer.sanitize(headers)),
+            rows=tuple(map(tuple, Sanitizer.sanitize(rows))),
+            title=Sanitizer.sanitize(title),
+            is_latex_downloadable=is_latex_downloadable,
+        )
+
+    def append(self, rows: list[list]) -> "Table":
+        """Table with the `rows` appended, only the new rows are sanitized."""
+        return dataclasses.replace(
+            self, rows=self.rows + tuple(map(tuple, Sanitizer.sanitize(rows)))
+        )
+
+    def construct_table_description(self, page_size: int | None = None):
+        """Description of the table sent to the frontend, built only once for
+        each `page_size`.
 
+        Args:
+        ----
+            page_size (int | None, optional): if set, only the first `page_size`
+                rows are described, the others are requested by the frontend
+                when they are scrolled to (see `TableElement.endpoint_callback`).
+                Defaults to None.
+
+        """
+        description = self._descriptions.get(page_size)
+        if description is None:
+            description = self._descriptions[page_size] = {
+                "headers": self.headers,
+                "rows": self.rows if page_size is None else self.rows[:page_size],
+                "total_rows": len(self.rows),
+                "title": self.title,
+                "is_latex_downloadable": self.is_latex_downloadable,
+            }
+        return description
 
-class TableElement(ElementBase):
-    def __init__(self, name="table"):
-        super().__init__(name=name, type="connected_tables")
+    def row_window(self, start: int, stop: int) -> tuple[tuple[str, ...], ...]:
+        """Rows from `start` to `stop`. The index of the row in the table is its
+        stable identifier, which is used by `LinkBetweenRows`.
+        """
+        return self.rows[start:stop]
+
+
+class TableElement(ElementWithEndpoint):
+    def __init__(
+        self,
+        name="table",
+        page_size: int | None = None,
+        endpoint_url: str | None = None,
+    ):
+        """Display tables, and links between their rows.
+
+        Args:
+        ----
+            name (str, optional): name of the element. Defaults to "table".
+            page_size (int | None, optional): if set, only the first `page_size`
+                rows of each table are sent with the element, the frontend
+                renders only the rows scrolled into view and requests the other
+                windows of rows from the endpoint of the element. Meant for large
+                tables. If None, or if the frontend doesn't support the windows
+                of rows, all the rows are sent at once. Defaults to None.
+            endpoint_url (str | None, optional): url of the endpoint which returns
+                the windows of rows. Defaults to None.
+
+        """
+        super().__init__(name=name, type="connected_tables", endpoint_url=endpoint_url)
+        self._page_size: int | None = None
+        self.page_size = page_size
+        self._appended_rows: dict[int, int] | None = None
+        """Index of the first row appended to each table since the description
+        with version `_appends_base_version` was constructed, None if the
+        element changed otherwise."""
+        self._appends_base_version = 0
         self.clear()
 
+    @property
+    def page_size(self) -> int | None:
+        """Number of rows of each table sent with the element, None if all the
+        rows are sent.
+        """
+        return self._page_size
+
+    @page_size.setter
+    def page_size(self, value: int | None):
+        if value is not None and value <= 0:
+            raise ValueError("page_size must be positive")
+        if value != self._page_size:
+            self.set_changed()
+        self._page_size = value
+
+    @property
+    def client_features(self) -> tuple[str, ...]:
+        return () if self.page_size is None else (TABLE_WINDOWS,)
+
+    @property
+    def client_page_size(self) -> int | None:
+        """`page_size` if the frontend which sent the current request supports
+        the windows of rows, otherwise None.
+        """
+        if self.page_size is None or not client_supports(TABLE_WINDOWS):
+            return None
+        return self.page_size
+
+    def set_changed(self):
+        # any change apart from appending rows needs the whole description
+        self._appended_rows = None
+        super().set_changed()
+
     def clear(self) -> None:
         """Set all the tables, and links between rows to empty lists."""
         self.set_changed()
@@ -139,17 +250,43 @@ class TableElement(ElementBase):
         if title in self._tables:
             raise ValueError("Cannot add two tables with the same name!")
         self.set_changed()
-        self._tables[title] = Table(
+        self._tables[title] = Table.create(
+            title=title,
+            headers=headers,
+            rows=rows,
             is_latex_downloadable=is_latex_downloadable,
-            headers=Sanitizer.sanitize(headers),
-            rows=Sanitizer.sanitize(rows),
-            title=Sanitizer.sanitize(title),
         )
         if prepend:
             self.tables = [self._tables[title]] + self.tables
         else:
             self.tables.append(self._tables[title])
 
+    def append_rows(self, title: str, rows: list[list[str]]):
+        """Append `rows` to the end of the table with `title`. Only the new rows
+        are sanitized, and the frontend which already displays the table
+        receives only them.
+        """
+        table = self._tables.get(title)
+        if table is None:
+            raise ValueError(f"Table '{title}' isn't registered!")
+        if not self.check_rows(list(table.headers), rows):
+            raise ValueError(
+                "The length of some row doesn't match the lenght of headers."
+            )
+        if len(rows) == 0:
+            return
+        index = next(i for i, t in enumerate(self.tables) if t is table)
+        self._tables[title] = self.tables[index] = table.append(rows)
+
+        if self._appended_rows is None and not self.changed:
+            # the frontend displays the last constructed description
+            self._appended_rows = {}
+            self._appends_base_version = self.version
+        if self._appended_rows is not None:
+            self._appended_rows.setdefault(index, len(table.rows))
+        # doesn't discard the appended rows, unlike `self.set_changed`
+        super().set_changed()
+
     def add_link_between_rows(self, link: LinkBetweenRows):
         if (link.StartTable not in self._tables) or (link.EndTable not in self._tables):
             raise TableNameNotRegisteredError(
@@ -167,7 +304,80 @@ class TableElement(ElementBase):
         self.links.append(link)
 
     def construct_element_configuration(self):
+        page_size = self.client_page_size
         return {
-            "tables": [t.construct_table_description() for t in self.tables],
+            "tables": [t.construct_table_description(page_size) for t in self.tables],
             "links": self.links,
+            "page_size": page_size,
+        }
+
+    def construct_element_description(self) -> dict[str, Any]:
+        # the appended rows are part of the whole description
+        self._appended_rows = None
+        return super().construct_element_description()
+
+    def construct_element_update(self) -> dict[str, Any]:
+        """If only rows were appended since the last constructed description,
+        describe only them, the frontend appends them to the tables if it
+        displays the description with `base_version`. The frontends which
+        don't support it receive the whole description.
+        """
+        if self._appended_rows is None or not client_supports(TABLE_DELTAS):
+            return self.construct_element_description()
+        page_size = self.client_page_size
+        appended_rows = []
+        for index, start in sorted(self._appended_rows.items()):
+            table = self.tables[index]
+            stop = len(table.rows)
+            if page_size is not None:
+                # the rows after the first page are requested by the frontend
+                stop = max(min(stop, page_size), start)
+            appended_rows.append(
+                {
+                    "table": index,
+                    "start": start,
+                    "rows": table.row_window(start, stop),
+                    "total_rows": len(table.rows),
+                }
+            )
+        self._appended_rows = None
+        self._changed = False
+        return {
+            "name": self.name,
+            "type": self.type,
+            "version": self.version,
+            "base_version": self._appends_base_version,
+            "appended_rows": appended_rows,
+        }
+
+    def endpoint_callback(self):
+        """Return the window of rows of one of the tables. The request contains
+        the index of the `table`, the index of the first row `start` and the
+        number of the rows `count`. The response contains the `version` of the
+        element, so that the frontend can ignore the rows of the tables which
+        were changed in the meantime. If the request doesn't contain `table`,
+        the whole description of the element is returned.
+        """
+        request_dict = self.get_request_dict()
+        if "table" not in request_dict:
+            # the frontend missed some change, and requests the whole element
+            return {
+                "result": "success",
+                "elementDescriptions": [self.construct_element_description()],
+            }
+        try:
+            table = self.tables[int(request_dict["table"])]
+            start = max(int(request_dict["start"]), 0)
+            count = max(int(request_dict["count"]), 0)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return self.parent_component.fetch_exception(
+                f"Invalid request for the rows of the table: {request_dict}"
+            )
+        return {
+            "result": "success",
+            "version": self.version,
+            "table": request_dict["table"],
+            "start": start,
+            "rows": table.row_window(start, start + count),
+            "total_rows": len(table.rows),
         }
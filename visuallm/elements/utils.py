@@ -1,4 +1,4 @@
-from collections.abc import MutableSet
+from collections.abc import Iterable, MutableSet
 from typing import TypeVar
 
 from visuallm.named import NamedProtocol
@@ -6,6 +6,18 @@ from visuallm.named import NamedProtocol
 T = TypeVar("T", bound=NamedProtocol)
 
 
+class RegisteredNames(set[str]):
+
+    """Set of the registered names which remembers for each name the next
+    number that `register_named` appends after it, so that registering many
+    values with the same name doesn't try all the preceding numbers again.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        super().__init__(names)
+        self.next_suffixes: dict[str, int] = {}
+
+
 def register_named(
     named: T,
     registered_names_set: MutableSet[str],
@@ -17,16 +29,24 @@ def register_named(
 
     It is arranged in such a way that an integer is appended after the name.
     E.g. after registering 5 components with name `n`. The registered names
-    would be the following ones: [n, n_1, n_2, n_3, n_4]
+    would be the following ones: [n, n_1, n_2, n_3, n_4]. If `registered_names_set`
+    is `RegisteredNames`, the numbers aren't reused after the names are removed
+    from it.
     """
-    ix = 1
     c_name = named.name
 
     if c_name in registered_names_set:
+        next_suffixes = None
+        ix = 1
+        if isinstance(registered_names_set, RegisteredNames):
+            next_suffixes = registered_names_set.next_suffixes
+            ix = next_suffixes.get(named.name, 1)
         c_name = f"{named.name}_{ix}"
         while c_name in registered_names_set:
             ix += 1
             c_name = f"{named.name}_{ix}"
+        if next_suffixes is not None:
+            next_suffixes[named.name] = ix + 1
         named.set_name(c_name)
     if registered_named_list is not None:
         registered_named_list.append(named)
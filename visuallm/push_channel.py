@@ -0,0 +1,129 @@
+import queue
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from flask import Response, abort, request
+
+STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    # disable response buffering in the nginx-like reverse proxies
+    "X-Accel-Buffering": "no",
+}
+
+
+class PushChannel:
+    def __init__(
+        self,
+        dumps: Callable[[Any], str],
+        heartbeat_interval: float = 15.0,
+        retry_interval_ms: int = 3000,
+        max_pending_events: int = 1000,
+    ):
+        """Server-sent events channel over which the backend pushes messages
+        to the frontend without waiting for the frontend to ask for them.
+
+        The frontend subscribes to a channel (each component has its own
+        channel) and receives all the events published to it from then on.
+        Each subscriber has its own queue, so a slow subscriber doesn't
+        block the others.
+
+        Args:
+        ----
+            dumps (Callable[[Any], str]): serializer of the event data to json
+            heartbeat_interval (float, optional): number of seconds after which
+                an empty comment is sent to a subscriber which didn't receive
+                any event, so that the dead connections are detected and the
+                proxies don't close the idle ones. Defaults to 15.0.
+            retry_interval_ms (int, optional): how long should the browser wait
+                before reconnecting after the connection is lost.
+                Defaults to 3000.
+            max_pending_events (int, optional): maximal number of events
+                waiting for a single subscriber, when the limit is reached,
+                the new events for that subscriber are dropped.
+                Defaults to 1000.
+
+        """
+        self.dumps = dumps
+        self.heartbeat_interval = heartbeat_interval
+        self.retry_interval_ms = retry_interval_ms
+        self.max_pending_events = max_pending_events
+        self._subscribers: defaultdict[str, set[queue.Queue[str]]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str) -> queue.Queue[str]:
+        """Create a queue to which all the events published to `channel`
+        are put.
+        """
+        subscriber: queue.Queue[str] = queue.Queue(maxsize=self.max_pending_events)
+        with self._lock:
+            self._subscribers[channel].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, channel: str, subscriber: queue.Queue[str]):
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if len(subscribers) == 0:
+                del self._subscribers[channel]
+
+    def has_subscribers(self, channel: str) -> bool:
+        with self._lock:
+            return channel in self._subscribers
+
+    def publish(self, channel: str, event: str, data: Any) -> int:
+        """Send event with name `event` and payload `data` to all the
+        subscribers of the `channel`.
+
+        Returns the number of subscribers to which the event was delivered.
+        """
+        message = format_event(event, self.dumps(data))
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+
+        delivered = 0
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                continue
+            delivered += 1
+        return delivered
+
+    def stream(self, channel: str) -> Iterator[str]:
+        """Generator of the server-sent events published to `channel`, it ends
+        only when the client disconnects.
+        """
+        subscriber = self.subscribe(channel)
+        try:
+            yield f"retry: {self.retry_interval_ms}\n\n"
+            while True:
+                try:
+                    yield subscriber.get(timeout=self.heartbeat_interval)
+                except queue.Empty:
+                    yield ": heartbeat\n\n"
+        finally:
+            self.unsubscribe(channel, subscriber)
+
+    def on_subscribe(self):
+        """Flask view which opens the event stream of the channel passed in
+        the `component` query parameter.
+        """
+        channel = request.args.get("component")
+        if not channel:
+            abort(400)
+        return Response(
+            self.stream(channel), mimetype="text/event-stream", headers=STREAM_HEADERS
+        )
+
+
+def format_event(event: str, data: str) -> str:
+    """Format single server-sent event, the multiline data are split to
+    multiple `data:` fields as required by the protocol.
+    """
+    lines = [f"event: {event}"]
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,119 @@
+import dataclasses
+import threading
+from collections.abc import Callable, Hashable
+from functools import partial
+from types import FunctionType
+from typing import Any, TypeVar
+
+from visuallm.components.dataset_snapshots import constructor_identity
+
+V = TypeVar("V")
+
+
+def resource_identity(constructor: Any) -> Hashable:
+    """Identifier of the `constructor` of a resource. The functions (and their
+    `functools.partial` objects) are identified by `constructor_identity`, so
+    that e.g. the lambdas created anew for each component still share the
+    resource. Parametrize the functions by `functools.partial` instead of by
+    the captured variables, which aren't part of the identifier. The other
+    objects (the already constructed generators and datasets, or callable
+    objects) are identified by the object itself.
+    """
+    if _is_function(constructor):
+        return constructor_identity(constructor)
+    # the registry keeps the object alive, hence its id isn't reused
+    return id(constructor)
+
+
+def _is_function(constructor: Any) -> bool:
+    if isinstance(constructor, partial):
+        return _is_function(constructor.func)
+    return isinstance(constructor, FunctionType)
+
+
+@dataclasses.dataclass
+class _Resource:
+    constructor: Any
+    """Kept alive, so that its id isn't reused while the resource is registered"""
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    references: int = 0
+    loaded: bool = False
+    value: Any = None
+
+
+class ResourceRegistry:
+
+    """Process-wide registry of the expensive resources (generators and datasets)
+    shared by the components. A resource is identified by its kind, the name of
+    the choice and the identity of the constructor (the generator / dataset or
+    the function that loads it, see `resource_identity`), hence the components
+    created from the same `generator_choices` or `dataset_choices` construct each
+    resource exactly once.
+
+    The resources are reference counted, a resource is dropped from the registry
+    once all the components that acquired it release it.
+    """
+
+    def __init__(self) -> None:
+        self._resources: dict[tuple[str, str, Hashable], _Resource] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self, kind: str, name: str, constructor: Any, load: Callable[[], V]
+    ) -> V:
+        """Return the resource, if it isn't registered yet, construct it with
+        `load`. Concurrent acquisitions of the same resource wait until the first
+        one constructs it. Each acquisition has to be paired with `release`.
+
+        Args:
+        ----
+            kind (str): kind of the resource, e.g. "generator" or "dataset"
+            name (str): name under which the resource is displayed on the frontend
+            constructor (Any): the object from the choices that the resource is
+                constructed from
+            load (Callable[[], V]): function that constructs the resource
+
+        """
+        key = (kind, name, resource_identity(constructor))
+        with self._lock:
+            resource = self._resources.get(key)
+            if resource is None:
+                resource = self._resources[key] = _Resource(constructor)
+            resource.references += 1
+
+        try:
+            with resource.lock:
+                if not resource.loaded:
+                    resource.value = load()
+                    resource.loaded = True
+                return resource.value
+        except BaseException:
+            self._release(key)
+            raise
+
+    def release(self, kind: str, name: str, constructor: Any):
+        """Release the resource acquired by `acquire`."""
+        self._release((kind, name, resource_identity(constructor)))
+
+    def references(self, kind: str, name: str, constructor: Any) -> int:
+        """Number of the unreleased acquisitions of the resource."""
+        with self._lock:
+            resource = self._resources.get((kind, name, resource_identity(constructor)))
+            return 0 if resource is None else resource.references
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._resources)
+
+    def _release(self, key: tuple[str, str, Hashable]):
+        with self._lock:
+            resource = self._resources.get(key)
+            if resource is None:
+                raise KeyError(f"Resource {key[:2]} isn't acquired")
+            resource.references -= 1
+            if resource.references == 0:
+                del self._resources[key]
+
+
+resource_registry = ResourceRegistry()
+"""The registry shared by all the components of the process"""
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import sys
+from array import array
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from flask import Flask, redirect
+from flask import Flask, Response, has_request_context, redirect, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException, MethodNotAllowed, NotFound
+
+from .elements.utils import RegisteredNames
+from .push_channel import PushChannel
+from .utils.client_features import FEATURES_HEADER
+from .utils.compression import choose_encoding, compress, supported_encodings
+from .utils.msgpack_encoding import (
+    MSGPACK_MIMETYPE,
+    packb,
+    prefers_msgpack,
+    request_body,
+)
+from .utils.static_files import StaticFiles
 
 if TYPE_CHECKING:
+    from werkzeug.sansio.response import Response as BaseResponse
+
     from .component_base import ComponentBase
 
 
@@ -20,17 +37,87 @@ class ComponentInfo:
     default_fetch_path: str
 
 
+class ResponseProvider(DefaultJSONProvider):
+
+    """JSON provider which responds with MessagePack to the clients that prefer
+    it (`Accept: application/msgpack`), if msgpack is installed. The float arrays
+    (`array("d")`) are packed as typed binary in MessagePack, and as lists in json.
+    """
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, array):
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
+
+    def response(self, *args: Any, **kwargs: Any) -> BaseResponse:
+        if not has_request_context():
+            return super().response(*args, **kwargs)
+        response: BaseResponse
+        if prefers_msgpack(request.accept_mimetypes):
+            obj = self._prepare_response_obj(args, kwargs)
+            response = Response(
+                packb(obj, default=self.default), mimetype=MSGPACK_MIMETYPE
+            )
+        else:
+            response = super().response(*args, **kwargs)
+        response.vary.add("Accept")
+        # the descriptions of the elements depend on the features of the frontend
+        response.vary.add(FEATURES_HEADER)
+        return response
+
+
 class Server:
-    def __init__(self, name, components: list[ComponentBase]):
-        self.app = Flask(
-            name,
-            static_url_path="",
-            static_folder=self._retrieve_static_files_path(),
+    def __init__(
+        self,
+        name,
+        components: list[ComponentBase],
+        min_compressed_size: int = 1024,
+    ):
+        """Flask server serving the frontend and the endpoints of all the
+        `components`.
+
+        Args:
+        ----
+            name: name of the flask application
+            components (list[ComponentBase]): components displayed on the frontend
+            min_compressed_size (int, optional): json (or MessagePack) responses
+                with at least this number of bytes are compressed if the client
+                accepts it. Defaults to 1024.
+
+        """
+        # static files are served by `StaticFiles` instead of the flask's
+        # generic static handler, so that the hashed bundles could be cached
+        # forever and sent compressed
+        self.app = Flask(name, static_folder=None)
+        self.app.json = ResponseProvider(self.app)
+        self.static_files = StaticFiles(self._retrieve_static_files_path())
+        self.app.add_url_rule(
+            "/<path:filename>",
+            endpoint="static",
+            view_func=self.static_files.serve,
+            methods=["GET"],
         )
+        self.app.register_error_handler(405, self._on_method_not_allowed)
+
+        # the frontend subscribes to the pushed events of a component instead
+        # of polling the component's endpoints
+        self.push_channel = PushChannel(self.app.json.dumps)
+
+        self.min_compressed_size = min_compressed_size
+        self.app.after_request(self._compress_json_response)
 
         self.components: list[ComponentBase] = components
-        self.registered_urls: set[str] = {"/", "/fetch_component_infos"}
-        self.registered_component_names: set[str] = set()
+        self.registered_urls: set[str] = RegisteredNames(
+            [
+                "/",
+                "/fetch_component_infos",
+                "/events",
+                "/readiness",
+                "/batch",
+            ]
+        )
+        self.registered_component_names: set[str] = RegisteredNames()
         for component in self.components:
             component.register_to_server(self)
 
@@ -40,6 +127,9 @@ class Server:
         self.add_endpoint(
             "/fetch_component_infos", self.on_fetch_component_infos, methods=["GET"]
         )
+        self.add_endpoint("/events", self.push_channel.on_subscribe, methods=["GET"])
+        self.add_endpoint("/readiness", self.on_readiness, methods=["GET"])
+        self.add_endpoint("/batch", self.on_batch, methods=["POST"])
         CORS(self.app, resources={r"/*": {"origins": "*"}})
 
         print(f"Server initialized with following endpoints: {self.registered_urls}")
@@ -57,6 +147,78 @@ class Server:
             )
         return {"result": "success", "component_infos": component_infos}
 
+    def on_readiness(self):
+        """Report whether all the components finished their blocking
+        background jobs (e.g. loading of the models). Answers with status
+        503 until everything is ready, so it can be used as a readiness probe.
+        """
+        components = {c.name: c.readiness() for c in self.components}
+        ready = all(c["ready"] for c in components.values())
+        return {
+            "result": "success",
+            "ready": ready,
+            "components": components,
+        }, (200 if ready else 503)
+
+    def on_batch(self):
+        """Apply several actions of the elements of one component in one round
+        trip (see `ComponentBase.apply_actions`). The request contains the name
+        of the `component` and the ordered list of `actions`, the response is
+        one diff with all the elements changed by the actions.
+        """
+        try:
+            body = request_body(request)
+        except RuntimeError as e:
+            return {"result": "exception", "reason": str(e)}, 400
+        for component in self.components:
+            if component.name == body.get("component"):
+                return component.apply_actions(body.get("actions", []))
+        return {
+            "result": "exception",
+            "reason": f"Unknown component: '{body.get('component')}'",
+        }, 404
+
+    def _on_method_not_allowed(self, error: MethodNotAllowed):
+        """The catch-all static route matches every path, so flask answers
+        the requests to unknown paths with other methods than GET with 405.
+        Answer them with 404, as if the static route didn't exist.
+        """
+        adapter = self.app.url_map.bind_to_environ(request.environ)
+        try:
+            endpoint, _ = adapter.match(method="GET")
+        except HTTPException:
+            return error
+        if endpoint == "static":
+            return NotFound()
+        return error
+
+    def _compress_json_response(self, response: Response) -> Response:
+        """Compress big json (or MessagePack) responses with the best encoding
+        the client accepts.
+        """
+        if response.direct_passthrough or response.is_streamed:
+            return response
+        if response.status_code != 200 or response.mimetype not in (
+            "application/json",
+            MSGPACK_MIMETYPE,
+        ):
+            return response
+        if "Content-Encoding" in response.headers:
+            return response
+
+        response.vary.add("Accept-Encoding")
+        data = response.get_data()
+        if len(data) < self.min_compressed_size:
+            return response
+        encoding = choose_encoding(
+            request.headers.get("Accept-Encoding"), supported_encodings()
+        )
+        if encoding is None:
+            return response
+        response.set_data(compress(data, encoding))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
     def run(self, **kwargs):
         self.app.run(**kwargs)
 
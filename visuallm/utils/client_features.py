@@ -0,0 +1,35 @@
+from flask import has_request_context, request
+
+FEATURES_HEADER = "X-Visuallm-Features"
+"""Header in which the frontend lists the features it supports, separated by commas"""
+
+TABLE_WINDOWS = "table-windows"
+"""The frontend requests the windows of rows of the paged tables"""
+
+TABLE_DELTAS = "table-deltas"
+"""The frontend appends the rows described by `appended_rows` to the tables"""
+
+COLLAPSIBLE_DELTAS = "collapsible-deltas"
+"""The frontend updates the subelements of the collapsibles described by
+`updated_subelements`"""
+
+BAR_COLUMNS = "bar-columns"
+"""The frontend displays the bar charts described by `bar_columns`"""
+
+
+def client_supports(feature: str) -> bool:
+    """Whether the frontend which sent the current request supports the `feature`
+    according to its `X-Visuallm-Features` header. The frontends built before the
+    feature was introduced don't list it, and receive the descriptions which they
+    understand. Outside of a request (e.g. when the descriptions are constructed
+    in tests), all the features are supported.
+
+    Args:
+    ----
+        feature (str): one of the features defined in this module
+
+    """
+    if not has_request_context():
+        return True
+    header = request.headers.get(FEATURES_HEADER, "")
+    return feature in (f.strip() for f in header.split(","))
@@ -0,0 +1,74 @@
+import gzip
+from collections.abc import Iterable
+
+try:
+    import brotli
+except ImportError:
+    _has_brotli = False
+else:
+    _has_brotli = True
+
+
+def supported_encodings() -> list[str]:
+    """Content encodings the server is able to produce, ordered by preference."""
+    if _has_brotli:
+        return ["br", "gzip"]
+    return ["gzip"]
+
+
+def compress(data: bytes, encoding: str, best: bool = False) -> bytes:
+    """Compress `data` with the content `encoding` ("br" or "gzip").
+
+    Args:
+    ----
+        data (bytes): data to be compressed
+        encoding (str): content encoding, one of `supported_encodings()`
+        best (bool): use the best (and the slowest) compression level, meant for
+            data which is compressed once and served many times (e.g. static files).
+            Defaults to False.
+
+    """
+    if encoding == "br":
+        if not _has_brotli:
+            raise RuntimeError("brotli isn't installed, cannot compress with 'br'.")
+        return brotli.compress(data, quality=11 if best else 5)
+    if encoding == "gzip":
+        # mtime=0 keeps the output deterministic for the same input
+        return gzip.compress(data, compresslevel=9 if best else 6, mtime=0)
+    raise ValueError(f"Unsupported content encoding: '{encoding}'")
+
+
+def choose_encoding(
+    accept_encoding: str | None, available: Iterable[str]
+) -> str | None:
+    """Select the encoding from `available` (ordered by server preference) that
+    the client accepts according to its `Accept-Encoding` header.
+
+    Returns None if the client doesn't accept any of the available encodings,
+    in which case the identity encoding should be used.
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[token] = quality
+
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in available:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
@@ -0,0 +1,37 @@
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_attributes(
+    module_name: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create module level `__getattr__` and `__dir__` which import the
+    `attributes` only when they are accessed for the first time.
+
+    Usage in the `__init__.py` of a package:
+    ```
+    __getattr__, __dir__ = lazy_attributes(__name__, {"Name": "package.module"})
+    ```
+
+    Args:
+    ----
+        module_name (str): name of the module where the attributes are accessed
+        attributes (dict[str, str]): mapping of the attribute name to the name
+            of the module from which the attribute is imported
+
+    """
+    module = importlib.import_module(module_name)
+
+    def _getattr(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        value = getattr(importlib.import_module(attributes[name]), name)
+        # cache the value, so that the next access doesn't go through __getattr__
+        setattr(module, name, value)
+        return value
+
+    def _dir() -> list[str]:
+        return sorted({*vars(module), *attributes})
+
+    return _getattr, _dir
@@ -0,0 +1,199 @@
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclasses.dataclass
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    load_time: float = 0.0
+    """Total time (in seconds) spent in loading the missing values"""
+    size_bytes: int = 0
+    """Sum of the sizes of the values that are currently in the cache"""
+    budget_bytes: int | None = None
+
+
+@dataclasses.dataclass
+class _KeyLock:
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    waiters: int = 0
+
+
+class MemoryBudgetedLRUCache(Generic[K, V]):
+
+    """Cache which keeps the sum of the sizes of its values under `budget_bytes`
+    by evicting the least recently used values. The evicted values are loaded
+    again by the loader passed to `get_or_load` when they are requested. The
+    values of the pinned keys (see `pin`) are never evicted.
+    """
+
+    def __init__(
+        self,
+        size_of: Callable[[V], int],
+        budget_bytes: int | None = None,
+        max_entries: int | None = None,
+        on_evict: Callable[[K, V], None] | None = None,
+    ):
+        """Args:
+        ----
+            size_of (Callable[[V], int]): function which measures the size of
+                a value in bytes, it is called once, when the value is stored
+            budget_bytes (int | None, optional): maximal sum of the sizes of the
+                cached values. A value bigger than the whole budget is still
+                stored, but it evicts all the other values which aren't pinned
+                (if there are pinned values, it is evicted as well). If None,
+                nothing is evicted because of the size. Defaults to None.
+            max_entries (int | None, optional): maximal number of the cached
+                values. If None, the number isn't limited. Defaults to None.
+            on_evict (Callable[[K, V], None] | None, optional): called with the
+                key and the value of each evicted entry. Defaults to None.
+        """
+        if budget_bytes is not None and budget_bytes < 0:
+            raise ValueError("budget_bytes must not be negative")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._size_of = size_of
+        self._on_evict = on_evict
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._pinned: set[K] = set()
+        self._key_locks: dict[K, _KeyLock] = {}
+        """Locks of the keys which are being loaded, so that each key is loaded
+        only once even if it is requested concurrently"""
+        self._statistics = CacheStatistics(budget_bytes=budget_bytes)
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Snapshot of the hit, miss, eviction and load time counters."""
+        with self._lock:
+            return dataclasses.replace(self._statistics)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def pin(self, key: K):
+        """Never evict the value stored under `key`, e.g. because it is in use
+        and evicting it would only lead to loading it again. The key doesn't
+        have to be in the cache yet.
+        """
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: K):
+        """Let the value stored under `key` be evicted again."""
+        with self._lock:
+            self._pinned.discard(key)
+            evicted = self._evict_over_budget()
+        self._notify_evicted(evicted)
+
+    def get_or_load(self, key: K, load: Callable[[], V]) -> V:
+        """Return the cached value stored under `key` and mark it as the most
+        recently used, or load it with `load`, store it and return it. The
+        concurrent requests of a missing key wait until it is loaded once.
+        """
+        with self._lock:
+            if key in self._entries:
+                return self._hit(key)
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = _KeyLock()
+            key_lock.waiters += 1
+
+        try:
+            # only the key is locked while loading, so that the other keys
+            # may be read and loaded in the meantime
+            with key_lock.lock:
+                with self._lock:
+                    if key in self._entries:
+                        return self._hit(key)
+                    self._statistics.misses += 1
+                start = time.perf_counter()
+                value = load()
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self._statistics.load_time += elapsed
+                self.put(key, value)
+                return value
+        finally:
+            with self._lock:
+                key_lock.waiters -= 1
+                if key_lock.waiters == 0:
+                    del self._key_locks[key]
+
+    def _hit(self, key: K) -> V:
+        self._entries.move_to_end(key)
+        self._statistics.hits += 1
+        return self._entries[key][0]
+
+    def put(self, key: K, value: V):
+        """Store the `value` as the most recently used one and evict the least
+        recently used values until the cache fits into the budget. The value
+        previously stored under `key` is passed to `on_evict` even if it is
+        the same object, as each stored value may hold its own reference
+        (e.g. to the resource registry).
+        """
+        size = self._size_of(value)
+        with self._lock:
+            replaced = self._discard(key)
+            self._entries[key] = (value, size)
+            self._statistics.size_bytes += size
+            evicted = self._evict_over_budget()
+        if replaced is not None:
+            evicted.append((key, replaced))
+        self._notify_evicted(evicted)
+
+    def clear(self):
+        """Evict all the values."""
+        with self._lock:
+            evicted = [(key, value) for key, (value, _) in self._entries.items()]
+            self._entries.clear()
+            self._statistics.size_bytes = 0
+            self._statistics.evictions += len(evicted)
+        self._notify_evicted(evicted)
+
+    def _notify_evicted(self, evicted: list[tuple[K, V]]):
+        if self._on_evict is None:
+            return
+        for evicted_key, evicted_value in evicted:
+            self._on_evict(evicted_key, evicted_value)
+
+    def _discard(self, key: K) -> V | None:
+        if key not in self._entries:
+            return None
+        value, size = self._entries.pop(key)
+        self._statistics.size_bytes -= size
+        return value
+
+    def _is_over_budget(self) -> bool:
+        budget = self._statistics.budget_bytes
+        if budget is not None and self._statistics.size_bytes > budget:
+            return True
+        return self._max_entries is not None and len(self._entries) > self._max_entries
+
+    def _evict_over_budget(self) -> list[tuple[K, V]]:
+        evicted: list[tuple[K, V]] = []
+        # the values are evicted from the least recently used one, the last
+        # value in the cache is never evicted
+        while self._is_over_budget() and len(self._entries) > 1:
+            key = next((k for k in self._entries if k not in self._pinned), None)
+            if key is None:
+                break
+            value, size = self._entries.pop(key)
+            self._statistics.size_bytes -= size
+            self._statistics.evictions += 1
+            evicted.append((key, value))
+        return evicted
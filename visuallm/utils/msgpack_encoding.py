@@ -0,0 +1,102 @@
+import sys
+from array import array
+from collections.abc import Callable
+from typing import Any
+
+from werkzeug.exceptions import BadRequest
+
+try:
+    import msgpack
+except ImportError:
+    _has_msgpack = False
+    _UNPACK_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+else:
+    _has_msgpack = True
+    _UNPACK_ERRORS = (ValueError, msgpack.UnpackException)
+
+MSGPACK_MIMETYPE = "application/msgpack"
+FLOAT64_ARRAY_EXT = 1
+"""MessagePack extension type of the float arrays (`array("d")`), which are
+packed as little-endian float64 values instead of one float per item"""
+
+
+def msgpack_available() -> bool:
+    """Whether the server is able to pack and unpack MessagePack."""
+    return _has_msgpack
+
+
+def prefers_msgpack(accept_mimetypes: Any) -> bool:
+    """Whether the client prefers MessagePack to json according to its `Accept` header.
+
+    Args:
+    ----
+        accept_mimetypes (MIMEAccept): parsed `Accept` header of the request
+
+    """
+    if not _has_msgpack:
+        return False
+    best = accept_mimetypes.best_match(["application/json", MSGPACK_MIMETYPE])
+    return best == MSGPACK_MIMETYPE
+
+
+def packb(value: Any, default: Callable[[Any], Any]) -> bytes:
+    """Pack `value` to MessagePack.
+
+    Args:
+    ----
+        value (Any): value to be packed
+        default (Callable[[Any], Any]): converts the objects msgpack cannot pack
+            (e.g. dataclasses) to the objects it can pack, the float arrays
+            are converted to the extension type `FLOAT64_ARRAY_EXT`
+
+    """
+    if not _has_msgpack:
+        raise RuntimeError("msgpack isn't installed, cannot pack MessagePack.")
+
+    def pack_default(obj: Any) -> Any:
+        if isinstance(obj, array) and obj.typecode == "d":
+            if sys.byteorder != "little":
+                obj = array("d", obj)
+                obj.byteswap()
+            return msgpack.ExtType(FLOAT64_ARRAY_EXT, obj.tobytes())
+        return default(obj)
+
+    return msgpack.packb(value, default=pack_default, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Unpack MessagePack `data`, the float arrays are unpacked to `array("d")`."""
+    if not _has_msgpack:
+        raise RuntimeError("msgpack isn't installed, cannot unpack MessagePack.")
+    return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False)
+
+
+def request_body(request: Any) -> Any:
+    """Unpack the body of the flask `request`, either MessagePack or json.
+
+    Raises
+    ------
+        RuntimeError: if the body is neither MessagePack nor json, or if it is
+            malformed
+
+    """
+    if request.mimetype == MSGPACK_MIMETYPE:
+        try:
+            return unpackb(request.get_data())
+        except _UNPACK_ERRORS as e:
+            raise RuntimeError(f"Malformed MessagePack in request: {e}") from e
+    if not request.is_json:
+        raise RuntimeError("The data in request should be json!")
+    try:
+        return request.get_json()
+    except BadRequest as e:
+        raise RuntimeError("Malformed json in request!") from e
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code != FLOAT64_ARRAY_EXT:
+        return msgpack.ExtType(code, data)
+    values = array("d", data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class Prefetcher(Generic[K, V]):
+
+    """Computes the values which will probably be requested soon on a single
+    background worker, so that the request finds the value already computed.
+    """
+
+    def __init__(self, max_entries: int, thread_name_prefix: str = "visuallm-prefetch"):
+        """Args:
+        ----
+            max_entries (int): maximal number of the kept values (both the computed
+                and the scheduled ones), the least recently used are dropped
+            thread_name_prefix (str, optional): name of the worker thread.
+                Defaults to "visuallm-prefetch".
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[K, Future[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        # a single worker, so that the prefetching uses at most one core
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=thread_name_prefix
+        )
+        self.hits = 0
+        """Number of `get` calls which found the value computed or scheduled"""
+        self.misses = 0
+
+    def get(self, key: K, compute: Callable[[], V]) -> V:
+        """Return the value for the `key`. If it is being prefetched, wait until
+        it is computed, if it isn't prefetched, compute it on the calling thread.
+        """
+        with self._lock:
+            future = self._entries.get(key)
+            if future is not None and future.cancelled():
+                future = None
+            if future is None:
+                self.misses += 1
+                future = Future()
+                # claimed before the computation, so that the scheduled
+                # prefetching doesn't compute the same value
+                future.set_running_or_notify_cancel()
+                self._store(key, future)
+                compute_here = True
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                compute_here = False
+
+        if compute_here:
+            try:
+                future.set_result(compute())
+            except BaseException as e:
+                future.set_exception(e)
+                self._drop(key, future)
+                raise
+            return future.result()
+
+        try:
+            return future.result()
+        except Exception:
+            # the prefetching failed, compute it again, so that the exception
+            # is raised with the traceback of the caller
+            self._drop(key, future)
+            return compute()
+
+    def prefetch(self, items: Iterable[tuple[K, Callable[[], V]]]):
+        """Schedule the computation of the `items` (pairs of the key and the
+        function which computes the value) that aren't computed yet. The
+        scheduled computations of the other keys, which haven't started yet, are
+        cancelled.
+        """
+        items = list(items)
+        keys = {key for key, _ in items}
+        with self._lock:
+            for key, future in list(self._entries.items()):
+                if key not in keys and future.cancel():
+                    del self._entries[key]
+            for key, compute in items:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    continue
+                self._store(key, self._executor.submit(compute))
+
+    def clear(self):
+        with self._lock:
+            for future in self._entries.values():
+                future.cancel()
+            self._entries.clear()
+
+    def _store(self, key: K, future: Future[V]):
+        self._entries[key] = future
+        while len(self._entries) > self._max_entries:
+            _, dropped = self._entries.popitem(last=False)
+            dropped.cancel()
+
+    def _drop(self, key: K, future: Future[V]):
+        with self._lock:
+            if self._entries.get(key) is future:
+                del self._entries[key]
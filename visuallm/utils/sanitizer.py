@@ -1,43 +1,45 @@
 import re
-
-# TODO: move to singledispatch
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from typing import TypeVar
 
 T = TypeVar("T")
 
+_ESCAPED_BRACKETS = str.maketrans({"<": "&lt;", ">": "&gt;"})
+_SPECIAL_CHARACTERS = re.compile(r"[<>*`\n]")
+_BACKTICKS = re.compile(r"`([^`]*)`")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC = re.compile(r"\*(.+?)\*")
+_ALLOWED_TAGS = re.compile(r"<br />|</?code>|</?b>|</?em>")
+_MEMOIZED_LENGTH = 256
+"""Only the shorter strings (e.g. table cells, which often repeat) are memoized"""
+
 
 class Sanitizer:
     @staticmethod
     def convert_newline_to_br_tags(value: str):
-        value = value.replace("\n", "<br />")
-        return value
+        return value.replace("\n", "<br />")
 
     @staticmethod
     def convert_brackets(value: str):
-        value = value.replace("<", "&lt;")
-        value = value.replace(">", "&gt;")
-        return value
+        return value.translate(_ESCAPED_BRACKETS)
 
     @staticmethod
     def convert_backticks(value: str):
-        value = re.sub(r"`([^`]*)`", r"<code>\1</code>", value)
-        return value
+        return _BACKTICKS.sub(r"<code>\1</code>", value)
 
     @staticmethod
     def convert_bold(value: str):
-        value = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", value)
-        return value
+        return _BOLD.sub(r"<b>\1</b>", value)
 
     @staticmethod
     def convert_italic(value: str):
-        value = re.sub(r"\*(.+?)\*", r"<em>\1</em>", value)
-        return value
+        return _ITALIC.sub(r"<em>\1</em>", value)
 
     @staticmethod
     def is_sane(value: str):
-        allowed = [r"<br />", r"<code>", r"</code>", r"<b>", r"</b>", r"<em>", r"</em>"]
-        value = re.sub("|".join(allowed), "", value)
+        if "<" not in value and ">" not in value:
+            return True
+        value = _ALLOWED_TAGS.sub("", value)
         return "<" not in value and ">" not in value
 
     @singledispatch
@@ -53,14 +55,38 @@ class Sanitizer:
     @sanitize.register
     @staticmethod
     def sanitize_str(value: str):
-        value = Sanitizer.convert_brackets(value)
-        value = Sanitizer.convert_bold(value)
-        value = Sanitizer.convert_italic(value)
-        value = Sanitizer.convert_newline_to_br_tags(value)
-        value = Sanitizer.convert_backticks(value)
-        return value
+        if len(value) > _MEMOIZED_LENGTH:
+            return _sanitize_str(value)
+        return _memoized_sanitize_str(value)
 
     @sanitize.register
     @staticmethod
     def sanitize_list_str(values: list) -> list:
-        return [Sanitizer.sanitize(value) for value in values]
+        # dispatch only the values which aren't strings
+        return [
+            Sanitizer.sanitize_str(value)
+            if type(value) is str
+            else Sanitizer.sanitize(value)
+            for value in values
+        ]
+
+
+def _sanitize_str(value: str) -> str:
+    # most of the values contain no markup, and are returned untouched
+    if _SPECIAL_CHARACTERS.search(value) is None:
+        return value
+    # the conversions are applied in the same order as the separate `convert_*`
+    # methods, each one only if the value contains its markup
+    value = value.translate(_ESCAPED_BRACKETS)
+    if "*" in value:
+        if "**" in value:
+            value = _BOLD.sub(r"<b>\1</b>", value)
+        value = _ITALIC.sub(r"<em>\1</em>", value)
+    if "\n" in value:
+        value = value.replace("\n", "<br />")
+    if "`" in value:
+        value = _BACKTICKS.sub(r"<code>\1</code>", value)
+    return value
+
+
+_memoized_sanitize_str = lru_cache(maxsize=65536)(_sanitize_str)
@@ -0,0 +1,135 @@
+import hashlib
+import mimetypes
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flask import Response, abort, request
+from werkzeug.security import safe_join
+
+from visuallm.utils.compression import choose_encoding, compress, supported_encodings
+
+HASHED_FILE_NAME = re.compile(r"-[0-9a-fA-F]{8,}\.[0-9A-Za-z]+$")
+"""Vite appends content hash to the names of the bundled assets,
+e.g. `index-9b8c3d49.js`"""
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+"""Content hashed files never change, a new build produces a new name."""
+
+SHORT_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+"""`index.html` (and other files without hash) reference the hashed files,
+so they must be revalidated often for the new build to be picked up."""
+
+COMPRESSIBLE_SUFFIXES = {".html", ".js", ".mjs", ".css", ".svg", ".json", ".map"}
+
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+@dataclass
+class StaticFile:
+    content: bytes
+    mimetype: str
+    etag: str
+    cache_control: str
+    variants: dict[str, bytes] = field(default_factory=dict)
+    """Mapping of content encoding to the compressed content"""
+
+
+class StaticFiles:
+    def __init__(self, directory: Path, min_compressed_size: int = 256):
+        """Serve the files of the bundled frontend.
+
+        - content hashed files are served with far-future immutable caching,
+            other files (e.g. `index.html`) are cached only shortly
+        - if the client accepts it, the file is served compressed with brotli or
+            gzip. Precompressed variants (`<file>.br`, `<file>.gz`) lying next to
+            the file are used if they exist, otherwise the file is compressed
+            once on the first request and the result is kept in memory.
+
+        Args:
+        ----
+            directory (Path): directory from which the files are served
+            min_compressed_size (int, optional): files smaller than this
+                number of bytes aren't compressed. Defaults to 256.
+
+        """
+        self.directory = directory
+        self.min_compressed_size = min_compressed_size
+        self._files: dict[str, StaticFile] = {}
+        self._lock = threading.Lock()
+
+    def serve(self, filename: str):
+        """Flask view serving `filename` from `self.directory`."""
+        static_file = self.get_file(filename)
+        encoding = choose_encoding(
+            request.headers.get("Accept-Encoding"), static_file.variants.keys()
+        )
+        if encoding is None:
+            body = static_file.content
+            etag = static_file.etag
+        else:
+            body = static_file.variants[encoding]
+            etag = f"{static_file.etag}-{encoding}"
+
+        response = Response(body, mimetype=static_file.mimetype)
+        if encoding is not None:
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = static_file.cache_control
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
+    def get_file(self, filename: str) -> StaticFile:
+        """Load the file and all its compressed variants, the result is
+        cached so that the work is done only once per file.
+        """
+        static_file = self._files.get(filename)
+        if static_file is not None:
+            return static_file
+
+        with self._lock:
+            static_file = self._files.get(filename)
+            if static_file is None:
+                static_file = self._load_file(filename)
+                self._files[filename] = static_file
+        return static_file
+
+    def _load_file(self, filename: str) -> StaticFile:
+        joined = safe_join(str(self.directory), filename)
+        if joined is None:
+            abort(404)
+        path = Path(joined)
+        if not path.is_file():
+            abort(404)
+
+        content = path.read_bytes()
+        mimetype = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if HASHED_FILE_NAME.search(path.name) is not None:
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = SHORT_CACHE_CONTROL
+
+        static_file = StaticFile(
+            content=content,
+            mimetype=mimetype,
+            etag=hashlib.sha1(content, usedforsecurity=False).hexdigest(),
+            cache_control=cache_control,
+        )
+        if path.suffix not in COMPRESSIBLE_SUFFIXES:
+            return static_file
+        if len(content) < self.min_compressed_size:
+            return static_file
+
+        available_encodings = supported_encodings()
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            precompressed = path.with_name(path.name + suffix)
+            if precompressed.is_file():
+                static_file.variants[encoding] = precompressed.read_bytes()
+                continue
+            if encoding not in available_encodings:
+                continue
+            compressed = compress(content, encoding, best=True)
+            if len(compressed) < len(content):
+                static_file.variants[encoding] = compressed
+        return static_file